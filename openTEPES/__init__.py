@@ -22,9 +22,12 @@ from .openTEPES_InputSchema                       import *
 from .openTEPES_InputSource                       import *
 from .openTEPES_InputCSVSource                    import *
 from .openTEPES_InputDuckDBSource                 import *
+from .openTEPES_InputParquetSource                import *
 from .openTEPES_InputData                         import *
 from .openTEPES_DataConfiguration                 import *
 from .openTEPES_SettingUpVariables                import *
+from .openTEPES_InfeasibilityCheck                import *
+from .openTEPES_ConstraintRegistry                import *
 from .openTEPES_ModelFormulationObjective         import *
 from .openTEPES_ModelFormulationInvestment        import *
 from .openTEPES_ModelFormulationElectricity       import *
@@ -32,11 +35,19 @@ from .openTEPES_ModelFormulationHydro             import *
 from .openTEPES_ModelFormulationHydrogen          import *
 from .openTEPES_ModelFormulationHeat              import *
 from .openTEPES_ProblemSolving                    import *
+from .openTEPES_StageIndex                        import *
+from .openTEPES_ProblemSolvingStageRetirement     import *
+from .openTEPES_ProblemSolvingCheckpoint          import *
+from .openTEPES_ProblemSolvingWarmStart           import *
+from .openTEPES_ProblemSolvingSolutionStore       import *
+from .openTEPES_ProblemSolvingNativeDuals         import *
+from .openTEPES_ProblemSolvingCutPool             import *
 from .openTEPES_ProblemSolvingStageIter           import *
 from .openTEPES_ProblemSolvingBenders             import *
 from .openTEPES_ProblemSolvingStageDecomposition   import *
 from .openTEPES_ProblemSolvingSectorDecomposition import *
 from .openTEPES_OutputResultsSink                 import *
+from .openTEPES_OutputResultsStream               import *
 from .openTEPES_OutputResultsCommon               import *
 from .openTEPES_OutputResultsRawDump              import *
 from .openTEPES_OutputResultsInvestment           import *
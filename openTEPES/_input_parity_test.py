@@ -52,8 +52,9 @@ def snapshot(case_path: str) -> dict:
     """Build a fresh mTEPES via InputData on the given path and return a
     serialisable dict of its model-visible state.
 
-    Handles both directory cases (CSV) and ``.duckdb`` file cases — the
-    same sniff logic as ``openTEPES_run`` would apply.
+    Handles directory cases (CSV), ``.parquet`` directory cases and
+    ``.duckdb`` file cases — the same sniff logic as ``openTEPES_run``
+    would apply.
     """
     # Late imports so a parity probe in a freshly-cloned tree doesn't
     # error if optional deps are missing at import time.
@@ -62,7 +63,7 @@ def snapshot(case_path: str) -> dict:
 
     mTEPES = ConcreteModel("parity_probe")
     p = Path(case_path)
-    if p.is_file() and p.suffix == ".duckdb":
+    if (p.is_file() and p.suffix == ".duckdb") or (p.is_dir() and p.suffix == ".parquet"):
         source = open_source(p)
         mTEPES.pInputSource = source
         # InputData reads from pInputSource; DirName/CaseName are only
@@ -2,7 +2,6 @@
 Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - August 16, 2026
 """
 
-# import dill as pickle
 import datetime
 import json
 import os
@@ -19,7 +18,14 @@ try:
     from          .openTEPES_InputSource                import open_source
     from          .openTEPES_ModelFormulationObjective  import TotalObjectiveFunction
     from          .openTEPES_ModelFormulationInvestment import InvestmentElecModelFormulation, InvestmentHydroModelFormulation, InvestmentH2ModelFormulation, InvestmentHeatModelFormulation
+    from          .openTEPES_ModelCache               import ModelCache
+    from          .openTEPES_ProblemSolvingCheckpoint   import StageCheckpoints
+    from          .openTEPES_ProblemSolvingWarmStart    import StageWarmStart, enabled as stage_warm_start
+    from          .openTEPES_ProblemSolvingSolutionStore import SolutionStore
+    from          .openTEPES_ProblemSolvingCutPool      import CutPoolStore
     from          .openTEPES_ProblemSolvingStageIter    import StageIterativeSolving
+    from          .openTEPES_ProblemSolvingDualExtraction import DualStore, selective as selective_duals
+    from          .openTEPES_OutputResultsCommon        import VarValues
     from          .openTEPES_OutputResultsRawDump       import OutputResultsParVarCon
     from          .openTEPES_OutputResultsInvestment    import InvestmentResults
     from          .openTEPES_OutputResultsGeneration    import GenerationOperationResults, GenerationOperationHeatResults
@@ -30,6 +36,8 @@ try:
     from          .openTEPES_OutputResultsEconomic      import MarginalResults, CostSummaryResults, EconomicResults
     from          .openTEPES_OutputResultsSummary       import OperationSummaryResults, FlexibilityResults, ReliabilityResults
     from          .openTEPES_OutputResultsSink          import ResultSink, set_active_sink, clear_active_sink
+    from          .openTEPES_OutputResultsStream        import ResultStream, enabled as stream_results
+    from          .openTEPES_ProblemSolvingParallelStages import enabled as parallel_stages
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,7 +47,14 @@ except ImportError:
     from openTEPES.openTEPES_InputSource                import open_source
     from openTEPES.openTEPES_ModelFormulationObjective  import TotalObjectiveFunction
     from openTEPES.openTEPES_ModelFormulationInvestment import InvestmentElecModelFormulation, InvestmentHydroModelFormulation, InvestmentH2ModelFormulation, InvestmentHeatModelFormulation
+    from openTEPES.openTEPES_ModelCache               import ModelCache
+    from openTEPES.openTEPES_ProblemSolvingCheckpoint   import StageCheckpoints
+    from openTEPES.openTEPES_ProblemSolvingWarmStart    import StageWarmStart, enabled as stage_warm_start
+    from openTEPES.openTEPES_ProblemSolvingSolutionStore import SolutionStore
+    from openTEPES.openTEPES_ProblemSolvingCutPool      import CutPoolStore
     from openTEPES.openTEPES_ProblemSolvingStageIter    import StageIterativeSolving
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore, selective as selective_duals
+    from openTEPES.openTEPES_OutputResultsCommon        import VarValues
     from openTEPES.openTEPES_OutputResultsRawDump       import OutputResultsParVarCon
     from openTEPES.openTEPES_OutputResultsInvestment    import InvestmentResults
     from openTEPES.openTEPES_OutputResultsGeneration    import GenerationOperationResults, GenerationOperationHeatResults
@@ -50,6 +65,8 @@ except ImportError:
     from openTEPES.openTEPES_OutputResultsEconomic      import MarginalResults, CostSummaryResults, EconomicResults
     from openTEPES.openTEPES_OutputResultsSummary       import OperationSummaryResults, FlexibilityResults, ReliabilityResults
     from openTEPES.openTEPES_OutputResultsSink          import ResultSink, set_active_sink, clear_active_sink
+    from openTEPES.openTEPES_OutputResultsStream        import ResultStream, enabled as stream_results
+    from openTEPES.openTEPES_ProblemSolvingParallelStages import enabled as parallel_stages
 
 
 # Output categories selectable via --results CLI flag. Keys map to the pIndXxxResults flags inside openTEPES_run.
@@ -98,6 +115,33 @@ OUTPUT_REGISTRY = (
     ("map",         NetworkMapResults,              (),                       None),
 )
 
+# Constraint families whose duals each output writer reads from mTEPES.pDuals. With --selective-duals the stage solves harvest only the families of
+# the writers that will fire (dual_plan), and a MIP stage skips its fixed-LP re-solve when there are none. A writer that reads duals must be listed.
+OUTPUT_DUALS = {
+    OperationSummaryResults:   ("eBalanceElec",),
+    ReservoirOperationResults: ("eHydroInventory",),
+    MarginalResults:           ("eBalanceElec", "eBalanceH2", "eBalanceHeat", "eAdequacyReserveMarginElec", "eAdequacyReserveMarginHeat", "eMaxSystemEmission",
+                                "eMinSystemRESEnergy", "eOperReserveUp", "eOperReserveDw", "eESSInventory"),
+    EconomicResults:           ("eBalanceElec", "eAdequacyReserveMarginElec", "eOperReserveUp", "eOperReserveDw", "eSystemRampUp", "eSystemRampDw"),
+}
+# The duals the sector decomposition reads between its iterations to build the electrolyzer cuts.
+SECTOR_DECOMPOSITION_DUALS = ("eBalanceElec", "eBalanceH2", "eESSInventory", "eMaxShiftTime", "eInstallConESS", "eESSTotalCharge")
+
+
+def dual_plan(mTEPES, flags, pIndDumpRawResults=0) -> frozenset | None:
+    """The constraint families whose duals the run reads: those of the writers of ``OUTPUT_REGISTRY`` that ``flags`` and their guards select, and
+    those of the sector decomposition when it is on. None (every family) when the raw dump, which writes all the duals, is on.
+    """
+    if pIndDumpRawResults:
+        return None
+    families = set()
+    for _key, _fn, _extra_keys, _guard in OUTPUT_REGISTRY:
+        if flags[_key] and (_guard is None or _guard(mTEPES)):
+            families.update(OUTPUT_DUALS.get(_fn, ()))
+    if mTEPES.pIndSectorDecomposition():
+        families.update(SECTOR_DECOMPOSITION_DUALS)
+    return frozenset(families)
+
 
 def openTEPES_run(DirName, CaseName, SolverName, pIndOutputResults, pIndLogConsole,
                   *, output_spec=None, out_path=None, gzip_patterns=None, output_format="csv",
@@ -134,8 +178,8 @@ def openTEPES_run(DirName, CaseName, SolverName, pIndOutputResults, pIndLogConso
     InitialTime = time.time()
     _RunStartedUtc = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
 
-    # If the caller pointed at a .duckdb file (CaseName carries the suffix), open it as a DuckDBSource; InputData reads tables from this source instead of
-    # from disk. CSV cases get a CSVSource later inside InputData (or here if we want to keep the source object on the model from the start).
+    # If the caller pointed at a .duckdb file or a .parquet directory (CaseName carries the suffix), open it as a DuckDBSource or ParquetSource; InputData
+    # reads tables from this source instead of from the CSVs. CSV cases get a CSVSource later inside InputData (or here if we want to keep the source object on the model from the start).
     _db_input_origin_dir = None
     _input_source = None
     if input_source is not None:
@@ -147,17 +191,19 @@ def openTEPES_run(DirName, CaseName, SolverName, pIndOutputResults, pIndLogConso
         DirName  = getattr(_input_source, "dir_name", DirName) or DirName
     else:
         _input_path_candidate = os.path.join(DirName, CaseName)
-        if os.path.isfile(_input_path_candidate) and _input_path_candidate.endswith(".duckdb"):
+        if (os.path.isfile(_input_path_candidate) and _input_path_candidate.endswith(".duckdb")) or \
+           (os.path.isdir (_input_path_candidate) and _input_path_candidate.endswith(".parquet")):
             _db_input_origin_dir = os.path.dirname(os.path.abspath(_input_path_candidate))
             _input_source = open_source(_input_path_candidate)
-            # The (DirName, CaseName) pair still drives output paths and per-run log filenames downstream. Use the DB's parent dir and its embedded
+            # The (DirName, CaseName) pair still drives output paths and per-run log filenames downstream. Use the source's parent dir and its
             # case name to keep those file conventions stable.
             DirName  = _db_input_origin_dir
             CaseName = _input_source.case_name
 
     _path = os.path.join(DirName, CaseName)
     # Effective output directory — used by every function in OutputResults via the _outdir() helper. None means "use case input dir" (historical).
-    # For DuckDB inputs without an explicit out_path, default to the parent directory of the .duckdb file (the case dir under it does not exist).
+    # For DuckDB and Parquet inputs without an explicit out_path, default to the parent directory of the .duckdb file / .parquet directory (the case
+    # dir under it does not exist).
     if out_path:
         _OutPath = out_path
     elif _db_input_origin_dir is not None:
@@ -212,44 +258,51 @@ def openTEPES_run(DirName, CaseName, SolverName, pIndOutputResults, pIndLogConso
     mTEPES.pIndSequentialSolving = Param(initialize=pIndSequentialSolving, within=Binary, doc='Indicator of sequential solving',           mutable=True)
     mTEPES.pBdTol = 1e-6
 
-    # Reading sets and parameters. InputData also stores dfs/par on mTEPES (mTEPES.dFrame / mTEPES.dPar) for backward compatibility,
-    # but DataConfiguration takes them explicitly to avoid that coupling.
-    dfs, par = InputData(DirName, CaseName, mTEPES, pIndLogConsole)
-
-    # Define sets and parameters
-    DataConfiguration(mTEPES, dfs, par)
-
-    # Define variables
-    SettingUpVariables(mTEPES, mTEPES)
-
-    # first/last stage
-    FirstST = 0
-    for st in mTEPES.st:
-        if FirstST == 0:
-            FirstST = 1
-            mTEPES.First_st = st
-        mTEPES.Last_st = st
-
-    # objective function and investment constraints
-    TotalObjectiveFunction             (mTEPES, mTEPES, pIndLogConsole)
-    if mTEPES.gc or mTEPES.gd or mTEPES.lc or mTEPES.rn or mTEPES.pc or mTEPES.hc:
-        InvestmentElecModelFormulation (mTEPES, mTEPES, pIndLogConsole)
-    if mTEPES.pIndHydroTopology() and mTEPES.rn:
-        InvestmentHydroModelFormulation(mTEPES, mTEPES, pIndLogConsole)
-    if mTEPES.pIndHydrogen()      and mTEPES.pc:
-        InvestmentH2ModelFormulation   (mTEPES, mTEPES, pIndLogConsole)
-    if mTEPES.pIndHeat()          and mTEPES.hc:
-        InvestmentHeatModelFormulation (mTEPES, mTEPES, pIndLogConsole)
-
-    # initialize parameter for dual variables
-    mTEPES.pDuals = {}
-
-    # iterative formulation and solve for every stage of the year. The per-stage operation model and the two solve paths (deterministic per scenario,
-    # or one joint stochastic solve) live in openTEPES_ProblemSolvingStageIter; this is a pure extraction, so results are unchanged.
-    StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole, _path, pIndCycleFlow)
-
-    # pickle the case study data with open(dump_folder+f'/oT_Case_{CaseName}.pkl','wb') as f:
-    #     pickle.dump(mTEPES, f, pickle.HIGHEST_PROTOCOL)
+    # opt-in cache of the built model (--model-cache / OTEPES_MODEL_CACHE): a run whose inputs, settings and code match an earlier one loads its
+    # model instead of building it again
+    _settings     = dict(pIndCycleFlow=pIndCycleFlow, pIndSectorDecomposition=pIndSectorDecomposition, pIndCompleteProblem=pIndCompleteProblem, pIndSequentialSolving=pIndSequentialSolving)
+    _model_cache  = ModelCache.create(DirName, CaseName, _input_source, _settings)
+    _cached_model = _model_cache.load() if _model_cache is not None else None
+    if _cached_model is not None:
+        mTEPES = _cached_model
+        if _input_source is not None:
+            mTEPES.pInputSource = _input_source
+        print('Loading    cached model                ... ', round(time.time() - InitialTime), 's')
+    else:
+        # Reading sets and parameters. InputData also stores dfs/par on mTEPES (mTEPES.dFrame / mTEPES.dPar) for backward compatibility,
+        # but DataConfiguration takes them explicitly to avoid that coupling.
+        dfs, par = InputData(DirName, CaseName, mTEPES, pIndLogConsole)
+
+        # Define sets and parameters
+        DataConfiguration(mTEPES, dfs, par)
+
+        # Define variables
+        SettingUpVariables(mTEPES, mTEPES)
+
+        # first/last stage
+        FirstST = 0
+        for st in mTEPES.st:
+            if FirstST == 0:
+                FirstST = 1
+                mTEPES.First_st = st
+            mTEPES.Last_st = st
+
+        # objective function and investment constraints
+        TotalObjectiveFunction             (mTEPES, mTEPES, pIndLogConsole)
+        if mTEPES.gc or mTEPES.gd or mTEPES.lc or mTEPES.rn or mTEPES.pc or mTEPES.hc:
+            InvestmentElecModelFormulation (mTEPES, mTEPES, pIndLogConsole)
+        if mTEPES.pIndHydroTopology() and mTEPES.rn:
+            InvestmentHydroModelFormulation(mTEPES, mTEPES, pIndLogConsole)
+        if mTEPES.pIndHydrogen()      and mTEPES.pc:
+            InvestmentH2ModelFormulation   (mTEPES, mTEPES, pIndLogConsole)
+        if mTEPES.pIndHeat()          and mTEPES.hc:
+            InvestmentHeatModelFormulation (mTEPES, mTEPES, pIndLogConsole)
+
+        if _model_cache is not None:
+            _model_cache.save(mTEPES)
+
+    # initialize the store of dual variables
+    mTEPES.pDuals = DualStore()
 
     # output results only for every unit (0), only for every technology (1), or for both (2)
     pIndTechnologyOutput = 2
@@ -277,28 +330,64 @@ def openTEPES_run(DirName, CaseName, SolverName, pIndOutputResults, pIndLogConso
     # Only pIndPlotOutput is still read directly (via _extras below); every other output category is dispatched straight from _flags through OUTPUT_REGISTRY.
     pIndPlotOutput                  = _flags["plots"]
 
-    # Tell OutputResults functions where to write (used by _outdir helper). Setting on mTEPES avoids changing 14 function signatures.
-    mTEPES.pOutputPath = _OutPath
-    mTEPES.pOutputBackend = output_format
-
-    # Output results to CSV files. Dispatched via OUTPUT_REGISTRY (defined at module top): each entry fires when its category flag is truthy AND
-    # its model-state guard (if any) returns truthy. Registry order is the dispatch order — headlines first, bulky hourly tables next, plots last (per PR #118).
-    _OutputStart = time.time()
-
-    # Raw parameter/variable/constraint dump is gated by pIndDumpRawResults (hardcoded, not a CLI category), so it stays a pre-loop special case.
-    if pIndDumpRawResults:
-        OutputResultsParVarCon            (DirName, CaseName, mTEPES, mTEPES)
-
     _extras = {
         "tech": pIndTechnologyOutput,
         "area": pIndAreaOutput,
         "plot": pIndPlotOutput,
     }
+
+    # opt-in (default OFF): append the hourly tables of each solved stage to the result sink while the next stage solves. The sink is opened
+    # here, before the stage loop, and closed after the output writers below, which skip the tables the stream already holds in full.
+    _result_sink = None
+    if stream_results():
+        _result_sink = ResultStream(ResultSink(_OutPath, CaseName, fmt=output_format), mTEPES, _flags, _extras, background=not parallel_stages())
+    mTEPES.pResultStream = _result_sink
+
+    # the stream holds a writer thread and an open sink, closed after the writers below; if the run fails before them they are closed here,
+    # keeping the stages streamed so far
+    try:
+        # opt-in (default OFF): checkpoint every solve of the stage loop, and with --resume load the checkpoints of an interrupted run of this model
+        mTEPES.pCheckpoints = StageCheckpoints.create(_OutPath, CaseName, DirName, _input_source, _settings, SolverName)
+
+        # opt-in (default OFF): start the MIP of each stage from the commitment of the stage before it
+        mTEPES.pWarmStart = StageWarmStart() if stage_warm_start() else None
+
+        # opt-in (default OFF): harvest only the duals the selected outputs read, and skip the fixed-LP re-solve of a MIP stage when none is read
+        mTEPES.pDualPlan = dual_plan(mTEPES, _flags, pIndDumpRawResults) if selective_duals() else None
+
+        # opt-in (default OFF): store the solution of every solve, and start each stage from the solution an earlier run of the case stored for it
+        mTEPES.pSolutions = SolutionStore.create(_OutPath, CaseName)
+
+        # opt-in (default OFF): keep the Benders cuts of the decomposition loops, and start each loop from the cuts an earlier run of the case kept
+        mTEPES.pCutPools = CutPoolStore.create(_OutPath, CaseName)
+
+        # iterative formulation and solve for every stage of the year. The per-stage operation model and the two solve paths (deterministic per scenario,
+        # or one joint stochastic solve) live in openTEPES_ProblemSolvingStageIter; this is a pure extraction, so results are unchanged.
+        StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole, _path, pIndCycleFlow)
+
+        # Tell OutputResults functions where to write (used by _outdir helper). Setting on mTEPES avoids changing 14 function signatures.
+        mTEPES.pOutputPath = _OutPath
+        mTEPES.pOutputBackend = output_format
+        # every writer reads the variable values through this store, which pulls each variable's solution vector once for the whole output pass
+        mTEPES.pVarValues = VarValues(mTEPES)
+
+        # Output results to CSV files. Dispatched via OUTPUT_REGISTRY (defined at module top): each entry fires when its category flag is truthy AND
+        # its model-state guard (if any) returns truthy. Registry order is the dispatch order — headlines first, bulky hourly tables next, plots last (per PR #118).
+        _OutputStart = time.time()
+
+        # Raw parameter/variable/constraint dump is gated by pIndDumpRawResults (hardcoded, not a CLI category), so it stays a pre-loop special case.
+        if pIndDumpRawResults:
+            OutputResultsParVarCon            (DirName, CaseName, mTEPES, mTEPES)
+    except BaseException:
+        if _result_sink is not None:
+            _result_sink.close(drop_unclaimed=False)
+        raise
+
     # When DuckDB output is requested, install a per-case sink the .oT accessor routes every result write through. 'csv' leaves no sink, so the accessor
     # falls back to plain to_csv and the run is byte-identical to before. The sink is opened here (in this worker, after any fork) and closed below.
-    _result_sink = None
-    if output_format != "csv":
+    if _result_sink is None and output_format != "csv":
         _result_sink = ResultSink(_OutPath, CaseName, fmt=output_format)
+    if _result_sink is not None:
         set_active_sink(_result_sink)
     try:
         for _key, _fn, _extra_keys, _guard in OUTPUT_REGISTRY:
@@ -388,6 +477,10 @@ def openTEPES_run(DirName, CaseName, SolverName, pIndOutputResults, pIndLogConso
     with open(os.path.join(_OutPath, f'openTEPES_run_status_{CaseName}.json'), 'w') as _f:
         json.dump(status, _f, indent=2)
 
+    # the run is complete, so its checkpoints are no longer needed
+    if mTEPES.pCheckpoints is not None:
+        mTEPES.pCheckpoints.remove()
+
     # Close the DuckDB connection if we opened one.
     if _input_source is not None:
         _input_source.close()
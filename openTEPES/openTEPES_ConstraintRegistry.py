@@ -0,0 +1,90 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ConstraintRegistry — per-stage constraints indexed by (period, scenario, stage, family).
+
+The formulation modules build one constraint component per family and stage, named ``{family}_{p}_{sc}_{st}``. ``AddStageConstraint`` adds it
+to the model exactly as ``setattr`` did and records it in the ``ConstraintRegistry`` kept on the model (``OptModel.pConstraints``), so the stage
+drivers activate, deactivate and look up the constraints of a stage through a dictionary instead of matching the name of every constraint
+component of the model. Those name scans grew with the number of stages already formulated, which made a yearly run of weekly stages
+quadratic in the number of stages.
+
+A component removed from the model after it was registered (the Kirchhoff second-law constraints replaced by the cycle constraints) is
+skipped, and registering a family again for the same stage replaces the previous entry.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+
+
+class ConstraintRegistry:
+    """Constraint components of the model keyed by ``(p, sc, st)`` and family."""
+
+    def __init__(self):
+        # (p, sc, st) -> {family: component}, in formulation order
+        self._stages    = {}
+        # (p, sc) -> stages formulated, and st -> (p, sc) formulated, in formulation order
+        self._scenarios = defaultdict(list)
+        self._periods   = defaultdict(list)
+
+    def add(self, family, p, sc, st, constraint) -> None:
+        if (p,sc,st) not in self._stages:
+            self._stages   [p,sc,st] = {}
+            self._scenarios[p,sc   ].append(st)
+            self._periods  [      st].append((p,sc))
+        self._stages[p,sc,st][family] = constraint
+
+    def get(self, family, p, sc, st):
+        """The ``family`` component of stage ``(p, sc, st)``, or None if it was not formulated."""
+        constraint = self._stages.get((p,sc,st), {}).get(family)
+        return constraint if constraint is not None and constraint.parent_block() is not None else None
+
+    def stage(self, p, sc, st) -> list:
+        """The components of stage ``(p, sc, st)`` still on the model, in formulation order."""
+        return [constraint for constraint in self._stages.get((p,sc,st), {}).values() if constraint.parent_block() is not None]
+
+    def stages(self) -> list:
+        """The ``(p, sc, st)`` formulated, in formulation order."""
+        return list(self._stages)
+
+    def select(self, p=None, sc=None, st=None) -> list:
+        """The components of every stage matching the given period, scenario and stage (None matches any)."""
+        if p is not None and sc is not None:
+            keys = [(p,sc,st)] if st is not None else [(p,sc,stt) for stt in self._scenarios.get((p,sc), [])]
+        elif st is not None:
+            keys = [(pp,scc,st) for pp,scc in self._periods.get(st, []) if (p is None or pp == p) and (sc is None or scc == sc)]
+        else:
+            keys = [key for key in self._stages if (p is None or key[0] == p) and (sc is None or key[1] == sc)]
+        return [constraint for key in keys for constraint in self.stage(*key)]
+
+    def activate(self, p=None, sc=None, st=None) -> None:
+        for constraint in self.select(p, sc, st):
+            constraint.activate()
+
+    def deactivate(self, p=None, sc=None, st=None) -> None:
+        for constraint in self.select(p, sc, st):
+            constraint.deactivate()
+
+    def discard(self, p, sc, st) -> None:
+        """Forget stage ``(p, sc, st)``, so the registry no longer keeps its components alive."""
+        if self._stages.pop((p,sc,st), None) is not None:
+            self._scenarios[p,sc].remove(st)
+            self._periods  [st  ].remove((p,sc))
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+
+def StageConstraints(OptModel) -> ConstraintRegistry:
+    """The ``ConstraintRegistry`` of ``OptModel``, created on first use."""
+    registry = getattr(OptModel, 'pConstraints', None)
+    if registry is None:
+        registry = ConstraintRegistry()
+        OptModel.pConstraints = registry
+    return registry
+
+
+def AddStageConstraint(OptModel, family, p, sc, st, constraint) -> None:
+    """``setattr(OptModel, f'{family}_{p}_{sc}_{st}', constraint)``, recording the component in the registry of ``OptModel``."""
+    setattr(OptModel, f'{family}_{p}_{sc}_{st}', constraint)
+    StageConstraints(OptModel).add(family, p, sc, st, getattr(OptModel, f'{family}_{p}_{sc}_{st}'))
@@ -7,11 +7,52 @@ from __future__ import annotations
 
 import time
 import math
+import numpy         as np
 import pandas        as pd
 from   collections   import defaultdict
 from   pyomo.environ import Set, Param, Binary, NonNegativeReals, NonNegativeIntegers, PositiveReals, PositiveIntegers, Reals, UnitInterval, Any
 
 
+#%% set builders: the membership predicates of the derived sets are evaluated as boolean masks over the parameter Series, or once per key of a
+# cartesian product instead of once per tuple, and the members are handed to Set(initialize=...) as one list in the order of the product
+def _tuple(member) -> tuple:
+    return member if isinstance(member, tuple) else (member,)
+
+
+def _members(index, mask: pd.Series) -> list:
+    """Members of ``index``, in its order, whose entry in the boolean ``mask`` (a Series indexed by the members) is True."""
+    index = list(index)
+    if not index:
+        return []
+    return [member for member, keep in zip(index, mask.loc[index].to_numpy()) if keep]
+
+
+def _in_window(periods, index, PeriodIni: pd.Series, PeriodFin: pd.Series) -> list[tuple]:
+    """``(p, *member)`` of ``periods * index`` whose period lies in the ``[PeriodIni, PeriodFin]`` window of the member, in product order."""
+    periods, index = list(periods), list(index)
+    if not periods or not index:
+        return []
+    p    = np.array(periods)[:, None]
+    keep = (PeriodIni.loc[index].to_numpy() <= p) & (PeriodFin.loc[index].to_numpy() >= p)
+    return [(periods[i], *_tuple(index[j])) for i, j in zip(*np.nonzero(keep))]
+
+
+def _product(left, right, allowed=None, key: slice = slice(0, 1)) -> list[tuple]:
+    """``(*l, *r)`` of ``left * right`` whose ``(*l[key], *r)`` is in ``allowed`` (all of them if None), in product order.
+
+    The test runs once per distinct key of ``left`` (the period, say) and member of ``right``, not once per tuple of the product.
+    """
+    left    = [_tuple(l) for l in left ]
+    right   = [_tuple(r) for r in right]
+    allowed = None if allowed is None else {_tuple(a) for a in allowed}
+    kept    = {}
+    for l in left:
+        k = l[key]
+        if k not in kept:
+            kept[k] = right if allowed is None else [r for r in right if (*k, *r) in allowed]
+    return [(*l, *r) for l in left for r in kept[l[key]]]
+
+
 # @profile
 def DataConfiguration(mTEPES, dfs=None, par=None):
     """Build the derived sets and parameters on ``mTEPES``.
@@ -38,30 +79,34 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
     sBrList = list(dict.fromkeys(sBr))
 
     #%% defining subsets: active load levels (n,n2), thermal units (t), RES units (r), ESS units (es), candidate gen units (gc), candidate ESS units (ec), all the electric lines (la), candidate electric lines (lc), candidate DC electric lines (cd), existing DC electric lines (ed), electric lines with losses (ll), reference node (rf), and reactive generating units (gq)
-    mTEPES.p      = Set(doc='periods'                          , initialize=[pp     for pp   in mTEPES.pp  if par['pPeriodWeight']       [pp] >  0.0 and sum(par['pDuration'][pp,sc,n] for sc,n in mTEPES.scc*mTEPES.nn)])
+    # durations summed by period, by period and scenario, and by load level over the periods and scenarios kept
+    pDurationPeriod   = par['pDuration'].groupby(level=0).sum()
+    pDurationScenario = par['pDuration'].groupby(level=[0,1]).sum()
+    mTEPES.p      = Set(doc='periods'                          , initialize=_members(mTEPES.pp, (par['pPeriodWeight'] > 0.0) & (pDurationPeriod.reindex(par['pPeriodWeight'].index, fill_value=0) != 0)))
     mTEPES.sc     = Set(doc='scenarios'                        , initialize=[scc    for scc  in mTEPES.scc                                                  ])
-    mTEPES.ps     = Set(doc='periods/scenarios'                , initialize=[(p,sc) for p,sc in mTEPES.p*mTEPES.sc if par['pScenProb'] [p,sc] >  0.0 and sum(par['pDuration'][p,sc,n ] for    n in            mTEPES.nn)])
-    mTEPES.st     = Set(doc='stages'                           , initialize=[stt    for stt  in mTEPES.stt if par['pStageWeight']       [stt] >  0.0])
-    mTEPES.n      = Set(doc='load levels'                      , initialize=[nn     for nn   in mTEPES.nn  if sum(par['pDuration']  [p,sc,nn] for p,sc in mTEPES.ps) > 0])
-    mTEPES.n2     = Set(doc='load levels, alias of n'          , initialize=[nn     for nn   in mTEPES.nn  if sum(par['pDuration']  [p,sc,nn] for p,sc in mTEPES.ps) > 0])
+    mTEPES.ps     = Set(doc='periods/scenarios'                , initialize=_members(_product(mTEPES.p, mTEPES.sc), (par['pScenProb'] > 0.0) & (pDurationScenario.reindex(par['pScenProb'].index, fill_value=0) != 0)))
+    mTEPES.st     = Set(doc='stages'                           , initialize=_members(mTEPES.stt, par['pStageWeight'] > 0.0))
+    pDurationLevel    = par['pDuration'][par['pDuration'].index.droplevel(2).isin(list(mTEPES.ps))].groupby(level=2).sum().reindex(list(mTEPES.nn), fill_value=0)
+    mTEPES.n      = Set(doc='load levels'                      , initialize=_members(mTEPES.nn, pDurationLevel > 0))
+    mTEPES.n2     = Set(doc='load levels, alias of n'          , initialize=_members(mTEPES.nn, pDurationLevel > 0))
     # the generator-to-node membership test and the period bounds do not depend on gg: compute them once
     pGenHasNode  = par['pGenToNode'].reset_index().set_index(['Generator']).isin(mTEPES.nd)['Node']
     pFirstPeriod = mTEPES.p.first()
     pLastPeriod  = mTEPES.p.last()
-    mTEPES.g      = Set(doc='generating              units'    , initialize=[gg     for gg   in mTEPES.gg  if (par['pRatedMaxPowerElec'] [gg] >  0.0 or  par['pRatedMaxCharge'][gg] >  0.0   or  par['pRatedMaxPowerHeat']   [gg] >  0.0) and par['pElecGenPeriodIni'][gg] <= pLastPeriod and par['pElecGenPeriodFin'][gg] >= pFirstPeriod and pGenHasNode[gg]])  # excludes generators with empty node
-    mTEPES.tr     = Set(doc='thermal                 units'    , initialize=[g      for g    in mTEPES.g   if par['pRatedLinearOperCost'][g ] >  0.0])
-    mTEPES.re     = Set(doc='RES                     units'    , initialize=[g      for g    in mTEPES.g   if par['pRatedLinearOperCost'][g ] == 0.0 and par['pRatedMaxStorage'][g] == 0.0   and par['pProductionFunctionH2'      ][g ] == 0.0 and par['pProductionFunctionHeat'][g ] == 0.0  and par['pProductionFunctionHydro'][g ] == 0.0])
-    mTEPES.es     = Set(doc='ESS                     units'    , initialize=[g      for g    in mTEPES.g   if     (par['pRatedMaxCharge'][g ] >  0.0 or  par['pRatedMaxStorage'][g] >  0.0    or par['pProductionFunctionH2'      ][g ]  > 0.0  or par['pProductionFunctionHeat'][g ]  > 0.0) and par['pProductionFunctionHydro'][g ] == 0.0])
-    mTEPES.h      = Set(doc='hydro                   units'    , initialize=[g      for g    in mTEPES.g                                                                                      if par['pProductionFunctionH2'      ][g ] == 0.0 and par['pProductionFunctionHeat'][g ] == 0.0  and par['pProductionFunctionHydro'][g ]  > 0.0])
-    mTEPES.el     = Set(doc='electrolyzer            units'    , initialize=[es     for es   in mTEPES.es                                                                                     if par['pProductionFunctionH2'      ][es]  > 0.0 and par['pProductionFunctionHeat'][es] == 0.0  and par['pProductionFunctionHydro'][es] == 0.0])
-    mTEPES.hp     = Set(doc='heat pump & elec boiler units'    , initialize=[es     for es   in mTEPES.es                                                                                     if par['pProductionFunctionH2'      ][es] == 0.0 and par['pProductionFunctionHeat'][es]  > 0.0  and par['pProductionFunctionHydro'][es] == 0.0])
-    mTEPES.ch     = Set(doc='CHP       & fuel boiler units'    , initialize=[g      for g    in mTEPES.g   if                                            par['pRatedMaxPowerHeat'][g ] > 0.0 and par['pProductionFunctionHeat'    ][g ] == 0.0])
-    mTEPES.bo     = Set(doc='            fuel boiler units'    , initialize=[ch     for ch   in mTEPES.ch  if par['pRatedMaxPowerElec']  [ch] == 0.0 and par['pRatedMaxPowerHeat'][ch] > 0.0 and par['pProductionFunctionHeat'    ][ch] == 0.0])
-    mTEPES.hh     = Set(doc='        hydrogen boiler units'    , initialize=[bo     for bo   in mTEPES.bo                                                                                     if par['pProductionFunctionH2ToHeat'][bo] >  0.0])
-    mTEPES.gc     = Set(doc='candidate               units'    , initialize=[g      for g    in mTEPES.g   if par['pGenInvestCost']      [g ] >  0.0])
-    mTEPES.gd     = Set(doc='retirement              units'    , initialize=[g      for g    in mTEPES.g   if par['pGenRetireCost']      [g ] >  0.0])
-    mTEPES.ec     = Set(doc='candidate ESS           units'    , initialize=[es     for es   in mTEPES.es  if par['pGenInvestCost']      [es] >  0.0])
-    mTEPES.bc     = Set(doc='candidate boiler        units'    , initialize=[bo     for bo   in mTEPES.bo  if par['pGenInvestCost']      [bo] >  0.0])
+    mTEPES.g      = Set(doc='generating              units'    , initialize=_members(mTEPES.gg, ((par['pRatedMaxPowerElec'] >  0.0) | (par['pRatedMaxCharge'] >  0.0) | (par['pRatedMaxPowerHeat'] >  0.0)) & (par['pElecGenPeriodIni'] <= pLastPeriod) & (par['pElecGenPeriodFin'] >= pFirstPeriod) & pGenHasNode))  # excludes generators with empty node
+    mTEPES.tr     = Set(doc='thermal                 units'    , initialize=_members(mTEPES.g , (par['pRatedLinearOperCost'] >  0.0)))
+    mTEPES.re     = Set(doc='RES                     units'    , initialize=_members(mTEPES.g , (par['pRatedLinearOperCost'] == 0.0) & (par['pRatedMaxStorage'] == 0.0)   & (par['pProductionFunctionH2'      ] == 0.0) & (par['pProductionFunctionHeat'] == 0.0) & (par['pProductionFunctionHydro'] == 0.0)))
+    mTEPES.es     = Set(doc='ESS                     units'    , initialize=_members(mTEPES.g , ((par['pRatedMaxCharge'] >  0.0) | (par['pRatedMaxStorage'] >  0.0)  | (par['pProductionFunctionH2'      ]  > 0.0) | (par['pProductionFunctionHeat']  > 0.0)) & (par['pProductionFunctionHydro'] == 0.0)))
+    mTEPES.h      = Set(doc='hydro                   units'    , initialize=_members(mTEPES.g ,                                                                              (par['pProductionFunctionH2'      ] == 0.0) & (par['pProductionFunctionHeat'] == 0.0) & (par['pProductionFunctionHydro']  > 0.0)))
+    mTEPES.el     = Set(doc='electrolyzer            units'    , initialize=_members(mTEPES.es,                                                                              (par['pProductionFunctionH2'      ]  > 0.0) & (par['pProductionFunctionHeat'] == 0.0) & (par['pProductionFunctionHydro'] == 0.0)))
+    mTEPES.hp     = Set(doc='heat pump & elec boiler units'    , initialize=_members(mTEPES.es,                                                                              (par['pProductionFunctionH2'      ] == 0.0) & (par['pProductionFunctionHeat']  > 0.0) & (par['pProductionFunctionHydro'] == 0.0)))
+    mTEPES.ch     = Set(doc='CHP       & fuel boiler units'    , initialize=_members(mTEPES.g ,                                       (par['pRatedMaxPowerHeat'] > 0.0) & (par['pProductionFunctionHeat'    ] == 0.0)))
+    mTEPES.bo     = Set(doc='            fuel boiler units'    , initialize=_members(mTEPES.ch, (par['pRatedMaxPowerElec'] == 0.0) & (par['pRatedMaxPowerHeat'] > 0.0) & (par['pProductionFunctionHeat'    ] == 0.0)))
+    mTEPES.hh     = Set(doc='        hydrogen boiler units'    , initialize=_members(mTEPES.bo,                                                                              (par['pProductionFunctionH2ToHeat'] >  0.0)))
+    mTEPES.gc     = Set(doc='candidate               units'    , initialize=_members(mTEPES.g , (par['pGenInvestCost']       >  0.0)))
+    mTEPES.gd     = Set(doc='retirement              units'    , initialize=_members(mTEPES.g , (par['pGenRetireCost']       >  0.0)))
+    mTEPES.ec     = Set(doc='candidate ESS           units'    , initialize=_members(mTEPES.es, (par['pGenInvestCost']       >  0.0)))
+    mTEPES.bc     = Set(doc='candidate boiler        units'    , initialize=_members(mTEPES.bo, (par['pGenInvestCost']       >  0.0)))
     mTEPES.br     = Set(doc='all input       electric branches', initialize=sBrList        )
     mTEPES.ln     = Set(doc='all input       electric lines'   , initialize=dfs['dfNetwork'].index)
     # detect lines with undefined nodes or circuits
@@ -72,27 +117,27 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
             raise ValueError(f'### Line {ni} {nf} {cc} has equal initial and final nodes.')
     if len(mTEPES.ln) != len(dfs['dfNetwork'].index):
         raise ValueError('### Some electric lines are repeated in oT_Data_Network ', len(mTEPES.ln), len(dfs['dfNetwork'].index))
-    mTEPES.la     = Set(doc='all real        electric lines'   , initialize=[ln     for ln   in mTEPES.ln if par['pLineX']              [ln] != 0.0 and par['pLineNTCFrw'][ln] > 0.0 and par['pLineNTCBck'][ln] > 0.0 and par['pElecNetPeriodIni'][ln]  <= pLastPeriod and par['pElecNetPeriodFin'][ln]  >= pFirstPeriod])
-    mTEPES.ls     = Set(doc='all real switch electric lines'   , initialize=[la     for la   in mTEPES.la if par['pIndBinLineSwitch']   [la]       ])
-    mTEPES.lc     = Set(doc='candidate       electric lines'   , initialize=[la     for la   in mTEPES.la if par['pNetFixedCost']       [la] >  0.0])
-    mTEPES.cd     = Set(doc='candidate    DC electric lines'   , initialize=[la     for la   in mTEPES.la if par['pNetFixedCost']       [la] >  0.0 and par['pLineType'][la] == 'DC'])
-    mTEPES.ed     = Set(doc='existing     DC electric lines'   , initialize=[la     for la   in mTEPES.la if par['pNetFixedCost']       [la] == 0.0 and par['pLineType'][la] == 'DC'])
-    mTEPES.ll     = Set(doc='loss            electric lines'   , initialize=[la     for la   in mTEPES.la if par['pLineLossFactor']     [la] >  0.0 and par['pIndBinNetLosses'] > 0 ])
+    mTEPES.la     = Set(doc='all real        electric lines'   , initialize=_members(mTEPES.ln, (par['pLineX']              != 0.0) & (par['pLineNTCFrw'] > 0.0) & (par['pLineNTCBck'] > 0.0) & (par['pElecNetPeriodIni'] <= pLastPeriod) & (par['pElecNetPeriodFin'] >= pFirstPeriod)))
+    mTEPES.ls     = Set(doc='all real switch electric lines'   , initialize=_members(mTEPES.la, par['pIndBinLineSwitch'].map(bool)))
+    mTEPES.lc     = Set(doc='candidate       electric lines'   , initialize=_members(mTEPES.la, (par['pNetFixedCost']       >  0.0)))
+    mTEPES.cd     = Set(doc='candidate    DC electric lines'   , initialize=_members(mTEPES.la, (par['pNetFixedCost']       >  0.0) & (par['pLineType'] == 'DC')))
+    mTEPES.ed     = Set(doc='existing     DC electric lines'   , initialize=_members(mTEPES.la, (par['pNetFixedCost']       == 0.0) & (par['pLineType'] == 'DC')))
+    mTEPES.ll     = Set(doc='loss            electric lines'   , initialize=_members(mTEPES.la, (par['pLineLossFactor']     >  0.0) & (par['pIndBinNetLosses'] > 0)))
     mTEPES.rf     = Set(doc='reference node'                   , initialize=[par['pReferenceNode']])
-    mTEPES.gq     = Set(doc='gen    reactive units'            , initialize=[gg     for gg   in mTEPES.gg if par['pRMaxReactivePower']  [gg] >  0.0 and                                                            par['pElecGenPeriodIni'][gg]  <= pLastPeriod and par['pElecGenPeriodFin'][gg]  >= pFirstPeriod])
-    mTEPES.sq     = Set(doc='synchr reactive units'            , initialize=[gg     for gg   in mTEPES.gg if par['pRMaxReactivePower']  [gg] >  0.0 and par['pGenToTechnology'][gg] == 'SynchronousCondenser'  and par['pElecGenPeriodIni'][gg]  <= pLastPeriod and par['pElecGenPeriodFin'][gg]  >= pFirstPeriod])
+    mTEPES.gq     = Set(doc='gen    reactive units'            , initialize=_members(mTEPES.gg, (par['pRMaxReactivePower']  >  0.0) &                                                           (par['pElecGenPeriodIni'] <= pLastPeriod) & (par['pElecGenPeriodFin'] >= pFirstPeriod)))
+    mTEPES.sq     = Set(doc='synchr reactive units'            , initialize=_members(mTEPES.gg, (par['pRMaxReactivePower']  >  0.0) & (par['pGenToTechnology'] == 'SynchronousCondenser') & (par['pElecGenPeriodIni'] <= pLastPeriod) & (par['pElecGenPeriodFin'] >= pFirstPeriod)))
     mTEPES.sqc    = Set(doc='synchr reactive candidate')
     mTEPES.shc    = Set(doc='shunt           candidate')
     if par['pIndHydroTopology']:
-        mTEPES.rn = Set(doc='candidate reservoirs'             , initialize=[rs     for rs   in mTEPES.rs if par['pRsrInvestCost']      [rs] >  0.0 and                                                            par['pRsrPeriodIni'][rs]      <= pLastPeriod and par['pRsrPeriodFin'][rs]      >= pFirstPeriod])
+        mTEPES.rn = Set(doc='candidate reservoirs'             , initialize=_members(mTEPES.rs, (par['pRsrInvestCost']      >  0.0) &                                                           (par['pRsrPeriodIni']     <= pLastPeriod) & (par['pRsrPeriodFin']     >= pFirstPeriod)))
     else:
         mTEPES.rn = Set(doc='candidate reservoirs'             , initialize=[])
     if par['pIndHydrogen']:
         mTEPES.pn = Set(doc='all input hydrogen pipes'         , initialize=dfs['dfNetworkHydrogen'].index)
         if len(mTEPES.pn) != len(dfs['dfNetworkHydrogen'].index):
             raise ValueError('### Some hydrogen pipes are invalid ', len(mTEPES.pn), len(dfs['dfNetworkHydrogen'].index))
-        mTEPES.pa = Set(doc='all real  hydrogen pipes'         , initialize=[pn     for pn   in mTEPES.pn if par['pH2PipeNTCFrw']       [pn] >  0.0 and par['pH2PipeNTCBck'][pn] > 0.0 and                         par['pH2PipePeriodIni'][pn]   <= pLastPeriod and par['pH2PipePeriodFin'][pn]   >= pFirstPeriod])
-        mTEPES.pc = Set(doc='candidate hydrogen pipes'         , initialize=[pa     for pa   in mTEPES.pa if par['pH2PipeFixedCost']    [pa] >  0.0])
+        mTEPES.pa = Set(doc='all real  hydrogen pipes'         , initialize=_members(mTEPES.pn, (par['pH2PipeNTCFrw']       >  0.0) & (par['pH2PipeNTCBck'] > 0.0) &                       (par['pH2PipePeriodIni']  <= pLastPeriod) & (par['pH2PipePeriodFin']  >= pFirstPeriod)))
+        mTEPES.pc = Set(doc='candidate hydrogen pipes'         , initialize=_members(mTEPES.pa, (par['pH2PipeFixedCost']    >  0.0)))
         # existing hydrogen pipelines (pe)
         mTEPES.pe = mTEPES.pa - mTEPES.pc
     else:
@@ -105,8 +150,8 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
         mTEPES.hn = Set(doc='all input heat pipes'             , initialize=dfs['dfNetworkHeat'].index)
         if len(mTEPES.hn) != len(dfs['dfNetworkHeat'].index):
             raise ValueError('### Some heat pipes are invalid ', len(mTEPES.hn), len(dfs['dfNetworkHeat'].index))
-        mTEPES.ha = Set(doc='all real  heat pipes'             , initialize=[hn     for hn   in mTEPES.hn if par['pHeatPipeNTCFrw']     [hn] >  0.0 and par['pHeatPipeNTCBck'][hn] > 0.0 and par['pHeatPipePeriodIni'][hn] <= pLastPeriod and par['pHeatPipePeriodFin'][hn] >= pFirstPeriod])
-        mTEPES.hc = Set(doc='candidate heat pipes'             , initialize=[ha     for ha   in mTEPES.ha if par['pHeatPipeFixedCost']  [ha] >  0.0])
+        mTEPES.ha = Set(doc='all real  heat pipes'             , initialize=_members(mTEPES.hn, (par['pHeatPipeNTCFrw']     >  0.0) & (par['pHeatPipeNTCBck'] > 0.0) & (par['pHeatPipePeriodIni'] <= pLastPeriod) & (par['pHeatPipePeriodFin'] >= pFirstPeriod)))
+        mTEPES.hc = Set(doc='candidate heat pipes'             , initialize=_members(mTEPES.ha, (par['pHeatPipeFixedCost']  >  0.0)))
         # existing heat pipes (he)
         mTEPES.he = mTEPES.ha - mTEPES.hc
     else:
@@ -148,7 +193,7 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
     par['pStageToLevel'] = [(p,sc,st,n) for (p,sc,st),n in par['pStageToLevel'].items()]
     mTEPES.s2n = Set(initialize=par['pStageToLevel'], doc='Load level to stage')
     # all the stages must have the same duration
-    par['pStageDuration'] = pd.Series([sum(par['pDuration'][p,sc,n] for p,sc,st2,n in mTEPES.s2n if st2 == st) for st in mTEPES.st], index=mTEPES.st)
+    par['pStageDuration'] = pd.Series(par['pDuration'].loc[[(p,sc,n) for p,sc,st,n in mTEPES.s2n]].to_numpy(), index=[st for p,sc,st,n in mTEPES.s2n]).groupby(level=0).sum().reindex(list(mTEPES.st), fill_value=0)
     for st in mTEPES.st:
         if mTEPES.st.ord(st) > 1 and par['pStageDuration'][st] != par['pStageDuration'][mTEPES.st.prev(st)]:
             raise ValueError(f'### Stage {st} has a duration of {par["pStageDuration"][st]} h, different from the previous stage; all stages must have the same duration')
@@ -158,8 +203,8 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
     pZeroLevels = {n for p,sc,st,n in mTEPES.s2n if st in pZeroStages}
     mTEPES.del_component(mTEPES.n )
     mTEPES.del_component(mTEPES.n2)
-    mTEPES.n  = Set(doc='load levels'            , initialize=[nn for nn in mTEPES.nn if sum(par['pDuration'][p,sc,nn] for p,sc in mTEPES.ps) > 0 and nn not in pZeroLevels])
-    mTEPES.n2 = Set(doc='load levels, alias of n', initialize=[nn for nn in mTEPES.nn if sum(par['pDuration'][p,sc,nn] for p,sc in mTEPES.ps) > 0 and nn not in pZeroLevels])
+    mTEPES.n  = Set(doc='load levels'            , initialize=[nn for nn in _members(mTEPES.nn, pDurationLevel > 0) if nn not in pZeroLevels])
+    mTEPES.n2 = Set(doc='load levels, alias of n', initialize=[nn for nn in _members(mTEPES.nn, pDurationLevel > 0) if nn not in pZeroLevels])
 
 
     # @profile
@@ -175,89 +220,89 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
                 Returns:
                     None: Sets are added directly to the mTEPES object.
                 '''
-        mTEPES.pg        = Set(initialize = [(p,     g       ) for p,     g        in mTEPES.p  *mTEPES.g   if par['pElecGenPeriodIni'][g ] <= p and par['pElecGenPeriodFin'][g ] >= p])
-        mTEPES.ptr       = Set(initialize = [(p,     tr      ) for p,     tr       in mTEPES.p  *mTEPES.tr  if (p,tr)  in mTEPES.pg])
-        mTEPES.pgc       = Set(initialize = [(p,     gc      ) for p,     gc       in mTEPES.p  *mTEPES.gc  if (p,gc)  in mTEPES.pg])
-        mTEPES.pnr       = Set(initialize = [(p,     nr      ) for p,     nr       in mTEPES.p  *mTEPES.nr  if (p,nr)  in mTEPES.pg])
-        mTEPES.pch       = Set(initialize = [(p,     ch      ) for p,     ch       in mTEPES.p  *mTEPES.ch  if (p,ch)  in mTEPES.pg])
-        mTEPES.pchp      = Set(initialize = [(p,     chp     ) for p,     chp      in mTEPES.p  *mTEPES.chp if (p,chp) in mTEPES.pg])
-        mTEPES.pbo       = Set(initialize = [(p,     bo      ) for p,     bo       in mTEPES.p  *mTEPES.bo  if (p,bo)  in mTEPES.pg])
-        mTEPES.php       = Set(initialize = [(p,     hp      ) for p,     hp       in mTEPES.p  *mTEPES.hp  if (p,hp)  in mTEPES.pg])
-        mTEPES.phh       = Set(initialize = [(p,     hh      ) for p,     hh       in mTEPES.p  *mTEPES.hh  if (p,hh)  in mTEPES.pg])
-        mTEPES.pbc       = Set(initialize = [(p,     bc      ) for p,     bc       in mTEPES.p  *mTEPES.bc  if (p,bc)  in mTEPES.pg])
-        mTEPES.pgb       = Set(initialize = [(p,     gb      ) for p,     gb       in mTEPES.p  *mTEPES.gb  if (p,gb)  in mTEPES.pg])
-        mTEPES.peb       = Set(initialize = [(p,     eb      ) for p,     eb       in mTEPES.p  *mTEPES.eb  if (p,eb)  in mTEPES.pg])
-        mTEPES.pes       = Set(initialize = [(p,     es      ) for p,     es       in mTEPES.p  *mTEPES.es  if (p,es)  in mTEPES.pg])
-        mTEPES.pec       = Set(initialize = [(p,     ec      ) for p,     ec       in mTEPES.p  *mTEPES.ec  if (p,ec)  in mTEPES.pg])
-        mTEPES.peh       = Set(initialize = [(p,     eh      ) for p,     eh       in mTEPES.p  *mTEPES.eh  if (p,eh)  in mTEPES.pg])
-        mTEPES.pre       = Set(initialize = [(p,     re      ) for p,     re       in mTEPES.p  *mTEPES.re  if (p,re)  in mTEPES.pg])
-        mTEPES.ph        = Set(initialize = [(p,     h       ) for p,     h        in mTEPES.p  *mTEPES.h   if (p,h )  in mTEPES.pg])
-        mTEPES.pgd       = Set(initialize = [(p,     gd      ) for p,     gd       in mTEPES.p  *mTEPES.gd  if (p,gd)  in mTEPES.pg])
-        mTEPES.par       = Set(initialize = [(p,     ar      ) for p,     ar       in mTEPES.p  *mTEPES.ar                         ])
-        mTEPES.pla       = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.la  if par['pElecNetPeriodIni'][ni,nf,cc] <= p and par['pElecNetPeriodFin'][ni,nf,cc] >= p])
-        mTEPES.plc       = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.lc  if (p,ni,nf,cc) in mTEPES.pla])
-        mTEPES.pll       = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.ll  if (p,ni,nf,cc) in mTEPES.pla])
-
-        mTEPES.psg       = Set(initialize = [(p,sc,  g )       for p,sc,  g        in mTEPES.ps *mTEPES.g   if (p,g )  in mTEPES.pg  ])
-        mTEPES.psnr      = Set(initialize = [(p,sc,  nr)       for p,sc,  nr       in mTEPES.ps *mTEPES.nr  if (p,nr)  in mTEPES.pnr ])
-        mTEPES.pses      = Set(initialize = [(p,sc,  es)       for p,sc,  es       in mTEPES.ps *mTEPES.es  if (p,es)  in mTEPES.pes ])
-        mTEPES.pseh      = Set(initialize = [(p,sc,  eh)       for p,sc,  eh       in mTEPES.ps *mTEPES.eh  if (p,eh)  in mTEPES.peh ])
-        mTEPES.psn       = Set(initialize = [(p,sc,n   )       for p,sc,n          in mTEPES.ps *mTEPES.n   if par['pDuration'][p,sc,n]])
-        mTEPES.psng      = Set(initialize = [(p,sc,n,g )       for p,sc,n,g        in mTEPES.psn*mTEPES.g   if (p,g )  in mTEPES.pg  ])
-        mTEPES.psntr     = Set(initialize = [(p,sc,n,tr)       for p,sc,n,tr       in mTEPES.psn*mTEPES.tr  if (p,tr)  in mTEPES.ptr ])
-        mTEPES.psngc     = Set(initialize = [(p,sc,n,gc)       for p,sc,n,gc       in mTEPES.psn*mTEPES.gc  if (p,gc)  in mTEPES.pgc ])
-        mTEPES.psngb     = Set(initialize = [(p,sc,n,gb)       for p,sc,n,gb       in mTEPES.psn*mTEPES.gb  if (p,gb)  in mTEPES.pgc ])
-        mTEPES.psnre     = Set(initialize = [(p,sc,n,re)       for p,sc,n,re       in mTEPES.psn*mTEPES.re  if (p,re)  in mTEPES.pre ])
-        mTEPES.psnnr     = Set(initialize = [(p,sc,n,nr)       for p,sc,n,nr       in mTEPES.psn*mTEPES.nr  if (p,nr)  in mTEPES.pnr ])
-        mTEPES.psnch     = Set(initialize = [(p,sc,n,ch)       for p,sc,n,ch       in mTEPES.psn*mTEPES.ch  if (p,ch)  in mTEPES.pch ])
-        mTEPES.psnchp    = Set(initialize = [(p,sc,n,chp)      for p,sc,n,chp      in mTEPES.psn*mTEPES.chp if (p,chp) in mTEPES.pchp])
-        mTEPES.psnbo     = Set(initialize = [(p,sc,n,bo)       for p,sc,n,bo       in mTEPES.psn*mTEPES.bo  if (p,bo)  in mTEPES.pbo ])
-        mTEPES.psnhp     = Set(initialize = [(p,sc,n,hp)       for p,sc,n,hp       in mTEPES.psn*mTEPES.hp  if (p,hp)  in mTEPES.php ])
-        mTEPES.psneb     = Set(initialize = [(p,sc,n,eb)       for p,sc,n,eb       in mTEPES.psn*mTEPES.eb  if (p,eb)  in mTEPES.peb ])
-        mTEPES.psnes     = Set(initialize = [(p,sc,n,es)       for p,sc,n,es       in mTEPES.psn*mTEPES.es  if (p,es)  in mTEPES.pes ])
-        mTEPES.psneh     = Set(initialize = [(p,sc,n,eh)       for p,sc,n,eh       in mTEPES.psn*mTEPES.eh  if (p,eh)  in mTEPES.peh ])
-        mTEPES.psnel     = Set(initialize = [(p,sc,n,el)       for p,sc,n,el       in mTEPES.psn*mTEPES.el  if (p,el)  in mTEPES.peh ])
-        mTEPES.psnec     = Set(initialize = [(p,sc,n,ec)       for p,sc,n,ec       in mTEPES.psn*mTEPES.ec  if (p,ec)  in mTEPES.pec ])
-        mTEPES.psnnd     = Set(initialize = [(p,sc,n,nd)       for p,sc,n,nd       in mTEPES.psn*mTEPES.nd                           ])
-        mTEPES.psnar     = Set(initialize = [(p,sc,n,ar)       for p,sc,n,ar       in mTEPES.psn*mTEPES.ar                           ])
-
-        mTEPES.psnla     = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.la if (p,ni,nf,cc) in mTEPES.pla])
-        mTEPES.psnle     = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.le if (p,ni,nf,cc) in mTEPES.pla])
-        mTEPES.psnll     = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.ll if (p,ni,nf,cc) in mTEPES.pll])
-        mTEPES.psnls     = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.ls if (p,ni,nf,cc) in mTEPES.pla])
-
-        mTEPES.psnehc    = Set(initialize = [(p,sc,n,eh)       for p,sc,n,eh       in mTEPES.psneh         if par['pRatedMaxCharge'][eh] > 0.0])
+        mTEPES.pg        = Set(initialize = _in_window(mTEPES.p,  mTEPES.g,   par['pElecGenPeriodIni'], par['pElecGenPeriodFin']))
+        mTEPES.ptr       = Set(initialize = _product  (mTEPES.p,  mTEPES.tr,  mTEPES.pg  ))
+        mTEPES.pgc       = Set(initialize = _product  (mTEPES.p,  mTEPES.gc,  mTEPES.pg  ))
+        mTEPES.pnr       = Set(initialize = _product  (mTEPES.p,  mTEPES.nr,  mTEPES.pg  ))
+        mTEPES.pch       = Set(initialize = _product  (mTEPES.p,  mTEPES.ch,  mTEPES.pg  ))
+        mTEPES.pchp      = Set(initialize = _product  (mTEPES.p,  mTEPES.chp, mTEPES.pg  ))
+        mTEPES.pbo       = Set(initialize = _product  (mTEPES.p,  mTEPES.bo,  mTEPES.pg  ))
+        mTEPES.php       = Set(initialize = _product  (mTEPES.p,  mTEPES.hp,  mTEPES.pg  ))
+        mTEPES.phh       = Set(initialize = _product  (mTEPES.p,  mTEPES.hh,  mTEPES.pg  ))
+        mTEPES.pbc       = Set(initialize = _product  (mTEPES.p,  mTEPES.bc,  mTEPES.pg  ))
+        mTEPES.pgb       = Set(initialize = _product  (mTEPES.p,  mTEPES.gb,  mTEPES.pg  ))
+        mTEPES.peb       = Set(initialize = _product  (mTEPES.p,  mTEPES.eb,  mTEPES.pg  ))
+        mTEPES.pes       = Set(initialize = _product  (mTEPES.p,  mTEPES.es,  mTEPES.pg  ))
+        mTEPES.pec       = Set(initialize = _product  (mTEPES.p,  mTEPES.ec,  mTEPES.pg  ))
+        mTEPES.peh       = Set(initialize = _product  (mTEPES.p,  mTEPES.eh,  mTEPES.pg  ))
+        mTEPES.pre       = Set(initialize = _product  (mTEPES.p,  mTEPES.re,  mTEPES.pg  ))
+        mTEPES.ph        = Set(initialize = _product  (mTEPES.p,  mTEPES.h,   mTEPES.pg  ))
+        mTEPES.pgd       = Set(initialize = _product  (mTEPES.p,  mTEPES.gd,  mTEPES.pg  ))
+        mTEPES.par       = Set(initialize = _product  (mTEPES.p,  mTEPES.ar              ))
+        mTEPES.pla       = Set(initialize = _in_window(mTEPES.p,  mTEPES.la,  par['pElecNetPeriodIni'], par['pElecNetPeriodFin']))
+        mTEPES.plc       = Set(initialize = _product  (mTEPES.p,  mTEPES.lc,  mTEPES.pla ))
+        mTEPES.pll       = Set(initialize = _product  (mTEPES.p,  mTEPES.ll,  mTEPES.pla ))
+
+        mTEPES.psg       = Set(initialize = _product  (mTEPES.ps, mTEPES.g,   mTEPES.pg  ))
+        mTEPES.psnr      = Set(initialize = _product  (mTEPES.ps, mTEPES.nr,  mTEPES.pnr ))
+        mTEPES.pses      = Set(initialize = _product  (mTEPES.ps, mTEPES.es,  mTEPES.pes ))
+        mTEPES.pseh      = Set(initialize = _product  (mTEPES.ps, mTEPES.eh,  mTEPES.peh ))
+        mTEPES.psn       = Set(initialize = _members  (_product(mTEPES.ps, mTEPES.n), par['pDuration'] != 0))
+        mTEPES.psng      = Set(initialize = _product  (mTEPES.psn, mTEPES.g,   mTEPES.pg  ))
+        mTEPES.psntr     = Set(initialize = _product  (mTEPES.psn, mTEPES.tr,  mTEPES.ptr ))
+        mTEPES.psngc     = Set(initialize = _product  (mTEPES.psn, mTEPES.gc,  mTEPES.pgc ))
+        mTEPES.psngb     = Set(initialize = _product  (mTEPES.psn, mTEPES.gb,  mTEPES.pgc ))
+        mTEPES.psnre     = Set(initialize = _product  (mTEPES.psn, mTEPES.re,  mTEPES.pre ))
+        mTEPES.psnnr     = Set(initialize = _product  (mTEPES.psn, mTEPES.nr,  mTEPES.pnr ))
+        mTEPES.psnch     = Set(initialize = _product  (mTEPES.psn, mTEPES.ch,  mTEPES.pch ))
+        mTEPES.psnchp    = Set(initialize = _product  (mTEPES.psn, mTEPES.chp, mTEPES.pchp))
+        mTEPES.psnbo     = Set(initialize = _product  (mTEPES.psn, mTEPES.bo,  mTEPES.pbo ))
+        mTEPES.psnhp     = Set(initialize = _product  (mTEPES.psn, mTEPES.hp,  mTEPES.php ))
+        mTEPES.psneb     = Set(initialize = _product  (mTEPES.psn, mTEPES.eb,  mTEPES.peb ))
+        mTEPES.psnes     = Set(initialize = _product  (mTEPES.psn, mTEPES.es,  mTEPES.pes ))
+        mTEPES.psneh     = Set(initialize = _product  (mTEPES.psn, mTEPES.eh,  mTEPES.peh ))
+        mTEPES.psnel     = Set(initialize = _product  (mTEPES.psn, mTEPES.el,  mTEPES.peh ))
+        mTEPES.psnec     = Set(initialize = _product  (mTEPES.psn, mTEPES.ec,  mTEPES.pec ))
+        mTEPES.psnnd     = Set(initialize = _product  (mTEPES.psn, mTEPES.nd              ))
+        mTEPES.psnar     = Set(initialize = _product  (mTEPES.psn, mTEPES.ar              ))
+
+        mTEPES.psnla     = Set(initialize = _product  (mTEPES.psn, mTEPES.la,  mTEPES.pla ))
+        mTEPES.psnle     = Set(initialize = _product  (mTEPES.psn, mTEPES.le,  mTEPES.pla ))
+        mTEPES.psnll     = Set(initialize = _product  (mTEPES.psn, mTEPES.ll,  mTEPES.pll ))
+        mTEPES.psnls     = Set(initialize = _product  (mTEPES.psn, mTEPES.ls,  mTEPES.pla ))
+
+        mTEPES.psnehc    = Set(initialize = _product  (mTEPES.psn, _members(mTEPES.eh, par['pRatedMaxCharge'] > 0.0), mTEPES.peh))
 
         if pIndHydroTopology:
-            mTEPES.prs   = Set(initialize = [(p,     rs)       for p,     rs       in mTEPES.p  *mTEPES.rs if par['pRsrPeriodIni'][rs] <= p and par['pRsrPeriodFin'][rs] >= p])
-            mTEPES.prc   = Set(initialize = [(p,     rc)       for p,     rc       in mTEPES.p  *mTEPES.rn if (p,rc) in mTEPES.prs])
-            mTEPES.psrs  = Set(initialize = [(p,sc,  rs)       for p,sc,  rs       in mTEPES.ps *mTEPES.rs if (p,rs) in mTEPES.prs])
-            mTEPES.psnh  = Set(initialize = [(p,sc,n,h )       for p,sc,n,h        in mTEPES.psn*mTEPES.h  if (p,h ) in mTEPES.ph ])
-            mTEPES.psnrs = Set(initialize = [(p,sc,n,rs)       for p,sc,n,rs       in mTEPES.psn*mTEPES.rs if (p,rs) in mTEPES.prs])
-            mTEPES.psnrc = Set(initialize = [(p,sc,n,rc)       for p,sc,n,rc       in mTEPES.psn*mTEPES.rn if (p,rc) in mTEPES.prc])
+            mTEPES.prs   = Set(initialize = _in_window(mTEPES.p,   mTEPES.rs, par['pRsrPeriodIni'], par['pRsrPeriodFin']))
+            mTEPES.prc   = Set(initialize = _product  (mTEPES.p,   mTEPES.rn, mTEPES.prs))
+            mTEPES.psrs  = Set(initialize = _product  (mTEPES.ps,  mTEPES.rs, mTEPES.prs))
+            mTEPES.psnh  = Set(initialize = _product  (mTEPES.psn, mTEPES.h,  mTEPES.ph ))
+            mTEPES.psnrs = Set(initialize = _product  (mTEPES.psn, mTEPES.rs, mTEPES.prs))
+            mTEPES.psnrc = Set(initialize = _product  (mTEPES.psn, mTEPES.rn, mTEPES.prc))
         else:
             mTEPES.prc   = []
 
         if pIndHydrogen:
-            mTEPES.ppa   = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.pa if par['pH2PipePeriodIni'][ni,nf,cc] <= p and par['pH2PipePeriodFin'][ni,nf,cc] >= p])
-            mTEPES.ppc   = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.pc if (p,ni,nf,cc) in mTEPES.ppa])
-            mTEPES.psnpn = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.pn if (p,ni,nf,cc) in mTEPES.ppa])
-            mTEPES.psnpa = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.pa if (p,ni,nf,cc) in mTEPES.ppa])
-            mTEPES.psnpe = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.pe if (p,ni,nf,cc) in mTEPES.ppa])
+            mTEPES.ppa   = Set(initialize = _in_window(mTEPES.p,   mTEPES.pa, par['pH2PipePeriodIni'], par['pH2PipePeriodFin']))
+            mTEPES.ppc   = Set(initialize = _product  (mTEPES.p,   mTEPES.pc, mTEPES.ppa))
+            mTEPES.psnpn = Set(initialize = _product  (mTEPES.psn, mTEPES.pn, mTEPES.ppa))
+            mTEPES.psnpa = Set(initialize = _product  (mTEPES.psn, mTEPES.pa, mTEPES.ppa))
+            mTEPES.psnpe = Set(initialize = _product  (mTEPES.psn, mTEPES.pe, mTEPES.ppa))
         else:
             mTEPES.ppc   = Set(initialize = [])
 
         if pIndHeat:
-            mTEPES.pha   = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.ha if par['pHeatPipePeriodIni'][ni,nf,cc] <= p and par['pHeatPipePeriodFin'][ni,nf,cc] >= p])
-            mTEPES.phc   = Set(initialize = [(p,     ni,nf,cc) for p,     ni,nf,cc in mTEPES.p  *mTEPES.hc if (p,ni,nf,cc) in mTEPES.pha])
-            mTEPES.psnhn = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.hn if (p,ni,nf,cc) in mTEPES.pha])
-            mTEPES.psnha = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.ha if (p,ni,nf,cc) in mTEPES.pha])
-            mTEPES.psnhe = Set(initialize = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in mTEPES.psn*mTEPES.he if (p,ni,nf,cc) in mTEPES.pha])
+            mTEPES.pha   = Set(initialize = _in_window(mTEPES.p,   mTEPES.ha, par['pHeatPipePeriodIni'], par['pHeatPipePeriodFin']))
+            mTEPES.phc   = Set(initialize = _product  (mTEPES.p,   mTEPES.hc, mTEPES.pha))
+            mTEPES.psnhn = Set(initialize = _product  (mTEPES.psn, mTEPES.hn, mTEPES.pha))
+            mTEPES.psnha = Set(initialize = _product  (mTEPES.psn, mTEPES.ha, mTEPES.pha))
+            mTEPES.psnhe = Set(initialize = _product  (mTEPES.psn, mTEPES.he, mTEPES.pha))
         else:
             mTEPES.phc   = Set(initialize = [])
 
         if pIndPTDF:
-            mTEPES.psnland = Set(initialize = [(p,sc,n,ni,nf,cc,nd) for p,sc,n,ni,nf,cc,nd in mTEPES.psnla*mTEPES.nd if (ni,nf,cc,nd) in par['pVariablePTDF'].columns])
+            mTEPES.psnland = Set(initialize = _product(mTEPES.psnla, mTEPES.nd, par['pVariablePTDF'].columns, key=slice(3, 6)))
 
         # assigning a node to an area
         mTEPES.ndar = Set(initialize = [(nd,ar) for nd,zn,ar in mTEPES.ndzn*mTEPES.ar if (zn,ar) in mTEPES.znar])
@@ -399,12 +444,13 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
         mTEPES.pset  = Set(initialize=[(p,sc,  et) for p,sc,  et in mTEPES.ps *mTEPES.et   if len([eh for eh in mTEPES.eh if eh in g2t[et] and (p,eh) in mTEPES.peh])])
         mTEPES.psrt  = Set(initialize=[(p,sc,  rt) for p,sc,  rt in mTEPES.ps *mTEPES.rt   if len([re for re in mTEPES.re if re in g2t[rt] and (p,re) in mTEPES.pre])])
         mTEPES.psnt  = Set(initialize=[(p,sc,  nt) for p,sc,  nt in mTEPES.ps *mTEPES.nt   if len([nr for nr in mTEPES.nr if nr in g2t[nt] and (p,nr) in mTEPES.pnr])])
-        mTEPES.psngt = Set(initialize=[(p,sc,n,gt) for p,sc,n,gt in mTEPES.psn*mTEPES.gt   if (p,sc,  gt) in mTEPES.psgt ])
-        mTEPES.psnot = Set(initialize=[(p,sc,n,ot) for p,sc,n,ot in mTEPES.psn*mTEPES.ot   if (p,sc,n,ot) in mTEPES.psngt])
-        mTEPES.psnht = Set(initialize=[(p,sc,n,ht) for p,sc,n,ht in mTEPES.psn*mTEPES.ht   if (p,sc,n,ht) in mTEPES.psngt])
-        mTEPES.psnet = Set(initialize=[(p,sc,n,et) for p,sc,n,et in mTEPES.psn*mTEPES.et   if (p,sc,n,et) in mTEPES.psngt])
-        mTEPES.psnrt = Set(initialize=[(p,sc,n,rt) for p,sc,n,rt in mTEPES.psn*mTEPES.rt   if (p,sc,n,rt) in mTEPES.psngt])
-        mTEPES.psnnt = Set(initialize=[(p,sc,n,nt) for p,sc,n,nt in mTEPES.psn*mTEPES.nt   if (p,sc,n,nt) in mTEPES.psngt])
+        # (p,sc,n,gt) is in psngt when (p,sc,gt) is in psgt, so the technologies of a load level are looked up by period and scenario
+        mTEPES.psngt = Set(initialize=_product(mTEPES.psn, mTEPES.gt, mTEPES.psgt, key=slice(0, 2)))
+        mTEPES.psnot = Set(initialize=_product(mTEPES.psn, mTEPES.ot, mTEPES.psgt, key=slice(0, 2)))
+        mTEPES.psnht = Set(initialize=_product(mTEPES.psn, mTEPES.ht, mTEPES.psgt, key=slice(0, 2)))
+        mTEPES.psnet = Set(initialize=_product(mTEPES.psn, mTEPES.et, mTEPES.psgt, key=slice(0, 2)))
+        mTEPES.psnrt = Set(initialize=_product(mTEPES.psn, mTEPES.rt, mTEPES.psgt, key=slice(0, 2)))
+        mTEPES.psnnt = Set(initialize=_product(mTEPES.psn, mTEPES.nt, mTEPES.psgt, key=slice(0, 2)))
 
     Create_ESS_RES_Sets(mTEPES)
 
@@ -861,8 +907,8 @@ def DataConfiguration(mTEPES, dfs=None, par=None):
     par['pNetUpInvest']             = par['pNetUpInvest'].loc     [mTEPES.lc]
     par['pLineLossFactor']          = par['pLineLossFactor'].loc  [mTEPES.ll]
 
-    par['pMaxNTCFrw'] = pd.DataFrame([[par['pLineNTCFrw'][la] for la in mTEPES.la] for p,sc,n in mTEPES.psn], index=mTEPES.psn, columns=mTEPES.la)
-    par['pMaxNTCBck'] = pd.DataFrame([[par['pLineNTCBck'][la] for la in mTEPES.la] for p,sc,n in mTEPES.psn], index=mTEPES.psn, columns=mTEPES.la)
+    par['pMaxNTCFrw'] = pd.DataFrame(np.tile(par['pLineNTCFrw'].loc[list(mTEPES.la)].to_numpy(), (len(mTEPES.psn),1)), index=mTEPES.psn, columns=mTEPES.la)
+    par['pMaxNTCBck'] = pd.DataFrame(np.tile(par['pLineNTCBck'].loc[list(mTEPES.la)].to_numpy(), (len(mTEPES.psn),1)), index=mTEPES.psn, columns=mTEPES.la)
     if par['pIndVarTTC']:
         par['pMaxNTCFrw'] = par['pVariableNTCFrw'].replace(0.0, par['pLineNTCFrw'])
         par['pMaxNTCBck'] = par['pVariableNTCBck'].replace(0.0, par['pLineNTCBck'])
@@ -0,0 +1,194 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_InfeasibilityCheck — pre-solve screening of the case data for infeasibilities.
+
+``DetectInfeasibilities`` runs at the end of ``SettingUpVariables``. It evaluates every check over the whole case and raises a single
+``ValueError`` that lists all the violations found, so a case with several inconsistent units is corrected in one pass instead of one rerun
+per error. Each parameter is read once into numpy rows over (period, scenario) and the load levels of ``n2``. The windowed sums of the ESS
+inventory and unit minimum energy checks are then differences of cumulative sums, linear in the load levels, instead of a Pyomo lookup per
+term of every window.
+
+Cumulative and numpy sums round differently from the sequential sums the checks are defined with, so the arrays only pick the candidates,
+with a margin well above that rounding. Each candidate is confirmed with the sequential sum of the same terms in the same order before it
+is reported, so the verdict is exactly the one the term-by-term check gives.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+
+import numpy as np
+
+# relative margin of the vectorized screening; cumulative sums of a year of load levels are off by far less than this
+_SCREEN_RTOL = 1e-9
+
+
+def _rows(values: dict, ps, n2list, unit=None) -> dict:
+    """``{(p,sc): array}`` of ``values[p,sc,n2(,unit)]`` over ``n2list``, 0.0 where a load level has no entry."""
+    key = (lambda p, sc, n2: (p,sc,n2)) if unit is None else (lambda p, sc, n2: (p,sc,n2,unit))
+    return {(p,sc): np.fromiter((values.get(key(p,sc,n2), 0.0) for n2 in n2list), dtype=float, count=len(n2list)) for p,sc in ps}
+
+
+def _window_violations(terms: np.ndarray, ends: np.ndarray, steps: int, base: np.ndarray, bound: np.ndarray) -> list[tuple[int, float]]:
+    """``(k, lhs)`` for each ``k`` with ``lhs = base[k] + sum(terms[ends[k]-steps:ends[k]]) < bound[k]``.
+
+    The window sums are screened as differences of the cumulative sum of ``terms`` and every candidate is confirmed term by term.
+    """
+    cumulative = np.concatenate(([0.0], np.cumsum(terms)))
+    lhs        = base + cumulative[ends] - cumulative[ends-steps]
+    margin     = _SCREEN_RTOL * (np.abs(terms).sum() + np.abs(base) + np.abs(bound))
+    found      = []
+    for k in np.flatnonzero(lhs < bound + margin):
+        exact = base[k] + sum(terms[ends[k]-steps:ends[k]].tolist())
+        if exact < bound[k]:
+            found.append((int(k), exact))
+    return found
+
+
+def _total_below(terms: np.ndarray, bound: float) -> float | None:
+    """``sum(terms)`` when it is lower than ``bound``, else None; screened with the numpy sum and confirmed with the sequential one."""
+    if terms.sum() >= bound + _SCREEN_RTOL * (np.abs(terms).sum() + abs(bound)):
+        return None
+    exact = sum(terms.tolist())
+    return exact if exact < bound else None
+
+
+# @profile
+def DetectInfeasibilities(mTEPES) -> None:
+    '''
+    Detect model infeasibilities.
+
+    This function takes an mTEPES instance and checks for different infeasibilities.
+
+    Parameters:
+        mTEPES: The instance of mTEPES.
+
+    Returns:
+        None: Raises a ValueError listing every infeasibility found.
+    '''
+
+    if len(mTEPES.p ) == 0:
+        raise ValueError('### No active periods in the case study'  )
+    if len(mTEPES.sc) == 0:
+        raise ValueError('### No active scenarios in the case study')
+    if len(mTEPES.st) == 0:
+        raise ValueError('### No active stages in the case study'   )
+
+    violations = []
+
+    # detecting infeasibility: sum of scenario probabilities must be 1 in each period
+    # tolerance to consider 0 the difference between parameters
+    pEpsilon = 1e-6
+    for p in mTEPES.p:
+        if abs(sum(mTEPES.pScenProb[p,sc]() for sc in mTEPES.sc if (p,sc) in mTEPES.ps)-1.0) > pEpsilon:
+            violations.append(f'Sum of scenario probabilities different from 1 in period {p}')
+
+    ps       = list(mTEPES.ps)
+    n2list   = list(mTEPES.n2)
+    # position of each load level in mTEPES.n (mTEPES.n.ord), the end of the window of load levels of n2list checked at it
+    nOrd     = {n: i for i, n in enumerate(mTEPES.n, 1)}
+    nList    = list(mTEPES.n)
+    Duration = _rows(mTEPES.pDuration.extract_values(), ps, n2list)
+
+    MaxPower = mTEPES.pMaxPowerElec.extract_values()
+
+    # ESS rows over the periods and scenarios where the unit exists
+    EssRows = {}
+    if len(mTEPES.es):
+        MinPower  = mTEPES.pMinPowerElec.extract_values()
+        MaxCharge = mTEPES.pMaxCharge.extract_values()
+        Inflows   = mTEPES.pEnergyInflows.extract_values()
+        Outflows  = mTEPES.pEnergyOutflows.extract_values()
+        MaxStor   = mTEPES.pMaxStorage.extract_values()
+        for es in mTEPES.es:
+            psEs = [(p,sc) for p,sc in ps if (p,es) in mTEPES.pes]
+            if psEs:
+                EssRows[es] = psEs, {name: _rows(values, psEs, n2list, es) for name, values in (('MinPower', MinPower), ('MaxPower', MaxPower), ('MaxCharge', MaxCharge),
+                                                                                             ('Inflows',  Inflows ), ('Outflows', Outflows), ('MaxStor',   MaxStor  ))}
+
+    # detecting infeasibility: total min ESS output greater than total inflows, total max ESS charge lower than total outflows, or no storage capacity for charging
+    for es, (psEs, rows) in EssRows.items():
+        pMinOutput, pInflows, pMaxCharge, pOutflows, pMaxPower, pMaxStor = (np.concatenate([rows[name][p,sc] for p,sc in psEs]) for name in ('MinPower', 'Inflows', 'MaxCharge', 'Outflows', 'MaxPower', 'MaxStor'))
+        if pMinOutput.sum() - pInflows.sum() > -_SCREEN_RTOL * (np.abs(pMinOutput).sum() + np.abs(pInflows).sum()):
+            excess = sum(pMinOutput.tolist()) - sum(pInflows.tolist())
+            if excess > 0.0:
+                violations.append(f'Total minimum output greater than total inflows for ESS unit {es} by {excess} GWh')
+        if pMaxCharge.sum() - pOutflows.sum() < _SCREEN_RTOL * (np.abs(pMaxCharge).sum() + np.abs(pOutflows).sum()):
+            excess = sum(pMaxCharge.tolist()) - sum(pOutflows.tolist())
+            if excess < 0.0:
+                violations.append(f'Total maximum charge lower than total outflows for ESS unit {es} by {excess} GWh')
+        if pMaxCharge.max() and pMaxPower.max() and pMaxStor.max() == 0.0:
+            violations.append(f'This ESS unit has no storage capacity for charging {es} {sum(pMaxCharge.tolist())} MW {sum(pMaxStor.tolist())} GWh')
+
+    # detect inventory infeasibility: the inventory at the end of each cycle, starting from the initial or the previous cycle maximum inventory,
+    # with minimum output and maximum charge over the cycle must reach the minimum storage
+    nesc = defaultdict(list)
+    for n,es in mTEPES.nesc:
+        nesc[es].append(n)
+    for es, (psEs, rows) in EssRows.items():
+        ts   = mTEPES.pStorageTimeStep[es]
+        ends = [n for n in nesc[es] if nOrd[n] >= ts]
+        for p,sc in psEs:
+            levels = [n for n in ends if mTEPES.pMaxCapacity[p,sc,n,es]]
+            if not levels:
+                continue
+            terms = Duration[p,sc]*(rows['Inflows'][p,sc] - rows['MinPower'][p,sc] + mTEPES.pEfficiency[es]*rows['MaxCharge'][p,sc])
+            ords  = np.array([nOrd[n] for n in levels])
+            base  = np.array([mTEPES.pIniInventory[p,sc,n,es]() if nOrd[n] == ts else mTEPES.pMaxStorage[p,sc,nList[nOrd[n]-ts-1],es]() for n in levels])
+            bound = np.array([mTEPES.pMinStorage[p,sc,n,es] for n in levels])
+            for k, lhs in _window_violations(terms, ords, ts, base, bound):
+                violations.append(f'Inventory equation violation {p} {sc} {levels[k]} {es} {lhs} {bound[k]}')
+
+    # detect minimum energy infeasibility
+    gm = set(mTEPES.gm)
+    if gm:
+        MinEnergy = mTEPES.pMinEnergy.extract_values()
+        ngen      = defaultdict(list)
+        for n,g in mTEPES.ngen:
+            ngen[g].append(n)
+        for g in mTEPES.g:
+            psG = [(p,sc) for p,sc in ps if (p,sc,g) in gm and (p,g) in mTEPES.pg]
+            if not psG or not ngen[g]:
+                continue
+            ts   = mTEPES.pEnergyTimeStep[g]
+            ords = np.array([nOrd[n] for n in ngen[g]])
+            zero = np.zeros(len(ords))
+            MaxPowerG, MinEnergyG = _rows(MaxPower, psG, n2list, g), _rows(MinEnergy, psG, n2list, g)
+            for p,sc in psG:
+                for k, lhs in _window_violations((MaxPowerG[p,sc] - MinEnergyG[p,sc])*Duration[p,sc], ords, ts, zero, zero):
+                    violations.append(f'Minimum energy violation {p} {sc} {ngen[g][k]} {g} {lhs}')
+
+    # detecting infeasibility: no capacity in the transmission network
+    if sum(mTEPES.pLineNTCMax[:,:,:]) == 0.0:
+        violations.append('There is no capacity in the network. All the lines have NTC zero probably due to security factor equal to zero')
+
+    # detecting reserve margin infeasibility
+    # units and nodes of each area as lists in the order of a2g and ndar, so the sums add their terms in the order of the original check
+    g2a = defaultdict(list)
+    for ar,g in mTEPES.a2g:
+        g2a[ar].append(g)
+    for p,ar in mTEPES.p*mTEPES.ar:
+        pFirmCapacity = sum(mTEPES.pRatedMaxPowerElec[g] * mTEPES.pAvailability[g]() / (1.0-mTEPES.pEFOR[g]()) for g in g2a[ar] if (p,g) in mTEPES.pg)
+        if pFirmCapacity < mTEPES.pDemandElecPeak[p,ar] * mTEPES.pReserveMargin[p,ar]():
+            violations.append(f'Electricity reserve margin infeasibility {p} {ar} {pFirmCapacity} {mTEPES.pDemandElecPeak[p,ar] * mTEPES.pReserveMargin[p,ar]()}')
+
+        if mTEPES.pIndHeat():
+            pFirmCapacity = sum(mTEPES.pRatedMaxPowerHeat[g] * mTEPES.pAvailability[g]() / (1.0-mTEPES.pEFOR[g]()) for g in g2a[ar] if (p,g) in mTEPES.pg)
+            if pFirmCapacity < mTEPES.pDemandHeatPeak[p,ar] * mTEPES.pReserveMarginHeat[p,ar]:
+                violations.append(f'Heat reserve margin infeasibility {p} {ar} {pFirmCapacity} {mTEPES.pDemandHeatPeak[p,ar] * mTEPES.pReserveMarginHeat[p,ar]}')
+
+    # detecting infeasibility: minimum renewable energy requirement greater than the demand of the area
+    d2a = defaultdict(list)
+    for nd,ar in mTEPES.ndar:
+        d2a[ar].append(nd)
+    Demand            = mTEPES.pDemandElec.extract_values()
+    LoadLevelDuration = mTEPES.pLoadLevelDuration.extract_values()
+    for p,sc,ar in mTEPES.ps*mTEPES.ar:
+        pRESEnergy = mTEPES.pRESEnergy[p,ar]()
+        # the energy demand of the area, term by term in the order of the original check (load level, then node)
+        terms = np.array([Demand[p,sc,n,nd]*LoadLevelDuration[p,sc,n] for n in nList for nd in d2a[ar] if (p,sc,n,nd) in Demand])
+        if _total_below(terms, pRESEnergy) is not None:
+            violations.append(f'Minimum renewable energy requirement exceeds the demand {p} {sc} {ar} {pRESEnergy} {sum(Demand[p,sc,n,nd] for n in nList for nd in d2a[ar] if (p,sc,n,nd) in Demand)}')
+
+    if violations:
+        raise ValueError(f'### {len(violations)} infeasibilities detected in the case data:\n' + '\n'.join(f'### {violation}' for violation in violations))
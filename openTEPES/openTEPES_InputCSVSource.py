@@ -4,9 +4,19 @@ Open Generation, Storage, and Transmission Operation and Expansion Planning Mode
 openTEPES.openTEPES_InputCSVSource — file-system CSV backend.
 
 Preserves today's behaviour bit-for-bit: every read uses ``pd.read_csv`` with ``encoding="utf-8-sig"`` so the optional BOM emitted by Excel is stripped silently.
+
+With ``--fast-csv`` / ``OTEPES_FAST_CSV`` set, ``read_data_batch`` reads the data tables concurrently in a thread pool sized by the ``--threads``
+budget, each file is read from disk once and its encoding checked on the bytes (a cp1252 file is no longer parsed twice), single-header tables go
+through the multithreaded ``pyarrow`` parser when it is installed, and the value columns of the wide tables are parsed straight to the dtype declared
+in ``VALUE_DTYPES``. A table the fast reader cannot parse is read again the historical way, which then reports the problem as it always has.
 """
 from __future__ import annotations
 
+import codecs
+import io
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -14,18 +24,37 @@ import pandas as pd
 # Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
 # relative imports below have no parent package; fall back to absolute package imports in that case.
 try:
-    from .openTEPES_InputSchema import WIDE_MULTILEVEL_TO_LONG, _SPEC_BY_CSV_STEM
-    from .openTEPES_InputSource import InputSource, _apply_index
+    from .openTEPES_InputSchema import VALUE_DTYPES
+    from .openTEPES_InputSource import InputSource, _header_levels, _shape_data
+    from .openTEPES_ProblemSolvingTuning import _threads
 except ImportError:
     import os, sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from openTEPES.openTEPES_InputSchema import WIDE_MULTILEVEL_TO_LONG, _SPEC_BY_CSV_STEM
-    from openTEPES.openTEPES_InputSource import InputSource, _apply_index
+    from openTEPES.openTEPES_InputSchema import VALUE_DTYPES
+    from openTEPES.openTEPES_InputSource import InputSource, _header_levels, _shape_data
+    from openTEPES.openTEPES_ProblemSolvingTuning import _threads
+
+try:
+    from pyarrow import ArrowInvalid  # pandas' pyarrow CSV engine needs pyarrow, and raises this on a table it cannot parse
+    _FAST_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover
+    ArrowInvalid = ValueError
+    _FAST_ENGINE = "c"
+
+# what the fast reader raises on a table it cannot parse; anything else (a missing file, no memory) is not retried
+_FAST_READ_ERRORS = (ValueError, pd.errors.ParserError, ArrowInvalid)
+
+
+def fast_csv() -> bool:
+    """True when the opt-in fast CSV read mode is switched on via ``--fast-csv`` / ``OTEPES_FAST_CSV``."""
+    return os.environ.get("OTEPES_FAST_CSV", "").strip().lower() in ("1", "true", "yes", "on")
 
 
 class CSVSource(InputSource):
-    def __init__(self, case_dir: Path) -> None:
+    def __init__(self, case_dir: Path, fast: bool | None = None, log: bool = False) -> None:
         self.case_dir = Path(case_dir)
+        self.fast     = fast_csv() if fast is None else fast
+        self.log      = log  # report the tables the fast reader hands back to the historical one; InputData sets it from pIndLogConsole
         cn = self._detect_case_name(self.case_dir)
         if cn is None:
             raise ValueError(f"{self.case_dir}: cannot detect case name (no oT_Data_Parameter_*.csv found)")
@@ -76,25 +105,66 @@ class CSVSource(InputSource):
             print(f'WARNING: {path.name} is not UTF-8; falling back to cp1252. Re-save it as UTF-8 to silence this warning.')
             return pd.read_csv(path, encoding="cp1252", **kwargs)
 
+    def _read_csv_fast(self, path: Path, stem: str, header_levels: list[int] | None) -> pd.DataFrame:
+        """Read a data table the fast way: one read of the file, the encoding checked on its bytes, declared value dtypes, the fast engine."""
+        raw = path.read_bytes()
+        try:
+            raw.decode("utf-8")
+            # pyarrow decodes UTF-8 natively; dropping the BOM here instead of passing utf-8-sig spares it a transcoding pass
+            raw, encoding = raw.removeprefix(codecs.BOM_UTF8), "utf-8"
+        except UnicodeDecodeError:
+            print(f'WARNING: {path.name} is not UTF-8; falling back to cp1252. Re-save it as UTF-8 to silence this warning.')
+            encoding = "cp1252"
+        if header_levels:
+            # the pyarrow engine has no multi-level header support
+            return pd.read_csv(io.BytesIO(raw), encoding=encoding, header=header_levels, index_col=[0, 1, 2])
+        df = pd.read_csv(io.BytesIO(raw), encoding=encoding, engine=_FAST_ENGINE)
+        dtype = VALUE_DTYPES.get(f"oT_Data_{stem}")
+        if dtype is not None:
+            # cast after the read: passing dtype= to the pyarrow engine converts every column in pandas, and most are already float64
+            cast = {col: dtype for col in df.columns[3:] if df[col].dtype != dtype}
+            if cast:
+                df = df.astype(cast)
+        return df
+
     def read_dict(self, stem: str) -> pd.DataFrame:
         path = self.case_dir / f"oT_Dict_{stem}_{self.case_name}.csv"
         if not path.exists():
             return pd.DataFrame()
         return self._read_csv(path)
 
-    def read_data(self, stem: str, header_levels: list[int] | None = None) -> pd.DataFrame:
+    def read_raw_data(self, stem: str, header_levels: list[int] | None = None) -> pd.DataFrame:
+        """A data table as parsed from its CSV, before ``read_data`` sets its index (what ``Tool_CSV_to_Parquet`` stores)."""
         path = self.case_dir / f"oT_Data_{stem}_{self.case_name}.csv"
         if not path.exists():
             raise FileNotFoundError(path)
-        # Multi-level header tables: derive level count from the spec if the caller didn't pass header_levels, so the
-        # source is self-sufficient.
-        spec = _SPEC_BY_CSV_STEM.get(f"oT_Data_{stem}")
-        if header_levels is None and spec and spec[1] == WIDE_MULTILEVEL_TO_LONG:
-            header_levels = list(range(len(spec[2]["entity_cols"])))
+        header_levels = _header_levels(stem, header_levels)
+        if self.fast:
+            try:
+                return self._read_csv_fast(path, stem, header_levels)
+            except _FAST_READ_ERRORS as e:
+                # read it the historical way below, which reports what is wrong with the table
+                if self.log:
+                    print(f'Fast CSV read of {path.name} failed ({type(e).__name__}: {e}); reading it the historical way')
         if header_levels:
             return self._read_csv(path, header=header_levels, index_col=[0, 1, 2])
-        df = self._read_csv(path)
-        # Option / Parameter are single-row, leave as-is (no index).
-        if stem in ("Option", "Parameter"):
-            return df
-        return _apply_index(df, stem)
+        return self._read_csv(path)
+
+    def read_data(self, stem: str, header_levels: list[int] | None = None) -> pd.DataFrame:
+        header_levels = _header_levels(stem, header_levels)
+        return _shape_data(self.read_raw_data(stem, header_levels), stem, header_levels)
+
+    def read_data_batch(self, stems: Iterable[str], header_levels: dict[str, list[int] | None] | None = None) -> dict[str, pd.DataFrame | Exception]:
+        """``InputSource.read_data_batch``, reading the tables concurrently in fast mode.
+
+        The parsers release the GIL for most of a read, so a pool of threads keeps the cores busy on the few very wide time-series tables that
+        dominate a large case. Results come back in the order of ``stems`` whichever read finishes first.
+        """
+        stems = list(stems)
+        workers = min(_threads(), len(stems))
+        if not self.fast or workers < 2:
+            return super().read_data_batch(stems, header_levels)
+        header_levels = header_levels or {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="oT_CSV") as pool:
+            futures = [pool.submit(self.read_data, stem, header_levels.get(stem)) for stem in stems]
+        return {stem: future.exception() or future.result() for stem, future in zip(stems, futures)}
@@ -57,6 +57,8 @@ def InputData(DirName, CaseName, mTEPES, pIndLogConsole):
     # CaseName). The CSV path through CSVSource is byte-identical to the historical pd.read_csv calls.
     source: InputSource = getattr(mTEPES, "pInputSource", None) or CSVSource(_path)
     mTEPES.pInputSource = source  # make accessible to DataConfiguration etc.
+    if isinstance(source, CSVSource):
+        source.log = bool(pIndLogConsole)
 
     # Reading dictionaries through the source. df_to_set_values converts a 1-col DataFrame -> list of values, an n-col DataFrame -> list of
     # tuples (relation/membership), which is exactly the shape Set(initialize=...) accepts.
@@ -100,11 +102,15 @@ def InputData(DirName, CaseName, mTEPES, pIndLogConsole):
         dfs: dict[str, pd.DataFrame] = {}
         par: dict[str, int] = {}
 
-        for fs in source.list_data_stems():
+        # one batch call, so a backend that can read tables concurrently (CSVSource in fast mode) gets all of them at once
+        stems  = list(source.list_data_stems())
+        tables = source.read_data_batch(stems, {fs: HEADER_LEVELS.get(fs) for fs in stems})
+        for fs in stems:
             dp_key, _, _ = FLAG_MAPPING.get(fs, (None, None, None))
-            header = HEADER_LEVELS.get(fs)
             try:
-                dfs[f'df{fs}'] = source.read_data(fs, header_levels=header)
+                if isinstance(tables[fs], Exception):
+                    raise tables[fs]
+                dfs[f'df{fs}'] = tables[fs]
                 if dp_key:
                     par[dp_key] = 1
             except (KeyError, ValueError, UnicodeDecodeError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
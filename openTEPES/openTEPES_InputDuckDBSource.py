@@ -8,6 +8,9 @@ the import is lazy and the ``_HAS_DUCKDB`` flag is consulted by ``Source.open_so
 
 The DB is opened read-only. ``schema_metadata.source_case`` is consulted at connection time so the case name follows the same rule as the CSV backend
 (``oT_Data_Parameter_*.csv`` filename for CSV, ``schema_metadata`` for DuckDB).
+
+The wide time series are rebuilt inside DuckDB: a ``PIVOT`` over the key, entity and value columns only, restricted to the periods and scenarios the
+model solves (weight and probability above zero), fetched as Arrow. A one-period run of a multi-year database therefore reads one year of each series.
 """
 from __future__ import annotations
 
@@ -49,7 +52,7 @@ except ImportError:  # pragma: no cover
 
 
 class DuckDBSource(InputSource):
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, active_only: bool = True) -> None:
         self.db_path = Path(db_path)
         self._con = duckdb.connect(str(self.db_path), read_only=True)
         row = self._con.execute("SELECT Value FROM schema_metadata WHERE Key='source_case'").fetchone()
@@ -61,6 +64,8 @@ class DuckDBSource(InputSource):
         # Pre-fetch existing DB table names (cheap; speeds up the list_data_stems / table-presence checks called many times).
         rows = self._con.execute("SELECT table_name FROM information_schema.tables").fetchall()
         self._existing_tables: set[str] = {r[0] for r in rows}
+        # the time series of idle periods and scenarios are skipped unless the caller wants the whole case (the CSV exporter does)
+        self._row_filter = self._active_rows() if active_only else ""
 
     @property
     def dir_name(self) -> str:
@@ -78,6 +83,10 @@ class DuckDBSource(InputSource):
         spec = _SPEC_BY_CSV_STEM.get(csv_stem)
         return spec  # (db_table, kind, kwargs) or None
 
+    def _fetch(self, query: str) -> pd.DataFrame:
+        """Run ``query`` and hand its result to pandas through Arrow, column block by column block, releasing each Arrow buffer once converted."""
+        return self._con.execute(query).to_arrow_table().to_pandas(split_blocks=True, self_destruct=True)
+
     def _table_present(self, db_table: str) -> bool:
         return db_table in self._existing_tables
 
@@ -105,7 +114,7 @@ class DuckDBSource(InputSource):
         spec = self._table_for(f"oT_Dict_{stem}")
         if spec is None or not self._table_present(spec[0]):
             return pd.DataFrame()
-        return self._con.execute(f"SELECT * FROM {spec[0]}").df()
+        return self._fetch(f"SELECT * FROM {spec[0]}")
 
     def read_data(self, stem: str, header_levels: list[int] | None = None) -> pd.DataFrame:
         spec = self._table_for(f"oT_Data_{stem}")
@@ -116,7 +125,7 @@ class DuckDBSource(InputSource):
             raise FileNotFoundError(f"oT_Data_{stem}_*.csv not present in {self.db_path}")
 
         if kind == PASSTHROUGH:
-            df = self._con.execute(f"SELECT * FROM {db_table}").df()
+            df = self._fetch(f"SELECT * FROM {db_table}")
             if stem in ("Option", "Parameter"):
                 return df
             return _apply_index(df, stem)
@@ -137,18 +146,53 @@ class DuckDBSource(InputSource):
 
     # ---- shape reconstruction (mirror of the C2 emit logic)
 
+    def _active_rows(self) -> str:
+        """``WHERE`` clause keeping the time-series rows of the periods and scenarios the model solves; empty when it solves all of them.
+
+        DataConfiguration leaves a period of weight 0 and a scenario of probability 0 (or blank) out of the model, so their load levels are never
+        used: pushing that predicate into the scan lets a one-period run of a multi-year database read one year of each time series.
+        """
+        terms = []
+        if self._table_present("period_weight") and self._con.execute(
+                "SELECT count(*) FROM period_weight WHERE NOT coalesce(Weight, 0) > 0").fetchone()[0]:
+            terms.append("Period IN (SELECT Period FROM period_weight WHERE coalesce(Weight, 0) > 0)")
+        if self._table_present("scenario_probability") and self._con.execute(
+                "SELECT count(*) FROM scenario_probability WHERE NOT coalesce(Probability, 0) > 0").fetchone()[0]:
+            terms.append("(Period, Scenario) IN (SELECT Period, Scenario FROM scenario_probability WHERE coalesce(Probability, 0) > 0)")
+        return f"WHERE {' AND '.join(terms)}" if terms else ""
+
+    def _pivot(self, table_name: str, entity_cols: list[str], value: str) -> tuple[pd.DataFrame, list[tuple]]:
+        """PIVOT a long time series to one column per entity inside DuckDB and fetch it as Arrow.
+
+        Returns the wide frame, keyed on ``(Period, Scenario, LoadLevel)`` columns sorted like ``DataFrame.pivot`` sorts its index, and the
+        entities in the order they appear in the table, which is the column order of the CSV it was written from. Only the key, entity and
+        value columns are read, and only the rows of ``_active_rows``. The pivot runs on each entity's ordinal rather than its name, so
+        multi-column entities need no name mangling; the caller names the columns. A sparse table (an entity missing at some keys) pivots
+        to NaN there, as pandas does; a repeated ``(Period, Scenario, LoadLevel, entity)`` key raises ``ValueError``, which ``first()`` would
+        otherwise hide, so it is looked for before the pivot.
+        """
+        id_cols  = ["Period", "Scenario", "LoadLevel"]
+        entities = ", ".join(entity_cols)
+        pOrder   = self._con.execute(f"SELECT {entities} FROM {table_name} GROUP BY ALL ORDER BY min(rowid)").fetchall()
+        if not pOrder:
+            return pd.DataFrame(columns=id_cols), []
+        if self._con.execute(f"SELECT 1 FROM {table_name} {self._row_filter} GROUP BY Period, Scenario, LoadLevel, {entities} "
+                             f"HAVING count(*) > 1 LIMIT 1").fetchone():
+            raise ValueError(f"{table_name}: duplicate (Period, Scenario, LoadLevel, {entities}) rows")
+        wide     = self._fetch(
+            f"WITH ordinal AS (SELECT {entities}, row_number() OVER (ORDER BY min(rowid)) - 1 AS k FROM {table_name} GROUP BY ALL) "
+            f"PIVOT (SELECT Period, Scenario, LoadLevel, k, {value} FROM {table_name} JOIN ordinal USING ({entities}) {self._row_filter}) "
+            f"ON k IN ({', '.join(map(str, range(len(pOrder))))}) USING first({value}) "
+            f"GROUP BY Period, Scenario, LoadLevel ORDER BY Period, Scenario, LoadLevel")
+        return wide, pOrder
+
     def _reconstruct_wide(self, table_name: str, *, entity: str, value: str) -> pd.DataFrame:
-        df      = self._con.execute(f"SELECT * FROM {table_name}").df()
-        id_cols = ["Period", "Scenario", "LoadLevel"]
-        # pivot (not pivot_table) so duplicate keys raise instead of being silently averaged. pivot sorts the columns,
-        # while the CSV reader keeps the order the entities appear in the file: restore that order.
-        pOrder  = list(dict.fromkeys(df[entity]))
-        wide    = df.pivot(index=id_cols, columns=entity, values=value)[pOrder].reset_index()
-        wide.columns.name = None
+        wide, pOrder = self._pivot(table_name, [entity], value)
+        wide.columns = ["Period", "Scenario", "LoadLevel"] + [e for (e,) in pOrder]
         return wide
 
     def _reconstruct_single_row(self, table_name: str, *, value_type: str) -> pd.DataFrame:
-        df  = self._con.execute(f"SELECT * FROM {table_name}").df()
+        df  = self._fetch(f"SELECT Name, Value FROM {table_name}")
         row = {str(name): (None if pd.isna(value) else value) for name, value in zip(df["Name"], df["Value"])}
         out = pd.DataFrame([row])
         # The DB stores Value as VARCHAR, so every parameter arrives as text. The CSV reader infers a column's dtype from its content,
@@ -166,11 +210,9 @@ class DuckDBSource(InputSource):
         Matches the pandas quirk where ``pd.read_csv(..., header=[0..N-1], index_col=[0,1,2])`` yields ``index.names = [None, None, None]`` and
         ``columns.names = ['Period', None, ...]``. Preserving this lets downstream CSV/DB consumers see identical DataFrames.
         """
-        df      = self._con.execute(f"SELECT * FROM {table_name}").df()
-        id_cols = ["Period", "Scenario", "LoadLevel"]
-        # same as _reconstruct_wide: pivot raises on duplicate keys but sorts the columns, so restore the file order
-        pOrder  = list(dict.fromkeys(df[entity_cols].itertuples(index=False, name=None)))
-        wide    = df.pivot(index=id_cols, columns=entity_cols, values=value)[pOrder]
+        wide, pOrder = self._pivot(table_name, entity_cols, value)
+        wide = wide.set_index(["Period", "Scenario", "LoadLevel"])
+        wide.columns = pd.MultiIndex.from_tuples(pOrder) if pOrder else wide.columns
         wide.index.names = [None, None, None]
         wide.columns.names = ["Period"] + [None] * (len(entity_cols) - 1)
         return wide
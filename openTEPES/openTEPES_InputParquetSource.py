@@ -0,0 +1,83 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_InputParquetSource — columnar ``<case>.parquet`` directory backend.
+
+A Parquet case is a directory ``<case>.parquet`` holding one file per input table, named like the CSV it was converted from
+(``oT_Data_<stem>_<case>.parquet``, ``oT_Dict_<stem>_<case>.parquet``). Each file stores the table exactly as ``CSVSource`` parses it, with
+its column types, so a read is a memory-mapped Arrow read handed to pandas without the text parsing, type inference and encoding fallback
+of a wide 8760-column CSV. The shape ``InputData`` expects (the index) is set on read by the same helper the CSV backend uses, so the two
+backends cannot drift. Write a Parquet case with ``scripts/openTEPES_Parquet/Tool_CSV_to_Parquet.py``.
+
+``pyarrow`` is an optional dependency, installed with the ``parquet`` extra (``pip install openTEPES[parquet]``); the import is lazy and the
+``_HAS_PYARROW`` flag is consulted by ``Source.open_source()`` before constructing a ``ParquetSource``.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the relative imports below have no parent package;
+# fall back to absolute package imports in that case.
+try:
+    from .openTEPES_InputSource import InputSource, _header_levels, _shape_data
+except ImportError:
+    import os, sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_InputSource import InputSource, _header_levels, _shape_data
+
+_HAS_PYARROW = True
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover
+    _HAS_PYARROW = False
+
+
+class ParquetSource(InputSource):
+    def __init__(self, case_dir: Path) -> None:
+        self.case_dir = Path(case_dir)
+        cn = self._detect_case_name(self.case_dir)
+        if cn is None:
+            raise ValueError(f"{self.case_dir}: cannot detect case name (no oT_Data_Parameter_*.parquet found)")
+        self.case_name = cn
+
+    # DirName/CaseName the rest of openTEPES expects; results go next to the .parquet directory, as they do next to a .duckdb file.
+    @property
+    def dir_name(self) -> str:
+        return str(self.case_dir.parent)
+
+    @staticmethod
+    def _detect_case_name(case_dir: Path) -> str | None:
+        names = sorted(p.stem[len("oT_Data_Parameter_"):] for p in case_dir.glob("oT_Data_Parameter_*.parquet"))
+        if len(names) > 1:
+            raise ValueError(f"{case_dir}: several cases share this directory ({', '.join(names)}); keep one case per directory")
+        return names[0] if names else None
+
+    def _stems(self, prefix: str) -> set[str]:
+        suffix = f"_{self.case_name}.parquet"
+        return {p.name[len(prefix):-len(suffix)] for p in self.case_dir.glob(f"{prefix}*{suffix}") if len(p.name) > len(prefix) + len(suffix)}
+
+    def list_data_stems(self) -> set[str]:
+        return self._stems("oT_Data_")
+
+    def list_dict_stems(self) -> set[str]:
+        return self._stems("oT_Dict_")
+
+    @staticmethod
+    def _read_parquet(path: Path) -> pd.DataFrame:
+        """Memory-map the file and convert it column block by column block, releasing each Arrow buffer as soon as pandas owns it."""
+        return pq.read_table(path, memory_map=True).to_pandas(split_blocks=True, self_destruct=True)
+
+    def read_dict(self, stem: str) -> pd.DataFrame:
+        path = self.case_dir / f"oT_Dict_{stem}_{self.case_name}.parquet"
+        if not path.exists():
+            return pd.DataFrame()
+        return self._read_parquet(path)
+
+    def read_data(self, stem: str, header_levels: list[int] | None = None) -> pd.DataFrame:
+        path = self.case_dir / f"oT_Data_{stem}_{self.case_name}.parquet"
+        if not path.exists():
+            raise FileNotFoundError(path)
+        # the multi-level header tables were stored with their column MultiIndex and row index, which Arrow's pandas metadata restores
+        return _shape_data(self._read_parquet(path), stem, _header_levels(stem, header_levels))
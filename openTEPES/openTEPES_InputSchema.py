@@ -154,6 +154,10 @@ TABLE_SPECS: list[tuple[str, str, str, dict]] = [
 # csv_stem_prefix -> (db_table, kind, kwargs). Derived lookup so backends can find a spec in O(1) without scanning.
 _SPEC_BY_CSV_STEM: dict[str, tuple[str, str, dict]] = {s[0]: (s[1], s[2], s[3]) for s in TABLE_SPECS}
 
+# csv_stem_prefix -> dtype of the value columns (every column after the ``(Period, Scenario, LoadLevel)`` key) of the single-header wide tables. Declared
+# so the fast CSV reader parses the values straight into the type they end up in instead of inferring one per column; stems not listed keep inferred dtypes.
+VALUE_DTYPES: dict[str, str] = {s[0]: "float64" for s in TABLE_SPECS if s[2] == WIDE_TO_LONG}
+
 # ---------------------------------------------------------------------------
 # Columns to scan for index when a stem is not declared in TABLE_SPECS (e.g. hydropower / heat / H2 tables that aren't yet in the C2 spec).
 # Kept here so backend code does not duplicate the list.
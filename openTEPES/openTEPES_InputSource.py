@@ -6,15 +6,17 @@ openTEPES.openTEPES_InputSource — ``InputSource`` ABC, ``open_source()`` facto
 Selection rules of ``open_source(path)``:
 
   * directory                → ``CSVSource(path)`` (historical behaviour).
+  * directory ``*.parquet`` → ``ParquetSource(path)`` (one Parquet file per table, written by ``Tool_CSV_to_Parquet``).
   * file with ``.duckdb``    → ``DuckDBSource(path)``.
   * anything else            → ``ValueError``.
 
-Backends are imported lazily so a parity probe in a freshly-cloned tree without ``duckdb`` installed still resolves ``InputSource`` and open_source`` for the CSV path.
+Backends are imported lazily so a parity probe in a freshly-cloned tree without ``duckdb`` or ``pyarrow`` installed still resolves ``InputSource`` and ``open_source`` for the CSV path.
 """
 from __future__ import annotations
 
 import abc
 import os
+from collections.abc import Iterable
 from pathlib import Path
 
 import pandas as pd
@@ -25,6 +27,7 @@ try:
     from .openTEPES_InputSchema import (
         DEFAULT_IDX_COLS,
         UNPIVOT_SINGLE_ROW,
+        WIDE_MULTILEVEL_TO_LONG,
         WIDE_TO_LONG,
         _SPEC_BY_CSV_STEM,
     )
@@ -34,13 +37,14 @@ except ImportError:
     from openTEPES.openTEPES_InputSchema import (
         DEFAULT_IDX_COLS,
         UNPIVOT_SINGLE_ROW,
+        WIDE_MULTILEVEL_TO_LONG,
         WIDE_TO_LONG,
         _SPEC_BY_CSV_STEM,
     )
 
 
 class InputSource(abc.ABC):
-    """Abstract input source. Implementations: ``CSVSource``, ``DuckDBSource``."""
+    """Abstract input source. Implementations: ``CSVSource``, ``ParquetSource``, ``DuckDBSource``."""
 
     case_name: str
 
@@ -72,6 +76,22 @@ class InputSource(abc.ABC):
         read a whole case once and hand forked workers a shared baseline.
         """
 
+    def read_data_batch(self, stems: Iterable[str], header_levels: dict[str, list[int] | None] | None = None) -> dict[str, pd.DataFrame | Exception]:
+        """Read several data tables in one call, for backends that can read them concurrently.
+
+        Maps each stem (in the order given) to what ``read_data`` returns for it, or to the exception it raised, so one unreadable table does not
+        hide the others and the caller decides which failures are fatal. ``header_levels`` maps a stem to its ``read_data`` argument. This default
+        reads the tables one after another.
+        """
+        header_levels = header_levels or {}
+        tables: dict[str, pd.DataFrame | Exception] = {}
+        for stem in stems:
+            try:
+                tables[stem] = self.read_data(stem, header_levels.get(stem))
+            except Exception as e:
+                tables[stem] = e
+        return tables
+
     def close(self) -> None:  # default no-op
         pass
 
@@ -83,11 +103,19 @@ class InputSource(abc.ABC):
 
 
 def open_source(path: str | os.PathLike) -> InputSource:
-    """Sniff ``path`` and return a ``CSVSource`` or ``DuckDBSource``.
+    """Sniff ``path`` and return a ``CSVSource``, ``ParquetSource`` or ``DuckDBSource``.
 
-    Backends are imported lazily so the ``duckdb`` dependency is only required when a ``.duckdb`` path is opened.
+    Backends are imported lazily so the ``pyarrow`` / ``duckdb`` dependencies are only required when a ``.parquet`` / ``.duckdb`` path is opened.
     """
     p = Path(path).expanduser()
+    if p.is_dir() and p.suffix == ".parquet":
+        try:
+            from .openTEPES_InputParquetSource import ParquetSource, _HAS_PYARROW
+        except ImportError:
+            from openTEPES.openTEPES_InputParquetSource import ParquetSource, _HAS_PYARROW
+        if not _HAS_PYARROW:
+            raise ImportError("pyarrow is required to read .parquet input sources; install it with `pip install openTEPES[parquet]`")
+        return ParquetSource(p)
     if p.is_dir():
         try:
             from .openTEPES_InputCSVSource import CSVSource  # local import keeps duckdb-free environments importing Source.py cleanly
@@ -102,7 +130,26 @@ def open_source(path: str | os.PathLike) -> InputSource:
         if not _HAS_DUCKDB:
             raise ImportError("duckdb is required to read .duckdb input sources; install it with `pip install duckdb`")
         return DuckDBSource(p)
-    raise ValueError(f"{p}: not a CSV case directory or a .duckdb file")
+    raise ValueError(f"{p}: not a CSV case directory, a .parquet case directory or a .duckdb file")
+
+
+def _header_levels(stem: str, header_levels: list[int] | None) -> list[int] | None:
+    """Column header levels of a data table: the caller's, else those of its WIDE_MULTILEVEL_TO_LONG spec, so a source is self-sufficient."""
+    spec = _SPEC_BY_CSV_STEM.get(f"oT_Data_{stem}")
+    if header_levels is None and spec and spec[1] == WIDE_MULTILEVEL_TO_LONG:
+        header_levels = list(range(len(spec[2]["entity_cols"])))
+    return header_levels
+
+
+def _shape_data(df: pd.DataFrame, stem: str, header_levels: list[int] | None) -> pd.DataFrame:
+    """Give a data table as stored in a file-per-table source (CSV, Parquet) the shape ``InputSource.read_data`` returns.
+
+    Multi-level header tables already carry their ``(Period, Scenario, LoadLevel)`` row index; ``Option`` / ``Parameter`` are single-row and
+    keep no index; every other table gets the index of ``_apply_index``.
+    """
+    if header_levels or stem in ("Option", "Parameter"):
+        return df
+    return _apply_index(df, stem)
 
 
 def _apply_index(df: pd.DataFrame, stem: str) -> pd.DataFrame:
@@ -723,16 +723,68 @@ parser.add_argument('--threads',          type=_positive_int, default=None,
                     help="Cap the solver thread count. Default: half of (logical + physical) cores. Also set by OTEPES_THREADS.")
 parser.add_argument('--warm-resolve',         default=False, action="store_true",
                     help="Persistent re-solves (Mode C hot-swap sweep, or a gurobi_persistent stage loop) use warm dual "
-                         "simplex with a barrier fallback. Gurobi only; no effect for Mode A/B or non-Gurobi solvers. Also set by OTEPES_WARM_RESOLVE.")
+                         "simplex with a barrier fallback. A Mode C sweep with highs or appsi_highs keeps one persistent HiGHS instance "
+                         "warm-started from the previous basis. No effect for Mode A/B or other solvers. Also set by OTEPES_WARM_RESOLVE.")
 parser.add_argument('--warm-resolve-cap', type=_positive_int, default=None,
                     help="Time cap (s) for each warm dual-simplex re-solve before falling back to barrier. Default 60. Also set by OTEPES_WARM_RESOLVE_CAP.")
 parser.add_argument('--warm-resolve-simplex', default=False, action="store_true",
                     help="EXPERIMENTAL: with --warm-resolve, use warm dual simplex instead of barrier for the re-solves. Erratic on large/degenerate LPs and "
                          "slower for objective (cost) sweeps; only helps small RHS/bound sweeps. Default is barrier. Also set by OTEPES_WARM_RESOLVE_SIMPLEX.")
 
+parser.add_argument('--parallel-stages', type=_positive_int, default=None,
+                    help="Solve up to this many independent stages (no expansion decisions, no emission or RES-energy limit) at once in forked "
+                         "workers, while the next stage is formulated. Each worker takes a slice of the --threads budget. POSIX only; "
+                         "default off (sequential). Also set by OTEPES_PARALLEL_STAGES.")
+parser.add_argument('--parallel-subproblems', type=_positive_int, default=None,
+                    help="Solve up to this many time-Benders stage subproblems (pIndSequentialSolving = 0) at once in forked workers. Each "
+                         "worker takes a slice of the --threads budget. POSIX only; default one worker per thread. Independent of "
+                         "--parallel-stages. Also set by OTEPES_PARALLEL_SUBPROBLEMS.")
+parser.add_argument('--model-cache',     type=str, default=None,
+                    help="Directory of the built-model cache. A run whose input tables, case settings and openTEPES version match an earlier "
+                         "run loads that run's model from here instead of building it again. Default off. Also set by OTEPES_MODEL_CACHE.")
+parser.add_argument('--retire-stages',   default=False, action="store_true",
+                    help="Delete each independently solved stage (no expansion decisions, no emission or RES-energy limit) from the model once "
+                         "its solution is in, keeping its duals and the constraint slacks the output writers read. Bounds the memory of long "
+                         "horizons; a model run this way cannot be re-solved with resolve(). Default off. Also set by OTEPES_RETIRE_STAGES.")
+parser.add_argument('--stream-results',  default=False, action="store_true",
+                    help="Append the hourly generation, storage and angle tables of each independently solved stage to the result files "
+                         "(CSV or DuckDB) as soon as it is solved, so partial results can be read during a long run. The final tables are "
+                         "the same as without it. Default off. Also set by OTEPES_STREAM_RESULTS.")
+parser.add_argument('--checkpoint',      default=False, action="store_true",
+                    help="Write a checkpoint of every stage solve (variable values, fixed commitment and investment decisions, duals) to "
+                         "openTEPES_checkpoint_<CaseName> in the output directory, removed once the results are written. Default off. "
+                         "Also set by OTEPES_CHECKPOINT.")
+parser.add_argument('--resume',          default=False, action="store_true",
+                    help="Continue an interrupted --checkpoint run of the same case: the stages it checkpointed are loaded instead of solved, "
+                         "and the rest are solved and checkpointed. Checkpoints of changed inputs, settings or code are discarded. Implies "
+                         "--checkpoint. Default off. Also set by OTEPES_RESUME.")
+parser.add_argument('--stage-warm-start', default=False, action="store_true",
+                    help="Start the MIP of each stage from the commitment, unit states and line switching of the stage before it, repeated "
+                         "load level by load level, so the solver has an incumbent from the start. Needs a solver with a MIP start: "
+                         "appsi_highs, appsi_gurobi, gurobi, gurobi_direct, gurobi_persistent, cplex. Default off. Also set by OTEPES_STAGE_WARM_START.")
+parser.add_argument('--solution-store',  default=False, action="store_true",
+                    help="Store the solution of every stage solve in openTEPES_solutions_<case> in the output directory, and start each stage "
+                         "of a later run of the case from its stored solution when the model structure is unchanged (a data change keeps it). "
+                         "Default off. Also set by OTEPES_SOLUTION_STORE.")
+parser.add_argument('--cut-pool',        default=False, action="store_true",
+                    help="Keep the Benders cuts of the decomposition loops (lshaped, stage and sector decomposition) in openTEPES_cuts_<case> "
+                         "in the output directory, and start each loop of a later run of the case by cutting again at the points those cuts "
+                         "were cut at. Default off. Also set by OTEPES_CUT_POOL.")
+parser.add_argument('--selective-duals', default=False, action="store_true",
+                    help="Harvest only the duals of the constraint families the selected --results outputs read (balances, reserves, "
+                         "inventories, ...), and skip the fixed-LP re-solve of a MIP stage when they read none. Without that re-solve a MIP "
+                         "keeps the dispatch of its incumbent. Default off. Also set by OTEPES_SELECTIVE_DUALS.")
+parser.add_argument('--native-fixed-duals', default=False, action="store_true",
+                    help="Take the duals of a MIP stage from the fixed LP the solver builds from its own MIP solution in memory, instead of "
+                         "re-solving the fixed model through Pyomo. Applies to appsi_highs, appsi_gurobi, gurobi_persistent and gurobi_direct; "
+                         "the other solvers re-solve as before. Default off. Also set by OTEPES_NATIVE_DUALS.")
+parser.add_argument('--fast-csv',        default=False, action="store_true",
+                    help="Read the input CSVs concurrently (within the --threads budget) with the pyarrow parser and the value dtypes declared in "
+                         "the input schema. Default off (one file at a time, as before). Also set by OTEPES_FAST_CSV.")
+
 DIR    = os.path.join(os.path.dirname(__file__), "cases")
 CASE   = '9n'
-SOLVER = 'highs'   # 'gams', 'highs', 'gurobi', 'gurobi_direct', 'gurobi_persistent', 'appsi_gurobi'
+SOLVER = 'highs'   # 'gams', 'highs', 'appsi_highs', 'gurobi', 'gurobi_direct', 'gurobi_persistent', 'appsi_gurobi'
 RESULT = 'Yes'
 LOG    = 'No'
 
@@ -752,6 +804,32 @@ def main():
         os.environ["OTEPES_WARM_RESOLVE_CAP"] = str(args.warm_resolve_cap)
     if args.warm_resolve_simplex:
         os.environ["OTEPES_WARM_RESOLVE_SIMPLEX"] = "1"     # deeper opt-in: warm dual simplex instead of barrier
+    if args.parallel_stages is not None:
+        os.environ["OTEPES_PARALLEL_STAGES"] = str(args.parallel_stages)
+    if args.parallel_subproblems is not None:
+        os.environ["OTEPES_PARALLEL_SUBPROBLEMS"] = str(args.parallel_subproblems)
+    if args.model_cache is not None:
+        os.environ["OTEPES_MODEL_CACHE"] = args.model_cache
+    if args.fast_csv:
+        os.environ["OTEPES_FAST_CSV"] = "1"
+    if args.retire_stages:
+        os.environ["OTEPES_RETIRE_STAGES"] = "1"
+    if args.stream_results:
+        os.environ["OTEPES_STREAM_RESULTS"] = "1"
+    if args.checkpoint:
+        os.environ["OTEPES_CHECKPOINT"] = "1"
+    if args.resume:
+        os.environ["OTEPES_RESUME"] = "1"
+    if args.stage_warm_start:
+        os.environ["OTEPES_STAGE_WARM_START"] = "1"
+    if args.solution_store:
+        os.environ["OTEPES_SOLUTION_STORE"] = "1"
+    if args.cut_pool:
+        os.environ["OTEPES_CUT_POOL"] = "1"
+    if args.selective_duals:
+        os.environ["OTEPES_SELECTIVE_DUALS"] = "1"
+    if args.native_fixed_duals:
+        os.environ["OTEPES_NATIVE_DUALS"] = "1"
 
     if args.dir is None:
         args.dir    = input('Input Dir    Name (Default {}): '.format(DIR))
@@ -819,16 +897,16 @@ def main():
     # Computing the elapsed time
     ElapsedTime = round(time.time() - StartTime)
     print('Total time                             ...  {} s'.format(ElapsedTime))
-    # When the case is a .duckdb file, the inputs were materialised to a
-    # tempdir already removed by openTEPES_run; fall back to args.dir.
+    # When the case is a .duckdb file or a .parquet directory, results go next to it (there is no case dir under args.dir); fall back to args.dir.
+    _case_suffix = next((sfx for sfx in (".duckdb", ".parquet") if args.case.endswith(sfx)), "")
     if args.out:
         _time_log_dir = args.out
-    elif args.case.endswith(".duckdb"):
+    elif _case_suffix:
         _time_log_dir = args.dir
     else:
         _time_log_dir = os.path.join(args.dir, args.case)
     os.makedirs(_time_log_dir, exist_ok=True)
-    _time_log_case_tag = args.case[:-len(".duckdb")] if args.case.endswith(".duckdb") else args.case
+    _time_log_case_tag = args.case[:-len(_case_suffix)] if _case_suffix else args.case
     path_to_write_time = os.path.join(_time_log_dir, f'openTEPES_time_{_time_log_case_tag}.log')
     with open(path_to_write_time, 'w') as f:
         f.write(('Elapsed time ' + str(ElapsedTime) + ' s   on ' + platform.node() + ' [' + platform.system() + ' ' +
@@ -0,0 +1,161 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ModelCache — opt-in cache of the built, ready-to-solve model (default OFF).
+
+Every run repeats ``InputData``, ``DataConfiguration``, ``SettingUpVariables`` and the objective and investment formulations, even when a solver
+or option sweep rebuilds the very same model again and again. With ``--model-cache DIR`` / ``OTEPES_MODEL_CACHE=DIR`` set, ``openTEPES_run``
+pickles ``mTEPES`` into ``DIR`` right after it is built, and a later run whose key matches loads it and goes straight to ``StageIterativeSolving``:
+
+  * ``model_key()``   hex digest of the case input tables (the bytes of every ``oT_Data_*`` / ``oT_Dict_*`` file of the case, or of the
+                      ``.duckdb`` file), the case settings fixed in ``openTEPES_run``, the ``OTEPES_*`` options that change how the model is
+                      built (``BUILD_OPTIONS``), the openTEPES version and source (which holds the dtypes the fast CSV reader declares), and the
+                      Python and Pyomo versions. Any change to any of them gives a new key, so a stale model is never loaded.
+  * ``ModelCache``    reads and writes ``DIR/oT_Model_<CaseName>_<key>.pkl``. The file is written to a temporary name and renamed into place,
+                      so a sweep of concurrent runs never reads half a file; an unreadable file is reported, removed and rebuilt.
+
+The model holds its construction rules as functions local to the formulation modules, which the standard pickler refuses. ``dill`` would take
+them, but its pure-Python pickler needs about ten times as long to write a model, longer than the build it is meant to save. ``_ModelPickler`` keeps the C pickler and
+only steps in for those functions, storing their code, module and closure, so a closure that refers back to the model is restored as a
+reference to the loaded model. Cases read from an in-memory source (Mode B sweeps) are not cached, since there is no file to fingerprint.
+"""
+from __future__ import annotations
+
+import contextlib
+import glob
+import hashlib
+import importlib
+import io
+import marshal
+import os
+import pickle
+import sys
+import types
+
+import pyomo
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          . import __version__
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES import __version__
+
+
+# the options that change how the input tables are read into the model; a model built with other values is not loaded
+BUILD_OPTIONS = ("OTEPES_FAST_CSV",)
+
+
+def cache_dir() -> str | None:
+    """Directory of the model cache, from ``--model-cache`` / ``OTEPES_MODEL_CACHE``; None (off) when unset."""
+    return os.environ.get("OTEPES_MODEL_CACHE", "").strip() or None
+
+
+def _input_files(DirName, CaseName, input_source) -> list[str] | None:
+    """Files the case is read from, or None when it comes from a source without files (an in-memory overlay)."""
+    if input_source is None or getattr(input_source, "case_dir", None) is not None:
+        case_dir = str(getattr(input_source, "case_dir", None) or os.path.join(DirName, CaseName))
+        return sorted(glob.glob(os.path.join(case_dir, f"oT_Data_*_{CaseName}.*")) + glob.glob(os.path.join(case_dir, f"oT_Dict_*_{CaseName}.*")))
+    if getattr(input_source, "db_path", None) is not None:
+        return [str(input_source.db_path)]
+    return None
+
+
+def _source_digest() -> bytes:
+    """Digest of the openTEPES modules, so that a development tree whose code changed under the same version string rebuilds its models."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "openTEPES*.py"))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def model_key(DirName, CaseName, input_source=None, settings=None) -> str | None:
+    """Hex key of the model ``openTEPES_run`` builds for this case, these settings and the ``BUILD_OPTIONS``, or None when the case cannot be cached."""
+    files = _input_files(DirName, CaseName, input_source)
+    if not files:
+        return None
+    settings = {**(settings or {}), **{name: os.environ.get(name, '').strip() for name in BUILD_OPTIONS}}
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((CaseName, __version__, sys.version, pyomo.version.version, sorted(settings.items()))).encode())
+    digest.update(_source_digest())
+    for path in files:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _function(code, module, name, defaults, kwdefaults, cells):
+    """Rebuild a function stored by ``_ModelPickler`` in the namespace of its module."""
+    fn = types.FunctionType(marshal.loads(code), importlib.import_module(module).__dict__, name, defaults,
+                            tuple(types.CellType(cell) for cell in cells) or None)
+    fn.__kwdefaults__ = kwdefaults
+    return fn
+
+
+class _ModelPickler(pickle.Pickler):
+    """C pickler that also stores local functions and lambdas (the construction rules) by their code instead of by name."""
+
+    def reducer_override(self, obj):
+        if type(obj) is types.FunctionType and ("<locals>" in obj.__qualname__ or obj.__name__ == "<lambda>"):
+            return (_function, (marshal.dumps(obj.__code__), obj.__module__, obj.__name__, obj.__defaults__, obj.__kwdefaults__,
+                                tuple(cell.cell_contents for cell in obj.__closure__ or ())))
+        return NotImplemented
+
+
+class ModelCache:
+    """One cached model: ``DIR/oT_Model_<CaseName>_<key>.pkl``."""
+
+    def __init__(self, directory, CaseName, key):
+        self.path = os.path.join(directory, f"oT_Model_{CaseName}_{key}.pkl")
+
+    @classmethod
+    def create(cls, DirName, CaseName, input_source=None, settings=None) -> ModelCache | None:
+        """The cache entry for this run, or None when the cache is off or the case cannot be fingerprinted."""
+        directory = cache_dir()
+        if directory is None:
+            return None
+        key = model_key(DirName, CaseName, input_source, settings)
+        if key is None:
+            print(f'Model cache skipped: case {CaseName} is not read from files')
+            return None
+        os.makedirs(directory, exist_ok=True)
+        return cls(directory, CaseName, key)
+
+    def load(self):
+        """The cached model, or None when there is none (or it cannot be read, in which case it is removed)."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            read = os.fstat(f.fileno())
+            try:
+                return pickle.load(f)
+            except Exception as exc:
+                print(f'### Model cache {self.path} cannot be read ({type(exc).__name__}: {exc}); rebuilding the model')
+        # a concurrent run may have replaced the entry (save renames a complete file into place) or removed it since it was opened: only the
+        # file that failed is removed
+        with contextlib.suppress(FileNotFoundError):
+            entry = os.stat(self.path)
+            if (entry.st_ino, entry.st_mtime_ns) == (read.st_ino, read.st_mtime_ns):
+                os.remove(self.path)
+        return None
+
+    def save(self, mTEPES) -> None:
+        """Write ``mTEPES`` to the cache. The input source is left out: it may hold an open database connection and is not needed to solve."""
+        source = mTEPES.__dict__.pop("pInputSource", None)
+        try:
+            buffer = io.BytesIO()
+            _ModelPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(mTEPES)
+        finally:
+            if source is not None:
+                mTEPES.pInputSource = source
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(buffer.getbuffer())
+        os.replace(temporary, self.path)
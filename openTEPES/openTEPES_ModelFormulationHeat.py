@@ -9,6 +9,15 @@ import time
 from collections import defaultdict
 from pyomo.environ import Constraint
 
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the relative imports below have no parent package;
+# fall back to absolute package imports in that case.
+try:
+    from .openTEPES_ConstraintRegistry import AddStageConstraint
+except ImportError:
+    import os, sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ConstraintRegistry import AddStageConstraint
+
 
 def NetworkHeatOperationModelFormulation(OptModel, mTEPES, pIndLogConsole, p, sc, st):
     print('Heat      scheduling       constraints ****')
@@ -35,7 +44,7 @@ def NetworkHeatOperationModelFormulation(OptModel, mTEPES, pIndLogConsole, p, sc
             return OptModel.vTotalOutputHeat[p,sc,n,chp] == OptModel.vESSTotalCharge[p,sc,n,chp] / mTEPES.pProductionFunctionHeat[chp]
         else:
             return Constraint.Skip
-    setattr(OptModel, f'eEnergy2Heat_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.chp, rule=eEnergy2Heat, doc='Energy to heat conversion [GW]'))
+    AddStageConstraint(OptModel, 'eEnergy2Heat', p, sc, st, Constraint(mTEPES.n*mTEPES.chp, rule=eEnergy2Heat, doc='Energy to heat conversion [GW]'))
 
     if pIndLogConsole:
         print('eEnergy2Heat              ... ', len(getattr(OptModel, f'eEnergy2Heat_{p}_{sc}_{st}')), ' rows')
@@ -45,14 +54,14 @@ def NetworkHeatOperationModelFormulation(OptModel, mTEPES, pIndLogConsole, p, sc
             return Constraint.Skip
         return (sum(OptModel.vTotalOutputHeat[p,sc,n,chp] for chp in chp2n[nd] if (p,chp) in mTEPES.pchp) + OptModel.vHeatNS[p,sc,n,nd] -
                 sum(OptModel.vFlowHeat[p,sc,n,nd,nf,cc] for nf,cc in lout[nd] if (p,nd,nf,cc) in mTEPES.pha) + sum(OptModel.vFlowHeat[p,sc,n,ni,nd,cc] for ni,cc in lin[nd] if (p,ni,nd,cc) in mTEPES.pha)) == mTEPES.pDemandHeat[p,sc,n,nd]
-    setattr(OptModel, f'eBalanceHeat_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.nd, rule=eBalanceHeat, doc='Heat load generation balance [GW]'))
+    AddStageConstraint(OptModel, 'eBalanceHeat', p, sc, st, Constraint(mTEPES.n*mTEPES.nd, rule=eBalanceHeat, doc='Heat load generation balance [GW]'))
 
     if pIndLogConsole:
         print('eBalanceHeat              ... ', len(getattr(OptModel, f'eBalanceHeat_{p}_{sc}_{st}')), ' rows')
 
     def eTotalRHeatCost(OptModel,n):
         return OptModel.vTotalRHeatCost[p,sc,n] == mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pHeatNSCost * sum(OptModel.vHeatNS[p,sc,n,nd] for nd in mTEPES.nd if len(chp2n[nd]) + len(lout[nd]) + len(lin[nd]))
-    setattr(OptModel, f'eTotalRHeatCost_{p}_{sc}_{st}', Constraint(mTEPES.n, rule=eTotalRHeatCost, doc='system reliability cost [MEUR]'))
+    AddStageConstraint(OptModel, 'eTotalRHeatCost', p, sc, st, Constraint(mTEPES.n, rule=eTotalRHeatCost, doc='system reliability cost [MEUR]'))
 
     if pIndLogConsole:
         print('eTotalRHeatCost           ... ', len(getattr(OptModel, f'eTotalRHeatCost_{p}_{sc}_{st}')), ' rows')
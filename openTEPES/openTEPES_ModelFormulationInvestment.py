@@ -10,6 +10,15 @@ import math
 from collections import defaultdict
 from pyomo.environ import Constraint
 
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the relative imports below have no parent package;
+# fall back to absolute package imports in that case.
+try:
+    from .openTEPES_ConstraintRegistry import AddStageConstraint
+except ImportError:
+    import os, sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ConstraintRegistry import AddStageConstraint
+
 
 def InvestmentElecModelFormulation(OptModel, mTEPES, pIndLogConsole):
     print('Investment elec      model formulation ****')
@@ -144,7 +153,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
             return OptModel.vCommitment[p,sc,n,gc] <= OptModel.vGenerationInvest[p,gc]
         else:
             return OptModel.vCommitment[p,sc,n,gc] == OptModel.vGenerationInvest[p,gc]
-    setattr(OptModel, f'eInstallGenComm_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.gc, rule=eInstallGenComm, doc='commitment if installed unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eInstallGenComm', p, sc, st, Constraint(mTEPES.n*mTEPES.gc, rule=eInstallGenComm, doc='commitment if installed unit [p.u.]'))
 
     if pIndLogConsole:
         print('eInstallGenComm           ... ', len(getattr(OptModel, f'eInstallGenComm_{p}_{sc}_{st}')), ' rows')
@@ -153,7 +162,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if (p,ec) not in mTEPES.pec or mTEPES.pIndBinStorInvest[ec] == 0:
             return Constraint.Skip
         return OptModel.vCommitment[p,sc,n,ec] <= OptModel.vGenerationInvest[p,ec]
-    setattr(OptModel, f'eInstallESSComm_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.ec, rule=eInstallESSComm, doc='commitment if ESS unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eInstallESSComm', p, sc, st, Constraint(mTEPES.n*mTEPES.ec, rule=eInstallESSComm, doc='commitment if ESS unit [p.u.]'))
 
     if pIndLogConsole:
         print('eInstallESSComm           ... ', len(getattr(OptModel, f'eInstallESSComm_{p}_{sc}_{st}')), ' rows')
@@ -162,7 +171,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if gc in mTEPES.bc or (p,gc) not in mTEPES.pgc or (mTEPES.pMinPowerElec[p,sc,n,gc] != 0.0 or mTEPES.pConstantVarCost[p,sc,n,gc] != 0.0) or mTEPES.pMaxPowerElec[p,sc,n,gc] == 0.0:
             return Constraint.Skip
         return OptModel.vTotalOutput   [p,sc,n,gc] / mTEPES.pMaxPowerElec [p,sc,n,gc] <= OptModel.vGenerationInvest[p,gc]
-    setattr(OptModel, f'eInstallGenCap_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.gc, rule=eInstallGenCap, doc='output if installed gen unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eInstallGenCap', p, sc, st, Constraint(mTEPES.n*mTEPES.gc, rule=eInstallGenCap, doc='output if installed gen unit [p.u.]'))
 
     if pIndLogConsole:
         print('eInstallGenCap            ... ', len(getattr(OptModel, f'eInstallGenCap_{p}_{sc}_{st}')), ' rows')
@@ -171,7 +180,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if (p,ec) not in mTEPES.pec or mTEPES.pMaxCharge[p,sc,n,ec] == 0.0:
             return Constraint.Skip
         return OptModel.vESSTotalCharge[p,sc,n,ec] / mTEPES.pMaxCharge[p,sc,n,ec] <= OptModel.vGenerationInvest[p,ec]
-    setattr(OptModel, f'eInstallConESS_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.ec, rule=eInstallConESS, doc='consumption if installed ESS unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eInstallConESS', p, sc, st, Constraint(mTEPES.n*mTEPES.ec, rule=eInstallConESS, doc='consumption if installed ESS unit [p.u.]'))
 
     if pIndLogConsole:
         print('eInstallConESS            ... ', len(getattr(OptModel, f'eInstallConESS_{p}_{sc}_{st}')), ' rows')
@@ -180,7 +189,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if gd in mTEPES.eh or gd not in mTEPES.nr or (p,gd) not in mTEPES.pgd or mTEPES.pMustRun[gd] or (mTEPES.pMinPowerElec[p,sc,n,gd] == 0.0 and mTEPES.pConstantVarCost[p,sc,n,gd] == 0.0):
             return Constraint.Skip
         return OptModel.vCommitment[p,sc,n,gd]                                <= 1 - OptModel.vGenerationRetire[p,gd]
-    setattr(OptModel, f'eUninstallGenComm_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.gd, rule=eUninstallGenComm, doc='commitment if uninstalled unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eUninstallGenComm', p, sc, st, Constraint(mTEPES.n*mTEPES.gd, rule=eUninstallGenComm, doc='commitment if uninstalled unit [p.u.]'))
 
     if pIndLogConsole:
         print('eUninstallGenComm         ... ', len(getattr(OptModel, f'eUninstallGenComm_{p}_{sc}_{st}')), ' rows')
@@ -189,7 +198,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if (p,gd) not in mTEPES.pgd or mTEPES.pMaxPowerElec[p,sc,n,gd] == 0.0:
             return Constraint.Skip
         return OptModel.vTotalOutput[p,sc,n,gd] / mTEPES.pMaxPowerElec[p,sc,n,gd] <= 1 - OptModel.vGenerationRetire[p,gd]
-    setattr(OptModel, f'eUninstallGenCap_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.gd, rule=eUninstallGenCap, doc='output if uninstalled gen unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eUninstallGenCap', p, sc, st, Constraint(mTEPES.n*mTEPES.gd, rule=eUninstallGenCap, doc='output if uninstalled gen unit [p.u.]'))
 
     if pIndLogConsole:
         print('eUninstallGenCap          ... ', len(getattr(OptModel, f'eUninstallGenCap_{p}_{sc}_{st}')), ' rows')
@@ -203,7 +212,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
                     sum((1-OptModel.vGenerationRetire[p,gd]) * mTEPES.pRatedMaxPowerElec[gd] * mTEPES.pAvailability[gd]() / (1.0-mTEPES.pEFOR[gd]()) for gd in mTEPES.gd if gd in g2a[ar] and (p,gd) in mTEPES.pgd) >= mTEPES.pDemandElecPeak[p,ar] * mTEPES.pReserveMargin[p,ar]())
         else:
             return Constraint.Skip
-    setattr(OptModel, f'eAdequacyReserveMarginElec_{p}_{sc}_{st}', Constraint(mTEPES.ar, rule=eAdequacyReserveMarginElec, doc='electricity system adequacy reserve margin [p.u.]'))
+    AddStageConstraint(OptModel, 'eAdequacyReserveMarginElec', p, sc, st, Constraint(mTEPES.ar, rule=eAdequacyReserveMarginElec, doc='electricity system adequacy reserve margin [p.u.]'))
 
     if pIndLogConsole:
         print('eAdeqReserveMarginElec    ... ', len(getattr(OptModel, f'eAdequacyReserveMarginElec_{p}_{sc}_{st}')), ' rows')
@@ -213,7 +222,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
             return Constraint.Skip
         # There is an emission limit, there are generators with emissions in the Area and it is the last stage
         return sum(OptModel.vTotalEmissionArea[p,sc,na,ar] for na in mTEPES.na) <= mTEPES.pEmission[p,ar]
-    setattr(OptModel, f'eMaxSystemEmission_{p}_{sc}_{st}', Constraint(mTEPES.ar, rule=eMaxSystemEmission, doc='maximum CO2 emission [MtCO2]'))
+    AddStageConstraint(OptModel, 'eMaxSystemEmission', p, sc, st, Constraint(mTEPES.ar, rule=eMaxSystemEmission, doc='maximum CO2 emission [MtCO2]'))
 
     if pIndLogConsole:
         print('eMaxSystemEmission        ... ', len(getattr(OptModel, f'eMaxSystemEmission_{p}_{sc}_{st}')), ' rows')
@@ -224,7 +233,7 @@ def GenerationOperationElecModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if mTEPES.pRESEnergy[p,ar]() == 0.0 or st != mTEPES.Last_st:
             return Constraint.Skip
         return sum(OptModel.vTotalRESEnergyArea[p,sc,na,ar] for na in mTEPES.na)/pTotalDuration >= mTEPES.pRESEnergy[p,ar]/pTotalDuration
-    setattr(OptModel, f'eMinSystemRESEnergy_{p}_{sc}_{st}', Constraint(mTEPES.ar, rule=eMinSystemRESEnergy, doc='minimum RES energy, expressed as average power over the stage [GW]'))
+    AddStageConstraint(OptModel, 'eMinSystemRESEnergy', p, sc, st, Constraint(mTEPES.ar, rule=eMinSystemRESEnergy, doc='minimum RES energy, expressed as average power over the stage [GW]'))
 
     if pIndLogConsole:
         print('eMinSystemRESEnergy       ... ', len(getattr(OptModel, f'eMinSystemRESEnergy_{p}_{sc}_{st}')), ' rows')
@@ -248,7 +257,7 @@ def GenerationOperationHeatModelFormulationInvestment(OptModel, mTEPES, pIndLogC
         if (p,bc) not in mTEPES.pbc or mTEPES.pMaxPowerHeat[p,sc,n,bc] == 0.0:
             return Constraint.Skip
         return OptModel.vTotalOutputHeat[p,sc,n,bc] / mTEPES.pMaxPowerHeat[p,sc,n,bc] <= OptModel.vGenerationInvest[p,bc]
-    setattr(OptModel, f'eInstallFHUCap_{p}_{sc}_{st}', Constraint(mTEPES.n*mTEPES.bc, rule=eInstallFHUCap, doc='heat production if installed fuel heating unit [p.u.]'))
+    AddStageConstraint(OptModel, 'eInstallFHUCap', p, sc, st, Constraint(mTEPES.n*mTEPES.bc, rule=eInstallFHUCap, doc='heat production if installed fuel heating unit [p.u.]'))
 
     if pIndLogConsole:
         print('eInstallFHUCap            ... ', len(getattr(OptModel, f'eInstallFHUCap_{p}_{sc}_{st}')), ' rows')
@@ -262,7 +271,7 @@ def GenerationOperationHeatModelFormulationInvestment(OptModel, mTEPES, pIndLogC
                     sum((1-OptModel.vGenerationRetire[p,gd]) * mTEPES.pRatedMaxPowerHeat[gd] * mTEPES.pAvailability[gd]() / (1.0-mTEPES.pEFOR[gd]()) for gd in mTEPES.gd if gd in g2a[ar] and (p,gd) in mTEPES.pgd) >= mTEPES.pDemandHeatPeak[p,ar] * mTEPES.pReserveMarginHeat[p,ar])
         else:
             return Constraint.Skip
-    setattr(OptModel, f'eAdequacyReserveMarginHeat_{p}_{sc}_{st}', Constraint(mTEPES.ar, rule=eAdequacyReserveMarginHeat, doc='heat system adequacy reserve margin [p.u.]'))
+    AddStageConstraint(OptModel, 'eAdequacyReserveMarginHeat', p, sc, st, Constraint(mTEPES.ar, rule=eAdequacyReserveMarginHeat, doc='heat system adequacy reserve margin [p.u.]'))
 
     if pIndLogConsole:
         print('eAdeqReserveMarginHeat    ... ', len(getattr(OptModel, f'eAdequacyReserveMarginHeat_{p}_{sc}_{st}')), ' rows')
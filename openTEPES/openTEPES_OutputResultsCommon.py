@@ -3,11 +3,13 @@ Open Generation, Storage, and Transmission Operation and Expansion Planning Mode
 
 Shared helpers used by every openTEPES_OutputResults<Concern> module.
 
-This module holds the small pieces that more than one results module needs: the output-directory resolver and the three Altair plot builders. Each
-concern module imports from here so the logic lives in one place and the plot styling stays the same across investment, generation, storage, economic, and network outputs.
+This module holds the small pieces that more than one results module needs: the output-directory resolver, the shared store of variable values
+and the three Altair plot builders. Each concern module imports from here so the logic lives in one place and the plot styling stays the same across
+investment, generation, storage, economic, and network outputs.
 """
 
 import os
+import numpy  as     np
 import pandas as     pd
 import altair as     alt
 
@@ -23,6 +25,54 @@ def _outdir(DirName, CaseName, mTEPES):
     return path
 
 
+class VarValues:
+    """Solution values of the model variables, pulled out once per variable and shared by every output writer.
+
+    The writers used to build each series with one `OptModel.vX[idx]()` call per index, and several of them read the same variable again. The first
+    `lookup` of a variable reads its whole solution vector into a Series indexed by the variable's keys; every later lookup of that variable is a
+    vectorised `get_indexer` on that Series. A value the solver left unset is NaN.
+    """
+
+    def __init__(self, OptModel):
+        self._model  = OptModel
+        self._series = {}
+
+    def __contains__(self, name):
+        return name in self._series
+
+    def clear(self):
+        self._series.clear()
+
+    def series(self, name) -> pd.Series:
+        """Every value of variable `name` as a Series indexed by its keys (a MultiIndex for multi-dimensional variables)."""
+        if name not in self._series:
+            var    = self._model.find_component(name)
+            keys   = list(var.keys())
+            values = np.array([v.value for v in var.values()], dtype=float)
+            index  = pd.MultiIndex.from_tuples(keys) if keys and isinstance(keys[0], tuple) else pd.Index(keys)
+            self._series[name] = pd.Series(values, index=index, name=name)
+        return self._series[name]
+
+    def lookup(self, name, keys) -> np.ndarray:
+        """Values of variable `name` at `keys`, in order; raises KeyError on a key the variable does not have."""
+        keys = list(keys)
+        if not keys:
+            return np.empty(0)
+        series   = self.series(name)
+        position = series.index.get_indexer(keys)
+        if (position < 0).any():
+            raise KeyError(f'{name}{keys[int(np.argmax(position < 0))]}')
+        return series.to_numpy()[position]
+
+
+def var_values(OptModel) -> VarValues:
+    """The `VarValues` of `OptModel`, created on first use. openTEPES_run installs a fresh one after each solve, before the writers run."""
+    values = getattr(OptModel, 'pVarValues', None)
+    if values is None:
+        values = OptModel.pVarValues = VarValues(OptModel)
+    return values
+
+
 # Definition of Pie plots
 # @profile
 def PiePlots(period, scenario, df, Category, Value):
@@ -15,11 +15,11 @@ import pandas            as     pd
 from   collections       import defaultdict
 
 try:
-    from          .openTEPES_OutputResultsCommon import _outdir, PiePlots, LinePlots
+    from          .openTEPES_OutputResultsCommon import _outdir, var_values, PiePlots, LinePlots
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from openTEPES.openTEPES_OutputResultsCommon import _outdir, PiePlots, LinePlots
+    from openTEPES.openTEPES_OutputResultsCommon import _outdir, var_values, PiePlots, LinePlots
 
 
 def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
@@ -75,7 +75,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
 
     #%% outputting the incremental variable cost of each Generator (neither ESS nor boilers) with power surplus
     sPSNARG      = [(p,sc,n,ar,g) for p,sc,n,ar,g in mTEPES.psn*mTEPES.a2g if g not in mTEPES.eh and g not in mTEPES.bo and (p,g) in mTEPES.pg]
-    OutputToFile = pd.Series(data=[(mTEPES.pLinearVarCost[p,sc,n,g]()+mTEPES.pEmissionVarCost[p,sc,n,g]) if OptModel.vTotalOutput[p,sc,n,g].ub - OptModel.vTotalOutput[p,sc,n,g]() > pSlackTolerance else math.inf for p,sc,n,ar,g in sPSNARG], index=pd.Index(sPSNARG))
+    OutputToFile = pd.Series(data=[(mTEPES.pLinearVarCost[p,sc,n,g]()+mTEPES.pEmissionVarCost[p,sc,n,g]) if OptModel.vTotalOutput[p,sc,n,g].ub - vTotalOutput > pSlackTolerance else math.inf for (p,sc,n,ar,g),vTotalOutput in zip(sPSNARG, var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,g) for p,sc,n,ar,g in sPSNARG]))], index=pd.Index(sPSNARG))
     OutputToFile *= 1e3
 
     OutputToFile = OutputToFile.to_frame(name='EUR/MWh').reset_index().pivot_table(index=['level_0','level_1','level_2','level_3'], columns='level_4', values='EUR/MWh')
@@ -96,7 +96,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
     #%% outputting the LSRMC of electricity
     if pHasDuals:
         sPSSTNND      = [(p,sc,st,n,nd) for p,sc,st,n,nd in mTEPES.s2n*mTEPES.nd if pNodeHasBalanceElec[p,nd] and (p,sc,n) in mTEPES.psn]
-        OutputResults = pd.Series(data=[mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,st,n,nd in sPSSTNND], index=pd.Index(sPSSTNND))
+        OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,st,n,nd),pDual in zip(sPSSTNND, mTEPES.pDuals.lookup('eBalanceElec', sPSSTNND))], index=pd.Index(sPSSTNND))
         OutputResults *= 1e3
         OutputResults.to_frame(name='LSRMC').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='LSRMC').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_NetworkSRMC_{CaseName}.csv', sep=',')
         OptModel.LSRMC = OutputResults.to_frame(name='LSRMC').reset_index().pivot_table(index=['level_0','level_1','level_3','level_4'], values='LSRMC').rename_axis(['level_0','level_1','level_2','level_3'], axis=0)
@@ -123,7 +123,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
 
         #%% outputting the LSRMC of H2
         sPSSTNND      = [(p,sc,st,n,nd) for p,sc,st,n,nd in mTEPES.s2n*mTEPES.nd if len(e2n[nd]) + len(b2n[nd]) + len(lout[nd]) + len(lin[nd]) and (p,sc,n) in mTEPES.psn]
-        OutputResults = pd.Series(data=[mTEPES.pDuals[f"eBalanceH2_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]() for p,sc,st,n,nd in sPSSTNND], index=pd.Index(sPSSTNND))
+        OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]() for (p,sc,st,n,nd),pDual in zip(sPSSTNND, mTEPES.pDuals.lookup('eBalanceH2', sPSSTNND))], index=pd.Index(sPSSTNND))
         OutputResults *= 1e3
         OutputResults.to_frame(name='LSRMCH2').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='LSRMCH2').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_NetworkSRMCH2_{CaseName}.csv', sep=',')
         OptModel.LSRMCH2 = OutputResults.to_frame(name='LSRMCH2').reset_index().pivot_table(index=['level_0','level_1','level_3','level_4'], values='LSRMCH2').rename_axis(['level_0','level_1','level_2','level_3'], axis=0)
@@ -143,7 +143,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
 
         #%% outputting the LSRMC of heat
         sPSSTNND      = [(p,sc,st,n,nd) for p,sc,st,n,nd in mTEPES.s2n*mTEPES.nd if len(c2n[nd]) + len(h2n[nd]) + len(lout[nd]) + len(lin[nd]) and (p,sc,n) in mTEPES.psn]
-        OutputResults = pd.Series(data=[mTEPES.pDuals[f"eBalanceHeat_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,st,n,nd in sPSSTNND], index=pd.Index(sPSSTNND))
+        OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,st,n,nd),pDual in zip(sPSSTNND, mTEPES.pDuals.lookup('eBalanceHeat', sPSSTNND))], index=pd.Index(sPSSTNND))
         OutputResults *= 1e3
         OutputResults.to_frame(name='LSRMCHeat').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='LSRMCHeat').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_NetworkSRMCHeat_{CaseName}.csv', sep=',')
 
@@ -161,7 +161,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
         pHasCandidateInArea   = {(p, ar): any(gc in g2a[ar] and (p,gc) in mTEPES.pgc for gc in mTEPES.gc) for p in mTEPES.p for ar in mTEPES.ar}
         sPSSTAR               = [(p,sc,st,ar) for p,sc,st,ar in mTEPES.ps*mTEPES.st*mTEPES.ar if mTEPES.pReserveMargin[p,ar]() and st == mTEPES.Last_st and pHasCandidateInArea[p,ar] and pExistingFirmCapacity[p,ar] <= mTEPES.pDemandElecPeak[p,ar] * mTEPES.pReserveMargin[p,ar]()]
         if sPSSTAR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f'eAdequacyReserveMarginElec_{p}_{sc}_{st}{ar}'] for p,sc,st,ar in sPSSTAR], index=pd.Index(sPSSTAR))
+            OutputResults = pd.Series(data=mTEPES.pDuals.lookup('eAdequacyReserveMarginElec', sPSSTAR), index=pd.Index(sPSSTAR))
             OutputResults.to_frame(name='RM').reset_index().pivot_table(index=['level_0','level_1'], columns='level_3', values='RM').rename_axis(['Period', 'Scenario'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalReserveMargin_{CaseName}.csv', sep=',')
 
     if mTEPES.pIndHeat() and (mTEPES.gc or mTEPES.gd) and sum(mTEPES.pReserveMarginHeat[:,:]) and pHasDuals:
@@ -171,7 +171,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
         pHasCandidateInArea   = {(p,ar): any(gc in g2a[ar] and (p,gc) in mTEPES.pgc for gc in mTEPES.gc) for p in mTEPES.p for ar in mTEPES.ar}
         sPSSTAR               = [(p,sc,st,ar) for p,sc,st,ar in mTEPES.ps*mTEPES.st*mTEPES.ar if mTEPES.pReserveMarginHeat[p,ar] and st == mTEPES.Last_st and pHasCandidateInArea[p,ar] and pExistingFirmCapacity[p,ar] <= mTEPES.pDemandHeatPeak[p,ar] * mTEPES.pReserveMarginHeat[p,ar]]
         if sPSSTAR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f'eAdequacyReserveMarginHeat_{p}_{sc}_{st}{ar}'] for p,sc,st,ar in sPSSTAR], index=pd.Index(sPSSTAR))
+            OutputResults = pd.Series(data=mTEPES.pDuals.lookup('eAdequacyReserveMarginHeat', sPSSTAR), index=pd.Index(sPSSTAR))
             OutputResults.to_frame(name='RM').reset_index().pivot_table(index=['level_0','level_1'], columns='level_3', values='RM').rename_axis(['Period', 'Scenario'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalReserveMarginHeat_{CaseName}.csv', sep=',')
 
     if pHasDuals:
@@ -179,19 +179,19 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
         pHasEmissionRate  = {ar: sum(mTEPES.pEmissionRate[g] for g in g2a[ar]) != 0.0 for ar in mTEPES.ar}
         sPSSTAR           = [(p,sc,st,ar) for p,sc,st,ar in mTEPES.ps*mTEPES.st*mTEPES.ar if mTEPES.pEmission[p,ar] < math.inf and st == mTEPES.Last_st and pHasEmissionRate[ar]]
         if sPSSTAR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f'eMaxSystemEmission_{p}_{sc}_{st}{ar}'] for p,sc,st,ar in sPSSTAR], index=pd.Index(sPSSTAR))
+            OutputResults = pd.Series(data=mTEPES.pDuals.lookup('eMaxSystemEmission', sPSSTAR), index=pd.Index(sPSSTAR))
             OutputResults.to_frame(name='EM').reset_index().pivot_table(index=['level_0','level_1'], columns='level_3', values='EM').rename_axis(['Period', 'Scenario'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalEmission_{CaseName}.csv', sep=',')
 
         sPSSTAR           = [(p,sc,st,ar) for p,sc,st,ar in mTEPES.ps*mTEPES.st*mTEPES.ar if mTEPES.pRESEnergy[p,ar]() and st == mTEPES.Last_st]
         if sPSSTAR:
             pTotalDuration = {(p,sc): sum(mTEPES.pLoadLevelDuration[p,sc,na]() for na in mTEPES.na) for p,sc in mTEPES.ps}
-            OutputResults  = pd.Series(data=[mTEPES.pDuals[f'eMinSystemRESEnergy_{p}_{sc}_{st}{ar}']*1e-3*pTotalDuration[p,sc] for p,sc,st,ar in sPSSTAR], index=pd.Index(sPSSTAR))
+            OutputResults  = pd.Series(data=[pDual*1e-3*pTotalDuration[p,sc] for (p,sc,st,ar),pDual in zip(sPSSTAR, mTEPES.pDuals.lookup('eMinSystemRESEnergy', sPSSTAR))], index=pd.Index(sPSSTAR))
             OutputResults.to_frame(name='RES').reset_index().pivot_table(index=['level_0','level_1'], columns='level_3', values='RES').rename_axis(['Period', 'Scenario'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalRESEnergy_{CaseName}.csv', sep=',')
 
     #%% outputting the up operating reserve marginal
     if pHasOperReserveUp and pHasReserveOffer and pHasDuals:
         sPSSTNAR      = [(p,sc,st,n,ar) for p,sc,st,n,ar in mTEPES.s2n*mTEPES.ar if mTEPES.pOperReserveUp[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n) in mTEPES.psn]
-        OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveUp_{p}_{sc}_{st}('{n}', '{ar}')"] for p,sc,st,n,ar in sPSSTNAR], index=pd.Index(sPSSTNAR))
+        OutputResults = pd.Series(data=mTEPES.pDuals.lookup('eOperReserveUp', sPSSTNAR), index=pd.Index(sPSSTNAR))
         OutputResults *= 1e3
         OutputResults.to_frame(name='UORM').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='UORM').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalOperatingReserveUp_{CaseName}.csv', sep=',')
         if pIndPlotOutput:
@@ -205,7 +205,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
     #%% outputting the down operating reserve marginal
     if pHasOperReserveDw and pHasReserveOffer and pHasDuals:
         sPSSTNAR      = [(p,sc,st,n,ar) for p,sc,st,n,ar in mTEPES.s2n*mTEPES.ar if mTEPES.pOperReserveDw[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n) in mTEPES.psn]
-        OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveDw_{p}_{sc}_{st}('{n}', '{ar}')"] for p,sc,st,n,ar in sPSSTNAR], index=pd.Index(sPSSTNAR))
+        OutputResults = pd.Series(data=mTEPES.pDuals.lookup('eOperReserveDw', sPSSTNAR), index=pd.Index(sPSSTNAR))
         OutputResults *= 1e3
         OutputResults.to_frame(name='DORM').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='DORM').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalOperatingReserveDown_{CaseName}.csv', sep=',')
         if pIndPlotOutput:
@@ -221,7 +221,7 @@ def MarginalResults(DirName, CaseName, OptModel, mTEPES, pIndPlotOutput):
         # eESSInventory is declared over mTEPES.nesc (openTEPES_ModelFormulationElectricity.py:312), i.e. only the load levels that close a storage cycle; mTEPES.nesc is a plain list, so test membership against a set built once
         pNESC         = set(mTEPES.nesc)
         sPSSTNES      = [(p,sc,st,n,es) for p,sc,st,n,es in mTEPES.s2n*mTEPES.es if (p,sc,n,es) in mTEPES.psnes and (n,es) in pNESC and (mTEPES.pTotalMaxCharge[es] or mTEPES.pTotalEnergyInflows[es])]
-        OutputToFile  = pd.Series(data=[abs(mTEPES.pDuals[f"eESSInventory_{p}_{sc}_{st}('{n}', '{es}')"])*1e3 for p,sc,st,n,es in sPSSTNES], index=pd.Index(sPSSTNES))
+        OutputToFile  = pd.Series(data=[abs(pDual)*1e3 for (p,sc,st,n,es),pDual in zip(sPSSTNES, mTEPES.pDuals.lookup('eESSInventory', sPSSTNES))], index=pd.Index(sPSSTNES))
         if len(OutputToFile):
             OutputToFile.to_frame(name='WaterValue').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='WaterValue').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalEnergyValue_{CaseName}.csv', sep=',')
         if pIndPlotOutput and len(OutputToFile):
@@ -409,7 +409,7 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
     if mTEPES.eh:
         OutputResults03 = pd.Series(data=[ sum(OptModel.vTotalOutput   [p,sc,n,eh      ]()*mTEPES.pLoadLevelDuration[p,sc,n]() for eh in pNodeTechEH[p,nd,et]) for p,sc,n,ar,nd,et in sPSNARNDET], index=pd.Index(sPSNARNDET)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
         OutputResults04 = pd.Series(data=[-sum(OptModel.vESSTotalCharge[p,sc,n,eh      ]()*mTEPES.pLoadLevelDuration[p,sc,n]() for eh in pNodeTechEH[p,nd,et]) for p,sc,n,ar,nd,et in sPSNARNDET], index=pd.Index(sPSNARNDET)).to_frame(name='Consumption'    ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Consumption', aggfunc='sum').rename(columns={et: et+str(' -') for et in mTEPES.et})
-    OutputResults05     = pd.Series(data=[     OptModel.vENS           [p,sc,n,nd      ]()*mTEPES.pLoadLevelDuration[p,sc,n]()                                                                                      for p,sc,n,ar,nd    in sPSNARND  ], index=pd.Index(sPSNARND  )).to_frame(name='EnergyNotServed')
+    OutputResults05     = pd.Series(data=[     vENS*mTEPES.pLoadLevelDuration[p,sc,n]()                                                                                      for (p,sc,n,ar,nd),vENS in zip(sPSNARND, var_values(OptModel).lookup('vENS', [(p,sc,n,nd) for p,sc,n,ar,nd in sPSNARND]))  ], index=pd.Index(sPSNARND  )).to_frame(name='EnergyNotServed')
     OutputResults06     = pd.Series(data=[-  mTEPES.pDemandElec        [p,sc,n,nd      ]()  *mTEPES.pLoadLevelDuration[p,sc,n]()                                                                                      for p,sc,n,ar,nd    in sPSNARND  ], index=pd.Index(sPSNARND  )).to_frame(name='EnergyDemand'   )
     OutputResults07     = pd.Series(data=[-sum(OptModel.vFlowElec      [p,sc,n,nd,nf,cc]()*mTEPES.pLoadLevelDuration[p,sc,n]() for nf,cc in lout [nd] if (p,nd,nf,cc) in mTEPES.pla                               ) for p,sc,n,ar,nd    in sPSNARND  ], index=pd.Index(sPSNARND  )).to_frame(name='EnergyFlowOut'  )
     OutputResults08     = pd.Series(data=[ sum(OptModel.vFlowElec      [p,sc,n,ni,nd,cc]()*mTEPES.pLoadLevelDuration[p,sc,n]() for ni,cc in lin  [nd] if (p,ni,nd,cc) in mTEPES.pla                               ) for p,sc,n,ar,nd    in sPSNARND  ], index=pd.Index(sPSNARND  )).to_frame(name='EnergyFlowIn'   )
@@ -448,10 +448,10 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
 
     if pHasDuals:
         # keep the LSRMC under its own name: OutputResults still holds the energy balance built above, and concatenating that by mistake writes GWh into a price file
-        LSRMCElec     = pd.Series(data=[mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,st,n,ar,nd in sPSSTNARND], index=pd.Index(sPSSTNARND))
+        LSRMCElec     = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,st,n,ar,nd),pDual in zip(sPSSTNARND, mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd) for p,sc,st,n,ar,nd in sPSSTNARND]))], index=pd.Index(sPSSTNARND))
         LSRMCElec *= 1e3
         LSRMCElec.index = LSRMCElec.index.droplevel(2)
-        OutputResults = pd.Series(data=[mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,st,n,ar,nd in sPSSTNARND], index=pd.Index(sPSSTNARND))
+        OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,st,n,ar,nd),pDual in zip(sPSSTNARND, mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd) for p,sc,st,n,ar,nd in sPSSTNARND]))], index=pd.Index(sPSSTNARND))
         OutputResults *= 1e3
         OutputResults.index = OutputResults.index.droplevel(2)
 
@@ -473,12 +473,12 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
 
     #%% outputting the generator power output
     if sum(1 for nr in mTEPES.nr if nr not in mTEPES.eh):
-        OutputResults01 = pd.Series(data=[    OptModel.vTotalOutput   [p,sc,n,nr      ]()*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for p,sc,n,ar,nd,nr in sPSNARNDNR], index=pd.Index(sPSNARNDNR)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
+        OutputResults01 = pd.Series(data=[    vTotalOutput*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for (p,sc,n,ar,nd,nr),vTotalOutput in zip(sPSNARNDNR, var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,nr) for p,sc,n,ar,nd,nr in sPSNARNDNR]))], index=pd.Index(sPSNARNDNR)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
     if mTEPES.re:
-        OutputResults02 = pd.Series(data=[    OptModel.vTotalOutput   [p,sc,n,re      ]()*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for p,sc,n,ar,nd,re in sPSNARNDRE], index=pd.Index(sPSNARNDRE)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
+        OutputResults02 = pd.Series(data=[    vTotalOutput*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for (p,sc,n,ar,nd,re),vTotalOutput in zip(sPSNARNDRE, var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,re) for p,sc,n,ar,nd,re in sPSNARNDRE]))], index=pd.Index(sPSNARNDRE)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
     if mTEPES.eh:
-        OutputResults03 = pd.Series(data=[    OptModel.vTotalOutput   [p,sc,n,eh      ]()*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for p,sc,n,ar,nd,eh in sPSNARNDEH], index=pd.Index(sPSNARNDEH)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
-        OutputResults04 = pd.Series(data=[   -OptModel.vESSTotalCharge[p,sc,n,eh      ]()*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for p,sc,n,ar,nd,eh in sPSNARNDEH], index=pd.Index(sPSNARNDEH)).to_frame(name='Consumption'    ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Consumption', aggfunc='sum').rename(columns={et: et+str(' -') for et in mTEPES.et})
+        OutputResults03 = pd.Series(data=[    vTotalOutput*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for (p,sc,n,ar,nd,eh),vTotalOutput in zip(sPSNARNDEH, var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,eh) for p,sc,n,ar,nd,eh in sPSNARNDEH]))], index=pd.Index(sPSNARNDEH)).to_frame(name='Generation'     ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Generation' , aggfunc='sum')
+        OutputResults04 = pd.Series(data=[   -vESSTotalCharge*mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for (p,sc,n,ar,nd,eh),vESSTotalCharge in zip(sPSNARNDEH, var_values(OptModel).lookup('vESSTotalCharge', [(p,sc,n,eh) for p,sc,n,ar,nd,eh in sPSNARNDEH]))], index=pd.Index(sPSNARNDEH)).to_frame(name='Consumption'    ).reset_index().pivot_table(index=['level_0','level_1','level_2','level_3','level_4'], columns='level_5', values='Consumption', aggfunc='sum').rename(columns={et: et+str(' -') for et in mTEPES.et})
     # OutputResults05 (EnergyNotServed) and OutputResults08 (EnergyFlowIn) used to be rebuilt here and were never read again: the two
     # frames written below take 04, 06, 09 and 10, and the generation block takes 01, 02 and 03. Two full passes over sPSNARND removed.
     OutputResults06     = pd.Series(data=[   -mTEPES.pDemandElec      [p,sc,n,nd      ]()  *mTEPES.pLoadLevelDuration[p,sc,n]()                                                       for p,sc,n,ar,nd    in sPSNARND  ], index=pd.Index(sPSNARND  )).to_frame(name='EnergyDemand'   )
@@ -532,34 +532,34 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
     pHasLinearOMCost  = any(mTEPES.pLinearOMCost   [gg ]   for gg  in mTEPES.gg)
     pHasLinearVarCost = any(mTEPES.pLinearVarCost  [idx]() for idx in mTEPES.pLinearVarCost)
     pHasESSReserve    = any(mTEPES.pIndOperReserveGen[eh] == 0 or mTEPES.pIndOperReserveCon[eh] == 0 for eh in mTEPES.eh)
-    OutputToFile = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost  [p,sc,n,nr]() * OptModel.vTotalOutput[p,sc,n,nr]() +
-                                    pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pConstantVarCost[p,sc,n,nr]   * OptModel.vCommitment [p,sc,n,nr]() +
-                                    pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pStartUpCost    [       nr]   * OptModel.vStartUp    [p,sc,n,nr]() +
-                                    pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pShutDownCost   [       nr]   * OptModel.vShutDown   [p,sc,n,nr]()) for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+    OutputToFile = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost  [p,sc,n,nr]() * vTotalOutput +
+                                    pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pConstantVarCost[p,sc,n,nr]   * vCommitment +
+                                    pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pStartUpCost    [       nr]   * vStartUp +
+                                    pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pShutDownCost   [       nr]   * vShutDown) for (p,sc,n,nr),vTotalOutput,vCommitment,vStartUp,vShutDown in zip(mTEPES.psnnr, var_values(OptModel).lookup('vTotalOutput', mTEPES.psnnr), var_values(OptModel).lookup('vCommitment', mTEPES.psnnr), var_values(OptModel).lookup('vStartUp', mTEPES.psnnr), var_values(OptModel).lookup('vShutDown', mTEPES.psnnr))], index=mTEPES.psnnr)
     if mTEPES.nr:
         OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationCostOperation_{CaseName}.csv', sep=',')
 
     if mTEPES.re:
-        OutputToFile = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearOMCost [re] * OptModel.vTotalOutput [p,sc,n,re]() for p,sc,n,re in mTEPES.psnre], index=mTEPES.psnre)
+        OutputToFile = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearOMCost [re] * vTotalOutput for (p,sc,n,re),vTotalOutput in zip(mTEPES.psnre, var_values(OptModel).lookup('vTotalOutput', mTEPES.psnre))], index=mTEPES.psnre)
         OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationCostOandM_{CaseName}.csv', sep=',')
 
     if mTEPES.nr and (pHasOperReserveUp or pHasOperReserveDw):
-        OutputToFile = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[nr] * OptModel.vReserveUp  [p,sc,n,nr]() +
-                                        pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[nr] * OptModel.vReserveDown[p,sc,n,nr]()) for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+        OutputToFile = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[nr] * vReserveUp +
+                                        pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[nr] * vReserveDown) for (p,sc,n,nr),vReserveUp,vReserveDown in zip(mTEPES.psnnr, var_values(OptModel).lookup('vReserveUp', mTEPES.psnnr), var_values(OptModel).lookup('vReserveDown', mTEPES.psnnr))], index=mTEPES.psnnr)
         OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationCostOperatingReserve_{CaseName}.csv', sep=',')
 
     if mTEPES.psnehc:
-        OutputToFile = pd.Series(data=[     pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost[p,sc,n,eh]() * OptModel.vESSTotalCharge[p,sc,n,eh]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+        OutputToFile = pd.Series(data=[     pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost[p,sc,n,eh]() * vESSTotalCharge for (p,sc,n,eh),vESSTotalCharge in zip(mTEPES.psnehc, var_values(OptModel).lookup('vESSTotalCharge', mTEPES.psnehc))], index=mTEPES.psnehc)
         OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_ConsumptionCostOperation_{CaseName}.csv', sep=',')
         if pHasESSReserve:
-            OutputToFile = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[eh] * OptModel.vESSReserveUp  [p,sc,n,eh]() +
-                                            pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[eh] * OptModel.vESSReserveDown[p,sc,n,eh]()) for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+            OutputToFile = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[eh] * vESSReserveUp +
+                                            pScenFactor[p,sc] * mTEPES.pLoadLevelWeight[p,sc,n]() * mTEPES.pOperReserveCost[eh] * vESSReserveDown) for (p,sc,n,eh),vESSReserveUp,vESSReserveDown in zip(mTEPES.psnehc, var_values(OptModel).lookup('vESSReserveUp', mTEPES.psnehc), var_values(OptModel).lookup('vESSReserveDown', mTEPES.psnehc))], index=mTEPES.psnehc)
             OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_ConsumptionCostOperatingReserve_{CaseName}.csv', sep=',')
 
-    OutputToFile = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pEmissionVarCost[p,sc,n,g] * OptModel.vTotalOutput[p,sc,n,g]() for p,sc,n,g in mTEPES.psng], index=mTEPES.psng)
+    OutputToFile = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pEmissionVarCost[p,sc,n,g] * vTotalOutput for (p,sc,n,g),vTotalOutput in zip(mTEPES.psng, var_values(OptModel).lookup('vTotalOutput', mTEPES.psng))], index=mTEPES.psng)
     OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'],     columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationCostEmission_{CaseName}.csv', sep=',')
 
-    OutputToFile = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pENSCost()                  * OptModel.vENS        [p,sc,n,nd]() for p,sc,n,nd in mTEPES.psnnd], index=mTEPES.psnnd)
+    OutputToFile = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pENSCost()                  * vENS for (p,sc,n,nd),vENS in zip(mTEPES.psnnd, var_values(OptModel).lookup('vENS', mTEPES.psnnd))], index=mTEPES.psnnd)
     OutputToFile.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_2'],     columns='level_3', values='MEUR', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_NetworkCostENS_{CaseName}.csv', sep=',')
 
     def Transformation1(df, _name):
@@ -583,45 +583,45 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
                     if mTEPES.nr:
                         sPSNNR = [(p,sc,n,nr) for p,sc,n,nr in mTEPES.psnnr if nr in n2a[ar]]
                         if sPSNNR:
-                            OutputResults1 =     pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost  [p,sc,n,nr]() * OptModel.vTotalOutput[p,sc,n,nr]() +
-                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pConstantVarCost[p,sc,n,nr] * OptModel.vCommitment [p,sc,n,nr]() +
-                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pStartUpCost    [       nr] * OptModel.vStartUp    [p,sc,n,nr]() +
-                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pShutDownCost   [       nr] * OptModel.vShutDown   [p,sc,n,nr]()) for p,sc,n,nr in sPSNNR], index=pd.Index(sPSNNR))
+                            OutputResults1 =     pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost  [p,sc,n,nr]() * vTotalOutput +
+                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pConstantVarCost[p,sc,n,nr] * vCommitment +
+                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pStartUpCost    [       nr] * vStartUp +
+                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pShutDownCost   [       nr] * vShutDown) for (p,sc,n,nr),vTotalOutput,vCommitment,vStartUp,vShutDown in zip(sPSNNR, var_values(OptModel).lookup('vTotalOutput', sPSNNR), var_values(OptModel).lookup('vCommitment', sPSNNR), var_values(OptModel).lookup('vStartUp', sPSNNR), var_values(OptModel).lookup('vShutDown', sPSNNR))], index=pd.Index(sPSNNR))
                             OutputResults1 =     Transformation1(OutputResults1, 'Operation Cost Generation')
                             sPSNNR = [(p,sc,n,nr) for p,sc,n,nr in mTEPES.psnnr if nr in n2a[ar]]
                             if pHasOperReserveUp or pHasOperReserveDw:
-                                OutputResults2 = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       nr] * OptModel.vReserveUp  [p,sc,n,nr]() +
-                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       nr] * OptModel.vReserveDown[p,sc,n,nr]()) for p,sc,n,nr in sPSNNR], index=pd.Index(sPSNNR))
+                                OutputResults2 = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       nr] * vReserveUp +
+                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       nr] * vReserveDown) for (p,sc,n,nr),vReserveUp,vReserveDown in zip(sPSNNR, var_values(OptModel).lookup('vReserveUp', sPSNNR), var_values(OptModel).lookup('vReserveDown', sPSNNR))], index=pd.Index(sPSNNR))
                                 OutputResults2 = Transformation1(OutputResults2, 'Operating Reserve Cost Generation')
 
                     if mTEPES.g :
                         sPSNG  = [(p,sc,n,g ) for p,sc,n,g  in mTEPES.psng  if g  in g2a[ar]]
                         if sPSNG:
                             if pHasEmissionCost:
-                                OutputResults6 = pd.Series(data=[ pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pEmissionVarCost[p,sc,n,g ] * OptModel.vTotalOutput[p,sc,n,g ]() for p,sc,n,g in sPSNG], index=pd.Index(sPSNG))
+                                OutputResults6 = pd.Series(data=[ pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pEmissionVarCost[p,sc,n,g ] * vTotalOutput for (p,sc,n,g),vTotalOutput in zip(sPSNG, var_values(OptModel).lookup('vTotalOutput', sPSNG))], index=pd.Index(sPSNG))
                                 OutputResults6 = Transformation1(OutputResults6, 'Emission Cost')
 
                     if mTEPES.re:
                         sPSNRE = [(p,sc,n,re) for p,sc,n,re in mTEPES.psnre if re in g2a[ar]]
                         if sPSNRE:
                             if pHasLinearOMCost:
-                                OutputResults3 = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearOMCost [re] * OptModel.vTotalOutput   [p,sc,n,re]() for p,sc,n,re in sPSNRE], index=pd.Index(sPSNRE))
+                                OutputResults3 = pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearOMCost [re] * vTotalOutput for (p,sc,n,re),vTotalOutput in zip(sPSNRE, var_values(OptModel).lookup('vTotalOutput', sPSNRE))], index=pd.Index(sPSNRE))
                                 OutputResults3 = Transformation1(OutputResults3, 'O&M Cost Generation')
 
                     if mTEPES.psnehc:
                         sPSNES = [(p,sc,n,eh) for p,sc,n,eh in mTEPES.psnehc if eh in g2a[ar]]
                         if sPSNES:
                             if pHasLinearVarCost:
-                                OutputResults4 = pd.Series(data=[ pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost  [p,sc,n,eh]() * OptModel.vESSTotalCharge[p,sc,n,eh]()  for p,sc,n,eh in sPSNES], index=pd.Index(sPSNES))
+                                OutputResults4 = pd.Series(data=[ pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pLinearVarCost  [p,sc,n,eh]() * vESSTotalCharge  for (p,sc,n,eh),vESSTotalCharge in zip(sPSNES, var_values(OptModel).lookup('vESSTotalCharge', sPSNES))], index=pd.Index(sPSNES))
                                 OutputResults4 = Transformation1(OutputResults4, 'Operation Cost Consumption')
                             if pHasESSReserve:
-                                OutputResults5 = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       eh] * OptModel.vESSReserveUp  [p,sc,n,eh]() +
-                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       eh] * OptModel.vESSReserveDown[p,sc,n,eh]()) for p,sc,n,eh in sPSNES], index=pd.Index(sPSNES))
+                                OutputResults5 = pd.Series(data=[(pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       eh] * vESSReserveUp +
+                                                                  pScenFactor[p,sc] * mTEPES.pLoadLevelWeight  [p,sc,n]() * mTEPES.pOperReserveCost[       eh] * vESSReserveDown) for (p,sc,n,eh),vESSReserveUp,vESSReserveDown in zip(sPSNES, var_values(OptModel).lookup('vESSReserveUp', sPSNES), var_values(OptModel).lookup('vESSReserveDown', sPSNES))], index=pd.Index(sPSNES))
                                 OutputResults5 = Transformation1(OutputResults5, 'Operating Reserve Cost Consumption')
 
                     sPSNND = [(p,sc,n,nd) for p,sc,n,nd in mTEPES.psnnd if (nd,ar) in mTEPES.ndar]
                     if sPSNND:
-                        OutputResults7 =         pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pENSCost()           * OptModel.vENS        [p,sc,n,nd]() for p,sc,n,nd in sPSNND], index=pd.Index(sPSNND))
+                        OutputResults7 =         pd.Series(data=[pScenFactor[p,sc] * mTEPES.pLoadLevelDuration[p,sc,n]() * mTEPES.pENSCost()           * vENS for (p,sc,n,nd),vENS in zip(sPSNND, var_values(OptModel).lookup('vENS', sPSNND))], index=pd.Index(sPSNND))
                         OutputResults7 =         Transformation1(OutputResults7, 'Reliability Cost')
 
                     OutputResults = pd.concat([OutputResults1, OutputResults2, OutputResults3, OutputResults4, OutputResults5, OutputResults6, OutputResults7]).reset_index().rename(columns={'level_0': 'Period', 'level_1': 'Scenario', 'level_2': 'Cost', 0: 'MEUR'})
@@ -639,8 +639,8 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
     GenRev                = pd.Series(data=[0.0 for gc in mTEPES.gc], index=mTEPES.gc, dtype='float64')
     ChargeRev             = pd.Series(data=[0.0 for gc in mTEPES.gc], index=mTEPES.gc, dtype='float64')
     if pHasDuals:
-        OutputResults     = pd.Series(data=[ mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*OptModel.vTotalOutput   [p,sc,n,g]() for p,sc,st,n,nd,g in sPSSTNNDG], index=pd.Index(sPSSTNNDG))
-        MeanOutput        = pd.Series(data=[OptModel.vTotalOutput[p,sc,n,g]() for p,sc,st,n,g in sPSSTNG], index=pd.Index(sPSSTNG)).groupby(level=4).mean()
+        OutputResults     = pd.Series(data=[ pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*vTotalOutput for (p,sc,st,n,nd,g),pDual,vTotalOutput in zip(sPSSTNNDG, mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd) for p,sc,st,n,nd,g in sPSSTNNDG]), var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,g) for p,sc,st,n,nd,g in sPSSTNNDG]))], index=pd.Index(sPSSTNNDG))
+        MeanOutput        = pd.Series(data=var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,g) for p,sc,st,n,g in sPSSTNG]), index=pd.Index(sPSSTNG)).groupby(level=4).mean()
         MeanOutput        = MeanOutput.where(MeanOutput > pMinMeanOutput) * 1e-3
         OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueEnergyGeneration_{CaseName}.csv', sep=',')
         # reuse the revenue series above (dual x output) and divide it by the mean output per generator (level 5) instead of recomputing
@@ -651,8 +651,8 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
         if mTEPES.eh:
             sPSSTNES      = [(p,sc,st,n,   eh) for p,sc,st,n,   eh in mTEPES.s2n*mTEPES.eh  if (p,sc,n,eh) in mTEPES.psneh]
             sPSSTNNDEH    = [(p,sc,st,n,nd,eh) for p,sc,st,n,nd,eh in mTEPES.s2n*mTEPES.n2g if (p,sc,n,eh) in mTEPES.psneh]
-            OutputResults = pd.Series(data=[-mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*OptModel.vESSTotalCharge[p,sc,n,eh]() for p,sc,st,n,nd,eh in sPSSTNNDEH], index=pd.Index(sPSSTNNDEH))
-            MeanOutput    = pd.Series(data=[OptModel.vESSTotalCharge[p,sc,n,eh]() for p,sc,st,n,eh in sPSSTNES], index=pd.Index(sPSSTNES)).groupby(level=4).mean()
+            OutputResults = pd.Series(data=[-pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*vESSTotalCharge for (p,sc,st,n,nd,eh),pDual,vESSTotalCharge in zip(sPSSTNNDEH, mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd) for p,sc,st,n,nd,eh in sPSSTNNDEH]), var_values(OptModel).lookup('vESSTotalCharge', [(p,sc,n,eh) for p,sc,st,n,nd,eh in sPSSTNNDEH]))], index=pd.Index(sPSSTNNDEH))
+            MeanOutput    = pd.Series(data=var_values(OptModel).lookup('vESSTotalCharge', [(p,sc,n,eh) for p,sc,st,n,eh in sPSSTNES]), index=pd.Index(sPSSTNES)).groupby(level=4).mean()
             MeanOutput    = MeanOutput.where(MeanOutput > pMinMeanOutput) * 1e-3
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueEnergyConsumption_{CaseName}.csv', sep=',')
             # reuse the consumption revenue series above and divide it by the mean charge per consumption unit (level 5) rather than recomputing
@@ -666,11 +666,11 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
             # gc units that belong to some ESS technology: the two set comprehensions below only need the yes/no answer, and asking it once per tuple over mTEPES.ot both costs and risks emitting the same tuple twice
             pGcInESSTech           = {gc for ot in mTEPES.ot for gc in o2e[ot]}
             sPSSTNNDGC1            = [(p,sc,st,n,nd,gc) for p,sc,st,n,nd,gc in mTEPES.s2n*mTEPES.n2g if (p,sc,n,gc) in mTEPES.psngc]
-            OutputToGenRev         = pd.Series(data=[mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*OptModel.vTotalOutput   [p,sc,n,gc]() for p,sc,st,n,nd,gc in sPSSTNNDGC1], index=pd.Index(sPSSTNNDGC1))
+            OutputToGenRev         = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*vTotalOutput for (p,sc,st,n,nd,gc),pDual,vTotalOutput in zip(sPSSTNNDGC1, mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd) for p,sc,st,n,nd,gc in sPSSTNNDGC1]), var_values(OptModel).lookup('vTotalOutput', [(p,sc,n,gc) for p,sc,st,n,nd,gc in sPSSTNNDGC1]))], index=pd.Index(sPSSTNNDGC1))
             GenRev.append(OutputToGenRev)
             sPSSTNNDGC2            = [(p,sc,st,n,nd,gc) for p,sc,st,n,nd,gc in sPSSTNNDGC1 if (p,sc,n,gc) in mTEPES.psngc and gc in pGcInESSTech]
             if sPSSTNNDGC2:
-                OutputChargeRevESS = pd.Series(data=[mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*OptModel.vESSTotalCharge[p,sc,n,gc]() for p,sc,st,n,nd,gc in sPSSTNNDGC2], index=pd.Index(sPSSTNNDGC2))
+                OutputChargeRevESS = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*vESSTotalCharge for (p,sc,st,n,nd,gc),pDual,vESSTotalCharge in zip(sPSSTNNDGC2, mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd) for p,sc,st,n,nd,gc in sPSSTNNDGC2]), var_values(OptModel).lookup('vESSTotalCharge', [(p,sc,n,gc) for p,sc,st,n,nd,gc in sPSSTNNDGC2]))], index=pd.Index(sPSSTNNDGC2))
                 ChargeRev.append(OutputChargeRevESS)
             sPSSTNNDGC3            = [(p,sc,st,n,nd,gc) for p,sc,st,n,nd,gc in sPSSTNNDGC1 if gc not in pGcInESSTech]
             if sPSSTNNDGC3:
@@ -695,7 +695,7 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
     if (mTEPES.gc or mTEPES.gd) and sum(mTEPES.pReserveMargin[:,:]()) and pHasDuals:
         pExistingFirmCapacity = {(p, ar): sum(mTEPES.pRatedMaxPowerElec[g] * mTEPES.pAvailability[g]() / (1.0-mTEPES.pEFOR[g]()) for g in g2a[ar] if (p,g) in mTEPES.pg and g not in mTEPES.gc and g not in mTEPES.gd) for p in mTEPES.p for ar in mTEPES.ar}
         sPSSTARGC             = [(p,sc,st,ar,gc) for p,sc,st,ar,gc in mTEPES.ps*mTEPES.st*mTEPES.ar*mTEPES.gc if gc in g2a[ar] and (p,gc) in mTEPES.pgc and mTEPES.pReserveMargin[p,ar]() and st == mTEPES.Last_st and sum(1 for gc in mTEPES.gc if gc in g2a[ar]) and pExistingFirmCapacity[p,ar] <= mTEPES.pDemandElecPeak[p,ar] * mTEPES.pReserveMargin[p,ar]()]
-        OutputToResRev        = pd.Series(data=[mTEPES.pDuals[f'eAdequacyReserveMarginElec_{p}_{sc}_{st}{ar}']*mTEPES.pRatedMaxPowerElec[gc]*mTEPES.pAvailability[gc]() for p,sc,st,ar,gc in sPSSTARGC], index=pd.Index(sPSSTARGC))
+        OutputToResRev        = pd.Series(data=[pDual*mTEPES.pRatedMaxPowerElec[gc]*mTEPES.pAvailability[gc]() for (p,sc,st,ar,gc),pDual in zip(sPSSTARGC, mTEPES.pDuals.lookup('eAdequacyReserveMarginElec', [(p,sc,st,ar) for p,sc,st,ar,gc in sPSSTARGC]))], index=pd.Index(sPSSTARGC))
         ResRev                = pd.Series(data=[0.0 for gc in mTEPES.gc], index=mTEPES.gc, dtype='float64')
         if sPSSTARGC:
             OutputToResRev /= 1e3
@@ -708,17 +708,17 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
     if pHasOperReserveUp and pHasReserveOffer and pHasDuals:
         sPSSTNARNR        = [(p,sc,st,n,ar,nr) for p,sc,st,n,ar,nr in mTEPES.s2n*mTEPES.ar*mTEPES.nr if nr in g2a[ar] and mTEPES.pOperReserveUp[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n,nr) in mTEPES.psnnr]
         if sPSSTNARNR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveUp_{p}_{sc}_{st}('{n}', '{ar}')"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vReserveUp   [p,sc,n,nr]() for p,sc,st,n,ar,nr in sPSSTNARNR], index=pd.Index(sPSSTNARNR))
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vReserveUp for (p,sc,st,n,ar,nr),pDual,vReserveUp in zip(sPSSTNARNR, mTEPES.pDuals.lookup('eOperReserveUp', [(p,sc,st,n,ar) for p,sc,st,n,ar,nr in sPSSTNARNR]), var_values(OptModel).lookup('vReserveUp', [(p,sc,n,nr) for p,sc,st,n,ar,nr in sPSSTNARNR]))], index=pd.Index(sPSSTNARNR))
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueGenOperatingReserveUp_{CaseName}.csv', sep=',')
 
         sPSSTNARES        = [(p,sc,st,n,ar,eh) for p,sc,st,n,ar,eh in mTEPES.s2n*mTEPES.ar*mTEPES.eh if eh in g2a[ar] and mTEPES.pOperReserveUp[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n,eh) in mTEPES.psnehc]
         if sPSSTNARES:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveUp_{p}_{sc}_{st}('{n}', '{ar}')"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vESSReserveUp[p,sc,n,eh]() for p,sc,st,n,ar,eh in sPSSTNARES], index=pd.Index(sPSSTNARES))
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vESSReserveUp for (p,sc,st,n,ar,eh),pDual,vESSReserveUp in zip(sPSSTNARES, mTEPES.pDuals.lookup('eOperReserveUp', [(p,sc,st,n,ar) for p,sc,st,n,ar,eh in sPSSTNARES]), var_values(OptModel).lookup('vESSReserveUp', [(p,sc,n,eh) for p,sc,st,n,ar,eh in sPSSTNARES]))], index=pd.Index(sPSSTNARES))
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueConOperatingReserveUp_{CaseName}.csv', sep=',')
 
         sPSSTNAREC        = [(p,sc,st,n,ar,ec) for p,sc,st,n,ar,ec in mTEPES.s2n*mTEPES.ar*mTEPES.ec if ec in g2a[ar] and mTEPES.pOperReserveUp[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n,ec) in mTEPES.psnec]
         if sPSSTNAREC:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveUp_{p}_{sc}_{st}('{n}', '{ar}')"]/mTEPES.pPeriodProb[p,sc]()*(OptModel.vReserveUp[p,sc,n,ec]()+OptModel.vESSReserveUp[p,sc,n,ec]()) for p,sc,st,n,ar,ec in sPSSTNAREC], index=pd.Index(sPSSTNAREC), dtype='float64')
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*(vReserveUp+vESSReserveUp) for (p,sc,st,n,ar,ec),pDual,vReserveUp,vESSReserveUp in zip(sPSSTNAREC, mTEPES.pDuals.lookup('eOperReserveUp', [(p,sc,st,n,ar) for p,sc,st,n,ar,ec in sPSSTNAREC]), var_values(OptModel).lookup('vReserveUp', [(p,sc,n,ec) for p,sc,st,n,ar,ec in sPSSTNAREC]), var_values(OptModel).lookup('vESSReserveUp', [(p,sc,n,ec) for p,sc,st,n,ar,ec in sPSSTNAREC]))], index=pd.Index(sPSSTNAREC), dtype='float64')
             OutputToUpRev = OutputResults.to_frame('MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).sum(axis=0)
         else:
             OutputToUpRev = pd.Series(data=[0.0 for gc in mTEPES.gc], index=mTEPES.gc, dtype='float64')
@@ -731,17 +731,17 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
     if pHasOperReserveDw and pHasReserveOffer and pHasDuals:
         sPSSTNARNR        = [(p,sc,st,n,ar,nr) for p,sc,st,n,ar,nr in mTEPES.s2n*mTEPES.ar*mTEPES.nr if nr in g2a[ar] and mTEPES.pOperReserveDw[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n,nr) in mTEPES.psnnr]
         if sPSSTNARNR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveDw_{p}_{sc}_{st}('{n}', '{ar}')"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vReserveDown   [p,sc,n,nr]() for p,sc,st,n,ar,nr in sPSSTNARNR], index=pd.Index(sPSSTNARNR))
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vReserveDown for (p,sc,st,n,ar,nr),pDual,vReserveDown in zip(sPSSTNARNR, mTEPES.pDuals.lookup('eOperReserveDw', [(p,sc,st,n,ar) for p,sc,st,n,ar,nr in sPSSTNARNR]), var_values(OptModel).lookup('vReserveDown', [(p,sc,n,nr) for p,sc,st,n,ar,nr in sPSSTNARNR]))], index=pd.Index(sPSSTNARNR))
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueGenOperatingReserveDown_{CaseName}.csv', sep=',')
 
         sPSSTNARES        = [(p,sc,st,n,ar,eh) for p,sc,st,n,ar,eh in mTEPES.s2n*mTEPES.ar*mTEPES.eh if eh in g2a[ar] and mTEPES.pOperReserveDw[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n,eh) in mTEPES.psnehc]
         if sPSSTNARES:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveDw_{p}_{sc}_{st}('{n}', '{ar}')"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vESSReserveDown[p,sc,n,eh]() for p,sc,st,n,ar,eh in sPSSTNARES], index=pd.Index(sPSSTNARES))
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vESSReserveDown for (p,sc,st,n,ar,eh),pDual,vESSReserveDown in zip(sPSSTNARES, mTEPES.pDuals.lookup('eOperReserveDw', [(p,sc,st,n,ar) for p,sc,st,n,ar,eh in sPSSTNARES]), var_values(OptModel).lookup('vESSReserveDown', [(p,sc,n,eh) for p,sc,st,n,ar,eh in sPSSTNARES]))], index=pd.Index(sPSSTNARES))
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueConOperatingReserveDown_{CaseName}.csv', sep=',')
 
         sPSSTNAREC        = [(p,sc,st,n,ar,ec) for p,sc,st,n,ar,ec in mTEPES.s2n*mTEPES.ar*mTEPES.ec if ec in g2a[ar] and mTEPES.pOperReserveDw[p,sc,n,ar] and pRsrvOfferArea[p,ar] and (p,sc,n,ec) in mTEPES.psnec]
         if sPSSTNAREC:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eOperReserveDw_{p}_{sc}_{st}('{n}', '{ar}')"]/mTEPES.pPeriodProb[p,sc]()*(OptModel.vReserveDown[p,sc,n,ec]()+OptModel.vESSReserveDown[p,sc,n,ec]()) for p,sc,st,n,ar,ec in sPSSTNAREC], index=pd.Index(sPSSTNAREC), dtype='float64')
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*(vReserveDown+vESSReserveDown) for (p,sc,st,n,ar,ec),pDual,vReserveDown,vESSReserveDown in zip(sPSSTNAREC, mTEPES.pDuals.lookup('eOperReserveDw', [(p,sc,st,n,ar) for p,sc,st,n,ar,ec in sPSSTNAREC]), var_values(OptModel).lookup('vReserveDown', [(p,sc,n,ec) for p,sc,st,n,ar,ec in sPSSTNAREC]), var_values(OptModel).lookup('vESSReserveDown', [(p,sc,n,ec) for p,sc,st,n,ar,ec in sPSSTNAREC]))], index=pd.Index(sPSSTNAREC), dtype='float64')
             OutputToDwRev = OutputResults.to_frame('MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_5', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).sum(axis=0)
         else:
             OutputToDwRev = pd.Series(data=[0.0 for gc in mTEPES.gc], index=mTEPES.gc, dtype='float64')
@@ -756,7 +756,7 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
         pRampReserveUpPSN = {(p,sc,n): sum(mTEPES.pRampReserveUp[p,sc,n,ar] for ar in mTEPES.ar) for p,sc,n in mTEPES.psn}
         sPSSTNNR          = [(p,sc,st,n,nr) for p,sc,st,n,nr in mTEPES.s2n*mTEPES.nr if pRampReserveUpPSN[p,sc,n] and (p,sc,n,nr) in mTEPES.psnnr]
         if sPSSTNNR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eSystemRampUp_{p}_{sc}_{st}{n}"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vRampReserveUp[p,sc,n,nr]() for p,sc,st,n,nr in sPSSTNNR], index=pd.Index(sPSSTNNR))
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vRampReserveUp for (p,sc,st,n,nr),pDual,vRampReserveUp in zip(sPSSTNNR, mTEPES.pDuals.lookup('eSystemRampUp', [(p,sc,st,n) for p,sc,st,n,nr in sPSSTNNR]), var_values(OptModel).lookup('vRampReserveUp', [(p,sc,n,nr) for p,sc,st,n,nr in sPSSTNNR]))], index=pd.Index(sPSSTNNR))
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueRampReserveUp_{CaseName}.csv', sep=',')
 
         # if len([(p,sc,n,eh)                 for p,sc,   n,eh in mTEPES.psneh         if sum(mTEPES.pRampReserveUp[p,sc,n,ar] for ar in mTEPES.ar) and (p,sc,n,eh) in mTEPES.psnehc]):
@@ -766,7 +766,7 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
 
         sPSSTNEC          = [(p,sc,st,n,ec) for p,sc,st,n,ec in mTEPES.s2n*mTEPES.ec if pRampReserveUpPSN[p,sc,n] and (p,sc,n,ec) in mTEPES.psnec]
         if sPSSTNEC:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eSystemRampUp_{p}_{sc}_{st}{n}"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vRampReserveUp[p,sc,n,ec]() for p,sc,st,n,ec in sPSSTNEC], index=pd.Index(sPSSTNEC), dtype='float64')
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vRampReserveUp for (p,sc,st,n,ec),pDual,vRampReserveUp in zip(sPSSTNEC, mTEPES.pDuals.lookup('eSystemRampUp', [(p,sc,st,n) for p,sc,st,n,ec in sPSSTNEC]), var_values(OptModel).lookup('vRampReserveUp', [(p,sc,n,ec) for p,sc,st,n,ec in sPSSTNEC]))], index=pd.Index(sPSSTNEC), dtype='float64')
             if len(OutputResults):
                 OutputToUpRev = OutputResults.to_frame('MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).sum(axis=0)
             else:
@@ -784,7 +784,7 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
         pRampReserveDwPSN = {(p,sc,n): sum(mTEPES.pRampReserveDw[p,sc,n,ar] for ar in mTEPES.ar) for p,sc,n in mTEPES.psn}
         sPSSTNNR          = [(p,sc,st,n,nr) for p,sc,st,n,nr in mTEPES.s2n*mTEPES.nr if pRampReserveDwPSN[p,sc,n] and (p,sc,n,nr) in mTEPES.psnnr]
         if sPSSTNNR:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eSystemRampDw_{p}_{sc}_{st}{n}"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vRampReserveDw[p,sc,n,nr]() for p,sc,st,n,nr in sPSSTNNR], index=pd.Index(sPSSTNNR))
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vRampReserveDw for (p,sc,st,n,nr),pDual,vRampReserveDw in zip(sPSSTNNR, mTEPES.pDuals.lookup('eSystemRampDw', [(p,sc,st,n) for p,sc,st,n,nr in sPSSTNNR]), var_values(OptModel).lookup('vRampReserveDw', [(p,sc,n,nr) for p,sc,st,n,nr in sPSSTNNR]))], index=pd.Index(sPSSTNNR))
             OutputResults.to_frame(name='MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_RevenueRampReserveDw_{CaseName}.csv', sep=',')
 
         # if len([(p,sc,n,eh)                 for p,sc,   n,eh in mTEPES.psneh         if sum(mTEPES.pRampReserveDw[p,sc,n,ar] for ar in mTEPES.ar) and (p,sc,n,eh) in mTEPES.psnehc]):
@@ -794,7 +794,7 @@ def EconomicResults(DirName, CaseName, OptModel, mTEPES, pIndAreaOutput, pIndPlo
 
         sPSSTNEC          = [(p,sc,st,n,ec) for p,sc,st,n,ec in mTEPES.s2n*mTEPES.ec if pRampReserveDwPSN[p,sc,n] and (p,sc,n,ec) in mTEPES.psnec]
         if sPSSTNEC:
-            OutputResults = pd.Series(data=[mTEPES.pDuals[f"eSystemRampDw_{p}_{sc}_{st}{n}"]/mTEPES.pPeriodProb[p,sc]()*OptModel.vRampReserveDw[p,sc,n,ec]() for p,sc,st,n,ec in sPSSTNEC], index=pd.Index(sPSSTNEC), dtype='float64')
+            OutputResults = pd.Series(data=[pDual/mTEPES.pPeriodProb[p,sc]()*vRampReserveDw for (p,sc,st,n,ec),pDual,vRampReserveDw in zip(sPSSTNEC, mTEPES.pDuals.lookup('eSystemRampDw', [(p,sc,st,n) for p,sc,st,n,ec in sPSSTNEC]), var_values(OptModel).lookup('vRampReserveDw', [(p,sc,n,ec) for p,sc,st,n,ec in sPSSTNEC]))], index=pd.Index(sPSSTNEC), dtype='float64')
             if len(OutputResults):
                 OutputToDwRev = OutputResults.to_frame('MEUR').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='MEUR').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).sum(axis=0)
             else:
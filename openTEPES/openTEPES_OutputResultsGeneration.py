@@ -15,11 +15,13 @@ import altair            as     alt
 from   collections       import defaultdict
 
 try:
-    from          .openTEPES_OutputResultsCommon import _outdir, AreaPlots, PiePlots
+    from          .openTEPES_OutputResultsCommon import _outdir, var_values, AreaPlots, PiePlots
+    from          .openTEPES_ProblemSolvingStageRetirement import stage_slack
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from openTEPES.openTEPES_OutputResultsCommon import _outdir, AreaPlots, PiePlots
+    from openTEPES.openTEPES_OutputResultsCommon import _outdir, var_values, AreaPlots, PiePlots
+    from openTEPES.openTEPES_ProblemSolvingStageRetirement import stage_slack
 
 
 # @profile
@@ -79,16 +81,16 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
 
     if mTEPES.nr:
         if pIndUnitOutput:
-            OutputToFile = pd.Series(data=[OptModel.vCommitment[p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vCommitment', mTEPES.psnnr), index=mTEPES.psnnr)
             OutputToFile.to_frame(name='p.u.').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='p.u.').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationCommitment_{CaseName}.csv', sep=',')
-            OutputToFile = pd.Series(data=[OptModel.vStartUp   [p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vStartUp', mTEPES.psnnr), index=mTEPES.psnnr)
             OutputToFile.to_frame(name='p.u.').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='p.u.').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationStartUp_{CaseName}.csv', sep=',')
-            OutputToFile = pd.Series(data=[OptModel.vShutDown  [p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vShutDown', mTEPES.psnnr), index=mTEPES.psnnr)
             OutputToFile.to_frame(name='p.u.').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='p.u.').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationShutDown_{CaseName}.csv', sep=',')
 
     if any(mTEPES.pOperReserveUp[idx] for idx in mTEPES.pOperReserveUp):
         if mTEPES.nr:
-            OutputToFile = pd.Series(data=[OptModel.vReserveUp     [p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vReserveUp', mTEPES.psnnr), index=mTEPES.psnnr)
             OutputToFile = OutputToFile.fillna(0.0)
             OutputToFile *= 1e3
             if pIndUnitOutput:
@@ -98,7 +100,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                 OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyGenOperatingReserveUp_{CaseName}.csv', sep=',')
 
             if mTEPES.pIndReserveActivation() == 1:
-                OutputToFile = pd.Series(data=[OptModel.vReserveUpEnergy[p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+                OutputToFile = pd.Series(data=var_values(OptModel).lookup('vReserveUpEnergy', mTEPES.psnnr), index=mTEPES.psnnr)
                 OutputToFile = OutputToFile.fillna(0.0)
                 OutputToFile *= 1e3
                 if pIndUnitOutput:
@@ -108,7 +110,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                     OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyGenOperatingReserveUpEnergy_{CaseName}.csv', sep=',')
 
         if mTEPES.psnehc:
-            OutputToFile = pd.Series(data=[OptModel.vESSReserveUp  [p,sc,n,eh]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSReserveUp', mTEPES.psnehc), index=mTEPES.psnehc)
             OutputToFile = OutputToFile.fillna(0.0)
             OutputToFile *= 1e3
             if pIndUnitOutput:
@@ -118,7 +120,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                 OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyConOperatingReserveUp_{CaseName}.csv', sep=',')
 
             if mTEPES.pIndReserveActivation() == 1:
-                OutputToFile = pd.Series(data=[OptModel.vESSReserveUpEnergy[p,sc,n,eh]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+                OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSReserveUpEnergy', mTEPES.psnehc), index=mTEPES.psnehc)
                 OutputToFile = OutputToFile.fillna(0.0)
                 OutputToFile *= 1e3
                 if pIndUnitOutput:
@@ -129,7 +131,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
 
     if any(mTEPES.pOperReserveDw[idx] for idx in mTEPES.pOperReserveDw):
         if mTEPES.nr:
-            OutputToFile = pd.Series(data=[OptModel.vReserveDown   [p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vReserveDown', mTEPES.psnnr), index=mTEPES.psnnr)
             OutputToFile = OutputToFile.fillna(0.0)
             OutputToFile *= 1e3
             if pIndUnitOutput:
@@ -139,7 +141,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                 OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyGenOperatingReserveDown_{CaseName}.csv', sep=',')
 
             if mTEPES.pIndReserveActivation() == 1:
-                OutputToFile = pd.Series(data=[OptModel.vReserveDownEnergy[p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+                OutputToFile = pd.Series(data=var_values(OptModel).lookup('vReserveDownEnergy', mTEPES.psnnr), index=mTEPES.psnnr)
                 OutputToFile = OutputToFile.fillna(0.0)
                 OutputToFile *= 1e3
                 if pIndUnitOutput:
@@ -149,7 +151,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                     OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyGenOperatingReserveDownEnergy_{CaseName}.csv', sep=',')
 
         if mTEPES.psnehc:
-            OutputToFile = pd.Series(data=[OptModel.vESSReserveDown[p,sc,n,eh]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSReserveDown', mTEPES.psnehc), index=mTEPES.psnehc)
             OutputToFile = OutputToFile.fillna(0.0)
             OutputToFile *= 1e3
             if pIndUnitOutput:
@@ -159,7 +161,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                 OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyConOperatingReserveDown_{CaseName}.csv', sep=',')
 
             if mTEPES.pIndReserveActivation() == 1:
-                OutputToFile = pd.Series(data=[OptModel.vESSReserveDownEnergy[p,sc,n,eh]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+                OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSReserveDownEnergy', mTEPES.psnehc), index=mTEPES.psnehc)
                 OutputToFile = OutputToFile.fillna(0.0)
                 OutputToFile *= 1e3
                 if pIndUnitOutput:
@@ -172,7 +174,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
     pHasRampReserveDw = hasattr(mTEPES, 'pRampReserveDw') and any(mTEPES.pRampReserveDw[idx] for idx in mTEPES.pRampReserveDw)
 
     if mTEPES.nr and mTEPES.pIndRampReserves() and pHasRampReserveUp:
-        OutputToFile = pd.Series(data=[OptModel.vRampReserveUp[p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vRampReserveUp', mTEPES.psnnr), index=mTEPES.psnnr)
         OutputToFile = OutputToFile.fillna(0.0)
         OutputToFile *= 1e3
         if pIndUnitOutput:
@@ -182,7 +184,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
             OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyRampReserveUp_{CaseName}.csv', sep=',')
 
     if mTEPES.nr and mTEPES.pIndRampReserves() and pHasRampReserveDw:
-        OutputToFile = pd.Series(data=[OptModel.vRampReserveDw[p,sc,n,nr]() for p,sc,n,nr in mTEPES.psnnr], index=mTEPES.psnnr)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vRampReserveDw', mTEPES.psnnr), index=mTEPES.psnnr)
         OutputToFile = OutputToFile.fillna(0.0)
         OutputToFile *= 1e3
         if pIndUnitOutput:
@@ -191,7 +193,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
             OutputToFile = OutputToFile[[(p,nr) in mTEPES.pnr and nr in pNr2Tech for p,sc,n,nr in OutputToFile.index]].rename(index=pNr2Tech, level=3).groupby(level=[0,1,2,3]).sum().reindex(pIdxPSNNT, fill_value=0.0)
             OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyRampReserveDown_{CaseName}.csv', sep=',')
 
-    OutputToFile = pd.Series(data=[OptModel.vTotalOutput[p,sc,n,g]() for p,sc,n,g in mTEPES.psng], index=mTEPES.psng)
+    OutputToFile = pd.Series(data=var_values(OptModel).lookup('vTotalOutput', mTEPES.psng), index=mTEPES.psng)
     OutputToFile *= 1e3
     OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_Generation_{CaseName}.csv', sep=',')
 
@@ -199,9 +201,8 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
     pEpsilon = 1e-6
 
     sPSNG, pSurplus = [], []
-    for p,sc,n,g in mTEPES.psng:
+    for (p,sc,n,g),pOutput in zip(mTEPES.psng, var_values(OptModel).lookup('vTotalOutput', mTEPES.psng)):
         pUpperBound = OptModel.vTotalOutput[p,sc,n,g].ub
-        pOutput     = OptModel.vTotalOutput[p,sc,n,g]()
         if pUpperBound - pOutput > pEpsilon:
             sPSNG.append((p,sc,n,g))
             pSurplus.append((pUpperBound*OptModel.vGenerationInvest[p,g]() - pOutput) if g in mTEPES.gc else (pUpperBound - pOutput))
@@ -225,7 +226,8 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                 and (nr not in mTEPES.es or _num(mTEPES.pTotalMaxCharge[nr]) or _num(mTEPES.pTotalEnergyInflows[nr])))
 
     sPSSTNNR      = [(p,sc,st,n,nr) for p,sc,st,n,nr in mTEPES.s2n*mTEPES.nr if                            RampSurplusCandidate(p,sc,n,nr,mTEPES.pRampUp) and abs(OptModel.vCommitment[p,sc,n,nr]()                - OptModel.vStartUp[p,sc,n,nr]()) > pEpsilon]
-    OutputToFile  = pd.Series(data=[(getattr(OptModel, f'eRampUp_{p}_{sc}_{st}')[n,nr].slack())*_num(mTEPES.pDuration[p,sc,n])*_num(mTEPES.pRampUp[nr])*(OptModel.vCommitment[p,sc,n,nr]() - OptModel.vStartUp[p,sc,n,nr]()) for p,sc,st,n,nr in sPSSTNNR], index=pd.Index(sPSSTNNR), dtype='float64')
+    sPSNNR        = [(p,sc,n,nr) for p,sc,st,n,nr in sPSSTNNR]
+    OutputToFile  = pd.Series(data=[stage_slack(OptModel, 'eRampUp', p, sc, st, (n,nr))*_num(mTEPES.pDuration[p,sc,n])*_num(mTEPES.pRampUp[nr])*(vCommitment - vStartUp) for (p,sc,st,n,nr),vCommitment,vStartUp in zip(sPSSTNNR, var_values(OptModel).lookup('vCommitment', sPSNNR), var_values(OptModel).lookup('vStartUp', sPSNNR))], index=pd.Index(sPSSTNNR), dtype='float64')
     OutputToFile *= 1e3
     if len(OutputToFile):
         OutputToFile.to_frame(name='MW/h').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='MW/h', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationRampUpSurplus_{CaseName}.csv', sep=',')
@@ -233,11 +235,13 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
     # the ramp-down surplus is built in two parts, the first load level and the rest, and written as one frame
     RampDwSurplusParts = []
     sPSSTNNR      = [(p,sc,st,n,nr) for p,sc,st,n,nr in mTEPES.s2n*mTEPES.nr if n == mTEPES.n.first() and RampSurplusCandidate(p,sc,n,nr,mTEPES.pRampDw) and abs(mTEPES.pInitialUC[p,sc,n,nr]()                   - OptModel.vShutDown[p,sc,n,nr]()) > pEpsilon]
-    OutputToFile  = pd.Series(data=[min((getattr(OptModel, f'eRampDw_{p}_{sc}_{st}')[n,nr].slack())*_num(mTEPES.pDuration[p,sc,n])*_num(mTEPES.pRampDw[nr])*(mTEPES.pInitialUC[p,sc,n,nr]()                   - OptModel.vShutDown[p,sc,n,nr]()), OptModel.vOutput2ndBlock[p,sc,n,nr]()) for p,sc,st,n,nr in sPSSTNNR], index=pd.Index(sPSSTNNR), dtype='float64')
+    sPSNNR        = [(p,sc,n,nr) for p,sc,st,n,nr in sPSSTNNR]
+    OutputToFile  = pd.Series(data=[min(stage_slack(OptModel, 'eRampDw', p, sc, st, (n,nr))*_num(mTEPES.pDuration[p,sc,n])*_num(mTEPES.pRampDw[nr])*(mTEPES.pInitialUC[p,sc,n,nr]()                   - vShutDown), vOutput2ndBlock) for (p,sc,st,n,nr),vShutDown,vOutput2ndBlock in zip(sPSSTNNR, var_values(OptModel).lookup('vShutDown', sPSNNR), var_values(OptModel).lookup('vOutput2ndBlock', sPSNNR))], index=pd.Index(sPSSTNNR), dtype='float64')
     OutputToFile *= 1e3
     RampDwSurplusParts.append(OutputToFile)
     sPSSTNNR      = [(p,sc,st,n,nr) for p,sc,st,n,nr in mTEPES.s2n*mTEPES.nr if n != mTEPES.n.first() and RampSurplusCandidate(p,sc,n,nr,mTEPES.pRampDw) and abs(OptModel.vCommitment[p,sc,mTEPES.n.prev(n),nr]() - OptModel.vShutDown[p,sc,n,nr]()) > pEpsilon]
-    OutputToFile  = pd.Series(data=[min((getattr(OptModel, f'eRampDw_{p}_{sc}_{st}')[n,nr].slack())*_num(mTEPES.pDuration[p,sc,n])*_num(mTEPES.pRampDw[nr])*(OptModel.vCommitment[p,sc,mTEPES.n.prev(n),nr]() - OptModel.vShutDown[p,sc,n,nr]()), OptModel.vOutput2ndBlock[p,sc,n,nr]()) for p,sc,st,n,nr in sPSSTNNR], index=pd.Index(sPSSTNNR), dtype='float64')
+    sPSNNR        = [(p,sc,n,nr) for p,sc,st,n,nr in sPSSTNNR]
+    OutputToFile  = pd.Series(data=[min(stage_slack(OptModel, 'eRampDw', p, sc, st, (n,nr))*_num(mTEPES.pDuration[p,sc,n])*_num(mTEPES.pRampDw[nr])*(OptModel.vCommitment[p,sc,mTEPES.n.prev(n),nr]() - vShutDown), vOutput2ndBlock) for (p,sc,st,n,nr),vShutDown,vOutput2ndBlock in zip(sPSSTNNR, var_values(OptModel).lookup('vShutDown', sPSNNR), var_values(OptModel).lookup('vOutput2ndBlock', sPSNNR))], index=pd.Index(sPSSTNNR), dtype='float64')
     OutputToFile *= 1e3
     RampDwSurplusParts.append(OutputToFile)
     RampDwSurplus = pd.concat(RampDwSurplusParts)
@@ -249,11 +253,11 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
         # curtailment is reported four times over the same set: as power, as energy, and as the relative ratio of both. Evaluate every
         # Pyomo value once per tuple here and derive the rest by vectorised multiplication.
         pDuration, pCurtail, pMaximum = [], [], []
-        for p,sc,n,re in mTEPES.psnre:
+        for (p,sc,n,re),pOutput in zip(mTEPES.psnre, var_values(OptModel).lookup('vTotalOutput', mTEPES.psnre)):
             pUpperBound = OptModel.vTotalOutput[p,sc,n,re].ub*OptModel.vGenerationInvest[p,re]() if re in mTEPES.gc else OptModel.vTotalOutput[p,sc,n,re].ub
             pDuration.append(mTEPES.pLoadLevelDuration[p,sc,n]())
             pMaximum.append(pUpperBound)
-            pCurtail.append(pUpperBound - OptModel.vTotalOutput[p,sc,n,re]())
+            pCurtail.append(pUpperBound - pOutput)
         CurtailDuration = pd.Series(data=pDuration, index=mTEPES.psnre)
         CurtailPower    = pd.Series(data=pCurtail , index=mTEPES.psnre)
         MaxPower        = pd.Series(data=pMaximum , index=mTEPES.psnre)
@@ -298,7 +302,7 @@ def GenerationOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolo
                 chart.save(f'{_path}/oT_Plot_TechnologyCurtailmentEnergy_{CaseName}.html', embed_options={'renderer':'svg'})
 
     if pIndUnitOutput:
-        OutputToFile = pd.Series(data=[OptModel.vTotalOutput[p,sc,n,g ]()*mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,n,g in mTEPES.psng], index=mTEPES.psng)
+        OutputToFile = pd.Series(data=[vTotalOutput*mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,n,g),vTotalOutput in zip(mTEPES.psng, var_values(OptModel).lookup('vTotalOutput', mTEPES.psng))], index=mTEPES.psng)
         OutputToFile.to_frame(name='GWh').reset_index().pivot_table(      index=['level_0','level_1','level_2'], columns='level_3', values='GWh', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationEnergy_{CaseName}.csv', sep=',')
 
     if mTEPES.nr or mTEPES.bo:
@@ -407,7 +411,7 @@ def GenerationOperationHeatResults(DirName, CaseName, OptModel, mTEPES, pIndTech
     # for p,sc,n,hp in mTEPES.psnhp:
     #     OptModel.vTotalOutputHeat[p,sc,n,hp] = OptModel.vESSTotalCharge[p,sc,n,hp] / mTEPES.pProductionFunctionHeat[hp]
 
-    OutputToFile = pd.Series(data=[OptModel.vTotalOutputHeat[p,sc,n,chp]() for p,sc,n,chp in mTEPES.psnchp], index=mTEPES.psnchp)
+    OutputToFile = pd.Series(data=var_values(OptModel).lookup('vTotalOutputHeat', mTEPES.psnchp), index=mTEPES.psnchp)
     OutputToFile *= 1e3
     OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationHeat_{CaseName}.csv', sep=',')
 
@@ -415,9 +419,8 @@ def GenerationOperationHeatResults(DirName, CaseName, OptModel, mTEPES, pIndTech
     pEpsilon = 1e-6
 
     sPSNG, pSurplus = [], []
-    for p,sc,n,ch in mTEPES.psnch:
+    for (p,sc,n,ch),pOutput in zip(mTEPES.psnch, var_values(OptModel).lookup('vTotalOutputHeat', mTEPES.psnch)):
         pUpperBound = OptModel.vTotalOutputHeat[p,sc,n,ch].ub
-        pOutput     = OptModel.vTotalOutputHeat[p,sc,n,ch]()
         if pUpperBound - pOutput > pEpsilon:
             sPSNG.append((p,sc,n,ch))
             pSurplus.append((pUpperBound*OptModel.vGenerationInvest[p,ch]() - pOutput) if ch in mTEPES.gc else (pUpperBound - pOutput))
@@ -427,7 +430,7 @@ def GenerationOperationHeatResults(DirName, CaseName, OptModel, mTEPES, pIndTech
     OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationSurplusHeat_{CaseName}.csv', sep=',')
 
     if pIndUnitOutput:
-        OutputToFile = pd.Series(data=[OptModel.vTotalOutputHeat[p,sc,n,chp]()*mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,n,chp in mTEPES.psnchp], index=mTEPES.psnchp)
+        OutputToFile = pd.Series(data=[vTotalOutputHeat*mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,n,chp),vTotalOutputHeat in zip(mTEPES.psnchp, var_values(OptModel).lookup('vTotalOutputHeat', mTEPES.psnchp))], index=mTEPES.psnchp)
         OutputToFile.to_frame(name='GWh').reset_index().pivot_table(      index=['level_0','level_1','level_2'], columns='level_3', values='GWh', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationEnergyHeat_{CaseName}.csv', sep=',')
 
     if pIndTechOutput:
@@ -9,6 +9,14 @@ steps were identical across the three maps, so they live here. The rest of each
 
 import pandas as pd
 
+try:
+    from          .openTEPES_OutputResultsCommon import var_values
+except ImportError:
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_OutputResultsCommon import var_values
+
 
 def make_flow_series(var, sets, factor, membership):
     """Flow values for the lines in `membership`, scaled by `factor`.
@@ -16,7 +24,7 @@ def make_flow_series(var, sets, factor, membership):
     `p, sc, n` come from iterating `sets`, so this does not capture any enclosing scope and can live as a plain module function.
     """
     sKeys = [(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in sets if (p,ni,nf,cc) in membership]
-    return pd.Series(data=[var[Key]()*factor for Key in sKeys], index=pd.Index(sKeys))
+    return pd.Series(data=var_values(var.model()).lookup(var.name, sKeys)*factor, index=pd.Index(sKeys))
 
 
 def pick_snapshot(mTEPES):
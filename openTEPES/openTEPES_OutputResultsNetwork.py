@@ -19,12 +19,12 @@ from   collections       import defaultdict
 from   colour            import Color
 
 try:
-    from          .openTEPES_OutputResultsCommon    import _outdir
+    from          .openTEPES_OutputResultsCommon    import _outdir, var_values
     from          .openTEPES_OutputResultsMapCommon import make_flow_series, pick_snapshot
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from openTEPES.openTEPES_OutputResultsCommon    import _outdir
+    from openTEPES.openTEPES_OutputResultsCommon    import _outdir, var_values
     from openTEPES.openTEPES_OutputResultsMapCommon import make_flow_series, pick_snapshot
 
 
@@ -39,19 +39,19 @@ def NetworkOperationResults(DirName, CaseName, OptModel, mTEPES):
     # tuple slice and one membership test per line and load level, to end up with the very same |psn| and |ps| entries.
     Dur  = {Psn: mTEPES.pLoadLevelDuration[Psn]() for Psn in mTEPES.psn  }
     Prob = {Ps:  mTEPES.pPeriodProb       [Ps ]() for Ps  in mTEPES.ps   }
-    Flow = {Key: OptModel.vFlowElec       [Key]() for Key in mTEPES.psnla}
+    Flow = dict(zip(mTEPES.psnla, var_values(OptModel).lookup('vFlowElec', mTEPES.psnla)))
 
     if any(mTEPES.pIndBinLineSwitch[idx] for idx in mTEPES.pIndBinLineSwitch):
         if mTEPES.lc:
-            OutputToFile = pd.Series(data=[OptModel.vLineCommit  [p,sc,n,ni,nf,cc]() for p,sc,n,ni,nf,cc in mTEPES.psnla], index=mTEPES.psnla)
+            OutputToFile = pd.Series(data=var_values(OptModel).lookup('vLineCommit', mTEPES.psnla), index=mTEPES.psnla)
             OutputToFile.index.names = ['Period', 'Scenario', 'LoadLevel', 'InitialNode', 'FinalNode', 'Circuit']
             OutputToFile = pd.pivot_table(OutputToFile.to_frame(name='p.u.'), values='p.u.', index=['Period', 'Scenario', 'LoadLevel'], columns=['InitialNode', 'FinalNode', 'Circuit'], fill_value=0.0).rename_axis([None, None, None], axis=1)
             OutputToFile.reset_index().oT.write(f'{_path}/oT_Result_NetworkCommitment_{CaseName}.csv', index=False, sep=',')
-        OutputToFile = pd.Series(data=[OptModel.vLineOnState [p,sc,n,ni,nf,cc]() for p,sc,n,ni,nf,cc in mTEPES.psnla], index=mTEPES.psnla)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vLineOnState', mTEPES.psnla), index=mTEPES.psnla)
         OutputToFile.index.names = ['Period', 'Scenario', 'LoadLevel', 'InitialNode', 'FinalNode', 'Circuit']
         OutputToFile = pd.pivot_table(OutputToFile.to_frame(name='p.u.'), values='p.u.', index=['Period', 'Scenario', 'LoadLevel'], columns=['InitialNode', 'FinalNode', 'Circuit'], fill_value=0.0).rename_axis([None, None, None], axis=1)
         OutputToFile.reset_index().oT.write(f'{_path}/oT_Result_NetworkSwitchOn_{CaseName}.csv', index=False, sep=',')
-        OutputToFile = pd.Series(data=[OptModel.vLineOffState[p,sc,n,ni,nf,cc]() for p,sc,n,ni,nf,cc in mTEPES.psnla], index=mTEPES.psnla)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vLineOffState', mTEPES.psnla), index=mTEPES.psnla)
         OutputToFile.index.names = ['Period', 'Scenario', 'LoadLevel', 'InitialNode', 'FinalNode', 'Circuit']
         OutputToFile = pd.pivot_table(OutputToFile.to_frame(name='p.u.'), values='p.u.', index=['Period', 'Scenario', 'LoadLevel'], columns=['InitialNode', 'FinalNode', 'Circuit'], fill_value=0.0).rename_axis([None, None, None], axis=1)
         OutputToFile.reset_index().oT.write(f'{_path}/oT_Result_NetworkSwitchOff_{CaseName}.csv', index=False, sep=',')
@@ -95,13 +95,13 @@ def NetworkOperationResults(DirName, CaseName, OptModel, mTEPES):
     OutputToFile.reset_index().oT.write(f'{_path}/oT_Result_NetworkElecUtilization_{CaseName}.csv', index=False, sep=',')
 
     if mTEPES.pIndBinNetLosses() and mTEPES.psnll:
-        OutputToFile = pd.Series(data=[OptModel.vLineLosses[p,sc,n,ni,nf,cc]()*2*1e3              for p,sc,n,ni,nf,cc in mTEPES.psnll], index=mTEPES.psnll)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vLineLosses', mTEPES.psnll)*2*1e3, index=mTEPES.psnll)
         OutputToFile.index.names = ['Period', 'Scenario', 'LoadLevel', 'InitialNode', 'FinalNode', 'Circuit']
         OutputToFile = pd.pivot_table(OutputToFile.to_frame(name='p.u.'), values='p.u.', index=['Period', 'Scenario', 'LoadLevel'], columns=['InitialNode', 'FinalNode', 'Circuit'], fill_value=0.0).rename_axis([None, None, None], axis=1)
         OutputToFile.reset_index().oT.write(f'{_path}/oT_Result_NetworkLosses_{CaseName}.csv', index=False, sep=',')
 
     if mTEPES.pIndBinSingleNode() == 0 and mTEPES.pIndPTDF() == 0:
-        OutputToFile = pd.Series(data=[OptModel.vTheta[p,sc,n,nd]()                                   for p,sc,n,nd in mTEPES.psnnd], index=mTEPES.psnnd)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vTheta', mTEPES.psnnd), index=mTEPES.psnnd)
         OutputToFile.to_frame(name='rad').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='rad').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_NetworkAngle_{CaseName}.csv', sep=',')
 
         # warn if the voltage-angle bound (pMaxTheta = pi/2) is (nearly) binding -- this indicates either an undersized Big-M on AC candidate lines,
@@ -115,7 +115,7 @@ def NetworkOperationResults(DirName, CaseName, OptModel, mTEPES):
             print(f'WARNING: voltage angle bound pMaxTheta = pi/2 is (nearly) binding in {nBinding} (period, scenario, loadlevel, node) entries; max|theta| = {maxAbs:.6f} rad ({maxAbs/pMaxThetaVal*100:.2f} %% of pi/2).\nInspect oT_Result_NetworkAngle_{CaseName}.csv -- the bound may be clipping the DC-OPF solution.')
 
     # vENS feeds both the power (MW) and the energy (GWh) files, so evaluate it once. Dur already covers every load level, so it needs no completion here
-    Ens = {Key: OptModel.vENS[Key]() for Key in mTEPES.psnnd}
+    Ens = dict(zip(mTEPES.psnnd, var_values(OptModel).lookup('vENS', mTEPES.psnnd)))
 
     OutputToFile = pd.Series(data=[Ens[k] for k in mTEPES.psnnd], index=mTEPES.psnnd)
     OutputToFile *= 1e3
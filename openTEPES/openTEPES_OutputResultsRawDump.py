@@ -129,7 +129,7 @@ def _write_constraint_to_db(con, constraint, name, model):
     name : str
         Constraint name used to build the table name `c_{name}`.
     model : pyomo.core.base.PyomoModel.ConcreteModel
-        Model providing `pDuals` (mapping from constraint+index string to dual value).
+        Model providing `pDuals` (the `DualStore` of the collected duals).
 
     Notes
     -----
@@ -139,13 +139,14 @@ def _write_constraint_to_db(con, constraint, name, model):
         return
 
     records = []
-    for index in constraint:
-        key = str(constraint.name) + str(index)
+    indices = list(constraint)
+    duals   = model.pDuals.of(constraint.name, indices)
+    for index, dual in zip(indices, duals):
         records.append(
             dict(
                 name=str(name),
                 index=index,
-                dual=model.pDuals.get(key),
+                dual=dual,
                 lower_bound=constraint[index].lb,
                 upper_bound=constraint[index].ub,
             )
@@ -110,6 +110,26 @@ class ResultSink:
             self._con.execute(f'CREATE OR REPLACE TABLE "{table}" AS SELECT * FROM df')
         return None
 
+    def append(self, obj, path, **csv_kwargs):
+        """Append the rows of ``obj`` to a table ``write`` started, with the
+        same columns (the streamed hourly tables of ``openTEPES_OutputResultsStream``)."""
+        if self.writes_csv:
+            obj.to_csv(path, mode="a", header=False, **csv_kwargs)
+        if self._con is not None:
+            df = obj.to_frame() if isinstance(obj, pd.Series) else obj
+            if csv_kwargs.get("index", True):
+                df = df.reset_index()
+            table = _table_name(path, self.case_name)
+            self._con.execute(f'INSERT INTO "{table}" SELECT * FROM df')
+        return None
+
+    def drop(self, path):
+        """Remove a table written before, from the CSV files and the DuckDB file."""
+        if self.writes_csv and os.path.exists(path):
+            os.remove(path)
+        if self._con is not None:
+            self._con.execute(f'DROP TABLE IF EXISTS "{_table_name(path, self.case_name)}"')
+
     def close(self):
         if self._con is not None:
             self._con.close()
@@ -13,11 +13,11 @@ import pandas            as     pd
 from   collections       import defaultdict
 
 try:
-    from          .openTEPES_OutputResultsCommon import _outdir, AreaPlots, PiePlots, LinePlots
+    from          .openTEPES_OutputResultsCommon import _outdir, var_values, AreaPlots, PiePlots, LinePlots
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from openTEPES.openTEPES_OutputResultsCommon import _outdir, AreaPlots, PiePlots, LinePlots
+    from openTEPES.openTEPES_OutputResultsCommon import _outdir, var_values, AreaPlots, PiePlots, LinePlots
 
 
 def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutput, pIndAreaOutput, pIndPlotOutput):
@@ -50,7 +50,7 @@ def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutpu
     pIdxPSNOT      = pd.MultiIndex.from_tuples(mTEPES.psnot) if len(mTEPES.psnot) else None
     pIdxPSNET      = pd.MultiIndex.from_tuples(mTEPES.psnet) if len(mTEPES.psnet) else None
 
-    OutputToFile = pd.Series(data=[OptModel.vEnergyOutflows[p,sc,n,es]() for p,sc,n,es in mTEPES.psnes], index=mTEPES.psnes)
+    OutputToFile = pd.Series(data=var_values(OptModel).lookup('vEnergyOutflows', mTEPES.psnes), index=mTEPES.psnes)
     OutputToFile *= 1e3
     OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationOutflows_{CaseName}.csv', sep=',')
 
@@ -61,16 +61,14 @@ def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutpu
     # Check if there are any ESS with consumption capabilities
     # If there are none, just skip outputting consumption related files
     if mTEPES.psnehc:
-        OutputToFile = pd.Series(data=[OptModel.vESSTotalCharge    [p,sc,n,eh]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSTotalCharge', mTEPES.psnehc), index=mTEPES.psnehc)
         OutputToFile *= -1e3
         OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_Consumption_{CaseName}.csv', sep=',')
 
         # tolerance to consider that an ESS is not producing or consuming
         pEpsilon = 1e-6
         pRatioValues = []
-        for p,sc,n,eh in mTEPES.psnehc:
-            pTotalOutput = OptModel.vTotalOutput   [p,sc,n,eh]()
-            pTotalCharge = OptModel.vESSTotalCharge[p,sc,n,eh]()
+        for (p,sc,n,eh),pTotalOutput,pTotalCharge in zip(mTEPES.psnehc, var_values(OptModel).lookup('vTotalOutput', mTEPES.psnehc), var_values(OptModel).lookup('vESSTotalCharge', mTEPES.psnehc)):
             pRatio       = 0.0
             if pTotalCharge and pTotalOutput <= pEpsilon * mTEPES.pMaxPowerElec[p,sc,n,eh]:
                 pRatio = -1.0
@@ -87,7 +85,7 @@ def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutpu
             OutputToFile *= 1e3
             OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_TechnologyConsumption_{CaseName}.csv', sep=',')
 
-        OutputToFile = - pd.Series(data=[OptModel.vESSTotalCharge[p,sc,n,eh]() * mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,n,eh in mTEPES.psnehc], index=mTEPES.psnehc)
+        OutputToFile = - pd.Series(data=[vESSTotalCharge * mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,n,eh),vESSTotalCharge in zip(mTEPES.psnehc, var_values(OptModel).lookup('vESSTotalCharge', mTEPES.psnehc))], index=mTEPES.psnehc)
         if pIndUnitOutput:
             OutputToFile.to_frame(name='GWh').reset_index().pivot_table(index=['level_0', 'level_1', 'level_2'], columns='level_3', values='GWh', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_ConsumptionEnergy_{CaseName}.csv', sep=',')
 
@@ -125,7 +123,7 @@ def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutpu
                                     chart = PiePlots(p, sc, OutputToFile, 'Technology', '%')
                                     chart.save(f'{_path}/oT_Plot_TechnologyConsumptionEnergy_{CaseName}_{p}_{sc}_{ar}.html', embed_options={'renderer': 'svg'})
 
-    OutputToFile = pd.Series(data=[OptModel.vEnergyOutflows    [p,sc,n,es]()*mTEPES.pLoadLevelDuration[p,sc,n]() for p,sc,n,es in mTEPES.psnes], index=mTEPES.psnes)
+    OutputToFile = pd.Series(data=[vEnergyOutflows*mTEPES.pLoadLevelDuration[p,sc,n]() for (p,sc,n,es),vEnergyOutflows in zip(mTEPES.psnes, var_values(OptModel).lookup('vEnergyOutflows', mTEPES.psnes))], index=mTEPES.psnes)
     if pIndUnitOutput:
         OutputToFile.to_frame(name='GWh').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='GWh', aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationOutflowsEnergy_{CaseName}.csv', sep=',')
 
@@ -139,17 +137,17 @@ def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutpu
 
     sPSNES = [(p,sc,n,es) for p,sc,n,es in mTEPES.ps*mTEPES.nesc if (p,es) in mTEPES.pes and (mTEPES.pTotalMaxCharge[es] or mTEPES.pTotalEnergyInflows[es])]
     if pIndUnitOutput:
-        OutputToFile = pd.Series(data=[OptModel.vESSInventory[p,sc,n,es]()                                          for p,sc,n,es in sPSNES], index=pd.Index(sPSNES))
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSInventory', sPSNES), index=pd.Index(sPSNES))
         OutputToFile.to_frame(name='GWh').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='GWh',               aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationInventory_{CaseName}.csv', sep=',')
 
         # Inventory-utilization denominator: candidate ESS scale their max storage by the build decision.
         # Compute the scaling inline instead of mutating mTEPES.pMaxStorage, which used to leak the scaled
         # value to any later read of the parameter (the mutation persisted past this function).
-        OutputToFile = pd.Series(data=[OptModel.vESSInventory[p,sc,n,es]()/(mTEPES.pMaxStorage[p,sc,n,es]()*(OptModel.vGenerationInvest[p,es]() if (p,sc,n,es) in mTEPES.psnec else 1.0)+pEpsilon) for p,sc,n,es in sPSNES], index=pd.Index(sPSNES))
+        OutputToFile = pd.Series(data=[vESSInventory/(mTEPES.pMaxStorage[p,sc,n,es]()*(OptModel.vGenerationInvest[p,es]() if (p,sc,n,es) in mTEPES.psnec else 1.0)+pEpsilon) for (p,sc,n,es),vESSInventory in zip(sPSNES, var_values(OptModel).lookup('vESSInventory', sPSNES))], index=pd.Index(sPSNES))
         OutputToFile = OutputToFile.fillna(0.0)
         OutputToFile.to_frame(name='GWh').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='GWh', dropna=False, aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationInventoryUtilization_{CaseName}.csv', sep=',')
 
-    OutputToFile = pd.Series(data=[OptModel.vESSSpillage[p,sc,n,es]()                                               for p,sc,n,es in sPSNES], index=pd.Index(sPSNES))
+    OutputToFile = pd.Series(data=var_values(OptModel).lookup('vESSSpillage', sPSNES), index=pd.Index(sPSNES))
     if pIndUnitOutput:
         OutputToFile.to_frame(name='GWh').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='GWh',               aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_GenerationSpillage_{CaseName}.csv', sep=',')
 
@@ -160,9 +158,9 @@ def ESSOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnologyOutpu
 
     pSpillage1 = []
     pSpillage2 = []
-    for p,sc,n,es in mTEPES.psnes:
+    for (p,sc,n,es),pOutput in zip(mTEPES.psnes, var_values(OptModel).lookup('vTotalOutput', mTEPES.psnes)):
         pUpperBound = OptModel.vTotalOutput[p,sc,n,es].ub * (OptModel.vGenerationInvest[p,es]() if es in mTEPES.ec else 1.0) * mTEPES.pLoadLevelDuration[p,sc,n]()
-        pSpillage1.append(pUpperBound - OptModel.vTotalOutput[p,sc,n,es]()*mTEPES.pLoadLevelDuration[p,sc,n]())
+        pSpillage1.append(pUpperBound - pOutput*mTEPES.pLoadLevelDuration[p,sc,n]())
         pSpillage2.append(pUpperBound)
     OutputToFile1 = pd.Series(data=pSpillage1, index=mTEPES.psnes)
     OutputToFile2 = pd.Series(data=pSpillage2, index=mTEPES.psnes)
@@ -217,14 +215,14 @@ def ReservoirOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolog
 
     VolumeConstraints = [(p,sc,n,rs) for p,sc,n,rs in mTEPES.ps*mTEPES.nrsc if (p,rs) in mTEPES.prs]
     if pIndUnitOutput:
-        OutputToFile = pd.Series(data=[OptModel.vReservoirVolume[p,sc,n,rs]()                                         for p,sc,n,rs in VolumeConstraints], index=pd.Index(VolumeConstraints))
+        OutputToFile = pd.Series(data=var_values(OptModel).lookup('vReservoirVolume', VolumeConstraints), index=pd.Index(VolumeConstraints))
         OutputToFile.to_frame(name='hm3').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='hm3',               aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_ReservoirVolume_{CaseName}.csv', sep=',')
 
-        OutputToFile = pd.Series(data=[OptModel.vReservoirVolume[p,sc,n,rs]()/(mTEPES.pMaxVolume[p,sc,n,rs]+pEpsilon) for p,sc,n,rs in VolumeConstraints], index=pd.Index(VolumeConstraints))
+        OutputToFile = pd.Series(data=[vReservoirVolume/(mTEPES.pMaxVolume[p,sc,n,rs]+pEpsilon) for (p,sc,n,rs),vReservoirVolume in zip(VolumeConstraints, var_values(OptModel).lookup('vReservoirVolume', VolumeConstraints))], index=pd.Index(VolumeConstraints))
         OutputToFile = OutputToFile.fillna(0.0)
         OutputToFile.to_frame(name='hm3').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='hm3', dropna=False, aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_ReservoirVolumeUtilization_{CaseName}.csv', sep=',')
 
-    OutputToFile = pd.Series(data=[OptModel.vReservoirSpillage[p,sc,n,rs]()                                           for p,sc,n,rs in VolumeConstraints], index=pd.Index(VolumeConstraints))
+    OutputToFile = pd.Series(data=var_values(OptModel).lookup('vReservoirSpillage', VolumeConstraints), index=pd.Index(VolumeConstraints))
     if pIndUnitOutput:
         OutputToFile.to_frame(name='hm3').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='hm3',               aggfunc='sum').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_ReservoirSpillage_{CaseName}.csv', sep=',')
 
@@ -236,7 +234,7 @@ def ReservoirOperationResults(DirName, CaseName, OptModel, mTEPES, pIndTechnolog
 
     #%% outputting the water volume values
     sPSSTNES      = [(p,sc,st,n,rs) for p,sc,st,n,rs in mTEPES.s2n*mTEPES.rs if (p,sc,n,rs) in mTEPES.psnrs]
-    OutputToFile = pd.Series(data=[abs(mTEPES.pDuals[f"eHydroInventory_{p}_{sc}_{st}('{n}', '{rs}')"])*1e3 for p,sc,st,n,rs in sPSSTNES], index=pd.Index(sPSSTNES))
+    OutputToFile = pd.Series(data=[abs(pDual)*1e3 for (p,sc,st,n,rs),pDual in zip(sPSSTNES, mTEPES.pDuals.lookup('eHydroInventory', sPSSTNES))], index=pd.Index(sPSSTNES))
     if len(OutputToFile):
         OutputToFile.to_frame(name='WaterValue').reset_index().pivot_table(index=['level_0','level_1','level_3'], columns='level_4', values='WaterValue').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1).oT.write(f'{_path}/oT_Result_MarginalWaterValue_{CaseName}.csv', sep=',')
 
@@ -0,0 +1,193 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_OutputResultsStream — opt-in streaming of the hourly result tables while the stages solve (default OFF).
+
+The output writers run once, after ``StageIterativeSolving`` has solved every stage. With ``--stream-results`` / ``OTEPES_STREAM_RESULTS`` set,
+``openTEPES_run`` installs a ``ResultStream`` on the model (``mTEPES.pResultStream``) before the stage loop. Each time a stage solved on its own
+has its solution on the model, ``StreamStage`` appends the rows of that stage to the hourly tables of ``STREAM_TABLES`` through the
+``ResultSink`` (CSV and/or DuckDB), so a long run shows its partial results and the writes overlap the solve of the next stage. The writes go
+through one background thread, or inline when ``--parallel-stages`` forks workers, since a thread must not be running in the parent at a fork.
+
+A table of ``STREAM_TABLES`` is the pivot of one variable by load level, built by its writer in one pass over all the stages. The stream builds the
+same pivot over the load levels of the stage and keeps a digest of the rows it appended. When the writer later writes the whole table, the
+stream compares the whole frame with that digest: if the columns, the rows and every value match, the file already holds the table and the write
+is skipped; otherwise (a stage whose variables changed after it was streamed, a column missing in some stage, stages streamed out of the order
+of the table) the writer's table replaces the streamed one. A streamed table that the writers do not write is removed. The final tables are
+therefore the ones the batch writers produce. The joint solve paths solve all the stages at once, so they stream nothing. When the stage loop
+fails, ``openTEPES_run`` closes the stream with the stages streamed so far left in the files.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_StageIndex import _stage_index
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_StageIndex import _stage_index
+
+
+# The hourly tables streamed by stage. Each entry is (category_key, table, variable, index_set, scale, unit, aggfunc, guard_fn), mirroring the
+# writer of the table: the values of ``variable`` over ``index_set``, times ``scale``, pivoted by load level with ``aggfunc`` (None: the pandas
+# default). ``category_key`` is the OUTPUT_CATEGORIES flag of the writer; ``guard_fn`` is a callable(mTEPES, extras) -> bool for the conditions
+# the writer checks before writing the table, with ``extras`` the per-run dict of openTEPES_run ("tech", "area", "plot").
+STREAM_TABLES = (
+    ("generation", "GenerationCommitment", "vCommitment",     "psnnr",  1.0,  "p.u.", None,  lambda m, x: bool(m.nr) and x["tech"] in (0, 2)),
+    ("generation", "GenerationStartUp",    "vStartUp",        "psnnr",  1.0,  "p.u.", None,  lambda m, x: bool(m.nr) and x["tech"] in (0, 2)),
+    ("generation", "GenerationShutDown",   "vShutDown",       "psnnr",  1.0,  "p.u.", None,  lambda m, x: bool(m.nr) and x["tech"] in (0, 2)),
+    ("generation", "Generation",           "vTotalOutput",    "psng",   1e3,  "MW",   None,  None),
+    ("ess",        "GenerationOutflows",   "vEnergyOutflows", "psnes",  1e3,  "MW",   "sum", lambda m, x: bool(m.es)),
+    ("ess",        "Consumption",          "vESSTotalCharge", "psnehc", -1e3, "MW",   "sum", lambda m, x: bool(m.es) and bool(m.psnehc)),
+    ("network",    "NetworkAngle",         "vTheta",          "psnnd",  1.0,  "rad",  None,  lambda m, x: m.pIndBinSingleNode() == 0 and m.pIndPTDF() == 0),
+)
+
+
+def enabled() -> bool:
+    """True when the opt-in result streaming is switched on via ``--stream-results`` / ``OTEPES_STREAM_RESULTS``."""
+    return os.environ.get("OTEPES_STREAM_RESULTS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _pivot(Series, unit, aggfunc) -> pd.DataFrame:
+    """The pivot the writers apply to a ``(p, sc, n, unit)`` Series before writing it."""
+    kwargs = {} if aggfunc is None else {'aggfunc': aggfunc}
+    return Series.to_frame(name=unit).reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values=unit, **kwargs).rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1)
+
+
+def _layout(frame):
+    """Columns and dtypes of a table; two frames of the same layout write the same CSV header and value formats."""
+    return list(frame.columns), [str(dtype) for dtype in frame.dtypes], list(frame.index.names)
+
+
+def _rows(frame) -> tuple[bytes, bytes]:
+    """The rows of a table as bytes, in row order: the hash of each index tuple, and the bit pattern of each value."""
+    return pd.util.hash_pandas_object(frame.index).to_numpy().tobytes(), np.ascontiguousarray(frame.to_numpy(dtype=float)).tobytes()
+
+
+class _StreamedTable:
+    """Digest of the rows of one table streamed so far."""
+
+    def __init__(self, unit, aggfunc):
+        self.unit     = unit
+        self.aggfunc  = aggfunc
+        self.layout   = None
+        self.index    = hashlib.sha256()
+        self.values   = hashlib.sha256()
+        self.streamed = False
+        # the rows stopped being appended (a stage of another layout); the writer's table replaces the file
+        self.diverged = False
+        self.claimed  = False
+        # the writer's table matched the streamed rows, so its write was skipped
+        self.complete = False
+
+
+class ResultStream:
+    """Appends the hourly tables of each solved stage to ``sink`` and stands in as the active sink of the output pass.
+
+    ``write`` and ``close`` have the signature of ``ResultSink``, so ``openTEPES_run`` installs the stream with ``set_active_sink`` around the
+    output writers, where it skips the tables already complete on disk and passes every other write to ``sink``.
+    """
+
+    def __init__(self, sink, mTEPES, flags, extras, background: bool = True):
+        self.sink    = sink
+        self._tables = {}
+        self._specs  = []
+        for key, table, variable, index_set, scale, unit, aggfunc, guard in STREAM_TABLES:
+            if not flags.get(key) or (guard is not None and not guard(mTEPES, extras)):
+                continue
+            path = os.path.join(sink.out_path, f'oT_Result_{table}_{sink.case_name}.csv')
+            self._tables[os.path.abspath(path)] = _StreamedTable(unit, aggfunc)
+            self._specs.append((os.path.abspath(path), variable, index_set, scale))
+        # (index_set) -> {(p, sc, n): [keys]}, grouped on first use
+        self._keys     = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='oT_stream') if background and self._specs else None
+        self._futures  = []
+
+    def _stage_keys(self, mTEPES, index_set, p, sc, levels) -> list:
+        if index_set not in self._keys:
+            grouped = defaultdict(list)
+            for key in getattr(mTEPES, index_set):
+                grouped[key[:3]].append(key)
+            self._keys[index_set] = grouped
+        grouped = self._keys[index_set]
+        return [key for n in levels for key in grouped.get((p,sc,n), ())]
+
+    def stage(self, mTEPES, p, sc, st) -> None:
+        """Append the rows of stage ``(p, sc, st)`` to every streamed table."""
+        levels = _stage_index(mTEPES).stage(p, sc, st)[1]
+        for path, variable, index_set, scale in self._specs:
+            table = self._tables[path]
+            keys  = self._stage_keys(mTEPES, index_set, p, sc, levels)
+            if table.diverged or not keys:
+                continue
+            var          = getattr(mTEPES, variable)
+            OutputToFile = pd.Series(data=np.array([var[key].value for key in keys], dtype=float), index=pd.MultiIndex.from_tuples(keys))
+            if scale != 1.0:
+                OutputToFile *= scale
+            frame = _pivot(OutputToFile, table.unit, table.aggfunc)
+            if table.layout is not None and _layout(frame) != table.layout:
+                table.diverged = True
+                continue
+            index, values = _rows(frame)
+            table.index .update(index )
+            table.values.update(values)
+            self._submit(self.sink.append if table.streamed else self.sink.write, frame, path)
+            table.layout   = table.layout or _layout(frame)
+            table.streamed = True
+
+    def _submit(self, write, frame, path) -> None:
+        if self._executor is None:
+            write(frame, path, sep=',')
+        else:
+            self._futures.append(self._executor.submit(write, frame, path, sep=','))
+
+    def wait(self) -> None:
+        """Block until every streamed write is on disk, re-raising the first failed write."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def write(self, obj, path, **csv_kwargs):
+        """Skip the write of a table the stream already holds in full; pass any other write to the sink."""
+        self.wait()
+        table = self._tables.get(os.path.abspath(path))
+        if table is not None:
+            table.claimed = True
+            if table.streamed and not table.diverged and isinstance(obj, pd.DataFrame) and csv_kwargs == {'sep': ','} and _layout(obj) == table.layout:
+                index, values = _rows(obj)
+                if hashlib.sha256(index).digest() == table.index.digest() and hashlib.sha256(values).digest() == table.values.digest():
+                    table.complete = True
+                    return None
+        return self.sink.write(obj, path, **csv_kwargs)
+
+    def close(self, drop_unclaimed: bool = True) -> None:
+        """Finish the streamed writes, remove the streamed tables no writer wrote, and close the sink.
+
+        A run that fails before the writers passes ``drop_unclaimed=False``, which keeps the tables of the stages streamed so far.
+        """
+        try:
+            self.wait()
+            for path, table in self._tables.items():
+                if drop_unclaimed and table.streamed and not table.claimed:
+                    self.sink.drop(path)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self.sink.close()
+
+
+def StreamStage(OptModel, p, sc, st) -> None:
+    """Stream the hourly results of stage ``(p, sc, st)`` into ``OptModel.pResultStream`` when the opt-in is on; does nothing otherwise."""
+    stream = getattr(OptModel, 'pResultStream', None)
+    if stream is not None:
+        stream.stage(OptModel, p, sc, st)
@@ -93,7 +93,9 @@ def OperationSummaryResults(DirName, CaseName, OptModel, mTEPES):
         # product already satisfies it. The stage and the node come from two maps built once, so each renewable injection is visited exactly one time
         pLevelToStg    = {(p,sc,n): st for p,sc,st,n in mTEPES.s2n}
         pGen2Node      = {g: nd for nd,g in mTEPES.n2g}
-        VRETechRevenue = sum(mTEPES.pDuals[f"eBalanceElec_{p}_{sc}_{pLevelToStg[p,sc,n]}('{n}', '{pGen2Node[gc]}')"]/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*OptModel.vTotalOutput[p,sc,n,gc]() for p,sc,n,gc in mTEPES.psnre if (p,sc,n) in pLevelToStg and gc in pGen2Node and pGen2Node[gc] in pNodeConnected)
+        sPSNRE         = [(p,sc,n,gc) for p,sc,n,gc in mTEPES.psnre if (p,sc,n) in pLevelToStg and gc in pGen2Node and pGen2Node[gc] in pNodeConnected]
+        pDualBalance   = mTEPES.pDuals.lookup('eBalanceElec', [(p,sc,pLevelToStg[p,sc,n],n,pGen2Node[gc]) for p,sc,n,gc in sPSNRE])
+        VRETechRevenue = sum(pDual/mTEPES.pPeriodProb[p,sc]()/mTEPES.pLoadLevelDuration[p,sc,n]()*OptModel.vTotalOutput[p,sc,n,gc]() for (p,sc,n,gc),pDual in zip(sPSNRE, pDualBalance))
     else:
         VRETechRevenue = 0.0
     VREInvCostCapacity = sum(mTEPES.pDiscountedWeight[p]*mTEPES.pGenInvestCost[gc]*OptModel.vGenerationInvest[p,gc]() for p,gc in mTEPES.pgc if gc in mTEPES.re)
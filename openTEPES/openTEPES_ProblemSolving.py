@@ -4,7 +4,7 @@ openTEPES.openTEPES_ProblemSolving — per-stage solve orchestrator.
 
 Composes the three Layer 5.a primitives:
 
-  * ``Persistent.setup_solver``       set up (or reuse) the solver instance; handles ``appsi_gurobi`` ``gurobi_persistent`` ``ncall`` lifecycle.
+  * ``Persistent.setup_solver``       set up (or reuse) the solver instance; handles ``appsi_gurobi`` ``appsi_highs`` ``gurobi_persistent`` ``ncall`` lifecycle.
   * ``Tuning.apply_solver_options``   set per-solver option presets (Gurobi / CPLEX / HiGHS / GAMS).
   * ``DualExtraction.fix_for_duals``  fix integers + investments after the initial solve so the LP re-solve recovers shadow prices.
   * ``DualExtraction.collect_duals``  copy active-constraint duals into ``mTEPES.pDuals`` after the resolve.
@@ -27,17 +27,23 @@ from pyomo.util.infeasible import log_infeasible_constraints
 # Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
 # relative imports below have no parent package; fall back to absolute package imports in that case.
 try:
-    from          .openTEPES_ProblemSolvingDualExtraction import collect_duals, fix_for_duals
+    from          .openTEPES_ProblemSolvingDualExtraction import collect_duals, fix_for_duals, wants_duals
     from          .openTEPES_ProblemSolvingPersistent import prepare_for_resolve, setup_solver
     from          .openTEPES_ProblemSolvingTuning import apply_resolve_options, apply_solver_options
     from          .openTEPES_ProblemSolvingWarmSweep import fallback_if_stalled  # opt-in (default OFF)
+    from          .openTEPES_ProblemSolvingWarmStart import WARM_START_SOLVERS, warm_start       # opt-in (default OFF)
+    from          .openTEPES_ProblemSolvingSolutionStore import OfferSolution, StoreSolution  # opt-in (default OFF)
+    from          .openTEPES_ProblemSolvingNativeDuals import SolveFixedLp                    # opt-in (default OFF)
 except ImportError:
     import os, sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from openTEPES.openTEPES_ProblemSolvingDualExtraction import collect_duals, fix_for_duals
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import collect_duals, fix_for_duals, wants_duals
     from openTEPES.openTEPES_ProblemSolvingPersistent import prepare_for_resolve, setup_solver
     from openTEPES.openTEPES_ProblemSolvingTuning import apply_resolve_options, apply_solver_options
     from openTEPES.openTEPES_ProblemSolvingWarmSweep import fallback_if_stalled  # opt-in (default OFF)
+    from openTEPES.openTEPES_ProblemSolvingWarmStart import WARM_START_SOLVERS, warm_start       # opt-in (default OFF)
+    from openTEPES.openTEPES_ProblemSolvingSolutionStore import OfferSolution, StoreSolution  # opt-in (default OFF)
+    from openTEPES.openTEPES_ProblemSolvingNativeDuals import SolveFixedLp                    # opt-in (default OFF)
 
 
 def ProblemSolving(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st, ncall):
@@ -64,9 +70,14 @@ def ProblemSolving(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConso
     for var in OptModel.component_data_objects(pyo.Var, active=True, descend_into=True):
         if not var.is_continuous() and not var.is_fixed():
             nIntegerVars += 1
-    if nIntegerVars == 0:
+    # opt-in (default OFF): with --selective-duals an LP whose duals no output reads is solved without the Suffix
+    if nIntegerVars == 0 and wants_duals(mTEPES):
         OptModel.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
 
+    # opt-in (default OFF): the solution an earlier run of the case stored for this stage, when the structure is unchanged
+    stored  = OfferSolution(OptModel, mTEPES, Solver, SolverName, p, sc, st, nIntegerVars > 0)
+    offered = stored is not None and stored.offered
+
     # ---- Initial solve ----
     if SolverName == "gams":
         SolverResults = Solver.solve(OptModel, tee=True, report_timing=True, symbolic_solver_labels=False,
@@ -79,6 +90,13 @@ def ProblemSolving(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConso
         SolverResults = fallback_if_stalled(Solver, OptModel, SolverName, ncall, SolverResults, _solve_kwargs)
     else:
         _solve_kwargs = dict(tee=True, report_timing=True)
+        if SolverName == "appsi_highs":
+            # a MIP starts from the values on the model (those of the previous solve); an LP warm-starts from the basis the instance kept
+            _solve_kwargs["warmstart"] = nIntegerVars > 0
+        elif nIntegerVars > 0 and (warm_start(mTEPES, SolverName) or (offered and SolverName in WARM_START_SOLVERS)):
+            # opt-in (default OFF): the MIP starts from the values the previous stage or the stored solution left
+            # (openTEPES_ProblemSolvingWarmStart, openTEPES_ProblemSolvingSolutionStore)
+            _solve_kwargs["warmstart"] = True
         SolverResults = Solver.solve(OptModel, **_solve_kwargs)
         SolverResults = fallback_if_stalled(Solver, OptModel, SolverName, ncall, SolverResults, _solve_kwargs)
 
@@ -89,22 +107,26 @@ def ProblemSolving(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConso
         logging.basicConfig(filename=f"{_path}/openTEPES_infeasibilities_{CaseName}_{p}_{sc}_{st}.log", level=logging.INFO)
         log_infeasible_constraints(OptModel, log_expression=True, log_variables=True)
         raise ValueError(f"### Problem infeasible for period {p}, scenario {sc}, stage {st}")
+    StoreSolution(mTEPES, stored, Solver, SolverName, nIntegerVars > 0)
 
     # ---- Fix integers + investments; re-solve as LP to recover duals ----
     nUnfixedVars = fix_for_duals(OptModel, mTEPES, p, sc)
 
-    if nUnfixedVars > 0:
+    # opt-in (default OFF): with --selective-duals the re-solve is skipped when no output reads a dual
+    if nUnfixedVars > 0 and wants_duals(mTEPES):
         print("Problem solving with fixed investments ####", ncall)
         ncall += 1
-        prepare_for_resolve(OptModel, Solver, SolverName)
-        apply_resolve_options(Solver, SolverName)
-
-        OptModel.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
-        if SolverName == "gurobi_persistent":
-            SolverResults = Solver.solve(OptModel, tee=True, report_timing=True, warmstart=True,
-                                         keepfiles=False, load_solutions=True, save_results=False)
-        else:
-            SolverResults = Solver.solve(OptModel, tee=True, report_timing=True)
+        # opt-in (default OFF): with --native-fixed-duals the solver solves the fixed LP of its MIP in memory, without the Pyomo re-solve
+        if not SolveFixedLp(OptModel, Solver, SolverName):
+            prepare_for_resolve(OptModel, Solver, SolverName)
+            apply_resolve_options(Solver, SolverName)
+
+            OptModel.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+            if SolverName == "gurobi_persistent":
+                SolverResults = Solver.solve(OptModel, tee=True, report_timing=True, warmstart=True,
+                                             keepfiles=False, load_solutions=True, save_results=False)
+            else:
+                SolverResults = Solver.solve(OptModel, tee=True, report_timing=True)
 
     # ---- Collect duals into mTEPES.pDuals (used by MarginalResults / EconomicResults) ----
     collect_duals(OptModel, mTEPES)
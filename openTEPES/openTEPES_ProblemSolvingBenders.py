@@ -1,29 +1,83 @@
 """
 Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - June 03, 2026
 
-openTEPES.openTEPES_ProblemSolvingBenders — classical L-shaped Benders decomposition for transmission expansion.
+openTEPES.openTEPES_ProblemSolvingBenders — classical L-shaped Benders decomposition for generation, storage and transmission expansion.
 
 Master problem
 --------------
 
-* Decision variables: ``x[p, ni, nf, cc]`` for every candidate transmission line in ``mTEPES.plc`` (the   set of ``(Period, InitialNode, FinalNode, Circuit)`` tuples whose ``FixedInvestmentCost > 0``).
+* Decision variables: ``x[k]``, one per investment decision the case leaves open, of every family on the model: ``vGenerationInvest``
+  (generation and ESS candidates), ``vGenerationRetire``, ``vNetworkInvest``, ``vReservoirInvest``, ``vH2PipeInvest`` and ``vHeatPipeInvest``.
+  A decision the case fixed (before its initial period, or ``IndBin*Invest`` = 2) stays fixed; one a previous solve fixed to read its duals is
+  freed. A binary investment is binary in the master, which is then a MIP, and carries the integrality of the whole problem.
+* The constraints that hold decisions only (``eConsecutive*``, a reserve margin met by candidates alone) are copied into the master, so
+  every plan it proposes is feasible for them.
 * Recourse variable ``theta`` approximates the **full** system total cost ``eTotalSCost`` (operation + investment) as a function of master decisions. Investment cost is therefore baked into the cuts; the master objective is simply ``min theta``.
 * Benders cuts accumulated across iterations: ``theta >= eTotalSCost(x*) + dual^T (x - x*)`` where the dual is the multiplier on the subproblem's fixing constraint at ``x = x*``.
 
 Subproblem
 ----------
 
-The full openTEPES model with every candidate ``vNetworkInvest`` pinned to the master's decision via an explicit equality constraint
-``vNetworkInvest[k] == benders_x[k]`` (mutable ``Param`` ``benders_x``).
-The dual on this constraint is exactly ``∂(eTotalSCost) / ∂(vNetworkInvest[k])`` at the current master solution — which is what the Benders cut
+The full openTEPES model with every decision pinned to the master's value via an explicit equality constraint
+``decision[k] == benders_x[k]`` (mutable ``Param`` ``benders_x``).
+The dual on this constraint is exactly ``∂(eTotalSCost) / ∂(decision[k])`` at the current master solution — which is what the Benders cut
 needs. Pyomo's ``rc`` Suffix on ``Var.fix()`` is not reliably populated by every solver (HiGHS in particular leaves it empty), so the
-explicit-constraint approach is solver-portable.
+explicit-constraint approach is solver-portable. The subproblem is an LP: the binary decisions are continuous there, pinned by the
+constraint, and any other discrete variable (binary commitment, line switching) is taken at its LP relaxation, the commitment a solve
+fixed to read its duals included, so with binary operation the Benders cost is that of the relaxed operation. Every domain and fixed
+flag is put back at the end; a variable that was fixed gets its value back, and the free ones hold the values of the subproblem solves at
+the decisions of the best upper bound, which the subproblems are solved at once more when the last iteration tried another point.
+
+Multi-cut
+---------
+
+With ``multicut="scenario"`` or ``multicut="stage"`` the subproblem is split along the ``ConstraintRegistry`` of the model
+(``mTEPES.pConstraints``): one block per ``(period, scenario)`` or per ``(period, scenario, stage)``, holding the stage constraints of its
+load levels, plus one block for the investment cost (``eTotalICost`` and what it is built from). The objective of each block is its share of
+``eTotalTCost``, so the blocks add up to ``eTotalSCost``. The master keeps one ``theta[b]`` per block and receives one cut per block and
+iteration, ``theta[b] >= Q_b(x*) + dual_b^T (x - x*)``, instead of their sum, which on multi-scenario cases takes fewer iterations. The
+split is exact only when the blocks share no variable besides the master decisions; any other shared variable (a stage-coupling
+inventory) raises ``ValueError``, and the single cut remains the way to solve those models.
+
+Every block keeps its own solver: with a persistent solver (``"appsi_highs"``) each block is loaded once and then receives only the new
+master decisions. With ``workers > 1`` the blocks are shared out over that many forked worker processes (POSIX ``fork`` only, as for
+``--parallel-stages``), which solve them concurrently and send back the cost and the fixing duals of each block; at the end the variable
+values of their solves at the best upper bound are copied back to ``mTEPES``.
+
+Stabilization
+-------------
+
+The plain cutting-plane master swings the candidate decisions between their bounds in the first iterations. With ``stabilization`` the master
+is still solved as above, for the lower bound and the cutting-plane point ``x_cp``, but the subproblems are solved at a point held near the
+stability center, the decisions of the best upper bound so far:
+
+* ``"trust_region"``  the master again inside a box of ``radius`` times each candidate's range around the center; the radius doubles after a
+                      serious step that reached the box and halves after a step without sufficient decrease. The box leaves the
+                      binary decisions free.
+* ``"in_out"``        the point ``w * center + (1 - w) * x_cp``; when its cuts do not cut off ``x_cp`` the next point is ``x_cp`` itself. The
+                      binary decisions are those of ``x_cp``.
+* ``"level"``         the point of the level set ``sum(theta) <= LB + l * (UB - LB)`` nearest (L1) to the center, so the master stays an LP
+                      (a MIP with binary decisions).
+
+``history`` keeps the lower bound, the upper bound and their gap per iteration, and ``serious_steps`` the iterations that improved the upper
+bound, so the methods can be compared on the same case; on the 7-day ``9n`` of the parity test each takes fewer iterations than the plain
+cutting plane. The last point tried is then usually not the center, so the run ends with one more subproblem solve at the center. Only
+``lshaped`` is stabilized; the time decomposition of ``StageDecomposition`` solves its master point as before.
+
+Cut pool
+--------
+
+With ``cut_pool`` (or ``--cut-pool``, which keeps the ``lshaped`` pool of the case in ``openTEPES_cuts_<CaseName>``) every cut also goes
+into a ``CutPool`` keyed by ``(variable name, index)``: a cut dominated over the decision bounds is not added, and one a new cut dominates is
+dropped from the master. The pool counts the master solves each cut was slack at and keeps, at the end, the cuts binding at the last master
+solution and those of the last subproblem solves. A re-run with changed data first solves the subproblems at the origins of those cuts, on
+its own data, and starts the loop from the fresh cuts cut there and the best of those points as upper bound (and stability center).
 
 Scope
 -----
 
-This is a deliberately minimal driver — single deterministic case, no multi-cut, no trust region, no binary investments
-(subproblem must be LP for the duals to be valid). Intended as a **compatibility guard** for the layered-architecture restructure:
+This is a deliberately minimal driver — single deterministic case per run, and an LP subproblem for the duals to be valid.
+Intended as a **compatibility guard** for the layered-architecture restructure:
 every future refactor must keep this Benders loop converging to the joint-LP optimum on the bundled CI cases.
 The full Benders / sector decomposition driver with stochastic support is RFC PR #9 (``solver/decomposition/``).
 
@@ -33,32 +87,121 @@ to the joint-LP total cost within 1e-4 relative tolerance.
 from __future__ import annotations
 
 import math
+import os
+import sys
 import time
+import traceback
 
 import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_variables
 from pyomo.opt import SolverFactory
+from pyomo.repn import generate_standard_repn
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_ConstraintRegistry import StageConstraints
+    from          .openTEPES_ProblemSolvingCutPool import Cut, CutPool
+    from          .openTEPES_ProblemSolvingDualExtraction import _FIX_REGISTRY, _INV_REGISTRY
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ConstraintRegistry import StageConstraints
+    from openTEPES.openTEPES_ProblemSolvingCutPool import Cut, CutPool
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import _FIX_REGISTRY, _INV_REGISTRY
 
 
 _BENDERS_PARAM_ATTR = "_benders_x_param"
 _BENDERS_CONSTR_ATTR = "_benders_fix_constr"
+_BENDERS_OBJ_ATTR = "_benders_objective"
+
+
+# the investment variables the master decides, as SettingUpVariables declares them; a family the case does not have is not on the model
+_INVESTMENTS = ("vGenerationInvest", "vGenerationRetire", "vNetworkInvest", "vReservoirInvest", "vH2PipeInvest", "vHeatPipeInvest")
 
 
-def _attach_fixing_constraints(mTEPES, candidates: list[tuple]) -> tuple:
-    """Add (or replace) the mutable Param + explicit equality constraint that pin each candidate
-    ``vNetworkInvest`` to the master's current decision. Returns ``(param, constr)`` references."""
+def _decisions(mTEPES) -> tuple[list, list]:
+    """The investment variables left to the master and the domain each was declared with.
+
+    A variable the case fixed (a candidate before its initial period, or ``IndBin*Invest`` = 2) stays fixed. One that a solve of the model
+    fixed to read its duals, recorded by ``fix_for_duals``, is a decision again; a binary one was relaxed there, so its domain is read back.
+    """
+    relaxed   = getattr(mTEPES, _FIX_REGISTRY, None) or {}
+    invest    = getattr(mTEPES, _INV_REGISTRY, None) or {}
+    decisions = []
+    domains   = []
+    for name in _INVESTMENTS:
+        component = mTEPES.component(name)
+        if component is None:
+            continue
+        for var in component.values():
+            if id(var) in relaxed:
+                domains.append(relaxed[id(var)][1])
+            elif (invest[id(var)][1] if id(var) in invest else var.fixed):
+                continue
+            else:
+                domains.append(var.domain)
+            decisions.append(var)
+    return decisions, domains
+
+
+def _relax(mTEPES, decisions: list) -> list:
+    """Make the subproblem an LP: free the decisions (the fixing constraints pin them) and take every other discrete variable at its LP
+    relaxation, the commitment a solve fixed to read its duals included. Returns ``(var, fixed, value, domain)`` of what was changed."""
+    relaxed = getattr(mTEPES, _FIX_REGISTRY, None) or {}
+    master  = {id(var) for var in decisions}
+    changed = []
+    for var in mTEPES.component_data_objects(pyo.Var, descend_into=True):
+        if id(var) in master or (id(var) in relaxed and var.fixed) or (not var.fixed and not var.is_continuous()):
+            changed.append((var, var.fixed, var.value, var.domain))
+            var.fixed = False
+            if not var.is_continuous():
+                var.domain = pyo.UnitInterval
+    return changed
+
+
+def _unrelax(changed: list) -> None:
+    """Undo ``_relax``: a variable that was fixed is fixed again at its value, a free one keeps the value ``lshaped`` left it at."""
+    for var, fixed, value, domain in changed:
+        var.domain = domain
+        if fixed:
+            var.fix(value, skip_validation=True)
+
+
+def _master_rows(mTEPES, decisions: list) -> list:
+    """The constraints that hold no variable but the decisions (``eConsecutive*``, a reserve margin met by candidates only), as
+    ``(lower, {position: coefficient}, constant, upper)``. The master keeps a copy, so every decision it takes is feasible for them."""
+    position = {id(var): i for i, var in enumerate(decisions)}
+    rows     = []
+    for data in mTEPES.component_data_objects(pyo.Constraint, active=True, descend_into=True):
+        variables = list(identify_variables(data.body, include_fixed=False))
+        if not variables or any(id(var) not in position for var in variables):
+            continue
+        repn = generate_standard_repn(data.body, compute_values=True)
+        if not repn.is_linear():
+            continue
+        coefs = {}
+        for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+            coefs[position[id(var)]] = coefs.get(position[id(var)], 0.0) + coef
+        rows.append((pyo.value(data.lower) if data.has_lb() else None, coefs, repn.constant, pyo.value(data.upper) if data.has_ub() else None))
+    return rows
+
+
+def _attach_fixing_constraints(mTEPES, decisions: list) -> tuple:
+    """Add (or replace) the mutable Param + explicit equality constraint that pin each decision to the master's current value, both indexed
+    by the position of the decision in ``decisions``. Returns ``(param, constr)`` references."""
     # Remove previous attachments if present so the function is idempotent across reruns.
-    for attr in (_BENDERS_CONSTR_ATTR, _BENDERS_PARAM_ATTR):
+    for attr in (_BENDERS_CONSTR_ATTR, _BENDERS_PARAM_ATTR, "_benders_candidates"):
         if hasattr(mTEPES, attr):
             mTEPES.del_component(getattr(mTEPES, attr))
 
-    candidates_set = pyo.Set(initialize=candidates, dimen=4)
+    candidates_set = pyo.Set(initialize=range(len(decisions)))
     mTEPES.add_component("_benders_candidates", candidates_set)
 
     param = pyo.Param(candidates_set, mutable=True, initialize=0.0, within=pyo.Reals)
     mTEPES.add_component(_BENDERS_PARAM_ATTR, param)
 
-    def _fix_rule(m, *k):
-        return m.vNetworkInvest[k] == getattr(m, _BENDERS_PARAM_ATTR)[k]
+    def _fix_rule(m, i):
+        return decisions[i] == getattr(m, _BENDERS_PARAM_ATTR)[i]
 
     constr = pyo.Constraint(candidates_set, rule=_fix_rule)
     mTEPES.add_component(_BENDERS_CONSTR_ATTR, constr)
@@ -70,144 +213,601 @@ def _attach_fixing_constraints(mTEPES, candidates: list[tuple]) -> tuple:
 
 
 def _detach_fixing_constraints(mTEPES) -> None:
-    """Remove the Benders auxiliary Param/Constraint/Set so mTEPES is left as we found it."""
-    for attr in (_BENDERS_CONSTR_ATTR, _BENDERS_PARAM_ATTR, "_benders_candidates"):
+    """Remove the Benders auxiliary Param/Constraint/Set (and the block objectives) so mTEPES is left as we found it."""
+    for attr in (_BENDERS_OBJ_ATTR, _BENDERS_CONSTR_ATTR, _BENDERS_PARAM_ATTR, "_benders_candidates"):
         if hasattr(mTEPES, attr):
             mTEPES.del_component(getattr(mTEPES, attr))
 
 
+class _Block:
+    """One subproblem of the multi-cut split: its constraints, its share of ``eTotalTCost`` and the variables it solves."""
+
+    def __init__(self, name: str, index: int):
+        self.name       = name
+        self.index      = index   # of its objective in ``_benders_objective``
+        self.components = []      # whole constraint components (the stage constraints)
+        self.data       = []      # single constraints of the components outside the registry
+        self.cost       = []      # (coefficient, variable) of its share of eTotalTCost
+        self.constant   = 0.0
+        self.variables  = {}      # id -> variable, for the values sent back by a worker
+
+
+def _split(mTEPES, multicut: str, decisions: list) -> tuple[list[_Block], list]:
+    """Split the subproblem into one block per ``(p, sc)`` (``multicut="scenario"``) or ``(p, sc, st)`` (``"stage"``) of the registry, and one
+    for the investment cost. Returns the blocks and every constraint component they are cut from (the fixing constraints excepted)."""
+    if multicut not in ("scenario", "stage"):
+        raise ValueError(f'openTEPES.openTEPES_ProblemSolvingBenders.lshaped: multicut must be None, "scenario" or "stage", not {multicut!r}')
+    registry = StageConstraints(mTEPES)
+    master   = {id(var) for var in decisions}
+    blocks   = {}
+    owner    = {}   # id(var) -> block that solves it
+    shared   = {}   # id(var) -> var, for the variables of more than one block
+
+    def _own(block, data):
+        for var in identify_variables(data.body, include_fixed=False):
+            if id(var) in master:
+                continue
+            if owner.setdefault(id(var), block) is not block:
+                shared[id(var)] = var
+            block.variables[id(var)] = var
+
+    for p, sc, st in registry.stages():
+        key   = (p, sc) if multicut == "scenario" else (p, sc, st)
+        block = blocks.get(key)
+        if block is None:
+            block = blocks[key] = _Block("_".join(str(k) for k in key), len(blocks))
+        for component in registry.stage(p, sc, st):
+            block.components.append(component)
+            for data in component.values():
+                _own(block, data)
+
+    # the constraints outside the registry go with the block whose variables they hold, or else to the investment block
+    staged     = {id(component) for block in blocks.values() for component in block.components}
+    investment = _Block("investment", len(blocks))
+    components = [component for block in blocks.values() for component in block.components]
+    for component in mTEPES.component_objects(pyo.Constraint, active=True, descend_into=True):
+        if id(component) in staged or component.name == _BENDERS_CONSTR_ATTR:
+            continue
+        components.append(component)
+        if component is mTEPES.eTotalTCost:
+            continue
+        for data in component.values():
+            if data.active:
+                holders = [owner[id(var)] for var in identify_variables(data.body, include_fixed=False) if id(var) in owner]
+                block   = holders[0] if holders else investment
+                block.data.append(data)
+                _own(block, data)
+
+    # eTotalTCost: vTotalSCost == vTotalICost + sum of the operation costs; each block minimizes its own terms
+    con   = mTEPES.eTotalTCost
+    repn  = generate_standard_repn(con.body, compute_values=True)
+    scale = dict(zip((id(var) for var in repn.linear_vars), repn.linear_coefs))[id(mTEPES.vTotalSCost)]
+    investment.constant = (pyo.value(con.upper) - repn.constant) / scale
+    for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+        if var is not mTEPES.vTotalSCost:
+            block = owner.get(id(var), investment)
+            block.cost.append((-coef / scale, var))
+            block.variables[id(var)] = var
+
+    if shared:
+        names = sorted(var.name for var in shared.values())
+        raise ValueError(f'openTEPES.openTEPES_ProblemSolvingBenders.lshaped: the {multicut} subproblems share {len(names)} variables that are not '
+                         f'master decisions ({", ".join(names[:5])}{", ..." if len(names) > 5 else ""}); solve this model with multicut=None')
+    return list(blocks.values()) + ([investment] if investment.data or investment.cost else []), components
+
+
+def _attach_objectives(mTEPES, blocks: list[_Block]) -> None:
+    """Add the objective of every block, deactivated; ``_select`` activates the one of the block being loaded."""
+    if hasattr(mTEPES, _BENDERS_OBJ_ATTR):
+        mTEPES.del_component(getattr(mTEPES, _BENDERS_OBJ_ATTR))
+    objective = pyo.Objective(range(len(blocks)), sense=pyo.minimize,
+                              rule=lambda m, b: sum(coef * var for coef, var in blocks[b].cost) + blocks[b].constant)
+    mTEPES.add_component(_BENDERS_OBJ_ATTR, objective)
+    objective.deactivate()
+
+
+def _select(mTEPES, components: list, block: _Block) -> None:
+    """Leave active on ``mTEPES`` only the constraints and the objective of ``block``, besides the fixing constraints."""
+    for component in components:
+        component.deactivate()
+    for component in block.components:
+        component.activate()
+    parents = {}
+    for data in block.data:
+        parents.setdefault(id(data.parent_component()), (data.parent_component(), set()))[1].add(id(data))
+    for parent, chosen in parents.values():
+        parent.activate()
+        for data in parent.values():
+            if id(data) not in chosen:
+                data.deactivate()
+    mTEPES.eTotalSCost.deactivate()
+    objective = getattr(mTEPES, _BENDERS_OBJ_ATTR)
+    objective.activate()
+    for index, data in objective.items():
+        if index != block.index:
+            data.deactivate()
+
+
+def _restore(mTEPES, components: list) -> None:
+    """Undo ``_select``: every constraint of the split and the total-cost objective active again."""
+    for component in components:
+        component.activate()
+    getattr(mTEPES, _BENDERS_OBJ_ATTR).deactivate()
+    mTEPES.eTotalSCost.activate()
+
+
+def _subproblem_solver(solver_name: str):
+    solver = SolverFactory(solver_name)
+    if hasattr(solver, "update_config"):
+        # only the mutable Param of the master decisions changes between subproblem solves
+        solver.update_config.check_for_new_or_removed_params      = False
+        solver.update_config.check_for_new_or_removed_vars        = False
+        solver.update_config.check_for_new_or_removed_constraints = False
+        solver.update_config.check_for_new_objective              = False
+        solver.update_config.update_params                        = True
+        solver.update_config.update_vars                          = False
+        solver.update_config.update_constraints                   = False
+        solver.update_config.update_named_expressions             = False
+        solver.update_config.update_objective                     = False
+    return solver
+
+
+class _Subproblems:
+    """The subproblem blocks solved in this process, one solver each; without blocks the whole model is the only subproblem (single cut)."""
+
+    def __init__(self, mTEPES, solver_name: str, blocks: list[_Block] | None = None, components: list = ()):
+        self.mTEPES     = mTEPES
+        self.blocks     = blocks
+        self.components = components
+        self.solvers    = {name: _subproblem_solver(solver_name) for name in ([block.name for block in blocks] if blocks else ["total"])}
+        self._loaded    = set()
+
+    def solve(self, x: dict, it: int) -> dict:
+        """Solve every block at the master decisions ``x``: block name -> (cost, dual of the fixing constraint of each candidate)."""
+        param  = getattr(self.mTEPES, _BENDERS_PARAM_ATTR)
+        constr = getattr(self.mTEPES, _BENDERS_CONSTR_ATTR)
+        for k, value in x.items():
+            param[k] = value
+        solved = {}
+        for block in self.blocks or [None]:
+            name   = "total" if block is None else block.name
+            solver = self.solvers[name]
+            # a persistent solver keeps the block it was loaded with; any other solver reads the active components at every solve
+            if block is not None and (name not in self._loaded or not hasattr(solver, "update_config")):
+                _select(self.mTEPES, self.components, block)
+                self._loaded.add(name)
+            result = solver.solve(self.mTEPES, tee=False)
+            if str(result.solver.termination_condition) != "optimal":
+                raise RuntimeError(
+                    f"Benders subproblem {'' if block is None else name + ' '}infeasible at iter {it}: "
+                    f"{result.solver.termination_condition}"
+                )
+            cost = self.mTEPES.eTotalSCost if block is None else getattr(self.mTEPES, _BENDERS_OBJ_ATTR)[block.index]
+            solved[name] = (float(pyo.value(cost)), {k: float(self.mTEPES.dual.get(constr[k], 0.0)) for k in x})
+        return solved
+
+    def values(self) -> dict:
+        """component name -> {index: value} of the variables of the blocks, as the last solves left them."""
+        values = {}
+        for block in self.blocks:
+            for var in block.variables.values():
+                if var.value is not None:
+                    values.setdefault(var.parent_component().name, {})[var.index()] = var.value
+        return values
+
+    def load_values(self) -> None:
+        """The last solves already wrote their values on ``mTEPES``."""
+
+    def close(self) -> None:
+        if self.blocks:
+            _restore(self.mTEPES, self.components)
+
+
+def _serve(conn, mTEPES, solver_name: str, blocks: list[_Block], components: list) -> None:
+    """Worker body: solve the blocks this process was forked for at every master decision the parent sends, until it sends None."""
+    try:
+        subproblems = _Subproblems(mTEPES, solver_name, blocks, components)
+        for command, payload in iter(conn.recv, None):
+            conn.send(("ok", subproblems.solve(*payload) if command == "solve" else subproblems.values()))
+    except BaseException as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+
+class _Workers:
+    """The blocks shared out over forked worker processes, each keeping one solver per block and solving its share concurrently.
+
+    Only the POSIX ``fork`` start method is used: the workers inherit ``mTEPES`` with the fixing constraints and the block objectives attached.
+    """
+
+    def __init__(self, mTEPES, solver_name: str, blocks: list[_Block], components: list, n_workers: int):
+        import multiprocessing as mp
+        ctx           = mp.get_context("fork")
+        self.mTEPES   = mTEPES
+        self._workers = []
+        for w in range(n_workers):
+            conn, child = ctx.Pipe()
+            process     = ctx.Process(target=_serve, args=(child, mTEPES, solver_name, blocks[w::n_workers], components))
+            process.start()
+            child.close()
+            self._workers.append((process, conn))
+
+    def _ask(self, command: str, payload=None) -> list:
+        for _, conn in self._workers:
+            conn.send((command, payload))
+        answers = []
+        for process, conn in self._workers:
+            try:
+                status, answer = conn.recv()
+            except EOFError:
+                status, answer = "error", f"worker {process.pid} exited without a result (exit code {process.exitcode})"
+            if status != "ok":
+                raise RuntimeError(f"Benders subproblem worker {process.pid} failed\n{answer}")
+            answers.append(answer)
+        return answers
+
+    def solve(self, x: dict, it: int) -> dict:
+        solved = {}
+        for answer in self._ask("solve", (x, it)):
+            solved.update(answer)
+        return solved
+
+    def load_values(self) -> None:
+        """Copy the values of the last solves of every worker to ``mTEPES``."""
+        for values in self._ask("values"):
+            for name, indexed in values.items():
+                component = self.mTEPES.find_component(name)
+                for index, value in indexed.items():
+                    component[index].set_value(value, skip_validation=True)
+
+    def close(self) -> None:
+        for process, conn in self._workers:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            conn.close()
+        self._workers = []
+
+
+STABILIZATIONS = ("trust_region", "in_out", "level")
+
+# default of stabilization_param per method: trust-region radius (share of each candidate range), weight of the incumbent, share of the gap
+_STABILIZATION_PARAM = {"trust_region": 0.25, "in_out": 0.5, "level": 0.3}
+
+
+class _Stabilization:
+    """Where the subproblems are solved next: a point held near the incumbent instead of the bare cutting-plane point of the master.
+
+    The master is solved as before first; its value stays the lower bound and its solution is the cutting-plane point ``x_cp``. ``trial``
+    then picks the point the subproblems are solved at, and ``update`` moves the stability center (the decisions of the best upper bound) when
+    the step is serious.
+    """
+
+    def __init__(self, master, bounds: dict, method: str, param: float | None, binary: set):
+        self.method  = method
+        self.param   = _STABILIZATION_PARAM[method] if param is None else float(param)
+        self.master  = master
+        self.span    = {k: max(up - lo, 1.0e-9) for k, (lo, up) in bounds.items()}
+        self.binary  = binary   # decisions the box and the in-out point leave to the master
+        self.center  = None
+        self.best    = math.inf
+        self.kelley  = False   # in-out: the last cut did not cut off x_cp, so the next trial is x_cp itself
+        master.center = pyo.Param(master.CANDIDATES, mutable=True, initialize=lambda m, k: bounds[k][0])
+        if method == "trust_region":
+            master.radius   = pyo.Param(mutable=True, initialize=self.param)
+            master.trust_up = pyo.Constraint(master.CANDIDATES, rule=lambda m, k: pyo.Constraint.Skip if k in binary else
+                                             m.x[k] <= m.center[k] + m.radius * self.span[k])
+            master.trust_dw = pyo.Constraint(master.CANDIDATES, rule=lambda m, k: pyo.Constraint.Skip if k in binary else
+                                             m.x[k] >= m.center[k] - m.radius * self.span[k])
+            self._components = [master.trust_up, master.trust_dw]
+        elif method == "level":
+            # the L1 projection of the center onto the level set of the cutting-plane model keeps the master an LP
+            master.level     = pyo.Param(mutable=True, initialize=0.0)
+            master.dev_up    = pyo.Var(master.CANDIDATES, within=pyo.NonNegativeReals)
+            master.dev_dw    = pyo.Var(master.CANDIDATES, within=pyo.NonNegativeReals)
+            master.deviation = pyo.Constraint(master.CANDIDATES, rule=lambda m, k: m.x[k] - m.center[k] == m.dev_up[k] - m.dev_dw[k])
+            master.level_cut = pyo.Constraint(expr=sum(master.theta[b] for b in master.BLOCKS) <= master.level)
+            master.distance  = pyo.Objective(expr=sum((master.dev_up[k] + master.dev_dw[k]) / self.span[k] for k in master.CANDIDATES), sense=pyo.minimize)
+            self._components = [master.deviation, master.level_cut, master.distance]
+        else:
+            self._components = []
+        for component in self._components:
+            component.deactivate()
+
+    def trial(self, solver, x_cp: dict, LB: float, UB: float, it: int) -> dict:
+        """The decisions the subproblems are solved at in this iteration."""
+        self.x_cp     = x_cp
+        self.theta_cp = sum(float(pyo.value(theta)) for theta in self.master.theta.values())
+        if self.center is None or (self.method == "in_out" and self.kelley):
+            self.kelley = False
+            return x_cp
+        if self.method == "in_out":
+            # a convex combination of two plans is no plan for a binary decision, which stays at x_cp
+            return {k: x_cp[k] if k in self.binary else self.param * self.center[k] + (1.0 - self.param) * x_cp[k] for k in x_cp}
+
+        master = self.master
+        for k, value in self.center.items():
+            master.center[k] = value
+        if self.method == "level":
+            master.level = LB + self.param * (UB - LB)
+            master.obj.deactivate()
+        for component in self._components:
+            component.activate()
+        try:
+            result = solver.solve(master, tee=False)
+        finally:
+            for component in self._components:
+                component.deactivate()
+            master.obj.activate()
+        if str(result.solver.termination_condition) != "optimal":
+            raise RuntimeError(f"Benders {self.method} master non-optimal at iter {it}: {result.solver.termination_condition}")
+        # the model value at the trial point, for the sufficient-decrease test of the trust region
+        self.predicted = sum(float(pyo.value(theta)) for theta in master.theta.values())
+        return {k: float(pyo.value(master.x[k])) for k in x_cp}
+
+    def start(self, x: dict, cost: float) -> None:
+        """Take ``x``, solved before the loop (a warm restart), as the center when it is the best point so far."""
+        if cost < self.best:
+            self.center, self.best = x, cost
+
+    def update(self, x: dict, cost: float, solved: dict) -> None:
+        """Move the center to ``x`` after a serious step, and adapt the radius (trust region) or the next trial point (in-out)."""
+        if self.center is None:
+            self.center, self.best = x, cost
+            return
+        if self.method == "trust_region":
+            serious = cost <= self.best - 0.1 * (self.best - self.predicted)
+            if serious and any(abs(x[k] - self.center[k]) >= 0.99 * self.param * self.span[k] for k in x if k not in self.binary):
+                self.param = min(2.0 * self.param, 1.0)
+            elif not serious:
+                self.param = max(0.5 * self.param, 1.0e-3)
+            self.master.radius = self.param
+        else:
+            serious = cost < self.best
+        if self.method == "in_out" and x != self.x_cp:
+            # a cut at the in-out point that does not cut off (x_cp, theta_cp) would stall the lower bound: use x_cp next
+            at_cp = sum(cost_b + sum(duals[k] * (self.x_cp[k] - x[k]) for k in x) for cost_b, duals in solved.values())
+            self.kelley = at_cp <= self.theta_cp + 1.0e-9 * max(abs(self.theta_cp), 1.0)
+        if serious:
+            self.center, self.best = x, cost
+
+
 def lshaped(mTEPES, solver_name: str = "highs", max_iter: int = 20, tol: float = 1e-4,
-            verbose: bool = False) -> dict:
+            verbose: bool = False, multicut: str | None = None, workers: int = 1,
+            stabilization: str | None = None, stabilization_param: float | None = None, cut_pool: CutPool | None = None) -> dict:
     """Run classical L-shaped Benders on an already-built openTEPES model.
 
     Parameters
     ----------
     mTEPES : pyomo.ConcreteModel
-        Fully built openTEPES model (joint-LP solve optional — the driver unfixes every candidate
-        ``vNetworkInvest`` before starting and discards any prior solution).
+        Fully built openTEPES model (joint solve optional — the driver frees every investment decision the
+        case leaves open before starting and discards any prior solution; see *Master problem* above).
     solver_name : str
-        Pyomo solver name used for both master and subproblem. Default ``"highs"``.
+        Pyomo solver name used for both master and subproblem. Default ``"highs"``. With a persistent
+        solver (``"appsi_highs"``) the master and the subproblem stay loaded in one instance each: the
+        master receives only the new cut, the subproblem only the new master decisions, and each solve
+        starts from the basis of the previous iteration.
     max_iter : int
         Hard cap on Benders iterations.
     tol : float
         Relative convergence tolerance: stop when ``(UB - LB) / max(|LB|, 1)`` ≤ ``tol``.
     verbose : bool
         If ``True``, print one line per iteration with LB, UB, gap, and master solution.
+    multicut : str or None
+        ``None`` (default) for one aggregated cut per iteration on the whole model; ``"scenario"`` or ``"stage"``
+        for one cut per ``(period, scenario)`` or ``(period, scenario, stage)`` block plus one for the investment
+        cost (see *Multi-cut* above), each block with its own solver.
+    workers : int
+        With ``multicut``, number of forked worker processes the blocks are shared out over; 1 (default) solves
+        them one after the other in this process.
+    stabilization : str or None
+        ``None`` (default) solves the subproblems at the cutting-plane point of the master; ``"trust_region"``,
+        ``"in_out"`` or ``"level"`` solve them at a point held near the incumbent (see *Stabilization* above).
+    stabilization_param : float or None
+        The trust-region radius as a share of each candidate's range (default 0.25), the weight of the incumbent
+        in the in-out point (0.5), or the share of the gap above the lower bound the level is set at (0.3).
+    cut_pool : CutPool or None
+        Keep the cuts in this pool (see *Cut pool* above): its cuts of a previous run are refreshed at their origins
+        before the loop, and at the end it holds the cuts binding at the last master solution. Without it, the
+        ``lshaped`` pool of ``mTEPES.pCutPools`` is loaded and saved when ``--cut-pool`` is on.
 
     Returns
     -------
     dict
         Keys: ``total_cost`` (UB at termination), ``master_decisions`` (dict keyed on
-        ``(p, ni, nf, cc)``), ``num_iterations`` (iterations performed),
+        ``(variable name, index)``, e.g. ``("vNetworkInvest", (p, ni, nf, cc))``), ``num_iterations`` (iterations performed),
         ``converged`` (bool — True iff the convergence test triggered before ``max_iter``),
         ``history`` (list of per-iteration ``(it, LB, UB, gap, sub_cost)`` tuples),
-        ``wall_clock_s`` (total seconds).
+        ``num_subproblems`` (cuts added per iteration), ``stabilization`` (the method, or None),
+        ``serious_steps`` (iterations that improved the upper bound), ``warm_cuts`` (origins of the cut pool solved
+        before the loop), ``wall_clock_s`` (total seconds).
     """
     t0 = time.time()
 
-    candidates = list(mTEPES.plc)
-    if not candidates:
+    if stabilization is not None and stabilization not in STABILIZATIONS:
+        raise ValueError(f'openTEPES.openTEPES_ProblemSolvingBenders.lshaped: stabilization must be None, "trust_region", "in_out" or "level", '
+                         f'not {stabilization!r}')
+    decisions, domains = _decisions(mTEPES)
+    if not decisions:
         raise ValueError(
-            "openTEPES.openTEPES_ProblemSolvingBenders.lshaped requires at least one candidate transmission line "
-            "(mTEPES.plc is empty — no row in oT_Data_Network has FixedInvestmentCost > 0)."
+            "openTEPES.openTEPES_ProblemSolvingBenders.lshaped requires at least one investment decision "
+            "(no candidate generation, retirement, transmission line, reservoir, H2 or heat pipe is left free by the case)."
         )
+    candidates = range(len(decisions))
+    bounds     = {k: tuple(float(bound) for bound in decisions[k].bounds) for k in candidates}
+    binary     = {k for k in candidates if domains[k] is pyo.Binary}
+    keys       = [(decisions[k].parent_component().name, decisions[k].index()) for k in candidates]
+
+    store = getattr(mTEPES, "pCutPools", None) if cut_pool is None else None
+    if store is not None:
+        cut_pool = store.pool("lshaped")
+    warm = []
+    if cut_pool is not None:
+        cut_pool.bounds = {keys[k]: bounds[k] for k in candidates}
+        warm = cut_pool.origins(keys)
+        cut_pool.clear()
+
+    # Free the decisions so the solution of a previous solve does not leak into the master, and make the subproblem an LP.
+    relaxed = _relax(mTEPES, decisions)
+    rows    = _master_rows(mTEPES, decisions)
 
-    bounds: dict[tuple, tuple[float, float]] = {}
-    for (p, ni, nf, cc) in candidates:
-        lo = float(pyo.value(mTEPES.pNetLoInvest[ni, nf, cc]))
-        up = float(pyo.value(mTEPES.pNetUpInvest[ni, nf, cc]))
-        bounds[(p, ni, nf, cc)] = (lo, up)
+    # Attach the fixing Param + equality constraint that the subproblem uses to receive master decisions.
+    _attach_fixing_constraints(mTEPES, decisions)
 
-    # Reset every candidate investment var so the joint-LP solution does not leak into the master.
-    for k in candidates:
-        if mTEPES.vNetworkInvest[k].fixed:
-            mTEPES.vNetworkInvest[k].unfix()
+    # ----- Split the subproblem into its blocks, one cut each -----
 
-    # Attach the fixing Param + equality constraint that the subproblem uses to receive master decisions.
-    bd_param, bd_constr = _attach_fixing_constraints(mTEPES, candidates)
+    try:
+        if multicut is None:
+            subproblems = _Subproblems(mTEPES, solver_name)
+            names       = ["total"]
+        else:
+            blocks, components = _split(mTEPES, multicut, decisions)
+            _attach_objectives(mTEPES, blocks)
+            names     = [block.name for block in blocks]
+            n_workers = min(workers, len(blocks))
+            if n_workers > 1 and sys.platform != "win32":
+                subproblems = _Workers(mTEPES, solver_name, blocks, components, n_workers)
+            else:
+                subproblems = _Subproblems(mTEPES, solver_name, blocks, components)
+    except BaseException:
+        _detach_fixing_constraints(mTEPES)
+        _unrelax(relaxed)
+        raise
 
     # ----- Build the master -----
 
     master = pyo.ConcreteModel("benders_master")
-    master.CANDIDATES = pyo.Set(initialize=candidates, dimen=4)
-    master.x = pyo.Var(master.CANDIDATES, bounds=lambda m, *k: bounds[k], initialize=lambda m, *k: bounds[k][0])
-    master.theta = pyo.Var(domain=pyo.Reals, initialize=0.0)
-    # Initial finite lower bound on theta; once the first cut lands it becomes inactive.
-    master.theta.setlb(-1.0e9)
+    master.CANDIDATES = pyo.Set(initialize=candidates)
+    master.BLOCKS = pyo.Set(initialize=names)
+    # the master carries the integrality of the binary investments; the subproblem sees them as continuous, pinned to the master's value
+    master.x = pyo.Var(master.CANDIDATES, within=lambda m, k: pyo.Binary if k in binary else pyo.Reals,
+                       bounds=lambda m, k: bounds[k], initialize=lambda m, k: bounds[k][0])
+    # Initial finite lower bound on each theta; once the first cut lands it becomes inactive.
+    master.theta = pyo.Var(master.BLOCKS, domain=pyo.Reals, bounds=(-1.0e9, None), initialize=0.0)
     master.cuts = pyo.ConstraintList()
-    master.obj = pyo.Objective(expr=master.theta, sense=pyo.minimize)
+    master.links = pyo.ConstraintList()
+    for lower, coefs, constant, upper in rows:
+        body = constant + sum(coef * master.x[k] for k, coef in coefs.items())
+        master.links.add(body == lower if lower is not None and lower == upper else (lower, body, upper))
+    master.obj = pyo.Objective(expr=sum(master.theta[b] for b in master.BLOCKS), sense=pyo.minimize)
 
-    solver = SolverFactory(solver_name)
+    stabilizer = None if stabilization is None else _Stabilization(master, bounds, stabilization, stabilization_param, binary)
+
+    # one solver per model, so a persistent solver keeps each of them loaded between iterations
+    master_solver = SolverFactory(solver_name)
 
     # ----- L-shaped loop -----
 
     UB = math.inf
     LB = -math.inf
     history: list[tuple] = []
-    last_x: dict[tuple, float] = {k: 0.0 for k in candidates}
+    best_x: dict[int, float] = {k: bounds[k][0] for k in candidates}
+    serious = 0
+    converged = False
+    it = 0
+    rows_of = {}   # id(cut) -> its row of master.cuts, for the cuts of the pool
+
+    def _add_cuts(solved: dict, x: dict, it: int) -> None:
+        # theta[b] >= cost_b(x*) + sum_k dual_b[k] * (x[k] - x*[k])
+        for b in names:
+            cost, duals = solved[b]
+            if cut_pool is None:
+                master.cuts.add(master.theta[b] >= cost + sum(duals[k] * (master.x[k] - x[k]) for k in candidates))
+                continue
+            cut, removed = cut_pool.add(Cut.at(b, cost, {keys[k]: duals[k] for k in candidates}, {keys[k]: x[k] for k in candidates}, it))
+            for other in removed:
+                rows_of.pop(id(other)).deactivate()
+            if cut is not None:
+                rows_of[id(cut)] = master.cuts.add(master.theta[b] >= cut.constant + sum(cut.coefs.get(keys[k], 0.0) * master.x[k] for k in candidates))
 
     try:
+        # ---- Warm restart: the cuts of the pool are cut again at their origins, on the data of this run ----
+        for origin in warm:
+            x_warm = {k: origin[keys[k]] for k in candidates}
+            solved = subproblems.solve(x_warm, 0)
+            cost   = sum(cost for cost, _ in solved.values())
+            if cost < UB:
+                UB, best_x = cost, x_warm
+            if stabilizer is not None:
+                stabilizer.start(x_warm, cost)
+            _add_cuts(solved, x_warm, 0)
+
         for it in range(1, max_iter + 1):
             # ---- Solve master ----
-            master_result = solver.solve(master, tee=False)
+            master_result = master_solver.solve(master, tee=False)
             if str(master_result.solver.termination_condition) != "optimal":
                 raise RuntimeError(
                     f"Benders master infeasible / non-optimal at iter {it}: "
                     f"{master_result.solver.termination_condition}"
                 )
             LB = float(pyo.value(master.obj))
-            x_sol = {k: float(pyo.value(master.x[k])) for k in candidates}
-
-            # ---- Push master decisions into the subproblem Param and solve ----
-            for k in candidates:
-                bd_param[k] = x_sol[k]
-
-            sub_result = solver.solve(mTEPES, tee=False)
-            if str(sub_result.solver.termination_condition) != "optimal":
-                raise RuntimeError(
-                    f"Benders subproblem infeasible at iter {it}: "
-                    f"{sub_result.solver.termination_condition}"
-                )
-
-            sub_total_cost = float(pyo.value(mTEPES.eTotalSCost))
+            x_sol = {k: float(round(pyo.value(master.x[k])) if k in binary else pyo.value(master.x[k])) for k in candidates}
+            if cut_pool is not None:
+                cut_pool.observe({keys[k]: x_sol[k] for k in candidates}, {b: float(pyo.value(master.theta[b])) for b in names})
+            if stabilizer is not None:
+                x_sol = stabilizer.trial(master_solver, x_sol, LB, UB, it)
 
-            # ---- Read duals on the fixing constraint (one per candidate) ----
-            duals: dict[tuple, float] = {}
-            for k in candidates:
-                duals[k] = float(mTEPES.dual.get(bd_constr[k], 0.0))
+            # ---- Push master decisions into the subproblems and solve them; read the duals on the fixing constraint ----
+            solved = subproblems.solve(x_sol, it)
+            sub_total_cost = sum(cost for cost, _ in solved.values())
 
             # ---- Update UB and check convergence ----
             if sub_total_cost < UB:
                 UB = sub_total_cost
+                best_x = x_sol
+                serious += 1
+            if stabilizer is not None:
+                stabilizer.update(x_sol, sub_total_cost, solved)
             gap = UB - LB
             history.append((it, LB, UB, gap, sub_total_cost))
             if verbose:
                 print(f"  Benders iter {it}: LB={LB:.6f}, UB={UB:.6f}, gap={gap:.2e}, x={x_sol}")
 
-            last_x = x_sol
             if abs(gap) <= tol * max(abs(LB), 1.0):
-                return {
-                    "total_cost":       UB,
-                    "master_decisions": last_x,
-                    "num_iterations":   it,
-                    "converged":        True,
-                    "history":          history,
-                    "wall_clock_s":     time.time() - t0,
-                }
-
-            # ---- Add Benders optimality cut to master ----
-            # theta >= sub_total_cost(x*) + sum_k dual[k] * (x[k] - x*[k])
-            cut_expr = sub_total_cost + sum(duals[k] * (master.x[k] - x_sol[k]) for k in candidates)
-            master.cuts.add(master.theta >= cut_expr)
-
+                converged = True
+                break
+
+            # ---- Add one Benders optimality cut per subproblem to master ----
+            _add_cuts(solved, x_sol, it)
+
+        if history and x_sol != best_x:
+            # the last trial is not the incumbent (a stabilized trial point, a master point that closed the gap from below, or max_iter
+            # reached): solve the subproblems at the incumbent again, so the model is left at the decisions and the cost returned
+            subproblems.solve(best_x, it)
+        subproblems.load_values()
+        if history:
+            for k in candidates:
+                decisions[k].set_value(best_x[k], skip_validation=True)
+        if multicut is not None and history:
+            # no block holds eTotalTCost, so the total of the incumbent's solves is set on vTotalSCost as the whole-model solve would have
+            mTEPES.vTotalSCost.set_value(UB, skip_validation=True)
+        if cut_pool is not None:
+            # the cuts binding at the last master solution, and those of the last subproblem solves, are what the next run starts from
+            if converged:
+                _add_cuts(solved, x_sol, it)
+            cut_pool.purge(max_idle=0)
+            if store is not None:
+                store.save("lshaped", cut_pool)
     finally:
+        subproblems.close()
         _detach_fixing_constraints(mTEPES)
+        _unrelax(relaxed)
 
     return {
         "total_cost":       UB,
-        "master_decisions": last_x,
-        "num_iterations":   max_iter,
-        "converged":        False,
+        "master_decisions": {(decisions[k].parent_component().name, decisions[k].index()): value for k, value in best_x.items()},
+        "num_iterations":   it,
+        "converged":        converged,
         "history":          history,
+        "num_subproblems":  len(names),
+        "stabilization":    stabilization,
+        "serious_steps":    serious,
+        "warm_cuts":        len(warm),
         "wall_clock_s":     time.time() - t0,
     }
@@ -0,0 +1,169 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingCheckpoint — opt-in checkpoint of every stage solve, and resume of a run from them (default OFF).
+
+A run that stops in stage 40 of 52 (solver licence lost, out of memory, wall-clock limit) has to start again from ``InputData``. With
+``--checkpoint`` / ``OTEPES_CHECKPOINT`` set, ``StageIterativeSolving`` writes what each solve left on the model to
+``<output dir>/openTEPES_checkpoint_<CaseName>/``, one file per solve, right after it; with ``--resume`` / ``OTEPES_RESUME`` a later run of the
+same case still formulates every stage, but loads the checkpoint of each stage that has one instead of solving it, and checkpoints the rest.
+
+A checkpoint is the payload a ``--parallel-stages`` worker sends back to the parent (``openTEPES_ProblemSolvingParallelStages``): the values of
+the variables of the active constraints and objective, the variables ``fix_for_duals`` fixed (the commitment and the investment decisions), the
+duals of the stage and the solver results. Loading it is the merge of that payload, so a resumed stage leaves the model as the solve did. The
+stages solved one by one are checkpointed one by one; the joint solve of the expansion and system-limit paths is checkpointed as the stage it
+is run at. Each file is written to a temporary name and renamed into place, so a run killed while writing leaves the previous checkpoints
+intact.
+
+The directory also holds the key of the model (``openTEPES_ModelCache.model_key``: input tables, case settings, openTEPES version and source),
+extended with the solver name and the ``OTEPES_*`` options that change what a solve leaves on the model (``SOLVE_OPTIONS``). Checkpoints of
+another key are discarded rather than loaded, and the directory is removed once the run has written its results.
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import pickle
+import shutil
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_ModelCache                   import model_key
+    from          .openTEPES_ProblemSolvingDualExtraction import _FIX_REGISTRY, _INV_REGISTRY, _registry
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ModelCache                   import model_key
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import _FIX_REGISTRY, _INV_REGISTRY, _registry
+
+
+# the options that change the values, duals or fixings a stage solve leaves on the model; a checkpoint of a run with other values is not loaded
+SOLVE_OPTIONS = ("OTEPES_SELECTIVE_DUALS", "OTEPES_NATIVE_DUALS", "OTEPES_STAGE_WARM_START", "OTEPES_SOLUTION_STORE",
+                 "OTEPES_WARM_RESOLVE", "OTEPES_WARM_RESOLVE_CAP", "OTEPES_WARM_RESOLVE_SIMPLEX")
+
+
+def _payloads():
+    """``(_stage_payload, _merge_payload)`` of the stage dispatcher, imported on use since the dispatcher checkpoints through this module."""
+    try:
+        from .openTEPES_ProblemSolvingParallelStages import _merge_payload, _stage_payload
+    except ImportError:
+        from openTEPES.openTEPES_ProblemSolvingParallelStages import _merge_payload, _stage_payload
+    return _stage_payload, _merge_payload
+
+
+def _on(name) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def enabled() -> bool:
+    """True when the stage solves are checkpointed, via ``--checkpoint`` / ``OTEPES_CHECKPOINT`` or ``--resume`` / ``OTEPES_RESUME``."""
+    return _on("OTEPES_CHECKPOINT") or resume()
+
+
+def resume() -> bool:
+    """True when the checkpoints of an earlier run are loaded, via ``--resume`` / ``OTEPES_RESUME``."""
+    return _on("OTEPES_RESUME")
+
+
+class StageCheckpoints:
+    """The checkpoint directory of one case: ``<out>/openTEPES_checkpoint_<CaseName>/``, one ``stage_<p>_<sc>_<st>.pkl`` per solve."""
+
+    def __init__(self, directory, key, restore: bool):
+        self.directory = directory
+        self.key       = key
+        self._restore  = restore
+
+    @classmethod
+    def create(cls, OutPath, CaseName, DirName, input_source=None, settings=None, SolverName=None) -> StageCheckpoints | None:
+        """The checkpoints of this run, or None when checkpointing is off or the case cannot be fingerprinted.
+
+        Checkpoints left by a run of another model, another solver or other ``SOLVE_OPTIONS``, or by any run when ``--resume`` is not set,
+        are discarded.
+        """
+        if not enabled():
+            return None
+        settings = {**(settings or {}), 'SolverName': SolverName, **{name: os.environ.get(name, '').strip() for name in SOLVE_OPTIONS}}
+        key = model_key(DirName, CaseName, input_source, settings)
+        if key is None:
+            print(f'Stage checkpoints skipped: case {CaseName} is not read from files')
+            return None
+        directory = os.path.join(OutPath, f'openTEPES_checkpoint_{CaseName}')
+        key_file  = os.path.join(directory, 'key')
+        previous  = None
+        if os.path.isfile(key_file):
+            with open(key_file) as f:
+                previous = f.read().strip()
+        restore   = resume() and previous == key
+        if resume() and previous is not None and previous != key:
+            print(f'### Checkpoints in {directory} belong to another model (input, settings or code changed); solving from the start')
+        if not restore and os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory, exist_ok=True)
+        with open(key_file, 'w') as f:
+            f.write(key)
+        return cls(directory, key, restore)
+
+    def _path(self, p, sc, st) -> str:
+        return os.path.join(self.directory, f'stage_{p}_{sc}_{st}.pkl')
+
+    def __contains__(self, stage) -> bool:
+        return self._restore and os.path.isfile(self._path(*stage))
+
+    def save(self, p, sc, st, payload) -> None:
+        """Write the payload of the solve of stage ``(p, sc, st)``."""
+        path      = self._path(p, sc, st)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def restore(self, mTEPES, p, sc, st) -> None:
+        """Merge the checkpoint of stage ``(p, sc, st)`` into ``mTEPES``."""
+        with open(self._path(p, sc, st), 'rb') as f:
+            _payloads()[1](mTEPES, mTEPES, pickle.load(f))
+        print(f'Period {p}, Scenario {sc}, Stage {st} restored from checkpoint')
+
+    def remove(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def RestoreStage(mTEPES, p, sc, st) -> bool:
+    """Load the checkpoint of stage ``(p, sc, st)`` when the run resumes and has one; True when it did, so the caller skips the solve."""
+    checkpoints = getattr(mTEPES, 'pCheckpoints', None)
+    if checkpoints is None or (p,sc,st) not in checkpoints:
+        return False
+    checkpoints.restore(mTEPES, p, sc, st)
+    return True
+
+
+@contextlib.contextmanager
+def CheckpointStage(mTEPES, p, sc, st, joint: bool = False):
+    """Around a solve in the parent: checkpoint what it left on ``mTEPES`` as stage ``(p, sc, st)``, when checkpointing is on.
+
+    ``joint`` marks the joint solve over all the stages, whose checkpoint keeps the duals of every stage instead of those of ``(p, sc, st)``.
+    """
+    checkpoints = getattr(mTEPES, 'pCheckpoints', None)
+    if checkpoints is None:
+        yield
+        return
+    # the fixings of the earlier solves stay in the registries; only the ones this solve adds belong to its checkpoint
+    relaxed  = set(_registry(mTEPES, _FIX_REGISTRY))
+    invested = set(_registry(mTEPES, _INV_REGISTRY))
+    yield
+    payload  = _payloads()[0](mTEPES)
+    payload["relaxed" ] = [(var.parent_component().name, var.index()) for key, (var, _) in _registry(mTEPES, _FIX_REGISTRY).items() if key not in relaxed ]
+    payload["invested"] = [(var.parent_component().name, var.index()) for key, (var, _) in _registry(mTEPES, _INV_REGISTRY).items() if key not in invested]
+    payload["duals"   ] = mTEPES.pDuals if joint else mTEPES.pDuals.stage((p,sc,st))
+    try:
+        payload["results"] = pickle.loads(pickle.dumps(mTEPES.SolverResults))
+    except Exception:
+        payload["results"] = None
+    checkpoints.save(p, sc, st, payload)
+
+
+def CheckpointPayload(mTEPES, p, sc, st, payload) -> None:
+    """Checkpoint the payload of stage ``(p, sc, st)`` a ``--parallel-stages`` worker sent back, when checkpointing is on."""
+    checkpoints = getattr(mTEPES, 'pCheckpoints', None)
+    if checkpoints is not None:
+        checkpoints.save(p, sc, st, payload)
@@ -0,0 +1,174 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingCutPool — opt-in pool of the Benders cuts of the decomposition loops, kept between runs (default OFF).
+
+``lshaped``, ``StageDecomposition`` and ``SectorDecomposition`` start every run from an empty master, although a re-run of the case after a
+small data change (the demand forecast of the night) ends near the decisions the last run found. A ``CutPool`` keeps the cuts of a loop,
+``theta[block] >= constant + sum(coef[key] * x[key])``, with the iterate ``x*`` each was cut at (its origin) and the iteration, and:
+
+* drops a new cut that another one dominates over the bounds of the decisions, and removes the cuts a new one dominates;
+* counts, master solve after master solve, how long a cut has been slack, and ``purge`` removes the cuts idle for longer than ``max_idle``;
+* is saved to and loaded from a pickle.
+
+The cuts of another run are not valid cuts of this one once the data changed, so they are never added to a master as they are. A warm
+restart solves the subproblems at their origins first, which are the iterates the last run ended at, and adds the fresh cuts cut there; the
+loop then goes on from a master that already holds the cuts around the last optimum. An origin is used only when it holds the decisions of
+this run, key by key.
+
+With ``--cut-pool`` / ``OTEPES_CUT_POOL`` set, ``CutPoolStore`` keeps the pools of a case in ``<output dir>/openTEPES_cuts_<CaseName>/``,
+one file per loop (``lshaped.pkl``, ``stage_<p>_<sc>_<st>.pkl``, ``sector_<p>_<sc>_<st>.pkl``). A loop starts from the pool a previous run
+saved and, once converged, saves the cuts binding at its last master solution, the last cut included, so the next run refreshes only those.
+"""
+from __future__ import annotations
+
+import math
+import os
+import pickle
+
+
+def enabled() -> bool:
+    """True when the decomposition loops keep their cuts between runs, via ``--cut-pool`` / ``OTEPES_CUT_POOL``."""
+    return os.environ.get("OTEPES_CUT_POOL", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class Cut:
+    """``theta[block] >= constant + sum(coefs[key] * x[key])``, cut at ``origin`` in ``iteration``; ``idle`` counts the master solves it was slack at."""
+
+    __slots__ = ("block", "constant", "coefs", "origin", "iteration", "idle")
+
+    def __init__(self, block, constant: float, coefs: dict, origin: dict, iteration: int, idle: int = 0):
+        self.block     = block
+        self.constant  = float(constant)
+        self.coefs     = coefs
+        self.origin    = origin
+        self.iteration = iteration
+        self.idle      = idle
+
+    @classmethod
+    def at(cls, block, cost: float, duals: dict, origin: dict, iteration: int) -> Cut:
+        """The cut ``theta[block] >= cost + sum(duals[key] * (x[key] - origin[key]))`` of a subproblem solved at ``origin``."""
+        coefs = {key: float(dual) for key, dual in duals.items() if dual}
+        return cls(block, cost - sum(coef * origin[key] for key, coef in coefs.items()), coefs, dict(origin), iteration)
+
+    def value(self, x: dict) -> float:
+        """The right-hand side of the cut at the decisions ``x``."""
+        return self.constant + sum(coef * x[key] for key, coef in self.coefs.items())
+
+
+class CutPool:
+    """The cuts of one decomposition loop.
+
+    ``bounds`` maps each decision to its ``(lower, upper)``; without them one cut dominates another only when they have the same coefficients.
+    """
+
+    def __init__(self, bounds: dict | None = None, tol: float = 1.0e-9):
+        self.bounds = bounds or {}
+        self.tol    = tol
+        self._cuts  = []
+
+    def __len__(self) -> int:
+        return len(self._cuts)
+
+    def cuts(self, block=None) -> list[Cut]:
+        """The cuts of ``block``, or all of them, in the order they were added."""
+        return [cut for cut in self._cuts if block is None or cut.block == block]
+
+    def clear(self) -> None:
+        self._cuts = []
+
+    def _dominates(self, a: Cut, b: Cut) -> bool:
+        """True when cut ``a`` is at least cut ``b`` everywhere in the box of the decisions."""
+        if a.block != b.block:
+            return False
+        lowest = a.constant - b.constant
+        for key in a.coefs.keys() | b.coefs.keys():
+            delta = a.coefs.get(key, 0.0) - b.coefs.get(key, 0.0)
+            if abs(delta) <= self.tol * max(abs(a.coefs.get(key, 0.0)), abs(b.coefs.get(key, 0.0)), 1.0):
+                continue
+            lower, upper = self.bounds.get(key, (None, None))
+            bound = lower if delta > 0.0 else upper
+            if bound is None or not math.isfinite(bound):
+                return False
+            lowest += delta * bound
+        return lowest >= -self.tol * max(abs(a.constant), abs(b.constant), 1.0)
+
+    def add(self, cut: Cut) -> tuple[Cut | None, list[Cut]]:
+        """Add ``cut`` unless one in the pool dominates it, and remove the cuts it dominates.
+
+        Returns the cut added (None when it was dominated) and the cuts removed, so the loop can drop them from its master too.
+        """
+        if any(self._dominates(other, cut) for other in self._cuts):
+            return None, []
+        removed    = [other for other in self._cuts if self._dominates(cut, other)]
+        gone       = {id(other) for other in removed}
+        self._cuts = [other for other in self._cuts if id(other) not in gone] + [cut]
+        return cut, removed
+
+    def observe(self, x: dict, theta: dict) -> None:
+        """After a master solve at ``x`` with ``theta[block]``: a cut binding there is active, any other one idle for one more solve."""
+        for cut in self._cuts:
+            if cut.block not in theta:
+                continue
+            slack = theta[cut.block] - cut.value(x)
+            cut.idle = 0 if slack <= 1.0e-6 * max(abs(theta[cut.block]), 1.0) else cut.idle + 1
+
+    def purge(self, max_idle: int = 0) -> list[Cut]:
+        """Remove the cuts that were slack at more than ``max_idle`` master solves in a row; returns them."""
+        removed    = [cut for cut in self._cuts if cut.idle > max_idle]
+        self._cuts = [cut for cut in self._cuts if cut.idle <= max_idle]
+        return removed
+
+    def origins(self, keys) -> list[dict]:
+        """The distinct origins of the cuts that hold exactly the decisions ``keys``, the latest first."""
+        keys    = set(keys)
+        origins = {}
+        for cut in sorted(self._cuts, key=lambda cut: -cut.iteration):
+            if set(cut.origin) == keys:
+                origins.setdefault(tuple(sorted((repr(key), round(value, 9)) for key, value in cut.origin.items())), cut.origin)
+        return list(origins.values())
+
+    def save(self, path: str) -> None:
+        """Write the pool to ``path`` through a temporary file, so a reader never finds it half written."""
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as f:
+            pickle.dump({"bounds": self.bounds, "cuts": [{name: getattr(cut, name) for name in Cut.__slots__} for cut in self._cuts]},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str, bounds: dict | None = None) -> CutPool:
+        """The pool saved at ``path``, with ``bounds`` (the saved ones when None); an empty pool when there is no file."""
+        if not os.path.isfile(path):
+            return cls(bounds)
+        with open(path, 'rb') as f:
+            stored = pickle.load(f)
+        pool       = cls(stored["bounds"] if bounds is None else bounds)
+        pool._cuts = [Cut(**cut) for cut in stored["cuts"]]
+        return pool
+
+
+class CutPoolStore:
+    """The cut pools of one case: ``<out>/openTEPES_cuts_<CaseName>/``, one ``<loop>.pkl`` per decomposition loop."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @classmethod
+    def create(cls, OutPath, CaseName) -> CutPoolStore | None:
+        """The cut pool store of this case, or None when it is off."""
+        if not enabled():
+            return None
+        directory = os.path.join(OutPath, f'openTEPES_cuts_{CaseName}')
+        os.makedirs(directory, exist_ok=True)
+        return cls(directory)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f'{name}.pkl')
+
+    def pool(self, name: str, bounds: dict | None = None) -> CutPool:
+        """The pool a previous run saved for loop ``name``, or an empty one."""
+        return CutPool.load(self._path(name), bounds)
+
+    def save(self, name: str, pool: CutPool) -> None:
+        pool.save(self._path(name))
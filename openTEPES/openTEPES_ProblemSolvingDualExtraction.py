@@ -8,6 +8,10 @@ so the model becomes a pure LP; ``ProblemSolving`` then re-solves it with a ``du
 constraint to copy the dual values into ``mTEPES.pDuals`` for downstream consumption by ``MarginalResults`` / ``EconomicResults``
 (LMPs, water values, H2 marginals, …).
 
+``mTEPES.pDuals`` is a ``DualStore``: the duals of each constraint family (``eBalanceElec``, ``eOperReserveUp``, …) are kept as numpy arrays
+next to the constraint's own index tuples, with the ``(period, scenario, stage)`` of the ``_{p}_{sc}_{st}`` component name prepended, so
+``pDuals.lookup('eBalanceElec', [(p,sc,st,n,nd), ...])`` replaces building one ``"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"`` string per dual.
+
 The fixing of continuous investment variables (lines 172-192 of the original ``ProblemSolving.py``) is preserved exactly — those decisions are pinned
 even on a fully-LP case, ensuring the second solve cannot revise the investment plan.
 
@@ -16,9 +20,18 @@ even on a fully-LP case, ensuring the second solve cannot revise the investment
 
 ``fix_for_duals`` records what it changed on the model, so ``unfix_for_duals`` can put it back. A Mode C sweep needs that: the fixed plan is right
 for reading duals but wrong for re-optimising.
+
+With ``--selective-duals`` / ``OTEPES_SELECTIVE_DUALS`` the run sets ``mTEPES.pDualPlan`` to the constraint families the selected outputs read
+(``openTEPES.dual_plan``): ``collect_duals`` keeps only those, and ``ProblemSolving`` attaches no ``dual`` Suffix and skips the fixed-LP re-solve
+of a MIP when the plan is empty. ``fix_for_duals`` still runs, since the later stages rely on the investment and commitment decisions it pins.
+Without the re-solve a MIP stage keeps the dispatch of its incumbent, which may differ from the re-solved one within the MIP gap.
 """
 from __future__ import annotations
 
+import os
+
+import numpy  as np
+import pandas as pd
 import pyomo.environ as pyo
 from pyomo.environ import UnitInterval
 
@@ -29,6 +42,17 @@ _FIX_REGISTRY = "_pDualFixRelaxed"
 _INV_REGISTRY = "_pDualFixInvest"
 
 
+def selective() -> bool:
+    """True when the stage solves harvest only the duals the selected outputs read, via ``--selective-duals`` / ``OTEPES_SELECTIVE_DUALS``."""
+    return os.environ.get("OTEPES_SELECTIVE_DUALS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def wants_duals(mTEPES) -> bool:
+    """False when the dual plan of ``mTEPES`` has no family, so a solve needs no duals at all; True without a plan."""
+    plan = getattr(mTEPES, 'pDualPlan', None)
+    return plan is None or bool(plan)
+
+
 def _registry(OptModel, name) -> dict:
     reg = getattr(OptModel, name, None)
     if reg is None:
@@ -119,16 +143,123 @@ def unfix_for_duals(OptModel) -> int:
 
 
 def collect_duals(OptModel, mTEPES) -> None:
-    """Walk every active constraint in ``OptModel`` and copy its dual value into ``mTEPES.pDuals``.
+    """Walk every active constraint in ``OptModel`` and copy its dual values into the ``mTEPES.pDuals`` ``DualStore``.
 
-    Keys are formatted as ``"<ConstraintName><index>"`` to match the historical contract that
-    ``MarginalResults`` / ``EconomicResults`` rely on. The ``dual`` Suffix is deleted from ``OptModel`` once
-    the duals have been collected so the next iteration of the stage loop starts with a clean slate.
+    Each indexed constraint adds one array under its family, next to its own index tuples (no key strings are built). With a dual plan
+    (``mTEPES.pDualPlan``) only the families in it are copied, and a solve that attached no ``dual`` Suffix has nothing to copy. The Suffix is
+    deleted from ``OptModel`` once the duals have been collected so the next iteration of the stage loop starts with a clean slate.
     """
-    pDuals = {}
+    dual = OptModel.component('dual')
+    if dual is None:
+        return
+    plan = getattr(mTEPES, 'pDualPlan', None)
     for con in OptModel.component_objects(pyo.Constraint, active=True):
-        if con.is_indexed():
-            for index in con:
-                pDuals[str(con.name) + str(index)] = OptModel.dual[con[index]]
-    mTEPES.pDuals.update(pDuals)
-    OptModel.del_component(OptModel.dual)
+        if con.is_indexed() and len(con):
+            family, stage = mTEPES.pDuals.split_name(con.name, mTEPES)
+            if plan is None or family in plan:
+                mTEPES.pDuals.add(family, stage, con.keys(), np.fromiter((dual[data] for data in con.values()), dtype=float, count=len(con)))
+    OptModel.del_component(dual)
+
+
+class DualStore:
+    """Constraint duals keyed by constraint family and index tuple, held in numpy arrays and exposed as pandas objects.
+
+    A family is a constraint name without its ``_{p}_{sc}_{st}`` stage suffix; its keys are ``(p, sc, st) + index``. Constraints that are not
+    built per stage (``eTotalFElecCost``, …) keep their full name as the family and their own index as the key. Each constraint component is
+    one chunk (its index keys and a values array); collecting the same component again (a re-solved stage) replaces its chunk, as re-assigning
+    the string keys did. The per-family ``Series`` is assembled on first read and cached.
+    """
+
+    def __init__(self):
+        self._chunks = {}   # family -> {stage prefix: (index keys, values)}
+        self._series = {}   # family -> cached pd.Series over a MultiIndex
+        self._stages = {}   # component name -> (family, stage prefix)
+
+    def __len__(self) -> int:
+        return sum(len(values) for chunks in self._chunks.values() for _, values in chunks.values())
+
+    def __contains__(self, family) -> bool:
+        return family in self._chunks
+
+    def __getitem__(self, item):
+        """``store[family, key]``: a single dual. For many keys use ``lookup``."""
+        family, key = item
+        series = self.series(family)
+        return float(series.to_numpy()[series.index.get_loc(key)])
+
+    def families(self) -> list:
+        return list(self._chunks)
+
+    def add(self, family, stage, keys, values) -> None:
+        """Store the duals ``values`` of ``family`` at ``stage + key`` for each key in ``keys``."""
+        self._chunks.setdefault(family, {})[tuple(stage)] = (list(keys), np.asarray(values, dtype=float))
+        self._series.pop(family, None)
+
+    def update(self, other: DualStore) -> None:
+        """Add every chunk of ``other`` (e.g. a stage solved in a worker process), replacing the ones already held."""
+        for family, chunks in other._chunks.items():
+            self._chunks.setdefault(family, {}).update(chunks)
+            self._series.pop(family, None)
+        self._stages.update(other._stages)
+
+    def stage(self, stage) -> DualStore:
+        """A store with the chunks of ``stage`` (a ``(p, sc, st)`` prefix) and of the constraints not built per stage, as one solve leaves them."""
+        prefixes = {tuple(stage), ()}
+        store    = DualStore()
+        for family, chunks in self._chunks.items():
+            selected = {prefix: chunk for prefix, chunk in chunks.items() if prefix in prefixes}
+            if selected:
+                store._chunks[family] = selected
+        store._stages = {name: entry for name, entry in self._stages.items() if entry[1] in prefixes}
+        return store
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._series.clear()
+        self._stages.clear()
+
+    def series(self, family) -> pd.Series:
+        """The duals of ``family`` as a ``Series`` indexed by ``(p, sc, st) + index``."""
+        if family not in self._series:
+            keys, values = [], []
+            for stage, (index, chunk) in self._chunks[family].items():
+                keys.extend(stage + (key if type(key) is tuple else (key,)) for key in index)
+                values.append(chunk)
+            self._series[family] = pd.Series(np.concatenate(values), index=pd.MultiIndex.from_tuples(keys), name=family)
+        return self._series[family]
+
+    def frame(self, family) -> pd.DataFrame:
+        """The duals of ``family`` as a ``DataFrame`` with one column per key level and a ``Dual`` column."""
+        return self.series(family).rename('Dual').reset_index()
+
+    def lookup(self, family, keys) -> np.ndarray:
+        """The duals of ``family`` at ``keys`` (tuples in the ``series`` index order), in that order. A missing key raises ``KeyError``."""
+        series   = self.series(family)
+        keys     = list(keys)
+        if not keys:
+            return np.empty(0)
+        position = series.index.get_indexer(pd.MultiIndex.from_tuples(keys))
+        if (position < 0).any():
+            raise KeyError(f'{family}{keys[int(np.argmax(position < 0))]}')
+        return series.to_numpy()[position]
+
+    def of(self, name, indices) -> np.ndarray:
+        """Duals of the constraint component ``name`` at ``indices``, as collected (NaN where they were not)."""
+        indices = list(indices)
+        family, stage = self._stages.get(name, (None, ()))
+        if family not in self._chunks or not indices:
+            return np.full(len(indices), np.nan)
+        series   = self.series(family)
+        position = series.index.get_indexer(pd.MultiIndex.from_tuples([stage + (index if type(index) is tuple else (index,)) for index in indices]))
+        return np.where(position >= 0, series.to_numpy()[position], np.nan)
+
+    def split_name(self, name, mTEPES) -> tuple:
+        """``(family, stage prefix)`` of a constraint component name: ``('eBalanceElec', (p, sc, st))`` or ``(name, ())``."""
+        if name not in self._stages:
+            family, stage = name, ()
+            for p, sc, st in mTEPES.p*mTEPES.sc*mTEPES.stt:
+                suffix = f'_{p}_{sc}_{st}'
+                if name.endswith(suffix) and len(suffix) > len(name) - len(family):
+                    family, stage = name[:-len(suffix)], (p, sc, st)
+            self._stages[name] = (family, stage)
+        return self._stages[name]
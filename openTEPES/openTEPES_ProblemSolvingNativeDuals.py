@@ -0,0 +1,111 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingNativeDuals — opt-in fixed-LP dual pass solved inside the solver that solved the MIP (default OFF).
+
+After a MIP stage ``fix_for_duals`` fixes its discrete and investment decisions in Pyomo, and ``ProblemSolving`` re-solves the model as an LP
+through the Pyomo interface: the persistent interfaces push every changed variable to the solver, the direct ones build the whole model again,
+and either loads the solution and the ``dual`` Suffix back constraint by constraint. With ``--native-fixed-duals`` / ``OTEPES_NATIVE_DUALS`` set,
+``SolveFixedLp`` instead asks the solver for the fixed LP of its MIP (``Highs.getFixedLp``, ``gurobipy.Model.fixed``), a copy in solver
+memory with the integer columns at the incumbent and the MIP's options, and solves it there. The copy has the bounds of the variables Pyomo
+holds fixed, so it is the LP the Pyomo re-solve solves: the continuous investments are fixed at their solution, as ``fix_for_duals`` fixed
+them. Its primal solution and row duals are written back through the column and row maps of the interface, so ``collect_duals`` fills
+``mTEPES.pDuals`` as before and the dispatch is that of the fixed LP. Where that LP is dual degenerate (the output rows of a unit that is
+off, whose output its bound holds at zero too) the solver may return another optimal dual than the re-solve, which on ``appsi_highs`` passes
+the fixed variables as constants of their rows; the balance, reserve and inventory prices the outputs read are the same.
+
+``fix_for_duals`` still runs before it: the later stages and the Mode C sweep rely on the decisions it pins in Pyomo. The persistent instance
+itself is not changed; the next stage solve pushes the fixed variables to it. The pass is used for the solvers of ``NATIVE_DUAL_SOLVERS``;
+``SolveFixedLp`` returns False, and the Pyomo re-solve runs, for any other solver, when the solver holds an integer column Pyomo has not
+fixed (the fixed LP would fix more than ``fix_for_duals`` did), or when the fixed LP does not end optimal.
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from pyomo.environ import Suffix
+
+# The solver names whose interface keeps the solver model of the last solve and its column and row maps.
+NATIVE_DUAL_SOLVERS = ("appsi_highs", "appsi_gurobi", "gurobi_persistent", "gurobi_direct")
+
+
+def enabled() -> bool:
+    """True when the fixed LP of a MIP stage is solved by the solver itself, via ``--native-fixed-duals`` / ``OTEPES_NATIVE_DUALS``."""
+    return os.environ.get("OTEPES_NATIVE_DUALS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _columns(Solver) -> list:
+    """(Pyomo variable, solver column) of every variable the solver holds."""
+    if hasattr(Solver, '_vars'):
+        # appsi: the map is keyed by id(var), and the variable itself is kept in _vars
+        return [(Solver._vars[key][0], column) for key, column in Solver._pyomo_var_to_solver_var_map.items()]
+    return list(Solver._pyomo_var_to_solver_var_map.items())
+
+
+def _fixed_highs(Solver, positions: np.ndarray, lower: np.ndarray):
+    """Solve the fixed LP of the HiGHS MIP with ``lower`` as the bounds of the fixed columns (NaN for the others); None unless optimal."""
+    import highspy
+    highs      = Solver._solver_model
+    status, lp = highs.getFixedLp()
+    if status != highspy.HighsStatus.kOk:
+        return None
+    pinned         = ~np.isnan(lower)
+    col_lower      = np.asarray(lp.col_lower_, dtype=float)
+    col_upper      = np.asarray(lp.col_upper_, dtype=float)
+    col_lower[positions[pinned]] = col_upper[positions[pinned]] = lower[pinned]
+    lp.col_lower_  = col_lower
+    lp.col_upper_  = col_upper
+    fixed          = highspy.Highs()
+    fixed.passOptions(highs.getOptions())
+    fixed.passModel(lp)
+    fixed.run()
+    solution = fixed.getSolution()
+    if fixed.getModelStatus() != highspy.HighsModelStatus.kOptimal or not solution.dual_valid:
+        return None
+    return np.asarray(solution.col_value), np.asarray(solution.row_dual)
+
+
+def _fixed_gurobi(Solver, positions: np.ndarray, lower: np.ndarray):
+    """Solve the fixed LP of the Gurobi MIP with ``lower`` as the bounds of the fixed columns (NaN for the others); None unless optimal."""
+    from gurobipy import GRB
+    fixed     = Solver._solver_model.fixed()
+    variables = fixed.getVars()
+    pinned    = np.flatnonzero(~np.isnan(lower))
+    selected  = [variables[position] for position in positions[pinned]]
+    fixed.setAttr('LB', selected, lower[pinned].tolist())
+    fixed.setAttr('UB', selected, lower[pinned].tolist())
+    fixed.Params.Method = -1
+    fixed.optimize()
+    if fixed.Status != GRB.OPTIMAL:
+        return None
+    return np.asarray(fixed.getAttr('X', variables)), np.asarray(fixed.getAttr('Pi', fixed.getConstrs()))
+
+
+def SolveFixedLp(OptModel, Solver, SolverName) -> bool:
+    """Solve the fixed LP of the MIP just solved inside ``Solver`` and load its solution and duals, when the opt-in is on.
+
+    Returns False when the pass does not apply, so the caller re-solves through Pyomo.
+    """
+    if not enabled() or SolverName not in NATIVE_DUAL_SOLVERS:
+        return False
+    highs     = SolverName == "appsi_highs"
+    columns   = _columns(Solver)
+    positions = np.fromiter((column if highs else column.index for _, column in columns), dtype=np.int64, count=len(columns))
+    lower     = np.full(len(columns), np.nan)
+    for k, (var, _) in enumerate(columns):
+        if var.fixed:
+            lower[k] = var.value
+        elif not var.is_continuous():
+            return False
+    solved = (_fixed_highs if highs else _fixed_gurobi)(Solver, positions, lower)
+    if solved is None:
+        return False
+    values, duals = solved
+    for (var, _), value in zip(columns, values[positions]):
+        if not var.fixed:
+            var.set_value(value, skip_validation=True)
+    OptModel.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+    for con, row in Solver._pyomo_con_to_solver_con_map.items():
+        OptModel.dual[con] = duals[row if highs else row.index]
+    return True
@@ -0,0 +1,206 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingParallelStages — opt-in overlap of stage formulation and stage solves (default OFF).
+
+When a period has no expansion decisions and no system emission / RES-energy limit, ``SettingUpVariables`` marks its stages as independent
+(``mTEPES.IndependentStages[p]``) and ``StageIterativeSolving`` solves each ``(period, scenario, stage)`` as its own deterministic operation
+model. In the sequential loop one core alternates between formulating a stage and waiting for the solver on it. This module lets the loop hand
+each independent stage's solve to a forked worker and carry on formulating the next stage while it runs:
+
+  * ``workers()``             number of concurrent stage solves, from ``--parallel-stages`` / ``OTEPES_PARALLEL_STAGES`` (0 when unset).
+  * ``StageDispatcher``       forks one worker per submitted stage (at most ``workers()`` at a time). The worker inherits the model exactly as
+                              the sequential loop would have solved it, runs ``ProblemSolving``, and sends back the variable values it loaded,
+                              the variables ``fix_for_duals`` fixed, and the stage's duals.
+  * ``StageDispatcher.drain`` waits for every worker and merges the payloads into ``mTEPES`` in submission order, so the model ends in the same
+                              state as after the sequential loop and the output writers see no difference. With ``--retire-stages`` each
+                              stage is retired from the parent's model as soon as its payload is merged, and with ``--stream-results`` its
+                              hourly tables are streamed just before. With ``--checkpoint`` the payload is also the stage's checkpoint.
+
+Only the POSIX ``fork`` start method is used: the stage constraints live on the parent's model and are not worth pickling. Where ``fork`` is
+not available (Windows) the dispatcher is not created and the loop stays sequential. Each worker takes an equal slice of the solver thread
+budget (``_threads()``) unless ``--threads`` / ``OTEPES_THREADS`` was set explicitly. Persistent solvers gain nothing here, since every worker
+builds its own instance.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+import traceback
+from collections import deque
+
+import pyomo.environ as pyo
+from pyomo.environ import UnitInterval
+from pyomo.util.vars_from_expressions import get_vars_from_components
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_ProblemSolving               import ProblemSolving
+    from          .openTEPES_ProblemSolvingDualExtraction import DualStore, _FIX_REGISTRY, _INV_REGISTRY, _registry
+    from          .openTEPES_ProblemSolvingPersistent     import release_solver
+    from          .openTEPES_ProblemSolvingStageRetirement import RetireStage
+    from          .openTEPES_OutputResultsStream           import StreamStage
+    from          .openTEPES_ProblemSolvingCheckpoint      import CheckpointPayload
+    from          .openTEPES_ProblemSolvingTuning         import _threads
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ProblemSolving               import ProblemSolving
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore, _FIX_REGISTRY, _INV_REGISTRY, _registry
+    from openTEPES.openTEPES_ProblemSolvingPersistent     import release_solver
+    from openTEPES.openTEPES_ProblemSolvingStageRetirement import RetireStage
+    from openTEPES.openTEPES_OutputResultsStream           import StreamStage
+    from openTEPES.openTEPES_ProblemSolvingCheckpoint      import CheckpointPayload
+    from openTEPES.openTEPES_ProblemSolvingTuning         import _threads
+
+
+def workers() -> int:
+    """Number of stage solves to run side by side: ``OTEPES_PARALLEL_STAGES`` when set to a positive integer, else 0 (off)."""
+    env = os.environ.get("OTEPES_PARALLEL_STAGES", "").strip()
+    return int(env) if env.isdigit() and int(env) > 0 else 0
+
+
+def enabled() -> bool:
+    """True when more than one stage solve may run at once and the platform can fork."""
+    return workers() > 1 and sys.platform != "win32"
+
+
+def _stage_payload(OptModel) -> dict:
+    """Collect what a stage solve changed on ``OptModel``, keyed by component name so it can cross a process boundary.
+
+    ``values`` holds every variable of the active constraints and objective, i.e. everything the solve wrote (the ``stale`` flag cannot tell,
+    since the solver interfaces mark the loaded values stale again right after loading them); ``relaxed`` and ``invested`` name the
+    variables ``fix_for_duals`` fixed, so the parent can pin them too.
+    """
+    relaxed  = [var for var, _ in _registry(OptModel, _FIX_REGISTRY).values()]
+    invested = [var for var, _ in _registry(OptModel, _INV_REGISTRY).values()]
+    values   = {}
+    for ctype in (pyo.Constraint, pyo.Objective):
+        for var in get_vars_from_components(OptModel, ctype, include_fixed=True, active=True):
+            if var.value is not None:
+                values.setdefault(var.parent_component().name, {})[var.index()] = var.value
+    return dict(values   = values,
+                relaxed  = [(var.parent_component().name, var.index()) for var in relaxed ],
+                invested = [(var.parent_component().name, var.index()) for var in invested])
+
+
+def _merge_payload(OptModel, mTEPES, payload) -> None:
+    """Apply one worker's payload to the parent model: load the values, repeat the fixing, and add the stage's duals to ``pDuals``."""
+    for name, values in payload["values"].items():
+        component = OptModel.find_component(name)
+        for index, value in values.items():
+            component[index].set_value(value, skip_validation=True)
+
+    relaxed = _registry(OptModel, _FIX_REGISTRY)
+    for name, index in payload["relaxed"]:
+        var = OptModel.find_component(name)[index]
+        relaxed.setdefault(id(var), (var, var.domain))
+        var.fixed  = True
+        var.domain = UnitInterval
+    invest = _registry(OptModel, _INV_REGISTRY)
+    for name, index in payload["invested"]:
+        var = OptModel.find_component(name)[index]
+        invest.setdefault(id(var), (var, var.fixed))
+        var.fix(var.value)
+
+    mTEPES.pDuals.update(payload["duals"])
+    if payload.get("results") is not None:
+        mTEPES.SolverResults = payload["results"]
+
+
+def _solve_stage(conn, n_workers, DirName, CaseName, SolverName, mTEPES, pIndLogConsole, p, sc, st, ncall) -> None:
+    """Worker body: solve the stage this process was forked for and send the payload (or the error) back to the parent."""
+    try:
+        if not os.environ.get("OTEPES_THREADS", "").strip():
+            os.environ["OTEPES_THREADS"] = str(max(1, _threads() // n_workers))
+        # only this stage's duals and fixings travel back; the parent already has the rest
+        mTEPES.pDuals = DualStore()
+        _registry(mTEPES, _FIX_REGISTRY).clear()
+        _registry(mTEPES, _INV_REGISTRY).clear()
+        release_solver(mTEPES)
+        ProblemSolving(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, ncall)
+        payload = _stage_payload(mTEPES)
+        payload["duals"] = mTEPES.pDuals
+        try:
+            payload["results"] = pickle.loads(pickle.dumps(mTEPES.SolverResults))
+        except Exception:
+            payload["results"] = None
+        conn.send(("ok", payload))
+    except BaseException as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+
+class StageDispatcher:
+    """Run independent stage solves in forked workers while the parent formulates the next stage.
+
+    ``submit`` is called where the sequential loop would call ``ProblemSolving``; ``drain`` must be called before the model is read again
+    (at the latest, before the stage loop rebuilds the full sets). Payloads are merged strictly in submission order.
+    """
+
+    def __init__(self, n_workers: int):
+        import multiprocessing as mp
+        self.n_workers = n_workers
+        self._ctx      = mp.get_context("fork")
+        self._pending  = deque()   # (stage, process, connection, message or None), in submission order
+
+    @classmethod
+    def create(cls, mTEPES):
+        """Return a dispatcher when the opt-in is on and the model allows it (``mTEPES.Parallel``), else ``None``."""
+        if not enabled() or not mTEPES.Parallel():
+            return None
+        return cls(workers())
+
+    def submit(self, DirName, CaseName, SolverName, mTEPES, pIndLogConsole, p, sc, st, ncall) -> None:
+        while sum(1 for *_, message in self._pending if message is None) >= self.n_workers:
+            self._wait_one()
+        self._merge_ready(mTEPES)
+        recv_conn, send_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(target=_solve_stage, args=(send_conn, self.n_workers, DirName, CaseName, SolverName, mTEPES, pIndLogConsole, p, sc, st, ncall))
+        process.start()
+        send_conn.close()
+        self._pending.append([(p, sc, st), process, recv_conn, None])
+        if pIndLogConsole:
+            print(f'Period {p}, Scenario {sc}, Stage {st} dispatched to worker {process.pid}')
+
+    def _wait_one(self) -> None:
+        """Block until one running worker reports back, and keep its message until its turn to merge comes."""
+        from multiprocessing.connection import wait
+        running = {entry[2]: entry for entry in self._pending if entry[3] is None}
+        for conn in wait(list(running)):
+            entry = running[conn]
+            try:
+                entry[3] = conn.recv()
+            except EOFError:
+                entry[3] = ("error", f"worker {entry[1].pid} exited without a result (exit code {entry[1].exitcode})")
+            conn.close()
+            entry[1].join()
+
+    def _merge_ready(self, mTEPES) -> None:
+        """Merge the finished stages at the head of the queue; a stage that finished early waits for the ones submitted before it."""
+        while self._pending and self._pending[0][3] is not None:
+            (p, sc, st), _, _, (status, payload) = self._pending.popleft()
+            if status != "ok":
+                self.abort()
+                raise ValueError(f"### Stage solve failed for period {p}, scenario {sc}, stage {st}\n{payload}")
+            _merge_payload(mTEPES, mTEPES, payload)
+            CheckpointPayload(mTEPES, p, sc, st, payload)
+            StreamStage(mTEPES, p, sc, st)
+            RetireStage(mTEPES, p, sc, st)
+
+    def drain(self, mTEPES) -> None:
+        """Wait for every submitted stage and merge the payloads into ``mTEPES`` in submission order."""
+        while self._pending:
+            self._wait_one()
+            self._merge_ready(mTEPES)
+
+    def abort(self) -> None:
+        """Stop any worker still running; used when a stage fails so the run does not hang on the rest."""
+        for _, process, conn, message in self._pending:
+            if message is None and process.is_alive():
+                process.terminate()
+            process.join()
+            conn.close()
+        self._pending.clear()
@@ -1,11 +1,20 @@
 """
 Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - June 17, 2026
 
-openTEPES.openTEPES_ProblemSolvingPersistent — persistent-solver lifecycle for ``appsi_gurobi`` and ``gurobi_persistent``.
+openTEPES.openTEPES_ProblemSolvingPersistent — persistent-solver lifecycle for ``appsi_gurobi``, ``appsi_highs`` and ``gurobi_persistent``.
 
 The ``ncall`` counter in ``ProblemSolving`` distinguishes the first solve of a given Pyomo instance (which must ``set_instance`` once) from subsequent solves
 in the stage loop (which only need to update vars / params / constraints). This module owns the bookkeeping flags ``_appsi_gurobi_initialized`` /
-``_gurobi_persistent_initialized`` and the ``update_config`` toggles that control what gets pushed into the persistent Gurobi instance between solves.
+``_appsi_highs_initialized`` / ``_gurobi_persistent_initialized`` and the ``update_config`` toggles that control what gets pushed into the persistent
+instance between solves.
+
+``appsi_highs`` is the persistent path of HiGHS: one ``highspy`` instance per model, to which each stage solve, each fix-and-resolve LP pass and each
+Mode C re-solve pushes only the constraints added or removed and the bounds, coefficients and objective terms that changed, and which keeps the
+basis of the previous solve to warm-start the next one. The ``highs`` solver name stays the one-shot interface that loads the whole model per stage.
+
+In a sector decomposition (``pIndSectorDecomposition``) the loop changes only the bounds of the electrolyzer consumption between solves: it records
+those variables with ``push_bounds``, and the next ``setup_solver`` pushes them, and what ``fix_for_duals`` fixed, instead of re-reading the bounds of
+every variable of the model.
 
 Non-persistent solvers (``gurobi``, ``gurobi_direct``, ``cplex``, ``highs``, ``gams``, ``glpk``) bypass this layer entirely — ``setup_solver()`` just calls
 ``SolverFactory(SolverName)`` and clears any stale log file.
@@ -16,17 +25,62 @@ import gc
 import os
 
 import pyomo.environ as pyo
+from pyomo.common.collections import ComponentSet
+from pyomo.core.expr.visitor import identify_variables
 from pyomo.opt import SolverFactory
+try:
+    from          .openTEPES_ProblemSolvingDualExtraction import _FIX_REGISTRY, _INV_REGISTRY
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import _FIX_REGISTRY, _INV_REGISTRY
+
+# The solver names whose instance is kept on the model and updated between solves instead of loading the model again.
+PERSISTENT_SOLVERS = ("appsi_gurobi", "appsi_highs", "gurobi_persistent")
+
+# The variables whose bounds changed since the last solve, recorded by push_bounds and taken by the next setup_solver.
+_PUSH_REGISTRY = "_pPersistentPush"
+
+
+def push_bounds(OptModel, variables) -> None:
+    """Record ``variables`` as changed since the last solve of ``OptModel``, so a sector re-solve pushes only them into its persistent instance."""
+    pushed = getattr(OptModel, _PUSH_REGISTRY, None)
+    if pushed is None:
+        pushed = []
+        setattr(OptModel, _PUSH_REGISTRY, pushed)
+    pushed.extend(variables)
+
+
+def _take_pushed(OptModel):
+    """The variables ``push_bounds`` recorded, with those ``fix_for_duals`` fixed, and clear the record; None when nothing was recorded."""
+    pushed = getattr(OptModel, _PUSH_REGISTRY, None)
+    if pushed is None:
+        return None
+    setattr(OptModel, _PUSH_REGISTRY, None)
+    for name in (_FIX_REGISTRY, _INV_REGISTRY):
+        pushed.extend(var for var, _ in (getattr(OptModel, name, None) or {}).values())
+    return list({id(var): var for var in pushed}.values())
+
+
+def _instance_vars(OptModel) -> ComponentSet:
+    """The variables an appsi instance of ``OptModel`` holds: those of its active constraints and objective, as ``set_instance`` loads them."""
+    held = ComponentSet()
+    for con in OptModel.component_data_objects(pyo.Constraint, active=True, descend_into=True):
+        held.update(identify_variables(con.body, include_fixed=True))
+    for obj in OptModel.component_data_objects(pyo.Objective, active=True, descend_into=True):
+        held.update(identify_variables(obj.expr, include_fixed=True))
+    return held
 
 
 def setup_solver(OptModel, SolverName: str, FileName: str, ncall: int, mTEPES):
     """Return the (possibly cached) solver instance for this OptModel + SolverName combination.
 
-    For ``appsi_gurobi`` / ``gurobi_persistent`` the solver is attached to ``OptModel`` on first call and
-    re-used across stage-loop iterations; for everything else a fresh ``SolverFactory`` handle is built and the
+    For ``appsi_gurobi`` / ``appsi_highs`` / ``gurobi_persistent`` the solver is attached to ``OptModel`` on first call
+    and re-used across stage-loop iterations; for everything else a fresh ``SolverFactory`` handle is built and the
     stale log file (if any) is removed so each solve writes to a clean file.
     """
-    if SolverName != "appsi_gurobi" and SolverName != "gurobi_persistent":
+    pushed = _take_pushed(OptModel)
+    if SolverName not in PERSISTENT_SOLVERS:
         Solver = SolverFactory(SolverName)
         if os.path.exists(FileName):
             # A prior in-process solve may still hold this log open (the HiGHS interface keeps it open until
@@ -39,13 +93,14 @@ def setup_solver(OptModel, SolverName: str, FileName: str, ncall: int, mTEPES):
                 pass
         return Solver
 
-    if SolverName == "appsi_gurobi":
-        if not hasattr(OptModel, "_appsi_gurobi_solver"):
-            OptModel._appsi_gurobi_solver = SolverFactory(SolverName)
-        Solver = OptModel._appsi_gurobi_solver
-        if ncall == 1 or not getattr(OptModel, "_appsi_gurobi_initialized", False):
+    if SolverName in ("appsi_gurobi", "appsi_highs"):
+        if not hasattr(OptModel, f"_{SolverName}_solver"):
+            setattr(OptModel, f"_{SolverName}_solver", SolverFactory(SolverName))
+        Solver = getattr(OptModel, f"_{SolverName}_solver")
+        if ncall == 1 or not getattr(OptModel, f"_{SolverName}_initialized", False):
             Solver.set_instance(OptModel)
-            OptModel._appsi_gurobi_initialized = True
+            setattr(OptModel, f"_{SolverName}_initialized", True)
+            setattr(OptModel, f"_{SolverName}_vars", None)
         else:
             if mTEPES.pIndSectorDecomposition() == 0:
                 Solver.update_config.check_for_new_or_removed_params      = True
@@ -54,13 +109,22 @@ def setup_solver(OptModel, SolverName: str, FileName: str, ncall: int, mTEPES):
                 Solver.update_config.update_params                        = True
                 Solver.update_config.update_vars                          = True
                 Solver.update_config.update_constraints                   = True
+                setattr(OptModel, f"_{SolverName}_vars", None)
             else:
                 Solver.update_config.check_for_new_or_removed_params      = False
                 Solver.update_config.check_for_new_or_removed_vars        = False
                 Solver.update_config.check_for_new_or_removed_constraints = False
                 Solver.update_config.update_params                        = False
-                Solver.update_config.update_vars                          = True
+                Solver.update_config.update_vars                          = pushed is None
                 Solver.update_config.update_constraints                   = False
+                # only the variables the loop recorded, those the instance holds: it leaves out what no constraint uses. The constraints are not
+                # updated in this mode, so the variables of the instance are read from the model once per load
+                if pushed:
+                    held = getattr(OptModel, f"_{SolverName}_vars", None)
+                    if held is None:
+                        held = _instance_vars(OptModel)
+                        setattr(OptModel, f"_{SolverName}_vars", held)
+                    Solver.update_variables([var for var in pushed if var in held])
             Solver.update_config.update_named_expressions                 = False
             Solver.config.load_solution                                   = True
             Solver.config.warmstart                                       = True
@@ -75,18 +139,30 @@ def setup_solver(OptModel, SolverName: str, FileName: str, ncall: int, mTEPES):
         Solver.set_instance(OptModel)
         OptModel._gurobi_persistent_initialized = True
     else:
-        for var in OptModel.component_data_objects(pyo.Var, active=True, descend_into=True):
+        for var in (OptModel.component_data_objects(pyo.Var, active=True, descend_into=True) if pushed is None or mTEPES.pIndSectorDecomposition() == 0 else pushed):
             Solver.update_var(var)
     return Solver
 
 
+def release_solver(OptModel) -> None:
+    """Drop the persistent solver attached to ``OptModel``, so the next ``setup_solver`` loads the model into a new one.
+
+    A process forked for a stage solve calls it first: the instance it inherited belongs to the parent (a solver's worker threads do not survive a
+    fork), and the parent goes on using it.
+    """
+    for SolverName in PERSISTENT_SOLVERS:
+        for attr in (f"_{SolverName}_solver", f"_{SolverName}_initialized", f"_{SolverName}_vars"):
+            if hasattr(OptModel, attr):
+                delattr(OptModel, attr)
+
+
 def prepare_for_resolve(OptModel, Solver, SolverName: str) -> None:
     """Update the persistent solver's state for the fix-and-resolve LP pass.
 
-    For ``appsi_gurobi`` only the variable values changed (no new constraints / params / vars); for
-    ``gurobi_persistent`` push every var's new bound into Gurobi via ``update_var``.
+    For ``appsi_gurobi`` / ``appsi_highs`` only the variables changed (their domains and bounds, no new constraints / params
+    / vars); for ``gurobi_persistent`` push every var's new bound into Gurobi via ``update_var``.
     """
-    if SolverName == "appsi_gurobi":
+    if SolverName in ("appsi_gurobi", "appsi_highs"):
         Solver.update_config.check_for_new_or_removed_params      = False
         Solver.update_config.check_for_new_or_removed_vars        = False
         Solver.update_config.check_for_new_or_removed_constraints = False
@@ -71,6 +71,10 @@ def resolve(OptModel, SolverName: str, overlays, *, restore: bool = True, tee: b
     """
     overlays = list(overlays)
 
+    # A run with --retire-stages deleted the constraints of its solved stages, so a re-solve would optimise a model without them.
+    if getattr(OptModel, 'pRetiredStages', None):
+        raise ValueError("resolve() needs the constraints of every stage; the model was solved with --retire-stages (OTEPES_RETIRE_STAGES), which deletes them.")
+
     # Solving fixes the investment plan and the commitment to read the duals, so a model that has been solved
     # would answer a demand rise with unserved energy instead of new capacity, and report too high a cost
     # without saying anything. Release those decisions first; a model that was never solved is unaffected.
@@ -93,10 +97,10 @@ def resolve(OptModel, SolverName: str, overlays, *, restore: bool = True, tee: b
     # overlays are independent, not cumulative) and for the optional restore at the end.
     baseline = {name: getattr(OptModel, name).extract_values() for name in touched}
 
-    # opt-in (default OFF): keep one persistent Gurobi instance and warm dual-simplex the re-solves
-    # instead of re-exporting the whole model per overlay. Falls through to the standard path when OFF.
+    # opt-in (default OFF): keep one persistent Gurobi (or, for HiGHS, appsi_highs) instance and warm-start the
+    # re-solves instead of re-exporting the whole model per overlay. Falls through to the standard path when OFF.
     if _warm_resolve_enabled():
-        results = resolve_persistent(OptModel, overlays, baseline, touched, tee=tee)
+        results = resolve_persistent(OptModel, overlays, baseline, touched, tee=tee, SolverName=SolverName)
         if restore:
             for name, values in baseline.items():
                 getattr(OptModel, name).store_values(values)
@@ -6,16 +6,21 @@ import math
 import os
 import time
 import psutil
+import numpy  as np
 import pandas as pd
 from   collections   import defaultdict
 from   pyomo.environ import ConcreteModel, Set, RangeSet, Var, NonNegativeReals, Reals, Constraint, ConstraintList, Objective, minimize, Suffix
 from   pyomo.opt     import SolverFactory
 try:
     from          .openTEPES_ProblemSolving import ProblemSolving
+    from          .openTEPES_ProblemSolvingCutPool import Cut
+    from          .openTEPES_ProblemSolvingPersistent import push_bounds
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from openTEPES.openTEPES_ProblemSolving import ProblemSolving
+    from openTEPES.openTEPES_ProblemSolvingCutPool import Cut
+    from openTEPES.openTEPES_ProblemSolvingPersistent import push_bounds
 
 
 def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st):
@@ -78,17 +83,20 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
     mMaster.vIniInventory   = Var(mTEPES.psnel,   within=NonNegativeReals, doc='initial inventory for ESS candidate [GWh]')
     mMaster.vESSSpillage    = Var(mTEPES.psnel,   within=NonNegativeReals, doc='ESS spillage  [GWh]'                      )
 
-    [mMaster.vTotalOutput   [p,sc,n,el].setub(mTEPES.pMaxPowerElec     [p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vTotalOutput   [p,sc,n,el].setlb(mTEPES.pMinPowerElec     [p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vESSTotalCharge[p,sc,n,el].setub(mTEPES.pMaxCharge        [p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vCharge2ndBlock[p,sc,n,el].setub(mTEPES.pMaxCharge2ndBlock[p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vESSReserveUp  [p,sc,n,el].setub(mTEPES.pMaxCharge2ndBlock[p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vESSReserveDown[p,sc,n,el].setub(mTEPES.pMaxCharge2ndBlock[p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vEnergyOutflows[p,sc,n,el].setub(mTEPES.pMaxCapacity      [p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vESSInventory  [p,sc,n,el].setlb(mTEPES.pMinStorage       [p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vESSInventory  [p,sc,n,el].setub(mTEPES.pMaxStorage       [p,sc,n,el]()) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vIniInventory  [p,sc,n,el].setlb(mTEPES.pMinStorage       [p,sc,n,el]  ) for p,sc,n,el in mTEPES.psnel]
-    [mMaster.vIniInventory  [p,sc,n,el].setub(mTEPES.pMaxStorage       [p,sc,n,el]()) for p,sc,n,el in mTEPES.psnel]
+    # the bounds of every master variable in one pass over psnel
+    for key in mTEPES.psnel:
+        pMaxStorage = mTEPES.pMaxStorage[key]()
+        mMaster.vTotalOutput   [key].setlb(mTEPES.pMinPowerElec     [key])
+        mMaster.vTotalOutput   [key].setub(mTEPES.pMaxPowerElec     [key])
+        mMaster.vESSTotalCharge[key].setub(mTEPES.pMaxCharge        [key])
+        mMaster.vCharge2ndBlock[key].setub(mTEPES.pMaxCharge2ndBlock[key])
+        mMaster.vESSReserveUp  [key].setub(mTEPES.pMaxCharge2ndBlock[key])
+        mMaster.vESSReserveDown[key].setub(mTEPES.pMaxCharge2ndBlock[key])
+        mMaster.vEnergyOutflows[key].setub(mTEPES.pMaxCapacity      [key])
+        mMaster.vESSInventory  [key].setlb(mTEPES.pMinStorage       [key])
+        mMaster.vESSInventory  [key].setub(pMaxStorage                    )
+        mMaster.vIniInventory  [key].setlb(mTEPES.pMinStorage       [key])
+        mMaster.vIniInventory  [key].setub(pMaxStorage                    )
 
     # the loop variables are pp,scc (not p,sc) on purpose: p,sc are the function arguments and are used later to name log/lp files and the ProblemSolving call
     for pp,scc,n,el in mTEPES.psnel:
@@ -142,8 +150,10 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
         return mMaster.vTotalSCost == mMaster.vTheta
     mMaster.eTotalTCost = Constraint(rule=eTotalTCost, doc='total system cost [MEUR]')
 
+    # vTheta - cost >= - sum(marginal * (consumption - vESSTotalCharge)), with the constant folded by one dot product and only the nonzero marginals as terms
     def eBd_Cuts(mMaster, itMst):
-        return mMaster.vTheta - pTotalSCost_it[itMst] >= - sum(pESSTotalChargeMarginal_it[itMst,p,sc,n,el] * (pESSTotalCharge[itMst,p,sc,n,el] - mMaster.vESSTotalCharge[p,sc,n,el]) for p,sc,n,el in mTEPES.psnel)
+        pMarginal = pESSTotalChargeMarginal_it[itMst]
+        return mMaster.vTheta >= pTotalSCost_it[itMst] - float(pMarginal @ pESSTotalCharge[itMst]) + sum(float(pMarginal[i]) * mMaster.vESSTotalCharge[pSNEL[i]] for i in np.flatnonzero(pMarginal))
     mMaster.eBd_Cuts = ConstraintList(doc='Benders cuts')
 
     # this equation is directly taken from ModelFormulation
@@ -207,20 +217,72 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
     pTotalSCost_it = pd.Series([0.0]*len(mMaster.itBd), index=mMaster.itBd)
     # pMasterCost_it = pd.Series([0.0]*len(mMaster.itBd), index=mMaster.itBd)
 
-    if mTEPES.psnel:
-        pESSTotalCharge            = pd.Series([0.0]*len(mMaster.itBd*mTEPES.psnel), index=mMaster.itBd*mTEPES.psnel)
-        # pCharge2ndBlock            = pd.Series([0.0]*len(mMaster.itBd*mTEPES.psnel), index=mMaster.itBd*mTEPES.psnel)
-        # pESSReserveUp              = pd.Series([0.0]*len(mMaster.itBd*mTEPES.psnel), index=mMaster.itBd*mTEPES.psnel)
-        # pESSReserveDown            = pd.Series([0.0]*len(mMaster.itBd*mTEPES.psnel), index=mMaster.itBd*mTEPES.psnel)
-        pESSTotalChargeMarginal_it = pd.Series([0.0]*len(mMaster.itBd*mTEPES.psnel), index=mMaster.itBd*mTEPES.psnel)
+    # the consumption each subproblem was solved at and its marginals, one array per iteration aligned with pSNEL
+    pSNEL                      = list(mTEPES.psnel)
+    pESSTotalCharge            = {}
+    pESSTotalChargeMarginal_it = {}
+
+    # the factors of the duals in the marginal of each consumption, fixed along the loop
+    pIsEC          = [el in mTEPES.ec             for pp,scc,n,el in pSNEL]
+    pIsShift       = [bool(mTEPES.pShiftTime[el]) for pp,scc,n,el in pSNEL]
+    pInstallCoef   = np.array([1.0/mTEPES.pMaxCharge[pp,scc,n,el]                             if ec    else 0.0 for ec,   (pp,scc,n,el) in zip(pIsEC,    pSNEL)])
+    pShiftCoef     = np.array([mTEPES.pDuration[pp,scc,n]()*          mTEPES.pEfficiency[el]  if shift else 0.0 for shift,(pp,scc,n,el) in zip(pIsShift, pSNEL)])
+    pInventoryCoef = np.array([mTEPES.pDuration[pp,scc,n]()*math.sqrt(mTEPES.pEfficiency[el])                   for        pp,scc,n,el  in               pSNEL ])
+    pH2Coef        = np.array([mTEPES.pDuration[pp,scc,n]()/mTEPES.pProductionFunctionH2[el]                    for        pp,scc,n,el  in               pSNEL ])
+
+    # the consumption bounds on the subproblem now, so an iteration touches and pushes only the ones that move
+    pSbpCharge     = np.full(len(pSNEL), np.nan)
 
     # initialization
     Z_Lower = -math.inf
     Z_Upper =  math.inf
     pBdConvergenceRows = []
 
+    # opt-in: the cuts of a previous run of this stage are cut again at their origins, the subproblem points of the first iterations
+    pCutPools    = getattr(mTEPES, 'pCutPools', None)
+    pCutPoolName = f'sector_{p}_{sc}_{st}'
+    pCutKeys     = [('vESSTotalCharge', (pp,scc,n,el)) for pp,scc,n,el in mTEPES.psnel]
+    pWarmOrigins = []
+    if pCutPools is not None:
+        pCutPool     = pCutPools.pool(pCutPoolName, bounds={key: mMaster.vESSTotalCharge[key[1]].bounds for key in pCutKeys})
+        pWarmOrigins = pCutPool.origins(pCutKeys)[:len(mMaster.itBd)-1]
+        pCutPool.clear()
+
+    # one master solver for the whole loop: a persistent one is loaded once, then gets the new cut and the bounds of vTheta each iteration
+    SolverMst = SolverFactory(SolverName)
+    if SolverName in ('gurobi', 'gurobi_direct', 'appsi_gurobi'):
+        SolverMst.options['OutputFlag'       ] =   0
+        # SolverMst.options['LogFile'        ] = FileName
+        SolverMst.options['DisplayInterval'  ] = 100
+        SolverMst.options['LPWarmStart'      ] =   2
+        # SolverMst.options['LazyConstraints'] =   1   # works only for MIP problems
+        SolverMst.options['Method'           ] =  -1
+        SolverMst.options['Threads'          ] = int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2)
+    if SolverName.startswith('appsi_'):
+        # nothing is scanned before a solve: the loop adds each cut and updates vTheta itself, and vTheta fixed at the first iteration is a bound,
+        # not a constant folded into the rows, so freeing it is one bound update
+        SolverMst.update_config.treat_fixed_vars_as_params           = False
+        SolverMst.update_config.check_for_new_or_removed_params      = False
+        SolverMst.update_config.check_for_new_or_removed_vars        = False
+        SolverMst.update_config.check_for_new_or_removed_constraints = False
+        SolverMst.update_config.update_params                        = False
+        SolverMst.update_config.update_vars                          = False
+        SolverMst.update_config.update_constraints                   = False
+        SolverMst.update_config.update_named_expressions             = False
+        SolverMst.config.load_solution                               = True
+        SolverMst.config.warmstart                                   = True
+
     # Benders algorithm
     mMaster.vTheta.fix(0.0)
+    if SolverName == 'gurobi_persistent':
+        SolverMst.set_instance(mMaster)
+        SolverMst.set_gurobi_param('OutputFlag',        0)
+        # SolverMst.set_gurobi_param('LogFile',  FileName)
+        SolverMst.set_gurobi_param('DisplayInterval', 100)
+        SolverMst.set_gurobi_param('LPWarmStart',       2)
+        # SolverMst.set_gurobi_param('LazyConstraints', 1)
+        SolverMst.set_gurobi_param('Method',           -1)
+        SolverMst.set_gurobi_param('Threads', int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2))
     itBdFinal = 0
     itBdOptml = 0
     for itBd in mMaster.itBd:
@@ -239,46 +301,19 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
             if os.path.exists(FileName):
                 os.remove(FileName)
 
-            # solving the master problem
-            if SolverName != 'gurobi_persistent':
-                SolverMst = SolverFactory(SolverName)
-            if SolverName in ('appsi_cplex', 'appsi_gurobi', 'gurobi_persistent'):
-                solver_attr = f'_{SolverName}_solver'
-                init_attr   = f'_{SolverName}_initialized'
-                if not hasattr(mMaster, solver_attr):
-                    setattr(mMaster, solver_attr, SolverFactory(SolverName))
-                if SolverName == 'gurobi_persistent':
-                    SolverMst = getattr(mMaster, solver_attr)
-                if itBd == 2 or not getattr(mMaster, init_attr, False):
-                    SolverMst.set_instance(mMaster)
-                    setattr(mMaster, init_attr, True)
-
-            if SolverName in ('gurobi', 'gurobi_direct', 'appsi_gurobi'):
-                SolverMst.options['OutputFlag'       ] =   0
-                # SolverMst.options['LogFile'        ] = FileName
-                SolverMst.options['DisplayInterval'  ] = 100
-                SolverMst.options['LPWarmStart'      ] =   2
-                # SolverMst.options['LazyConstraints'] =   1   # works only for MIP problems
-                SolverMst.options['Method'           ] =  -1
-                SolverMst.options['Threads'          ] = int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2)
-            if SolverName == 'gurobi_persistent':
-                SolverMst.set_gurobi_param('OutputFlag',        0)
-                # SolverMst.set_gurobi_param('LogFile',  FileName)
-                SolverMst.set_gurobi_param('DisplayInterval', 100)
-                SolverMst.set_gurobi_param('LPWarmStart',       2)
-                # SolverMst.set_gurobi_param('LazyConstraints', 1)
-                SolverMst.set_gurobi_param('Method',           -1)
-                SolverMst.set_gurobi_param('Threads', int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2))
-
             # solving the master problem
             StartTime = time.time()
-            if SolverName in ('gurobi', 'gurobi_direct', 'appsi_gurobi'):
-                SolverMst.solve(mMaster, tee=False, report_timing=False)
             if SolverName == 'gurobi_persistent':
                 SolverMst.solve(mMaster, tee=False, report_timing=False, warmstart=True, keepfiles=False, load_solutions=True, save_results=False)
+            else:
+                SolverMst.solve(mMaster, tee=False, report_timing=False)
             MstSolvingTime = time.time() - StartTime
             StartTime = time.time()
 
+            # count the master solves each stored cut is slack at
+            if pCutPools is not None and itBd > 1 and mMaster.vTheta.value is not None:
+                pCutPool.observe({key: mMaster.vESSTotalCharge[key[1]]() for key in pCutKeys}, {'total': mMaster.vTheta()})
+
             # # After each solve, mark ALL Benders cuts already in the backend as Lazy.
             # # appsi_gurobi and appsi_cplex only add new constraints to the backend during solve() (via check_for_new_or_removed_constraints=True),
             # # so the cut added in the previous iteration is now available in _pyomo_con_to_solver_con_map and can be flagged.
@@ -316,34 +351,25 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
 
             # in normal Benders iterations
             if itBdFinal < 9999:
-
-                # storing the master solution and fixing electrolyzer decisions for the subproblem
-                # the loop variables are pp,scc (not p,sc) on purpose: p,sc are the function arguments and name the log/lp files and the ProblemSolving call
-                for pp,scc,n,el in mTEPES.psnel:
-                    pESSTotalCharge         [itBd,pp,scc,n,el] = 0.0 if itBd == 1 else mMaster.vESSTotalCharge[pp,scc,n,el]()
-                    # pESSTotalCharge           [itBd,pp,scc,n,el] = OptModel.vESSTotalCharge[pp,scc,n,el]() if itBd == 1 else mMaster.vESSTotalCharge[pp,scc,n,el]()
-                    # pCharge2ndBlock         [itBd,pp,scc,n,el] = OptModel.vCharge2ndBlock[pp,scc,n,el]() if itBd == 1 else mMaster.vCharge2ndBlock[pp,scc,n,el]()
-                    # pESSReserveUp           [itBd,pp,scc,n,el] = OptModel.vESSReserveUp  [pp,scc,n,el]() if itBd == 1 else mMaster.vESSReserveUp  [pp,scc,n,el]()
-                    # pESSReserveDown         [itBd,pp,scc,n,el] = OptModel.vESSReserveDown[pp,scc,n,el]() if itBd == 1 else mMaster.vESSReserveDown[pp,scc,n,el]()
-                    # pEnergyOutflows         [itBd,pp,scc,n,el] = OptModel.vEnergyOutflows[pp,scc,n,el]() if ItBd == 1 else mMaster.vEnergyOutflows[pp,scc,n,el]()
-                    # OptModel.vESSTotalCharge[     pp,scc,n,el].fix  (pESSTotalCharge[itBd,pp,scc,n,el])
-                    OptModel.vESSTotalCharge[     pp,scc,n,el].setlb(pESSTotalCharge[itBd,pp,scc,n,el])
-                    OptModel.vESSTotalCharge[     pp,scc,n,el].setub(pESSTotalCharge[itBd,pp,scc,n,el])
-                    # OptModel.vCharge2ndBlock[     pp,scc,n,el].fix(pCharge2ndBlock [itBd,pp,scc,n,el])
-                    # OptModel.vESSReserveUp  [     pp,scc,n,el].fix(pESSReserveUp   [itBd,pp,scc,n,el])
-                    # OptModel.vESSReserveDown[     pp,scc,n,el].fix(pESSReserveDown [itBd,pp,scc,n,el])
-                    # OptModel.vEnergyOutflows[     pp,scc,n,el].fix(pvEnergyOutflows[itBd,pp,scc,n,el])
+                # storing the master solution (a stored origin in the first iterations of a warm restart) as the electrolyzer decisions for the subproblem
+                if itBd <= len(pWarmOrigins):
+                    pESSTotalCharge[itBd] = np.array([pWarmOrigins[itBd-1][key] for key in pCutKeys])
+                elif itBd == 1:
+                    pESSTotalCharge[itBd] = np.zeros(len(pSNEL))
+                else:
+                    # a consumption in no master row has no value: it is at its lower bound
+                    pESSTotalCharge[itBd] = np.array([mMaster.vESSTotalCharge[key].value or 0.0 for key in pSNEL])
             else:
                 # fixing electrolyzer decisions for the subproblem for the final Benders iteration
-                for pp,scc,n,el in mTEPES.psnel:
-                    pESSTotalCharge         [itBd,pp,scc,n,el] =     pESSTotalCharge[itBdOptml,pp,scc,n,el]
-                    # OptModel.vESSTotalCharge[     pp,scc,n,el].fix  (pESSTotalCharge[itBdOptml,pp,scc,n,el])
-                    OptModel.vESSTotalCharge[     pp,scc,n,el].setlb(pESSTotalCharge[itBdOptml,pp,scc,n,el])
-                    OptModel.vESSTotalCharge[     pp,scc,n,el].setub(pESSTotalCharge[itBdOptml,pp,scc,n,el])
-                    # OptModel.vCharge2ndBlock[     pp,scc,n,el].fix(pCharge2ndBlock [itBdOptml,pp,scc,n,el])
-                    # OptModel.vESSReserveUp  [     pp,scc,n,el].fix(pESSReserveUp   [itBdOptml,pp,scc,n,el])
-                    # OptModel.vESSReserveDown[     pp,scc,n,el].fix(pESSReserveDown [itBdOptml,pp,scc,n,el])
-                    # OptModel.vEnergyOutflows[     pp,scc,n,el].fix(pvEnergyOutflows[itBdOptml,pp,scc,n,el])
+                pESSTotalCharge[itBd] = pESSTotalCharge[itBdOptml]
+
+            # fix the consumptions that moved since the last subproblem, and record them for its persistent solver
+            pChanged = np.flatnonzero(pESSTotalCharge[itBd] != pSbpCharge)
+            for i in pChanged:
+                OptModel.vESSTotalCharge[pSNEL[i]].setlb(pESSTotalCharge[itBd][i])
+                OptModel.vESSTotalCharge[pSNEL[i]].setub(pESSTotalCharge[itBd][i])
+            push_bounds(OptModel, [OptModel.vESSTotalCharge[pSNEL[i]] for i in pChanged])
+            pSbpCharge = pESSTotalCharge[itBd].copy()
 
             if pIndLogConsole:
                 StartTime         = time.time()
@@ -354,7 +380,8 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
 
             # solving the subproblem
             StartTime      = time.time()
-            ProblemSolving(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, itBd)
+            # the solve before the loop loaded the subproblem into its persistent solver (ncall 1): every iteration is a re-solve
+            ProblemSolving(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, itBd+1)
             SbpSolvingTime = time.time() - StartTime
             StartTime      = time.time()
 
@@ -371,26 +398,26 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
             print('  Total system                 cost [MEUR] ', OptModel.vTotalSCost())
 
             # get the duals for the Benders cuts
-            pESSTotalChargeMarginal = pd.Series([0.0] * len(mTEPES.psnel), index=mTEPES.psnel)
-            for pp,scc,n,el in mTEPES.psnel:
-                if el in mTEPES.ec:
-                    pESSTotalChargeMarginal    [pp,scc,n,el] -= mTEPES.pDuals[ f"eInstallConESS_{pp}_{scc}_{st}('{n}', '{el}')"]     /mTEPES.pMaxCharge[pp,scc,n,el]
-                pESSTotalChargeMarginal        [pp,scc,n,el] += mTEPES.pDuals[   f"eBalanceElec_{pp}_{scc}_{st}('{n}', '{n2l[el]}')"]
-                pESSTotalChargeMarginal        [pp,scc,n,el] -= mTEPES.pDuals[  f"eESSInventory_{pp}_{scc}_{st}('{n}', '{el}')"]     *mTEPES.pDuration[pp,scc,n]()*math.sqrt(mTEPES.pEfficiency[el])
-                if mTEPES.pShiftTime[el]:
-                    pESSTotalChargeMarginal    [pp,scc,n,el] -= mTEPES.pDuals[  f"eMaxShiftTime_{pp}_{scc}_{st}('{n}', '{el}')"]     *mTEPES.pDuration[pp,scc,n]()*          mTEPES.pEfficiency[el]
-                pESSTotalChargeMarginal        [pp,scc,n,el] -= mTEPES.pDuals[f"eESSTotalCharge_{pp}_{scc}_{st}('{n}', '{el}')"]
-                pESSTotalChargeMarginal        [pp,scc,n,el] -= mTEPES.pDuals[     f"eBalanceH2_{pp}_{scc}_{st}('{n}', '{n2l[el]}')"]*mTEPES.pDuration[pp,scc,n]()/mTEPES.pProductionFunctionH2[el]
-                pESSTotalChargeMarginal_it[itBd,pp,scc,n,el] = pESSTotalChargeMarginal[pp,scc,n,el]
+            pSbpDuals = mTEPES.pDuals
+            pESSTotalChargeMarginal_it[itBd] = (  np.array([pSbpDuals[   'eBalanceElec', (pp,scc,st,n,n2l[el])] for pp,scc,n,el in pSNEL])
+                                                - np.array([pSbpDuals[  'eESSInventory', (pp,scc,st,n,el)]      for pp,scc,n,el in pSNEL]) * pInventoryCoef
+                                                - np.array([pSbpDuals['eESSTotalCharge', (pp,scc,st,n,el)]      for pp,scc,n,el in pSNEL])
+                                                - np.array([pSbpDuals[     'eBalanceH2', (pp,scc,st,n,n2l[el])] for pp,scc,n,el in pSNEL]) * pH2Coef
+                                                - np.array([pSbpDuals[ 'eInstallConESS', (pp,scc,st,n,el)] if ec    else 0.0 for ec,   (pp,scc,n,el) in zip(pIsEC,    pSNEL)]) * pInstallCoef
+                                                - np.array([pSbpDuals[  'eMaxShiftTime', (pp,scc,st,n,el)] if shift else 0.0 for shift,(pp,scc,n,el) in zip(pIsShift, pSNEL)]) * pShiftCoef)
+
+            # the cut of this iteration, vTheta >= cost + sum(marginal * (vESSTotalCharge - consumption)), with the consumption it was cut at
+            if pCutPools is not None:
+                pCutPool.add(Cut.at('total', pTotalSCost_it[itBd], dict(zip(pCutKeys, pESSTotalChargeMarginal_it[itBd].tolist())), dict(zip(pCutKeys, pESSTotalCharge[itBd].tolist())), itBd))
 
             # save one row per (iteration, period, scenario, load level) and one independent column per electrolyzer
             pRowsByKey = {}
-            for pp,scc,n,el in mTEPES.psnel:
+            for (pp,scc,n,el), pConsumption, pMarginal in zip(pSNEL, pESSTotalCharge[itBd].tolist(), pESSTotalChargeMarginal_it[itBd].tolist()):
                 pKey = (pp, scc, n, itBd)
                 if pKey not in pRowsByKey:
                     pRowsByKey[pKey] = {'Iteration': itBd, 'Period': pp, 'Scenario': scc, 'LoadLevel': n,'TotalSystemCost_[MEUR]': pTotalSCost_it[itBd]}
-                pRowsByKey[pKey][f'Consumption_{el}_[MW]'  ] = - pESSTotalCharge           [itBd,pp,scc,n,el]*1e3
-                pRowsByKey[pKey][f'Marginal_{el}_[EUR/MWh]'] = - pESSTotalChargeMarginal_it[itBd,pp,scc,n,el]
+                pRowsByKey[pKey][f'Consumption_{el}_[MW]'  ] = - pConsumption*1e3
+                pRowsByKey[pKey][f'Marginal_{el}_[EUR/MWh]'] = - pMarginal
 
             sPSNGT = [(p,sc,n,gt) for p,sc,n,gt in mTEPES.psngt if sum(1 for g in g2t[gt] if (p,g) in mTEPES.pg)]
             if sPSNGT:
@@ -439,24 +466,22 @@ def SectorDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLog
             # force a minimum improvement between iterations
             mMaster.vTheta.setlb(Z_Upper * (1 - 0.0001))
 
-            # add one cut
+            # add one cut, and push it with the new bounds of vTheta into a persistent master
             new_cut = mMaster.eBd_Cuts.add(eBd_Cuts(mMaster, itBd))
-            if   SolverName in ('appsi_gurobi', 'appsi_cplex'):
-                SolverMst.update_config.check_for_new_or_removed_params      = False
-                SolverMst.update_config.check_for_new_or_removed_vars        = False
-                SolverMst.update_config.check_for_new_or_removed_constraints = True
-                SolverMst.update_config.update_params                        = False
-                SolverMst.update_config.update_vars                          = False
-                SolverMst.update_config.update_constraints                   = False
-                SolverMst.update_config.update_named_expressions             = False
-                SolverMst.config.load_solution                               = True
-                SolverMst.config.warmstart                                   = True
-                SolverMst.config.stream_solver                               = True
+            if   SolverName.startswith('appsi_'):
+                SolverMst.add_constraints([new_cut])
+                SolverMst.update_variables([mMaster.vTheta])
             elif SolverName == 'gurobi_persistent':
                 SolverMst.add_constraint(new_cut)
+                SolverMst.update_var(mMaster.vTheta)
                 # Benders cuts are considered as lazy
                 # SolverMst.set_linear_constraint_attr(new_cut, 'Lazy', 1)
 
+    # keep the cuts binding at the last master solution, and the last one, for the next run
+    if pCutPools is not None:
+        pCutPool.purge(max_idle=0)
+        pCutPools.save(pCutPoolName, pCutPool)
+
     SolvingTime = time.time() - FuncStartTime
     print('Sector Benders decomposition           ****')
     print('  Total system                 cost [MEUR] ', Z_Upper, ' Seconds', round(SolvingTime))
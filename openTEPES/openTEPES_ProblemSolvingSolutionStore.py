@@ -0,0 +1,175 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingSolutionStore — opt-in store of the stage solutions of a case, offered as the start of the next run (default OFF).
+
+A case re-run after a small data change (a fuel price, one generator) solves every stage from nothing, although the last run found a solution of
+the same stages that is close to the new one. With ``--solution-store`` / ``OTEPES_SOLUTION_STORE`` set, ``ProblemSolving`` writes the solution of
+each solve to ``<output dir>/openTEPES_solutions_<CaseName>/``, one file per period, scenario and stage, and a later run of the case starts the
+solve of that stage from it. The store is kept between runs: each run replaces the files of the stages it solves.
+
+A stored solution is offered only to a stage of the same structure. The structure hash covers the names and indices of the active constraints
+and of the variables in them, so a change of the data keeps it and a change of the sets, the options or the formulation does not. A MIP starts
+from the stored values of its variables that are not fixed, passed as a MIP start to the solvers of ``WARM_START_SOLVERS`` (they replace the
+values of ``--stage-warm-start``). An LP solved with ``appsi_highs`` starts from the stored simplex basis, set on the persistent HiGHS instance
+before the solve; the other solvers have no LP start through their Pyomo interface.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.util.vars_from_expressions import get_vars_from_components
+
+
+def enabled() -> bool:
+    """True when the stage solutions are stored and offered, via ``--solution-store`` / ``OTEPES_SOLUTION_STORE``."""
+    return os.environ.get("OTEPES_SOLUTION_STORE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _grouped(components) -> dict:
+    grouped = {}
+    for data in components:
+        grouped.setdefault(data.parent_component().name, []).append(data)
+    return grouped
+
+
+class StageSolution:
+    """The variables and active constraints of one solve, grouped by component, the hash of their structure, and what was offered to them."""
+
+    def __init__(self, p, sc, st, variables: dict, constraints: dict):
+        self.stage       = p, sc, st
+        self.variables   = variables
+        self.constraints = constraints
+        self.offered     = False
+        digest           = hashlib.sha256()
+        for kind, components in (("var", variables), ("con", constraints)):
+            for name in sorted(components):
+                digest.update(f'{kind} {name}'.encode())
+                digest.update(repr([data.index() for data in components[name]]).encode())
+        self.structure = digest.hexdigest()
+
+    @classmethod
+    def of(cls, OptModel, p, sc, st) -> StageSolution:
+        variables = {}
+        for ctype in (pyo.Constraint, pyo.Objective):
+            for name, group in _grouped(get_vars_from_components(OptModel, ctype, include_fixed=True, active=True)).items():
+                variables.setdefault(name, []).extend(group)
+        return cls(p, sc, st, variables, _grouped(OptModel.component_data_objects(pyo.Constraint, active=True, descend_into=True)))
+
+    def values(self) -> dict:
+        """component name -> values of its variables, in order (NaN where a variable has none)."""
+        return {name: np.fromiter((np.nan if var.value is None else var.value for var in variables), dtype=float, count=len(variables))
+                for name, variables in self.variables.items()}
+
+    def load(self, values: dict) -> int:
+        """Set ``values`` on the variables that are not fixed, rounded on the discrete ones; returns how many were set."""
+        count = 0
+        for name, variables in self.variables.items():
+            for var, value in zip(variables, values[name]):
+                if not var.fixed and not np.isnan(value):
+                    var.set_value(value if var.is_continuous() else round(value), skip_validation=True)
+                    count += 1
+        return count
+
+    def _positions(self, Solver) -> tuple:
+        """The HiGHS column of each variable and row of each constraint, by component (-1 where the instance has none)."""
+        columns, rows = Solver._pyomo_var_to_solver_var_map, Solver._pyomo_con_to_solver_con_map
+        return ({name: np.array([columns.get(id(var), -1) for var in variables], dtype=np.int64) for name, variables in self.variables.items()},
+                {name: np.array([rows.get(con, -1) for con in constraints], dtype=np.int64) for name, constraints in self.constraints.items()})
+
+    def basis(self, Solver) -> dict | None:
+        """The simplex basis the last solve left on the ``appsi_highs`` instance, as statuses by component; None when it has none."""
+        basis = Solver._solver_model.getBasis()
+        if not basis.valid:
+            return None
+        status  = {"columns": np.fromiter((int(s) for s in basis.col_status), dtype=np.int8, count=len(basis.col_status)),
+                   "rows":    np.fromiter((int(s) for s in basis.row_status), dtype=np.int8, count=len(basis.row_status))}
+        stored  = {}
+        for kind, positions in zip(("columns", "rows"), self._positions(Solver)):
+            stored[kind] = {name: np.where(index >= 0, status[kind][np.maximum(index, 0)], -1).astype(np.int8) for name, index in positions.items()}
+        return stored
+
+    def set_basis(self, Solver, stored: dict) -> bool:
+        """Set the stored basis on the ``appsi_highs`` instance, once it holds this model; False when it does not cover the instance."""
+        import highspy
+        Solver.update()
+        highs = Solver._solver_model
+        size  = {"columns": highs.getNumCol(), "rows": highs.getNumRow()}
+        for kind, positions in zip(("columns", "rows"), self._positions(Solver)):
+            status = np.full(size[kind], -1, dtype=np.int8)
+            for name, index in positions.items():
+                status[index[index >= 0]] = stored[kind][name][index >= 0]
+            if (status < 0).any():
+                return False
+            size[kind] = [highspy.HighsBasisStatus(int(s)) for s in status]
+        basis            = highspy.HighsBasis()
+        basis.col_status = size["columns"]
+        basis.row_status = size["rows"]
+        basis.valid      = True
+        return highs.setBasis(basis) == highspy.HighsStatus.kOk
+
+
+class SolutionStore:
+    """The stored solutions of one case: ``<out>/openTEPES_solutions_<CaseName>/``, one ``solution_<p>_<sc>_<st>.pkl`` per stage."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @classmethod
+    def create(cls, OutPath, CaseName) -> SolutionStore | None:
+        """The solution store of this case, or None when it is off."""
+        if not enabled():
+            return None
+        directory = os.path.join(OutPath, f'openTEPES_solutions_{CaseName}')
+        os.makedirs(directory, exist_ok=True)
+        return cls(directory)
+
+    def _path(self, p, sc, st) -> str:
+        return os.path.join(self.directory, f'solution_{p}_{sc}_{st}.pkl')
+
+    def offer(self, OptModel, Solver, SolverName, p, sc, st, mip: bool) -> StageSolution:
+        """The variables of the solve of stage ``(p, sc, st)``, started from the stored solution of the stage when its structure matches.
+
+        ``offered`` is set when the values were loaded as a MIP start; the basis of an LP is set on the solver directly.
+        """
+        solution = StageSolution.of(OptModel, p, sc, st)
+        path     = self._path(p, sc, st)
+        if not os.path.isfile(path):
+            return solution
+        with open(path, 'rb') as f:
+            stored = pickle.load(f)
+        if stored["structure"] != solution.structure:
+            print(f'Period {p}, Scenario {sc}, Stage {st} stored solution skipped: the model structure changed')
+        elif mip:
+            solution.offered = solution.load(stored["values"]) > 0
+            if solution.offered:
+                print(f'Period {p}, Scenario {sc}, Stage {st} starts from the stored solution')
+        elif SolverName == "appsi_highs" and stored.get("basis") is not None and solution.set_basis(Solver, stored["basis"]):
+            print(f'Period {p}, Scenario {sc}, Stage {st} starts from the stored basis')
+        return solution
+
+    def save(self, solution: StageSolution, Solver, SolverName, mip: bool) -> None:
+        """Write the values the solve left on the variables of ``solution``, and the simplex basis of an LP solved with ``appsi_highs``."""
+        path      = self._path(*solution.stage)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        basis     = solution.basis(Solver) if SolverName == "appsi_highs" and not mip else None
+        with open(temporary, 'wb') as f:
+            pickle.dump({"structure": solution.structure, "values": solution.values(), "basis": basis}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+
+def OfferSolution(OptModel, mTEPES, Solver, SolverName, p, sc, st, mip: bool) -> StageSolution | None:
+    """Before a solve: start ``OptModel`` from the stored solution of stage ``(p, sc, st)`` when the store is on; None when it is off."""
+    store = getattr(mTEPES, 'pSolutions', None)
+    return None if store is None else store.offer(OptModel, Solver, SolverName, p, sc, st, mip)
+
+
+def StoreSolution(mTEPES, solution: StageSolution | None, Solver, SolverName, mip: bool) -> None:
+    """After a solve: store what it left on the variables of ``solution``, when the store is on."""
+    store = getattr(mTEPES, 'pSolutions', None)
+    if store is not None and solution is not None:
+        store.save(solution, Solver, SolverName, mip)
@@ -0,0 +1,175 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingSolverManager — a concurrent Pyomo solver manager for the time-Benders subproblems.
+
+``StageSolve`` mode 0 (``pIndSequentialSolving == 0``) queues one subproblem per stage on a Pyomo solver manager and collects the results
+afterwards. Pyomo's ``'serial'`` manager solves each subproblem inside ``queue()``, so the stages ran one after another. This module
+registers ``'otepes_fork'``, a drop-in ``AsynchronousSolverManager`` that forks a worker per queued subproblem and lets up to ``n_workers``
+solver processes run at once:
+
+  * ``queue()``         forks a worker on the model as it stands (only the current stage active), then returns at once; it blocks only when
+                        ``n_workers`` solves are already running.
+  * ``wait_any()``      waits for whichever worker finishes first and keeps its message.
+  * ``get_results()``   loads the worker's variable values and duals into the model it was queued on and returns the ``SolverResults``.
+                        Results of a handle still running are waited for, so a caller that reads the handles in queue order gets the same
+                        model state, and the same floating-point sums, as with the serial manager.
+
+``parallel_manager()`` sizes it from the solver thread budget: ``--parallel-subproblems`` / ``OTEPES_PARALLEL_SUBPROBLEMS`` when set, else
+one worker per solver thread, never more workers than ``_threads()``; each worker is then given an equal slice of the threads. It falls back
+to the ``'serial'`` manager where ``fork`` is not available (Windows). The switch is separate from ``--parallel-stages``, which runs the
+independent stages of an operation-only period side by side and is not read here.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+import traceback
+from collections import deque
+
+import pyomo.environ as pyo
+from pyomo.opt.parallel.async_solver import AsynchronousSolverManager, SolverManagerFactory
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus, FailedActionHandle
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_ProblemSolvingParallelStages import _stage_payload
+    from          .openTEPES_ProblemSolvingTuning         import _threads
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ProblemSolvingParallelStages import _stage_payload
+    from openTEPES.openTEPES_ProblemSolvingTuning         import _threads
+
+
+def subproblem_workers() -> int:
+    """Number of time-Benders subproblems to solve at once: ``OTEPES_PARALLEL_SUBPROBLEMS`` when set to a positive integer, else 0 (auto)."""
+    env = os.environ.get("OTEPES_PARALLEL_SUBPROBLEMS", "").strip()
+    return int(env) if env.isdigit() and int(env) > 0 else 0
+
+
+def _solve_in_worker(conn, threads, opt, args, kwds) -> None:
+    """Worker body: solve the queued model, then send back the results, the loaded values and the duals of the active constraints."""
+    try:
+        os.environ["OTEPES_THREADS"] = str(threads)
+        model   = args[0]
+        results = opt.solve(*args, **kwds)
+        payload = _stage_payload(model)
+        duals   = {}
+        if hasattr(model, "dual"):
+            for con in model.component_data_objects(pyo.Constraint, active=True, descend_into=True):
+                if con in model.dual:
+                    duals[(con.parent_component().name, con.index())] = model.dual[con]
+        payload["duals"] = duals
+        conn.send(("ok", pickle.dumps(results), payload))
+    except BaseException as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}", None))
+    finally:
+        conn.close()
+
+
+@SolverManagerFactory.register("otepes_fork", doc="Concurrently execute solvers in forked local worker processes")
+class SolverManager_Fork(AsynchronousSolverManager):
+    """Pyomo solver manager that runs up to ``n_workers`` queued solves at once, each in a forked process."""
+
+    def __init__(self, n_workers: int = 2, threads: int = 1, **kwds):
+        import multiprocessing as mp
+        self.n_workers = max(1, n_workers)
+        self.threads   = max(1, threads)
+        self._ctx      = mp.get_context("fork")
+        AsynchronousSolverManager.__init__(self, **kwds)
+
+    def clear(self):
+        super().clear()
+        self._running  = {}        # ah.id -> (process, connection)
+        self._finished = deque()   # ah.id of finished solves not yet reported by wait_any()
+        self._loaded  = {}   # ah.id -> (model, payload), applied when the results are fetched
+
+    def _perform_queue(self, ah, *args, **kwds):
+        opt = kwds.pop("solver", kwds.pop("opt", None))
+        if opt is None:
+            raise ActionManagerError(f"No solver passed to {type(self).__name__}, use keyword option 'solver'")
+        while len(self._running) >= self.n_workers:
+            self._receive()
+        recv_conn, send_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(target=_solve_in_worker, args=(send_conn, self.threads, opt, args, kwds))
+        process.start()
+        send_conn.close()
+        self._running[ah.id] = (process, recv_conn)
+        self._loaded [ah.id] = (args[0], None)
+        return ah
+
+    def _receive(self) -> None:
+        """Block until at least one running worker reports back, and file its results under its handle."""
+        from multiprocessing.connection import wait
+        by_conn = {conn: (ah_id, process) for ah_id, (process, conn) in self._running.items()}
+        for conn in wait(list(by_conn)):
+            ah_id, process = by_conn[conn]
+            try:
+                status, results, payload = conn.recv()
+            except EOFError:
+                status, results, payload = "error", f"worker {process.pid} exited without a result (exit code {process.exitcode})", None
+            conn.close()
+            process.join()
+            del self._running[ah_id]
+            self._finished.append(ah_id)
+            ah = self.event_handle[ah_id]
+            if status == "ok":
+                self.results[ah_id] = pickle.loads(results)
+                self._loaded[ah_id] = (self._loaded[ah_id][0], payload)
+                ah.status = ActionStatus.done
+            else:
+                self._loaded.pop(ah_id, None)
+                ah.status      = ActionStatus.error
+                ah.error       = True
+                ah.explanation = results
+
+    def _perform_wait_any(self):
+        if self._finished:
+            return self.event_handle[self._finished.popleft()]
+        if self._running:
+            self._receive()
+            return None
+        return FailedActionHandle
+
+    def get_results(self, ah):
+        """Return the ``SolverResults`` of ``ah``, waiting for it if needed, after loading its solution into the queued model."""
+        while ah.id in self._running:
+            self._receive()
+        if ah.status == ActionStatus.error:
+            raise ActionManagerError(f"Subproblem solve failed:\n{ah.explanation}")
+        if ah.id in self._finished:
+            self._finished.remove(ah.id)
+        results = super().get_results(ah)
+        model, payload = self._loaded.pop(ah.id, (None, None))
+        if payload is not None:
+            for name, values in payload["values"].items():
+                component = model.find_component(name)
+                for index, value in values.items():
+                    component[index].set_value(value, skip_validation=True)
+            if payload["duals"] and hasattr(model, "dual"):
+                for (name, index), value in payload["duals"].items():
+                    model.dual[model.find_component(name)[index]] = value
+        return results
+
+    def shutdown(self) -> None:
+        """Stop any worker still running; safe to call more than once."""
+        for process, conn in self._running.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            conn.close()
+        self._running.clear()
+
+    def __exit__(self, t, v, traceback):
+        self.shutdown()
+
+
+def parallel_manager():
+    """Solver manager for ``StageSolve`` mode 0: ``'otepes_fork'`` sized from the thread budget, or ``'serial'`` where fork is missing."""
+    if sys.platform == "win32":
+        return SolverManagerFactory("serial")
+    budget    = _threads()
+    n_workers = min(subproblem_workers() or budget, budget)
+    return SolverManager_Fork(n_workers=n_workers, threads=max(1, budget // n_workers))
@@ -12,11 +12,13 @@ from   pyomo.opt     import SolverFactory
 try:
     from . import openTEPES_ProblemSolvingStageSolve   as oSS
     from . import openTEPES_ModelFormulationInvestment as oMFI
+    from .openTEPES_ProblemSolvingCutPool import Cut
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from openTEPES import openTEPES_ProblemSolvingStageSolve   as oSS
     from openTEPES import openTEPES_ModelFormulationInvestment as oMFI
+    from openTEPES.openTEPES_ProblemSolvingCutPool import Cut
 
 
 def StageDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st, _path, pIndCycleFlow):
@@ -102,6 +104,18 @@ def StageDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogC
     Z_Lower = float('-inf')
     Z_Upper = float('inf' )
 
+    # opt-in: the cuts of a previous run of this stage are cut again at their origins; in the first iterations the master is fixed there
+    pCutPools    = getattr(mTEPES, 'pCutPools', None)
+    pCutPoolName = f'stage_{p}_{sc}_{st}'
+    pCutVars     = ([mMaster.vGenerationInvest[pp,gc] for pp,gc in mTEPES.pgc] + [mMaster.vGenerationRetire[pp,gd] for pp,gd in mTEPES.pgd] +
+                    [mMaster.vNetworkInvest[pp,ni,nf,cc] for pp,ni,nf,cc in mTEPES.plc])
+    pCutKeys     = [(var.parent_component().local_name, var.index()) for var in pCutVars]
+    pWarmOrigins = []
+    if pCutPools is not None:
+        pCutPool     = pCutPools.pool(pCutPoolName, bounds={key: (0.0, 1.0) for key in pCutKeys})
+        pWarmOrigins = pCutPool.origins(pCutKeys)[:len(mMaster.itBd)-1]
+        pCutPool.clear()
+
     # Benders algorithm
     mMaster.vTheta.fix(0)
     itBdFinal = 0
@@ -125,9 +139,20 @@ def StageDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogC
 
             # in normal Benders iterations
             if itBdFinal < oSS.FINAL_ITERATION:
-                # solving master problem
+                # solving master problem, at a stored origin in the first iterations of a warm restart
+                pWarmFixed = []
+                if itBd <= len(pWarmOrigins):
+                    pWarmFixed = [var for var in pCutVars if not var.fixed]
+                    for var, key in zip(pCutVars, pCutKeys):
+                        if not var.fixed:
+                            var.fix(pWarmOrigins[itBd-1][key] if var.is_continuous() else round(pWarmOrigins[itBd-1][key]))
                 Solver.solve(mMaster)
+                for var in pWarmFixed:
+                    var.unfix()
                 pTotalSCost      = mMaster.vTotalSCost()
+                # count the master solves each stored cut is slack at
+                if pCutPools is not None and itBd > len(pWarmOrigins) and itBd > 1:
+                    pCutPool.observe({key: var() for key, var in zip(pCutKeys, pCutVars)}, {'operation': mMaster.vTheta()})
 
                 # storing the master solution and fixing investment decision for the subproblem
                 # the loop variables are pp (not p) on purpose: p is the function argument and names the master log/lp files of this (p,sc,st)
@@ -176,8 +201,8 @@ def StageDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogC
             print('Iteration         ', itBd, ' Lower bound [MEUR]  ... ', Z_Lower)
             print('Iteration         ', itBd, ' Upper bound [MEUR]  ... ', Z_Upper)
 
-            # after convergence allow a final iteration with the optimal solution of the master problem
-            if abs(1 - Z_Lower/Z_Upper) < mTEPES.pBdTol and itBd > 1 and itBdFinal < oSS.FINAL_ITERATION:
+            # after convergence allow a final iteration with the optimal solution of the master problem; a master fixed at a stored origin is no lower bound
+            if abs(1 - Z_Lower/Z_Upper) < mTEPES.pBdTol and itBd > max(1, len(pWarmOrigins)) and itBdFinal < oSS.FINAL_ITERATION:
                 itBdFinal  = oSS.FINAL_ITERATION
                 print('Iteration Final   ', itBdFinal)
             else:
@@ -192,6 +217,14 @@ def StageDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogC
             for pp,ni,nf,cc in mTEPES.plc:
                 pNetworkInvestMarginalCap_it [itBd,pp,ni,nf,cc] = mTEPES.pNetworkInvestMarginalCap [pp,ni,nf,cc]()
 
+            # the cut of this iteration, vTheta >= operation cost + sum(marginal * (decision - its value)), with the decisions it was cut at
+            if pCutPools is not None:
+                pCutMarginals = ([pGenerationInvestMarginalG_it[itBd,pp,gc] for pp,gc in mTEPES.pgc] + [pGenerationInvestMarginalR_it[itBd,pp,gd] for pp,gd in mTEPES.pgd] +
+                                 [pNetworkInvestMarginalCap_it[itBd,pp,ni,nf,cc] for pp,ni,nf,cc in mTEPES.plc])
+                pCutOrigin    = ([pGenerationInvest[itBd,pp,gc] for pp,gc in mTEPES.pgc] + [pGenerationRetire[itBd,pp,gd] for pp,gd in mTEPES.pgd] +
+                                 [pNetworkInvest[itBd,pp,ni,nf,cc] for pp,ni,nf,cc in mTEPES.plc])
+                pCutPool.add(Cut.at('operation', pTotalOCost, dict(zip(pCutKeys, pCutMarginals)), dict(zip(pCutKeys, pCutOrigin)), itBd))
+
             # delete Benders cuts because they are regenerated in each iteration
             if itBd > 1:
                 mMaster.del_component(mMaster.eBd_Cuts)
@@ -202,6 +235,11 @@ def StageDecomposition(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogC
             # for iter in mMaster.iter:
             #     Solver.set_linear_constraint_attr(mMaster.eBd_Cuts[iter], 'Lazy', 1)
     
+    # keep the cuts binding at the last master solution, and the last one, for the next run
+    if pCutPools is not None:
+        pCutPool.purge(max_idle=0)
+        pCutPools.save(pCutPoolName, pCutPool)
+
     SolvingTime = time.time() - FuncStartTime
     print('Time Benders decomposition             ... ', round(SolvingTime), 's')
     
@@ -15,6 +15,23 @@ Two solve paths are preserved exactly as they were inside ``openTEPES_run``:
 After the loop it rebuilds the full stage / load-level sets, reactivates every constraint, and restores the scenario probabilities so the output
 writers report the intended (per-scenario sum, or expected-value) cost.
 
+With ``--parallel-stages`` (``OTEPES_PARALLEL_STAGES``) the first path hands each stage of a period marked ``IndependentStages`` to a forked
+worker (``openTEPES_ProblemSolvingParallelStages``) and formulates the next stage while it solves; the workers' solutions are merged back in
+stage order before the full sets are rebuilt.
+
+With ``--retire-stages`` (``OTEPES_RETIRE_STAGES``) each stage solved on its own is deleted from the model once its solution is in, keeping
+only what the output writers read from its constraints (``openTEPES_ProblemSolvingStageRetirement``).
+
+With ``--checkpoint`` (``OTEPES_CHECKPOINT``) each solve in the parent, one stage or the joint one, is checkpointed right after it, and with
+``--resume`` (``OTEPES_RESUME``) the stages of an interrupted run that have a checkpoint are loaded instead of solved
+(``openTEPES_ProblemSolvingCheckpoint``); the decomposition paths are not checkpointed.
+
+With ``--stage-warm-start`` (``OTEPES_STAGE_WARM_START``) each stage solved on its own in the parent starts its MIP from the commitment of the
+stage before it (``openTEPES_ProblemSolvingWarmStart``).
+
+With ``--stream-results`` (``OTEPES_STREAM_RESULTS``) the hourly tables of each stage solved on its own are appended to the result files once its
+solution is in (``openTEPES_OutputResultsStream``).
+
 This is a pure move out of ``openTEPES_run`` — the loop body is unchanged, so results are identical. It sets up the seam that later
 orchestration drivers (Mode C re-solve, sector / time decomposition) build on.
 """
@@ -30,6 +47,7 @@ from   pyomo.environ import Set
 # Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
 # relative imports below have no parent package; fall back to absolute package imports in that case.
 try:
+    from .openTEPES_ConstraintRegistry                import StageConstraints
     from .openTEPES_ModelFormulationObjective         import GenerationOperationModelFormulationObjFunct
     from .openTEPES_ModelFormulationInvestment        import GenerationOperationElecModelFormulationInvestment, GenerationOperationHeatModelFormulationInvestment
     from .openTEPES_ModelFormulationElectricity       import GenerationOperationModelFormulationDemand, GenerationOperationModelFormulationStorage, GenerationOperationModelFormulationCommitment, GenerationOperationModelFormulationRampMinTime, NetworkSwitchingModelFormulation, NetworkOperationModelFormulation, NetworkCycles, CycleConstraints
@@ -37,11 +55,18 @@ try:
     from .openTEPES_ModelFormulationHydrogen          import NetworkH2OperationModelFormulation
     from .openTEPES_ModelFormulationHeat              import NetworkHeatOperationModelFormulation
     from .openTEPES_ProblemSolving                    import ProblemSolving
+    from .openTEPES_ProblemSolvingParallelStages      import StageDispatcher
     from .openTEPES_ProblemSolvingSectorDecomposition import SectorDecomposition
     from .openTEPES_ProblemSolvingStageDecomposition   import StageDecomposition
+    from .openTEPES_ProblemSolvingStageRetirement     import RetiredStages, RetireStage, enabled as retire_stages
+    from .openTEPES_OutputResultsStream               import StreamStage
+    from .openTEPES_ProblemSolvingCheckpoint          import CheckpointStage, RestoreStage
+    from .openTEPES_ProblemSolvingWarmStart           import WarmStartStage
+    from .openTEPES_StageIndex                        import ActivateStageSets, ActivateAllStageSets
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ConstraintRegistry                import StageConstraints
     from openTEPES.openTEPES_ModelFormulationObjective         import GenerationOperationModelFormulationObjFunct
     from openTEPES.openTEPES_ModelFormulationInvestment        import GenerationOperationElecModelFormulationInvestment, GenerationOperationHeatModelFormulationInvestment
     from openTEPES.openTEPES_ModelFormulationElectricity       import GenerationOperationModelFormulationDemand, GenerationOperationModelFormulationStorage, GenerationOperationModelFormulationCommitment, GenerationOperationModelFormulationRampMinTime, NetworkSwitchingModelFormulation, NetworkOperationModelFormulation, NetworkCycles, CycleConstraints
@@ -49,20 +74,32 @@ except ImportError:
     from openTEPES.openTEPES_ModelFormulationHydrogen          import NetworkH2OperationModelFormulation
     from openTEPES.openTEPES_ModelFormulationHeat              import NetworkHeatOperationModelFormulation
     from openTEPES.openTEPES_ProblemSolving                    import ProblemSolving
+    from openTEPES.openTEPES_ProblemSolvingParallelStages      import StageDispatcher
     from openTEPES.openTEPES_ProblemSolvingSectorDecomposition import SectorDecomposition
     from openTEPES.openTEPES_ProblemSolvingStageDecomposition   import StageDecomposition
+    from openTEPES.openTEPES_ProblemSolvingStageRetirement     import RetiredStages, RetireStage, enabled as retire_stages
+    from openTEPES.openTEPES_OutputResultsStream               import StreamStage
+    from openTEPES.openTEPES_ProblemSolvingCheckpoint          import CheckpointStage, RestoreStage
+    from openTEPES.openTEPES_ProblemSolvingWarmStart           import WarmStartStage
+    from openTEPES.openTEPES_StageIndex                        import ActivateStageSets, ActivateAllStageSets
 
 
 def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole, _path, pIndCycleFlow):
     """Run the per-stage formulate-and-solve loop in place on ``mTEPES``.
 
     ``mTEPES`` must already carry the objective, the investment constraints, ``First_st`` / ``Last_st`` and an
-    initialized ``pDuals`` dict (all set up by ``openTEPES_run`` before this call). ``_path`` is the case path
+    initialized ``pDuals`` ``DualStore`` (all set up by ``openTEPES_run`` before this call). ``_path`` is the case path
     used for optional LP-file dumps; ``pIndCycleFlow`` toggles the cycle-flow network formulation.
     """
     # initialize the set of load levels up to the current stage
     mTEPES.na = Set(initialize=[])
 
+    # opt-in (default OFF): solve independent stages in forked workers while the next stage is formulated
+    _dispatcher = StageDispatcher.create(mTEPES)
+
+    # opt-in (default OFF): retire each independently solved stage from the model, keeping the slacks the output writers read
+    mTEPES.pRetiredStages = RetiredStages() if retire_stages() else None
+
     # iterative model formulation for each stage of a year
     for p,sc,st in mTEPES.ps*mTEPES.stt:
 
@@ -70,31 +107,7 @@ def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
         mTEPES.NoRepetition = 0
 
         # activate only load levels to formulate
-        mTEPES.del_component(mTEPES.st)
-        mTEPES.del_component(mTEPES.n )
-        mTEPES.del_component(mTEPES.n2)
-        mTEPES.st = Set(doc='stages',      initialize=[stt for stt in mTEPES.stt if st == stt and mTEPES.pStageWeight[stt] and sum(1 for nn in mTEPES.nn if (p,sc,stt,nn) in mTEPES.s2n)])
-        mTEPES.n  = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                                                     (p,sc,st,nn) in mTEPES.s2n ])
-        mTEPES.n2 = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                                                     (p,sc,st,nn) in mTEPES.s2n ])
-
-        # load levels multiple of cycles for each ESS/generator
-        mTEPES.nesc         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [es] == 0]
-        mTEPES.necc         = [(n,ec) for n,ec in mTEPES.n*mTEPES.ec if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [ec] == 0]
-        mTEPES.neso         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pOutflowsTimeStep[es] == 0]
-        mTEPES.ngen         = [(n,g ) for n,g  in mTEPES.n*mTEPES.g  if mTEPES.n.ord(n) %     mTEPES.pEnergyTimeStep  [g ] == 0]
-        if mTEPES.pIndHydroTopology():
-            mTEPES.nhc      = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2h) == 0]
-            if mTEPES.p2r:
-                mTEPES.np2c = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if sum(1 for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) == 0]
-            else:
-                mTEPES.np2c = []
-            if mTEPES.r2p:
-                mTEPES.npc  = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if sum(1 for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) == 0]
-            else:
-                mTEPES.npc = []
-            mTEPES.nrsc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-            mTEPES.nrcc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rn if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-            mTEPES.nrso     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pWaterOutTimeStep [rs] == 0]
+        ActivateStageSets(mTEPES, p, sc, st)
 
         if mTEPES.st:
 
@@ -158,13 +171,30 @@ def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
 
                     # there are no expansion decisions, or they are ignored (it is an operation model), or there are no system emission or minimum RES constraints
                     mTEPES.pScenProb[p,sc] = 1.0
-                    ProblemSolving(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, mTEPES.p.ord(p)*mTEPES.sc.ord(sc)*mTEPES.st.ord(st))
+                    # opt-in: a resumed run loads the checkpoint of a stage already solved instead of solving it again
+                    _restored   = (p,sc,st) in (getattr(mTEPES, 'pCheckpoints', None) or ())
+                    _dispatched = _dispatcher is not None and mTEPES.IndependentStages[p]() and not _restored
+                    if _dispatched:
+                        _dispatcher.submit(DirName, CaseName, SolverName, mTEPES, pIndLogConsole, p, sc, st, mTEPES.p.ord(p)*mTEPES.sc.ord(sc)*mTEPES.st.ord(st))
+                    elif _restored:
+                        # merged in stage order, after the stages still solving in the workers
+                        if _dispatcher is not None:
+                            _dispatcher.drain(mTEPES)
+                        RestoreStage(mTEPES, p, sc, st)
+                    else:
+                        # opt-in: the MIP of the stage starts from the commitment of the stage before it
+                        WarmStartStage(mTEPES, mTEPES, p, sc, st)
+                        with CheckpointStage(mTEPES, p, sc, st):
+                            ProblemSolving(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, mTEPES.p.ord(p)*mTEPES.sc.ord(sc)*mTEPES.st.ord(st))
                     mTEPES.pScenProb[p,sc] = 0.0
 
                     # deactivate the constraints of the previous period and scenario
-                    for c in mTEPES.component_objects(pyo.Constraint, active=True):
-                        if f'_{p}_{sc}_' in c.name:
-                            c.deactivate()
+                    StageConstraints(mTEPES).deactivate(p, sc)
+                    # opt-in: stream the hourly results of the solved stage and delete it from the model (a stage solved in a worker is streamed
+                    # and retired when its solution is merged)
+                    if not _dispatched:
+                        StreamStage(mTEPES, p, sc, st)
+                        RetireStage(mTEPES, p, sc, st)
 
                 # Minimum RES requirements or emission limit
                 elif (max([mTEPES.pRESEnergy[p,ar]() for ar in mTEPES.ar]) > 0 or (min([mTEPES.pEmission [p,ar] for ar in mTEPES.ar]) < math.inf and any(mTEPES.pEmissionRate[nr] for nr in mTEPES.nr))):
@@ -174,31 +204,7 @@ def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
                         if (p,sc) == mTEPES.ps.last():
                             mTEPES.NoRepetition = 1
 
-                        mTEPES.del_component(mTEPES.st)
-                        mTEPES.del_component(mTEPES.n )
-                        mTEPES.del_component(mTEPES.n2)
-                        mTEPES.st = Set(doc='stages',      initialize=[stt for stt in mTEPES.stt if mTEPES.pStageWeight[stt] and sum(1 for pp,scc,stt2,nn in mTEPES.s2n if stt2 == stt)])
-                        mTEPES.n  = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                              sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st, nn) in mTEPES.s2n)])
-                        mTEPES.n2 = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                              sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st, nn) in mTEPES.s2n)])
-
-                        # load levels multiple of cycles for each ESS/generator
-                        mTEPES.nesc         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [es] == 0]
-                        mTEPES.necc         = [(n,ec) for n,ec in mTEPES.n*mTEPES.ec if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [ec] == 0]
-                        mTEPES.neso         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pOutflowsTimeStep[es] == 0]
-                        mTEPES.ngen         = [(n,g ) for n,g  in mTEPES.n*mTEPES.g  if mTEPES.n.ord(n) %     mTEPES.pEnergyTimeStep  [g ] == 0]
-                        if mTEPES.pIndHydroTopology():
-                            mTEPES.nhc      = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2h) == 0]
-                            if mTEPES.p2r:
-                                mTEPES.np2c = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if sum(1 for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) == 0]
-                            else:
-                                mTEPES.np2c = []
-                            if mTEPES.r2p:
-                                mTEPES.npc  = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if sum(1 for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) == 0]
-                            else:
-                                mTEPES.npc  = []
-                            mTEPES.nrsc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-                            mTEPES.nrcc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rn if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-                            mTEPES.nrso     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pWaterOutTimeStep [rs] == 0]
+                        ActivateAllStageSets(mTEPES)
 
                         # Writing an LP file
                         if pIndLogConsole:
@@ -208,19 +214,22 @@ def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
                             StartTime         = time.time()
                             print('Writing LP file                        ... ', round(WritingLPFileTime), 's')
 
+                        # the joint solve must see the model the sequential loop would have left behind
+                        if _dispatcher is not None:
+                            _dispatcher.drain(mTEPES)
+
                         mTEPES.pScenProb[p,sc] = 1.0
                         # there are system emission or RES requirement constraints
                         if mTEPES.pIndSectorDecomposition() and len(mTEPES.psnel):
                             ProblemSolving     (DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, 1)
                             SectorDecomposition(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st   )
-                        else:
-                            ProblemSolving     (DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, mTEPES.p.ord(p)*mTEPES.sc.ord(sc)*mTEPES.st.ord(st))
+                        elif not RestoreStage(mTEPES, p, sc, st):
+                            with CheckpointStage(mTEPES, p, sc, st, joint=True):
+                                ProblemSolving (DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, mTEPES.p.ord(p)*mTEPES.sc.ord(sc)*mTEPES.st.ord(st))
                         mTEPES.pScenProb[p,sc] = 0.0
 
                         # deactivate the constraints of the previous period and scenario
-                        for c in mTEPES.component_objects(pyo.Constraint, active=True):
-                            if f'_{p}_{sc}_' in c.name:
-                                c.deactivate()
+                        StageConstraints(mTEPES).deactivate(p, sc)
 
             # generator investments or generator retirements, or line investments
             elif (  (sum(1 for pp,eb       in mTEPES.peb if pp <= p) > 0 and mTEPES.pIndBinGenInvest()     < 2)
@@ -233,31 +242,7 @@ def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
                     if (p,sc) == mTEPES.ps.last() and st == mTEPES.Last_st and mTEPES.NoRepetition == 0:
                         mTEPES.NoRepetition = 1
 
-                        mTEPES.del_component(mTEPES.st)
-                        mTEPES.del_component(mTEPES.n )
-                        mTEPES.del_component(mTEPES.n2)
-                        mTEPES.st = Set(doc='stages',      initialize=[stt for stt in mTEPES.stt if mTEPES.pStageWeight[stt] and sum(1 for pp,scc,stt2,nn in mTEPES.s2n if stt2 == stt)])
-                        mTEPES.n  = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                              sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st, nn) in mTEPES.s2n)])
-                        mTEPES.n2 = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                              sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st, nn) in mTEPES.s2n)])
-
-                        # load levels multiple of cycles for each ESS/generator
-                        mTEPES.nesc         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [es] == 0]
-                        mTEPES.necc         = [(n,ec) for n,ec in mTEPES.n*mTEPES.ec if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [ec] == 0]
-                        mTEPES.neso         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pOutflowsTimeStep[es] == 0]
-                        mTEPES.ngen         = [(n,g ) for n,g  in mTEPES.n*mTEPES.g  if mTEPES.n.ord(n) %     mTEPES.pEnergyTimeStep  [g ] == 0]
-                        if mTEPES.pIndHydroTopology():
-                            mTEPES.nhc      = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2h) == 0]
-                            if mTEPES.p2r:
-                                mTEPES.np2c = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if len([rs for rs in mTEPES.rs if (h,rs) in mTEPES.p2r]) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) == 0]
-                            else:
-                                mTEPES.np2c = []
-                            if mTEPES.r2p:
-                                mTEPES.npc  = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if len([rs for rs in mTEPES.rs if (rs,h) in mTEPES.r2p]) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) == 0]
-                            else:
-                                mTEPES.npc  = []
-                            mTEPES.nrsc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-                            mTEPES.nrcc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rn if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-                            mTEPES.nrso     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pWaterOutTimeStep [rs] == 0]
+                        ActivateAllStageSets(mTEPES)
 
                         # Writing an LP file
                         if pIndLogConsole:
@@ -273,35 +258,17 @@ def StageIterativeSolving(mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
                             SectorDecomposition  (DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st   )
                         else:
                             if mTEPES.pIndCompleteProblem() == 1:
-                                ProblemSolving   (DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, 1)
+                                if not RestoreStage(mTEPES, p, sc, st):
+                                    with CheckpointStage(mTEPES, p, sc, st, joint=True):
+                                        ProblemSolving(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, 1)
                             else:
                                 StageDecomposition(DirName, CaseName, SolverName, mTEPES, mTEPES, pIndLogConsole, p, sc, st, _path, pIndCycleFlow)
 
-    mTEPES.del_component(mTEPES.st)
-    mTEPES.del_component(mTEPES.n )
-    mTEPES.del_component(mTEPES.n2)
-    mTEPES.st = Set(doc='stages',      initialize=[stt for stt in mTEPES.stt if mTEPES.pStageWeight[stt] and sum(1 for pp,scc,stt2,nn in mTEPES.s2n if stt2 == stt)])
-    mTEPES.n  = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                              sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st, nn) in mTEPES.s2n)])
-    mTEPES.n2 = Set(doc='load levels', initialize=[nn  for nn  in mTEPES.nn  if                              sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st, nn) in mTEPES.s2n)])
-
-    # load levels multiple of cycles for each ESS/generator
-    mTEPES.nesc         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [es] == 0]
-    mTEPES.necc         = [(n,ec) for n,ec in mTEPES.n*mTEPES.ec if mTEPES.n.ord(n) %     mTEPES.pStorageTimeStep [ec] == 0]
-    mTEPES.neso         = [(n,es) for n,es in mTEPES.n*mTEPES.es if mTEPES.n.ord(n) %     mTEPES.pOutflowsTimeStep[es] == 0]
-    mTEPES.ngen         = [(n,g ) for n,g  in mTEPES.n*mTEPES.g  if mTEPES.n.ord(n) %     mTEPES.pEnergyTimeStep  [g ] == 0]
-    if mTEPES.pIndHydroTopology():
-        mTEPES.nhc      = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2h) == 0]
-        if mTEPES.p2r:
-            mTEPES.np2c = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if len([rs for rs in mTEPES.rs if (h,rs) in mTEPES.p2r]) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) == 0]
-        else:
-            mTEPES.np2c = []
-        if mTEPES.r2p:
-            mTEPES.npc  = [(n,h ) for n,h  in mTEPES.n*mTEPES.h  if len([rs for rs in mTEPES.rs if (rs,h) in mTEPES.r2p]) and mTEPES.n.ord(n) % sum(mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) == 0]
-        else:
-            mTEPES.npc  = []
-        mTEPES.nrsc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-        mTEPES.nrcc     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rn if mTEPES.n.ord(n) %     mTEPES.pReservoirTimeStep[rs] == 0]
-        mTEPES.nrso     = [(n,rs) for n,rs in mTEPES.n*mTEPES.rs if mTEPES.n.ord(n) %     mTEPES.pWaterOutTimeStep [rs] == 0]
+    # merge the stages still solving in the workers before the full sets are rebuilt
+    if _dispatcher is not None:
+        _dispatcher.drain(mTEPES)
+
+    ActivateAllStageSets(mTEPES)
 
     # activate the constraints of all the periods and scenarios
     for c in mTEPES.component_objects(pyo.Constraint):
@@ -0,0 +1,87 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingStageRetirement — opt-in retirement of the solved stages from the model (default OFF).
+
+When the stages of a period are solved one by one (no expansion decisions, no system emission / RES-energy limit), ``StageIterativeSolving``
+deactivates the constraints of each stage after its solve but keeps them on ``mTEPES`` until the run ends, so the memory of the model grows
+with the horizon although no later solve reads them. With ``--retire-stages`` / ``OTEPES_RETIRE_STAGES`` set, each stage is retired as soon
+as its solution is on the model (right after its solve, or when a ``--parallel-stages`` worker's payload is merged):
+
+  * the slacks of the constraint families the output writers read (``SLACK_FAMILIES``) are copied into ``mTEPES.pRetiredStages``, a
+    ``RetiredStages`` store holding one numpy array per constraint component next to its index keys, like the ``DualStore``;
+  * every constraint component of the stage is deleted from the model and dropped from the constraint registry, so it can be freed.
+
+The duals of the stage are already in ``mTEPES.pDuals`` and the variables are shared by all the stages, so the writers read them as before;
+they read the ramp slacks through ``stage_slack``, which serves a retired stage from the store. A run with retired stages cannot be re-solved
+with ``resolve``, since the model no longer holds the constraints of those stages. The joint solve paths formulate every stage before their
+single solve, so they retire nothing.
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_ConstraintRegistry           import StageConstraints
+    from          .openTEPES_ProblemSolvingDualExtraction import DualStore
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ConstraintRegistry           import StageConstraints
+    from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore
+
+# constraint families whose slacks the output writers read after the run (the ramp surplus of OutputResultsGeneration)
+SLACK_FAMILIES = ('eRampUp', 'eRampDw')
+
+
+def enabled() -> bool:
+    """True when the opt-in stage retirement is switched on via ``--retire-stages`` / ``OTEPES_RETIRE_STAGES``."""
+    return os.environ.get("OTEPES_RETIRE_STAGES", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class RetiredStages:
+    """The stages deleted from the model, and the slacks of their ``SLACK_FAMILIES`` constraints keyed by ``(p, sc, st) + index``."""
+
+    def __init__(self):
+        self._stages = set()
+        self.slacks  = DualStore()
+
+    def __contains__(self, stage) -> bool:
+        return tuple(stage) in self._stages
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def slack(self, family, p, sc, st, index) -> float:
+        return self.slacks[family, (p,sc,st) + (index if type(index) is tuple else (index,))]
+
+    def retire(self, OptModel, p, sc, st) -> None:
+        """Copy the slacks of stage ``(p, sc, st)`` into the store and delete its constraint components from ``OptModel``."""
+        registry = StageConstraints(OptModel)
+        for family in SLACK_FAMILIES:
+            constraint = registry.get(family, p, sc, st)
+            if constraint is not None and len(constraint):
+                self.slacks.add(family, (p,sc,st), constraint.keys(), np.fromiter((data.slack() for data in constraint.values()), dtype=float, count=len(constraint)))
+        for constraint in registry.stage(p, sc, st):
+            OptModel.del_component(constraint)
+        registry.discard(p, sc, st)
+        self._stages.add((p,sc,st))
+
+
+def RetireStage(OptModel, p, sc, st) -> None:
+    """Retire stage ``(p, sc, st)`` into ``OptModel.pRetiredStages`` when the opt-in is on; does nothing otherwise."""
+    retired = getattr(OptModel, 'pRetiredStages', None)
+    if retired is not None:
+        retired.retire(OptModel, p, sc, st)
+
+
+def stage_slack(OptModel, family, p, sc, st, index) -> float:
+    """Slack of ``{family}_{p}_{sc}_{st}[index]``, from the store when the stage was retired."""
+    retired = getattr(OptModel, 'pRetiredStages', None)
+    if retired is not None and (p,sc,st) in retired:
+        return retired.slack(family, p, sc, st, index)
+    return getattr(OptModel, f'{family}_{p}_{sc}_{st}')[index].slack()
@@ -2,33 +2,41 @@
 Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - August 16, 2026
 """
 
+import contextlib
 import os
 import time
-import psutil
 import pandas              as     pd
 import pyomo.environ       as     pyo
 from   pyomo.environ       import Set, Param, Objective, minimize, TerminationCondition
 from   pyomo.opt           import SolverFactory
-from   pyomo.opt.parallel  import SolverManagerFactory
+from   pyomo.opt.parallel.manager import ActionStatus
 from   pyomo.contrib       import appsi
 from   pyomo.common.timing import HierarchicalTimer
 
 # Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
 # relative imports below have no parent package; fall back to absolute package imports in that case.
 try:
+    from          .openTEPES_ConstraintRegistry          import StageConstraints
     from          .openTEPES_ModelFormulationInvestment  import GenerationOperationElecModelFormulationInvestment, GenerationOperationHeatModelFormulationInvestment
     from          .openTEPES_ModelFormulationElectricity import GenerationOperationModelFormulationDemand, GenerationOperationModelFormulationStorage, GenerationOperationModelFormulationCommitment, GenerationOperationModelFormulationRampMinTime, NetworkSwitchingModelFormulation, NetworkOperationModelFormulation, NetworkCycles, CycleConstraints
     from          .openTEPES_ModelFormulationHydro       import GenerationOperationModelFormulationReservoir
     from          .openTEPES_ModelFormulationHydrogen    import NetworkH2OperationModelFormulation
     from          .openTEPES_ModelFormulationHeat        import NetworkHeatOperationModelFormulation
+    from          .openTEPES_ProblemSolvingSolverManager import parallel_manager
+    from          .openTEPES_ProblemSolvingTuning        import _threads
+    from          .openTEPES_StageIndex                  import ActivateAllStageSets
 except ImportError:
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_ConstraintRegistry          import StageConstraints
     from openTEPES.openTEPES_ModelFormulationInvestment  import GenerationOperationElecModelFormulationInvestment, GenerationOperationHeatModelFormulationInvestment
     from openTEPES.openTEPES_ModelFormulationElectricity import GenerationOperationModelFormulationDemand, GenerationOperationModelFormulationStorage, GenerationOperationModelFormulationCommitment, GenerationOperationModelFormulationRampMinTime, NetworkSwitchingModelFormulation, NetworkOperationModelFormulation, NetworkCycles, CycleConstraints
     from openTEPES.openTEPES_ModelFormulationHydro       import GenerationOperationModelFormulationReservoir
     from openTEPES.openTEPES_ModelFormulationHydrogen    import NetworkH2OperationModelFormulation
     from openTEPES.openTEPES_ModelFormulationHeat        import NetworkHeatOperationModelFormulation
+    from openTEPES.openTEPES_ProblemSolvingSolverManager import parallel_manager
+    from openTEPES.openTEPES_ProblemSolvingTuning        import _threads
+    from openTEPES.openTEPES_StageIndex                  import ActivateAllStageSets
 
 timer = HierarchicalTimer()
 
@@ -48,17 +56,11 @@ STAGE_PARAMS = (
 )
 
 def RebuildStageAndLoadLevelSets(mTEPES):
-    # rebuild the active stage set (st) and the load-level sets (n, n2) from s2n; shared by the per-stage loop and the final reactivation
-    mTEPES.del_component(mTEPES.st)
-    mTEPES.del_component(mTEPES.n )
-    mTEPES.del_component(mTEPES.n2)
-    mTEPES.st = Set(doc='stages',      initialize=[stt for stt in mTEPES.stt if mTEPES.pStageWeight[stt] and sum(1 for pp,scc,stt2,nn in mTEPES.s2n if stt2 == stt)])
-    ActiveLoadLevels = [nn for nn in mTEPES.nn if sum(1 for p,sc,st in mTEPES.ps*mTEPES.st if (p,sc,st,nn) in mTEPES.s2n)]
-    mTEPES.n  = Set(doc='load levels', initialize=ActiveLoadLevels)
-    mTEPES.n2 = Set(doc='load levels', initialize=ActiveLoadLevels)
-
-def ApplyGurobiSubproblemOptions(Solver, SolverName, LogFile):
-    # per-subproblem Gurobi options shared by the parallel and LP-file solving paths
+    # put the active stage set (st) and the load-level sets (n, n2) of all the stages, cached by the stage index, back on the model; shared by the per-stage loop and the final reactivation
+    ActivateAllStageSets(mTEPES, subsets=False)
+
+def ApplyGurobiSubproblemOptions(Solver, SolverName, LogFile, Threads=None):
+    # per-subproblem Gurobi options shared by the parallel and LP-file solving paths; the parallel path passes each worker's slice of the threads
     if SolverName == 'gurobi':
         Solver.options['OutputFlag'] =  0
         Solver.options['LogFile'   ] = LogFile
@@ -66,21 +68,25 @@ def ApplyGurobiSubproblemOptions(Solver, SolverName, LogFile):
         Solver.options['Presolve'  ] =  2
         Solver.options['Crossover' ] = -1
         Solver.options['BarConvTol'] =  1e-9
-        Solver.options['Threads'   ] =  int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2)
+        Solver.options['Threads'   ] =  Threads or _threads()
 
 def AccumulateBendersDuals(OptModel, mTEPES, p, sc, StageLabel, LoadLevels, MarginalG, MarginalR, MarginalE, MarginalCap):
     # accumulate the shadow prices of the investment-linking constraints for the Benders cuts; shared by the stage-loop and sensitivity paths
+    def Duals(Name, *Index):
+        # a linking constraint skipped for a unit or a load level (e.g. no commitment) has no dual, which counts as zero
+        Con = getattr(OptModel, f'{Name}_{p}_{sc}_{StageLabel}')
+        return sum(OptModel.dual[Con[n,*Index]] for n in LoadLevels if (n,*Index) in Con)
     for gc       in mTEPES.gc:
-        MarginalG  [p,gc      ] += sum(OptModel.dual[getattr(OptModel, f'eInstallGenComm_{p}_{sc}_{StageLabel}')  [n,gc]] + OptModel.dual[getattr(OptModel, f'eInstallGenCap_{p}_{sc}_{StageLabel}')[n,gc]] for n in LoadLevels)
+        MarginalG  [p,gc      ] += Duals('eInstallGenComm',   gc) + Duals('eInstallGenCap',   gc)
         mTEPES.pGenerationInvestMarginalG[p,gc      ]  = MarginalG  [p,gc     ]
     for gd       in mTEPES.gd:
-        MarginalR  [p,gd      ] += sum(OptModel.dual[getattr(OptModel, f'eUninstallGenComm_{p}_{sc}_{StageLabel}')[n,gd]] + OptModel.dual[getattr(OptModel, f'eUninstallGenCap_{p}_{sc}_{StageLabel}')[n,gd]] for n in LoadLevels)
+        MarginalR  [p,gd      ] += Duals('eUninstallGenComm', gd) + Duals('eUninstallGenCap', gd)
         mTEPES.pGenerationInvestMarginalR[p,gd      ]  = MarginalR  [p,gd     ]
     for ec       in mTEPES.ec:
-        MarginalE  [p,ec      ] += sum(OptModel.dual[getattr(OptModel, f'eInstallConESS_{p}_{sc}_{StageLabel}')   [n,ec]]                                                                            for n in LoadLevels)
+        MarginalE  [p,ec      ] += Duals('eInstallConESS',    ec)
         mTEPES.pGenerationInvestMarginalE[p,ec      ]  = MarginalE  [p,ec     ]
     for ni,nf,cc in mTEPES.lc:
-        MarginalCap[p,ni,nf,cc] += sum(OptModel.dual[getattr(OptModel, f'eLineStateCand_{p}_{sc}_{StageLabel}')[n,ni,nf,cc]]                                                                        for n in LoadLevels)
+        MarginalCap[p,ni,nf,cc] += Duals('eLineStateCand',    ni,nf,cc)
         mTEPES.pNetworkInvestMarginalCap [p,ni,nf,cc]  = MarginalCap[p,ni,nf,cc]
 
 def ReportInfeasible(itBd, p, sc, st):
@@ -106,248 +112,250 @@ def StageSolve(OptModel, mTEPES, DirName, CaseName, SolverName, pIndLogConsole,
 
     pTotalOCost = 0.0
 
-    # the parallel path (pIndSequentialSolving == 0) queues one subproblem per stage into a single, persistent
-    # solver manager; create it and its handle bookkeeping once here instead of recreating them on every iteration
+    # the parallel path (pIndSequentialSolving == 0) queues one subproblem per stage into a single solver manager that runs several of them
+    # at once; the handles are kept in stage order with the stage's load levels, and the results are collected strictly in that order, so the
+    # operation cost and the Benders duals are summed in the same order whichever subproblem finishes first
     if mTEPES.pIndSequentialSolving() == 0:
-        solver_manager    = SolverManagerFactory('serial')
-        action_handle_map = {}
-        action_handles    = []
-
-    # %% iterative solve for each stage of a year
-    for p,sc,st in mTEPES.ps*mTEPES.stt:
-
-        StartTime = time.time()
-
-        # activate only period, scenario, and load levels to formulate
-        RebuildStageAndLoadLevelSets(mTEPES)
-
-        if mTEPES.n:
-            ObjVal = None
-
-            if mTEPES.pIndSequentialSolving() <= 2 or (mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first()) or (mTEPES.pIndSequentialSolving() == 3 and itBdFinal == FINAL_ITERATION):
-
-                if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first() and not hasattr(mTEPES, 'n1'):
-                    # load level of the first stage (created once and reused across Benders iterations)
-                    mTEPES.n1 = Set(initialize=[nn for nn in mTEPES.nn if (p,sc,nn) in mTEPES.pDuration and (p,sc,st,nn) in mTEPES.s2n], ordered=True, doc='load levels')
-
-                if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first() and itBd == 1:
-                    # save all the parameters that depend on load level
-                    for ParamName, IndexSet in STAGE_PARAMS:
-                        setattr(mTEPES, ParamName + '_Saved', Param(getattr(mTEPES, IndexSet), initialize=getattr(mTEPES, ParamName).extract_values()))
-
-                if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first() and itBdFinal == FINAL_ITERATION:
-                    # delete and reload all the parameters that depend on load level from their saved copies
-                    for ParamName, IndexSet in STAGE_PARAMS:
-                        mTEPES.del_component(getattr(mTEPES, ParamName))
-                        setattr(mTEPES, ParamName, Param(getattr(mTEPES, IndexSet), initialize=getattr(mTEPES, ParamName + '_Saved').extract_values()))
-
-                # delete the o.f. of the complete problem
-                if hasattr(mTEPES, 'eTotalSCost'):
-                    mTEPES.del_component(mTEPES.eTotalSCost)
-
-                pScenFactor = {(p,sc): mTEPES.pDiscountedWeight[p] * mTEPES.pScenProb[p,sc]() for p,sc in mTEPES.ps}
-
-                # operation model o.f. by stage; the H2/heat flags do not depend on the tuple, so they select the whole addend instead of being re-evaluated per tuple
-                def eTotalOCost(OptModel):
-                    vTotalOCost = sum(pScenFactor[p,sc] * (OptModel.vTotalGCost    [p,sc,n] +
-                                                           OptModel.vTotalCCost    [p,sc,n] +
-                                                           OptModel.vTotalECost    [p,sc,n] +
-                                                           OptModel.vTotalNCost    [p,sc,n] +
-                                                           OptModel.vTotalRElecCost[p,sc,n]) for p,sc,n in mTEPES.psn)
-                    if mTEPES.pIndHydrogen():
-                        vTotalOCost += sum(pScenFactor[p,sc] * OptModel.vTotalRH2Cost  [p,sc,n] for p,sc,n in mTEPES.psn)
-                    if mTEPES.pIndHeat():
-                        vTotalOCost += sum(pScenFactor[p,sc] * OptModel.vTotalRHeatCost[p,sc,n] for p,sc,n in mTEPES.psn)
-                    return vTotalOCost
-                setattr(OptModel, f'eTotalOCost_{p}_{sc}_{st}', Objective(rule=eTotalOCost, sense=minimize, doc='total system operation cost [MEUR]'))
-
-                if itBd == 1:
-                    # operation model constraints by stage
-                    GenerationOperationElecModelFormulationInvestment    (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    if mTEPES.pIndHeat():
-                        GenerationOperationHeatModelFormulationInvestment(mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    GenerationOperationModelFormulationDemand            (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    GenerationOperationModelFormulationStorage           (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    if mTEPES.pIndHydroTopology():
-                        GenerationOperationModelFormulationReservoir     (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    if mTEPES.pIndHydrogen():
-                        NetworkH2OperationModelFormulation               (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    if mTEPES.pIndHeat():
-                        NetworkHeatOperationModelFormulation             (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    GenerationOperationModelFormulationCommitment        (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    GenerationOperationModelFormulationRampMinTime       (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    NetworkSwitchingModelFormulation                     (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                    NetworkOperationModelFormulation                     (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-
-                    # introduce cycle flow formulations
-                    if pIndCycleFlow == 1:
-                        if st == mTEPES.stt.first():
-                            NetworkCycles                                (        mTEPES, pIndLogConsole           )
-                        CycleConstraints                                 (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
-                else:
-                    # activate all the constraints by stage
-                    for c in OptModel.component_objects(pyo.Constraint):
-                        if c.name.endswith(str(st)):
-                            c.activate()
-
-                # send the problem to the solver
-                if   mTEPES.pIndSequentialSolving() == 0:
-                    Solver = SolverFactory(SolverName, symbolic_solver_labels=False)
-                    ApplyGurobiSubproblemOptions(Solver, SolverName, _path+'/openTEPES_gurobi_Sbp_'+CaseName+'.log')
-                    action_handle = solver_manager.queue(OptModel, opt=Solver, warmstart=False, keepfiles=False, tee=False, load_solutions=True, report_timing=False)
-                    action_handle_map    [action_handle] = f'Period {p} Scenario {sc} Stage {st}'
-                    action_handles.append(action_handle)
-                    # get results from already solved stages
-                    for this_action_handle in action_handles:
-                        SolverResults = solver_manager.get_results(this_action_handle)
-                        if SolverResults is not None:
-                            if SolverResults.solver.termination_condition == TerminationCondition.optimal:
-                                ObjVal = SolverResults.Problem.__getattr__('Lower bound')
-                                pTotalOCost += ObjVal
-                            else:
-                                ReportInfeasible(itBd, p, sc, st)
-                elif mTEPES.pIndSequentialSolving() == 1 or mTEPES.pIndSequentialSolving() == 3:
-                    Solver = SolverFactory(SolverName, symbolic_solver_labels=False)
-                    ApplyGurobiSubproblemOptions(Solver, SolverName, _path+'/openTEPES_gurobi_Sbp_'+CaseName+'.log')
-                elif mTEPES.pIndSequentialSolving() == 2:
-                    Solver = SolverFactory('gurobi_persistent', profile_memory=10)
-                    # Solver.set_gurobi_param('OutputFlag', 0)
-                    # Solver.set_gurobi_param('LogFile',   _path+'/openTEPES_gurobi_Sbp_'+CaseName+'.log')
-                    # Solver.set_gurobi_param('Method',     2)
-                    # Solver.set_gurobi_param('Presolve',   2)
-                    # Solver.set_gurobi_param('Crossover',   -1)
-                    # Solver.set_gurobi_param('BarConvTol', 1e-9)
-                    # Solver.set_gurobi_param('Threads',  int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2))
-                    Solver.set_instance(OptModel, symbolic_solver_labels=True)
-
-                if pIndLogConsole == 1:
-                    StartTime      = time.time()
-                    OptModel.write(_path+f'/openTEPES_Sbp_itBd{itBd}_{p}_{sc}_{st}_{CaseName}.lp', io_options={'symbolic_solver_labels': True})
+        solver_manager = parallel_manager()
+        action_handles = []
+
+        def CollectStage():
+            # collect the oldest queued subproblem: load its solution and duals into OptModel, add its cost and its investment duals
+            nonlocal pTotalOCost, ObjVal
+            action_handle, pp, scc, stt, LoadLevels = action_handles.pop(0)
+            SolverResults = solver_manager.get_results(action_handle)
+            if SolverResults is not None and SolverResults.solver.termination_condition == TerminationCondition.optimal:
+                ObjVal = SolverResults.Problem.__getattr__('Lower bound')
+                pTotalOCost += ObjVal
+            else:
+                ReportInfeasible(itBd, pp, scc, stt)
+            AccumulateBendersDuals(OptModel, mTEPES, pp, scc, stt, LoadLevels, pGenerationInvestMarginalG, pGenerationInvestMarginalR, pGenerationInvestMarginalE, pNetworkInvestMarginalCap)
+    else:
+        # the sequential modes solve each stage in place, so there is no manager whose workers would have to be shut down
+        solver_manager = contextlib.nullcontext()
+
+    # the manager's workers are shut down on leaving this block, also when a stage fails to build or to queue
+    with solver_manager:
+        # %% iterative solve for each stage of a year
+        for p,sc,st in mTEPES.ps*mTEPES.stt:
+
+            StartTime = time.time()
+
+            # activate only period, scenario, and load levels to formulate
+            RebuildStageAndLoadLevelSets(mTEPES)
+
+            if mTEPES.n:
+                ObjVal = None
+
+                if mTEPES.pIndSequentialSolving() <= 2 or (mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first()) or (mTEPES.pIndSequentialSolving() == 3 and itBdFinal == FINAL_ITERATION):
+
+                    if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first() and not hasattr(mTEPES, 'n1'):
+                        # load level of the first stage (created once and reused across Benders iterations)
+                        mTEPES.n1 = Set(initialize=[nn for nn in mTEPES.nn if (p,sc,nn) in mTEPES.pDuration and (p,sc,st,nn) in mTEPES.s2n], ordered=True, doc='load levels')
+
+                    if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first() and itBd == 1:
+                        # save all the parameters that depend on load level
+                        for ParamName, IndexSet in STAGE_PARAMS:
+                            setattr(mTEPES, ParamName + '_Saved', Param(getattr(mTEPES, IndexSet), initialize=getattr(mTEPES, ParamName).extract_values()))
+
+                    if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.first() and itBdFinal == FINAL_ITERATION:
+                        # delete and reload all the parameters that depend on load level from their saved copies
+                        for ParamName, IndexSet in STAGE_PARAMS:
+                            mTEPES.del_component(getattr(mTEPES, ParamName))
+                            setattr(mTEPES, ParamName, Param(getattr(mTEPES, IndexSet), initialize=getattr(mTEPES, ParamName + '_Saved').extract_values()))
+
+                    # delete the o.f. of the complete problem
+                    if hasattr(mTEPES, 'eTotalSCost'):
+                        mTEPES.del_component(mTEPES.eTotalSCost)
+
+                    pScenFactor = {(p,sc): mTEPES.pDiscountedWeight[p] * mTEPES.pScenProb[p,sc]() for p,sc in mTEPES.ps}
+
+                    # operation model o.f. by stage; the H2/heat flags do not depend on the tuple, so they select the whole addend instead of being re-evaluated per tuple
+                    def eTotalOCost(OptModel):
+                        vTotalOCost = sum(pScenFactor[p,sc] * (OptModel.vTotalGCost    [p,sc,n] +
+                                                               OptModel.vTotalCCost    [p,sc,n] +
+                                                               OptModel.vTotalECost    [p,sc,n] +
+                                                               OptModel.vTotalNCost    [p,sc,n] +
+                                                               OptModel.vTotalRElecCost[p,sc,n]) for p,sc,n in mTEPES.psn)
+                        if mTEPES.pIndHydrogen():
+                            vTotalOCost += sum(pScenFactor[p,sc] * OptModel.vTotalRH2Cost  [p,sc,n] for p,sc,n in mTEPES.psn)
+                        if mTEPES.pIndHeat():
+                            vTotalOCost += sum(pScenFactor[p,sc] * OptModel.vTotalRHeatCost[p,sc,n] for p,sc,n in mTEPES.psn)
+                        return vTotalOCost
+                    setattr(OptModel, f'eTotalOCost_{p}_{sc}_{st}', Objective(rule=eTotalOCost, sense=minimize, doc='total system operation cost [MEUR]'))
+
+                    if itBd == 1:
+                        # operation model constraints by stage
+                        GenerationOperationElecModelFormulationInvestment    (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        if mTEPES.pIndHeat():
+                            GenerationOperationHeatModelFormulationInvestment(mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        GenerationOperationModelFormulationDemand            (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        GenerationOperationModelFormulationStorage           (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        if mTEPES.pIndHydroTopology():
+                            GenerationOperationModelFormulationReservoir     (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        if mTEPES.pIndHydrogen():
+                            NetworkH2OperationModelFormulation               (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        if mTEPES.pIndHeat():
+                            NetworkHeatOperationModelFormulation             (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        GenerationOperationModelFormulationCommitment        (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        GenerationOperationModelFormulationRampMinTime       (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        NetworkSwitchingModelFormulation                     (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                        NetworkOperationModelFormulation                     (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+
+                        # introduce cycle flow formulations
+                        if pIndCycleFlow == 1:
+                            if st == mTEPES.stt.first():
+                                NetworkCycles                                (        mTEPES, pIndLogConsole           )
+                            CycleConstraints                                 (mTEPES, mTEPES, pIndLogConsole, p, sc, st)
+                    else:
+                        # activate all the constraints by stage
+                        StageConstraints(mTEPES).activate(st=st)
+
+                    # send the problem to the solver
+                    if   mTEPES.pIndSequentialSolving() == 0:
+                        Solver = SolverFactory(SolverName, symbolic_solver_labels=False)
+                        ApplyGurobiSubproblemOptions(Solver, SolverName, _path+'/openTEPES_gurobi_Sbp_'+CaseName+'.log', getattr(solver_manager, 'threads', None))
+                        action_handle = solver_manager.queue(OptModel, opt=Solver,                  keepfiles=False, tee=False, load_solutions=True, report_timing=False)
+                        action_handles.append((action_handle, p, sc, st, list(mTEPES.n)))
+                        # get results from the already solved stages at the head of the queue
+                        while action_handles and action_handles[0][0].status == ActionStatus.done:
+                            CollectStage()
+                    elif mTEPES.pIndSequentialSolving() == 1 or mTEPES.pIndSequentialSolving() == 3:
+                        Solver = SolverFactory(SolverName, symbolic_solver_labels=False)
+                        ApplyGurobiSubproblemOptions(Solver, SolverName, _path+'/openTEPES_gurobi_Sbp_'+CaseName+'.log')
+                    elif mTEPES.pIndSequentialSolving() == 2:
+                        Solver = SolverFactory('gurobi_persistent', profile_memory=10)
+                        # Solver.set_gurobi_param('OutputFlag', 0)
+                        # Solver.set_gurobi_param('LogFile',   _path+'/openTEPES_gurobi_Sbp_'+CaseName+'.log')
+                        # Solver.set_gurobi_param('Method',     2)
+                        # Solver.set_gurobi_param('Presolve',   2)
+                        # Solver.set_gurobi_param('Crossover',   -1)
+                        # Solver.set_gurobi_param('BarConvTol', 1e-9)
+                        # Solver.set_gurobi_param('Threads',  int((psutil.cpu_count(logical=True) + psutil.cpu_count(logical=False))/2))
+                        Solver.set_instance(OptModel, symbolic_solver_labels=True)
+
+                    if pIndLogConsole == 1:
+                        StartTime      = time.time()
+                        OptModel.write(_path+f'/openTEPES_Sbp_itBd{itBd}_{p}_{sc}_{st}_{CaseName}.lp', io_options={'symbolic_solver_labels': True})
+                        GeneratingTime = time.time() - StartTime
+                        StartTime      = time.time()
+                        print('Writing subproblem     LP file iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
+
                     GeneratingTime = time.time() - StartTime
                     StartTime      = time.time()
-                    print('Writing subproblem     LP file iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
 
-                GeneratingTime = time.time() - StartTime
-                StartTime      = time.time()
-
-                if mTEPES.pIndSequentialSolving() == 2:
-                    print('Writing subproblem   in memory iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
-                else:
-                    print('Writing subproblem     LP file iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
-
-                # mode 0 was already queued to the solver manager above; only the sequential modes solve here
-                if   mTEPES.pIndSequentialSolving() == 1 or mTEPES.pIndSequentialSolving() == 3:
-                    SolverResults = Solver.solve(OptModel, warmstart=False,                  tee=False,                                         report_timing=False)
-                    if SolverResults.solver.termination_condition == TerminationCondition.optimal:
-                        ObjVal = getattr(OptModel, f'eTotalOCost_{p}_{sc}_{st}').expr()
-                        pTotalOCost += ObjVal
+                    if mTEPES.pIndSequentialSolving() == 2:
+                        print('Writing subproblem   in memory iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
                     else:
-                        ReportInfeasible(itBd, p, sc, st)
-                elif mTEPES.pIndSequentialSolving() == 2:
-                    SolverResults = Solver.solve(OptModel, warmstart=False, keepfiles=False, tee=False, load_solutions=True, save_results=True, report_timing=False)
-                    if SolverResults.solver.termination_condition == TerminationCondition.optimal:
-                        ObjVal = Solver.get_model_attr('ObjVal')
+                        print('Writing subproblem     LP file iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
+
+                    # mode 0 was already queued to the solver manager above; only the sequential modes solve here
+                    if   mTEPES.pIndSequentialSolving() == 1 or mTEPES.pIndSequentialSolving() == 3:
+                        SolverResults = Solver.solve(OptModel, warmstart=False,                  tee=False,                                         report_timing=False)
+                        if SolverResults.solver.termination_condition == TerminationCondition.optimal:
+                            ObjVal = getattr(OptModel, f'eTotalOCost_{p}_{sc}_{st}').expr()
+                            pTotalOCost += ObjVal
+                        else:
+                            ReportInfeasible(itBd, p, sc, st)
+                    elif mTEPES.pIndSequentialSolving() == 2:
+                        SolverResults = Solver.solve(OptModel, warmstart=False, keepfiles=False, tee=False, load_solutions=True, save_results=True, report_timing=False)
+                        if SolverResults.solver.termination_condition == TerminationCondition.optimal:
+                            ObjVal = Solver.get_model_attr('ObjVal')
+                            pTotalOCost += ObjVal
+                        else:
+                            ReportInfeasible(itBd, p, sc, st)
+
+                    # get the duals for the Benders cuts (mode 0 gets them when its results are collected)
+                    if mTEPES.pIndSequentialSolving() > 0:
+                        AccumulateBendersDuals(OptModel, mTEPES, p, sc, st, mTEPES.n, pGenerationInvestMarginalG, pGenerationInvestMarginalR, pGenerationInvestMarginalE, pNetworkInvestMarginalCap)
+
+                elif (mTEPES.pIndSequentialSolving() == 3 and st != mTEPES.stt.first()) or (mTEPES.pIndSequentialSolving() == 3 and itBdFinal < FINAL_ITERATION):
+                    GeneratingTime = time.time() - StartTime
+                    if   mTEPES.pIndSequentialSolving() == 3:
+                        print('Writing subproblem sensitivity iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
+
+                    if SolverName in ('appsi_highs', 'highs'):
+                        Solver = appsi.solvers.Highs()
+                    else:
+                        Solver = appsi.solvers.Gurobi()
+
+                    # define and initialize all the parameters that depend on the current stage; pair the first-stage load levels with the
+                    # current-stage ones by ordinal position (the diagonal n1<->n) instead of scanning the full n1*n product and filtering
+                    StagePairs = list(zip(mTEPES.n1, mTEPES.n))
+                    for n1,n in StagePairs:
+                        mTEPES.pDuration         [     n1   ] = mTEPES.pDuration_Saved         [     n   ]
+                        mTEPES.pLoadLevelDuration[     n1   ] = mTEPES.pLoadLevelDuration_Saved[     n   ]
+                    for pp,scc in mTEPES.ps:
+                        for n1,n in StagePairs:
+                            for nd in mTEPES.nd:
+                                mTEPES.pDemandElec       [pp,scc,n1,nd] = mTEPES.pDemandElec_Saved       [pp,scc,n,nd]
+                                mTEPES.pMaxTheta         [pp,scc,n1,nd] = mTEPES.pMaxTheta_Saved         [pp,scc,n,nd]
+                            for ar in mTEPES.ar:
+                                mTEPES.pSystemInertia    [pp,scc,n1,ar] = mTEPES.pSystemInertia_Saved    [pp,scc,n,ar]
+                                mTEPES.pOperReserveUp    [pp,scc,n1,ar] = mTEPES.pOperReserveUp_Saved    [pp,scc,n,ar]
+                                mTEPES.pOperReserveDw    [pp,scc,n1,ar] = mTEPES.pOperReserveDw_Saved    [pp,scc,n,ar]
+                            for g in mTEPES.g:
+                                mTEPES.pInitialOutput    [pp,scc,n1,g ] = mTEPES.pInitialOutput_Saved    [pp,scc,n,g ]
+                                mTEPES.pInitialUC        [pp,scc,n1,g ] = mTEPES.pInitialUC_Saved        [pp,scc,n,g ]
+                                mTEPES.pIniInventory     [pp,scc,n1,g ] = mTEPES.pIniInventory_Saved     [pp,scc,n,g ]
+                                mTEPES.pMinPowerElec     [pp,scc,n1,g ] = mTEPES.pMinPowerElec_Saved     [pp,scc,n,g ]
+                                mTEPES.pMaxPowerElec     [pp,scc,n1,g ] = mTEPES.pMaxPowerElec_Saved     [pp,scc,n,g ]
+                                mTEPES.pMinCharge        [pp,scc,n1,g ] = mTEPES.pMinCharge_Saved        [pp,scc,n,g ]
+                                mTEPES.pMaxCharge        [pp,scc,n1,g ] = mTEPES.pMaxCharge_Saved        [pp,scc,n,g ]
+                                mTEPES.pMaxPower2ndBlock [pp,scc,n1,g ] = mTEPES.pMaxPower2ndBlock_Saved [pp,scc,n,g ]
+                                mTEPES.pMaxCharge2ndBlock[pp,scc,n1,g ] = mTEPES.pMaxCharge2ndBlock_Saved[pp,scc,n,g ]
+                                mTEPES.pEnergyInflows    [pp,scc,n1,g ] = mTEPES.pEnergyInflows_Saved    [pp,scc,n,g ]
+                                mTEPES.pEnergyOutflows   [pp,scc,n1,g ] = mTEPES.pEnergyOutflows_Saved   [pp,scc,n,g ]
+                                mTEPES.pMinStorage       [pp,scc,n1,g ] = mTEPES.pMinStorage_Saved       [pp,scc,n,g ]
+                                mTEPES.pMaxStorage       [pp,scc,n1,g ] = mTEPES.pMaxStorage_Saved       [pp,scc,n,g ]
+                            for ni,nf,cc in mTEPES.la:
+                                mTEPES.pInitialSwitch    [pp,scc,n1,ni,nf,cc] = mTEPES.pInitialSwitch_Saved    [pp,scc,n,ni,nf,cc]
+
+                    if pIndLogConsole == 1:
+                        StartTime      = time.time()
+                        # OptModel.write(_path+f'/openTEPES_Sbp_itBd{itBd}_{p}_{sc}_{st}_{CaseName}.lp', io_options={'symbolic_solver_labels': True})
+                        GeneratingTime = time.time() - StartTime
+                        StartTime      = time.time()
+                        print('Writing subproblem     LP file iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
+
+                    SolverResults = Solver.solve(OptModel, timer=timer)
+                    if SolverResults.termination_condition == appsi.base.TerminationCondition.optimal:
+                        ObjVal = SolverResults.best_feasible_objective
                         pTotalOCost += ObjVal
                     else:
+                        ObjVal = None
                         ReportInfeasible(itBd, p, sc, st)
 
-                # get the duals for the Benders cuts
-                AccumulateBendersDuals(OptModel, mTEPES, p, sc, st, mTEPES.n, pGenerationInvestMarginalG, pGenerationInvestMarginalR, pGenerationInvestMarginalE, pNetworkInvestMarginalCap)
+                    # get the duals for the Benders cuts
+                    AccumulateBendersDuals(OptModel, mTEPES, p, sc, mTEPES.stt.first(), mTEPES.n1, pGenerationInvestMarginalG, pGenerationInvestMarginalR, pGenerationInvestMarginalE, pNetworkInvestMarginalCap)
 
-            elif (mTEPES.pIndSequentialSolving() == 3 and st != mTEPES.stt.first()) or (mTEPES.pIndSequentialSolving() == 3 and itBdFinal < FINAL_ITERATION):
-                GeneratingTime = time.time() - StartTime
-                if   mTEPES.pIndSequentialSolving() == 3:
-                    print('Writing subproblem sensitivity iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
-
-                if SolverName in ('appsi_highs', 'highs'):
-                    Solver = appsi.solvers.Highs()
-                else:
-                    Solver = appsi.solvers.Gurobi()
-
-                # define and initialize all the parameters that depend on the current stage; pair the first-stage load levels with the
-                # current-stage ones by ordinal position (the diagonal n1<->n) instead of scanning the full n1*n product and filtering
-                StagePairs = list(zip(mTEPES.n1, mTEPES.n))
-                for n1,n in StagePairs:
-                    mTEPES.pDuration         [     n1   ] = mTEPES.pDuration_Saved         [     n   ]
-                    mTEPES.pLoadLevelDuration[     n1   ] = mTEPES.pLoadLevelDuration_Saved[     n   ]
-                for pp,scc in mTEPES.ps:
-                    for n1,n in StagePairs:
-                        for nd in mTEPES.nd:
-                            mTEPES.pDemandElec       [pp,scc,n1,nd] = mTEPES.pDemandElec_Saved       [pp,scc,n,nd]
-                            mTEPES.pMaxTheta         [pp,scc,n1,nd] = mTEPES.pMaxTheta_Saved         [pp,scc,n,nd]
-                        for ar in mTEPES.ar:
-                            mTEPES.pSystemInertia    [pp,scc,n1,ar] = mTEPES.pSystemInertia_Saved    [pp,scc,n,ar]
-                            mTEPES.pOperReserveUp    [pp,scc,n1,ar] = mTEPES.pOperReserveUp_Saved    [pp,scc,n,ar]
-                            mTEPES.pOperReserveDw    [pp,scc,n1,ar] = mTEPES.pOperReserveDw_Saved    [pp,scc,n,ar]
-                        for g in mTEPES.g:
-                            mTEPES.pInitialOutput    [pp,scc,n1,g ] = mTEPES.pInitialOutput_Saved    [pp,scc,n,g ]
-                            mTEPES.pInitialUC        [pp,scc,n1,g ] = mTEPES.pInitialUC_Saved        [pp,scc,n,g ]
-                            mTEPES.pIniInventory     [pp,scc,n1,g ] = mTEPES.pIniInventory_Saved     [pp,scc,n,g ]
-                            mTEPES.pMinPowerElec     [pp,scc,n1,g ] = mTEPES.pMinPowerElec_Saved     [pp,scc,n,g ]
-                            mTEPES.pMaxPowerElec     [pp,scc,n1,g ] = mTEPES.pMaxPowerElec_Saved     [pp,scc,n,g ]
-                            mTEPES.pMinCharge        [pp,scc,n1,g ] = mTEPES.pMinCharge_Saved        [pp,scc,n,g ]
-                            mTEPES.pMaxCharge        [pp,scc,n1,g ] = mTEPES.pMaxCharge_Saved        [pp,scc,n,g ]
-                            mTEPES.pMaxPower2ndBlock [pp,scc,n1,g ] = mTEPES.pMaxPower2ndBlock_Saved [pp,scc,n,g ]
-                            mTEPES.pMaxCharge2ndBlock[pp,scc,n1,g ] = mTEPES.pMaxCharge2ndBlock_Saved[pp,scc,n,g ]
-                            mTEPES.pEnergyInflows    [pp,scc,n1,g ] = mTEPES.pEnergyInflows_Saved    [pp,scc,n,g ]
-                            mTEPES.pEnergyOutflows   [pp,scc,n1,g ] = mTEPES.pEnergyOutflows_Saved   [pp,scc,n,g ]
-                            mTEPES.pMinStorage       [pp,scc,n1,g ] = mTEPES.pMinStorage_Saved       [pp,scc,n,g ]
-                            mTEPES.pMaxStorage       [pp,scc,n1,g ] = mTEPES.pMaxStorage_Saved       [pp,scc,n,g ]
-                        for ni,nf,cc in mTEPES.la:
-                            mTEPES.pInitialSwitch    [pp,scc,n1,ni,nf,cc] = mTEPES.pInitialSwitch_Saved    [pp,scc,n,ni,nf,cc]
-
-                if pIndLogConsole == 1:
-                    StartTime      = time.time()
-                    # OptModel.write(_path+f'/openTEPES_Sbp_itBd{itBd}_{p}_{sc}_{st}_{CaseName}.lp', io_options={'symbolic_solver_labels': True})
-                    GeneratingTime = time.time() - StartTime
-                    StartTime      = time.time()
-                    print('Writing subproblem     LP file iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's')
+                if mTEPES.pIndSequentialSolving() <= 2:
+                    # o.f. must be deleted on every Benders iteration
+                    OptModel.del_component    (getattr(OptModel, f'eTotalOCost_{p}_{sc}_{st}'))
 
-                SolverResults = Solver.solve(OptModel, timer=timer)
-                if SolverResults.termination_condition == appsi.base.TerminationCondition.optimal:
-                    ObjVal = SolverResults.best_feasible_objective
-                    pTotalOCost += ObjVal
-                else:
-                    ObjVal = None
-                    ReportInfeasible(itBd, p, sc, st)
+                    if itBdFinal < FINAL_ITERATION:
+                        # in the final iteration constraints can't be deleted to get all the output results
+                        for c in OptModel.component_objects(pyo.Constraint):
+                            c.deactivate()
 
-                # get the duals for the Benders cuts
-                AccumulateBendersDuals(OptModel, mTEPES, p, sc, mTEPES.stt.first(), mTEPES.n1, pGenerationInvestMarginalG, pGenerationInvestMarginalR, pGenerationInvestMarginalE, pNetworkInvestMarginalCap)
+                if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.last() and itBdFinal < FINAL_ITERATION:
+                    # delete the o.f.
+                    OptModel.del_component    (getattr(OptModel, f'eTotalOCost_{p}_{sc}_{mTEPES.stt.first()}'))
 
-            if mTEPES.pIndSequentialSolving() <= 2:
-                # o.f. must be deleted on every Benders iteration
-                OptModel.del_component    (getattr(OptModel, f'eTotalOCost_{p}_{sc}_{st}'))
-
-                if itBdFinal < FINAL_ITERATION:
-                    # in the final iteration constraints can't be deleted to get all the output results
+                    # delete the constraints
                     for c in OptModel.component_objects(pyo.Constraint):
                         c.deactivate()
 
-            if mTEPES.pIndSequentialSolving() == 3 and st == mTEPES.stt.last() and itBdFinal < FINAL_ITERATION:
-                # delete the o.f.
-                OptModel.del_component    (getattr(OptModel, f'eTotalOCost_{p}_{sc}_{mTEPES.stt.first()}'))
-
-                # delete the constraints
-                for c in OptModel.component_objects(pyo.Constraint):
-                    c.deactivate()
-
-            GeneratingTime = time.time() - StartTime
+                GeneratingTime = time.time() - StartTime
 
-            if mTEPES.pIndSequentialSolving() > 0:
-                print('Solving                        iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's   Total system operation cost [MEUR] ... ', ObjVal)
+                if mTEPES.pIndSequentialSolving() > 0:
+                    print('Solving                        iteration', itBd, ', period', p, ', scenario', sc, ', stage', st, ' ... ', round(GeneratingTime), 's   Total system operation cost [MEUR] ... ', ObjVal)
 
-    # retrieve the stage solution from the solver
-    if mTEPES.pIndSequentialSolving() == 0:
-        for this_action_handle in action_handles:
-            solved_name   = action_handle_map         [this_action_handle]
-            SolverResults = solver_manager.get_results(this_action_handle)
-            if SolverResults is not None:
-                if SolverResults.solver.termination_condition == TerminationCondition.optimal:
-                    ObjVal = SolverResults.Problem.__getattr__('Lower bound')
-                    pTotalOCost += ObjVal
-                else:
-                    print('Subproblem          infeasible ', solved_name)
-        print('Solving                        iteration', itBd, ' ... ', round(GeneratingTime), 's      Total system operation cost [MEUR] ... ', pTotalOCost)
+        # retrieve the stage solution from the solver
+        if mTEPES.pIndSequentialSolving() == 0:
+            while action_handles:
+                CollectStage()
+            print('Solving                        iteration', itBd, ' ... ', round(GeneratingTime), 's      Total system operation cost [MEUR] ... ', pTotalOCost)
 
     mTEPES.pTotalOCost = pTotalOCost
 
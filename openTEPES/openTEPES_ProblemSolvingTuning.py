@@ -82,7 +82,7 @@ def apply_solver_options(Solver, SolverName: str, FileName: str, ncall: int):
         # Solver.options["EpGap"]            = 0.01
         return None
 
-    if SolverName == "highs":
+    if SolverName == "highs" or SolverName == "appsi_highs":
         Solver.options["log_file"]                = FileName
         Solver.options["solver"]                  = "choose"
         Solver.options["simplex_strategy"]        = 1
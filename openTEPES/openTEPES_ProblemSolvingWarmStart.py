@@ -0,0 +1,127 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_ProblemSolvingWarmStart — opt-in MIP start of each stage from the solution of the stage before it (default OFF).
+
+A unit-commitment stage solved on its own starts its MIP search from nothing, and most of its time goes into finding a first incumbent, while
+the stage solved just before holds a commitment schedule of the same units. With ``--stage-warm-start`` / ``OTEPES_STAGE_WARM_START`` set,
+``StageIterativeSolving`` calls ``WarmStartStage`` before each stage it solves in the parent: the discrete variables of the stage
+(``STAGE_WARM_START_VARS``: commitment, startup, shutdown, unit states, exclusive-group and consumption commitment, line switching) take
+the values of the previous stage of the same period and scenario, load level by load level in order, the previous stage repeated if the
+stage is longer. The startups and shutdowns are then recomputed from the shifted commitment and the initial commitment of the stage, so the
+start agrees with the commitment transitions of the stage. ``ProblemSolving`` passes the values to the solvers of ``WARM_START_SOLVERS``
+with ``warmstart=True``.
+
+Only the discrete values are shifted. The solvers complete such a start themselves: HiGHS solves the LP of the stage with the discrete
+variables at the start, Gurobi and CPLEX complete a partial start. That gives the continuous variables (output, inventory, flows) from this
+stage's own initial inventory and demand, which a shifted trajectory would contradict. The ``highs`` interface has no warm-start, so with
+HiGHS use ``appsi_highs``. The stages solved in ``--parallel-stages`` workers and the joint solves get no start.
+"""
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+
+# Support running this file directly (e.g. VS Code "Run Python File"), where __package__ is empty and the
+# relative imports below have no parent package; fall back to absolute package imports in that case.
+try:
+    from          .openTEPES_StageIndex import _stage_index
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from openTEPES.openTEPES_StageIndex import _stage_index
+
+
+# The per-load-level discrete variables whose values are carried to the next stage; each is indexed by (p, sc, n, ...).
+STAGE_WARM_START_VARS = ("vCommitment", "vStartUp", "vShutDown", "vStableState", "vRampUpState", "vRampDwState", "vMaxCommitmentHourly",
+                         "vCommitmentCons", "vLineCommit", "vLineOnState", "vLineOffState")
+
+# The solver names whose interface takes the values on the model as a MIP start.
+WARM_START_SOLVERS = ("appsi_highs", "appsi_gurobi", "gurobi", "gurobi_direct", "gurobi_persistent", "cplex", "cplex_direct")
+
+
+def enabled() -> bool:
+    """True when the opt-in stage MIP start is switched on via ``--stage-warm-start`` / ``OTEPES_STAGE_WARM_START``."""
+    return os.environ.get("OTEPES_STAGE_WARM_START", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class StageWarmStart:
+    """Shifts the discrete values of the previous stage onto the next one (``mTEPES.pWarmStart``)."""
+
+    def __init__(self):
+        # variable name -> {(p, sc, n): [keys]}, grouped on first use
+        self._keys = {}
+
+    def _grouped(self, var) -> dict:
+        if var.name not in self._keys:
+            grouped = defaultdict(list)
+            for key in var:
+                grouped[key[:3]].append(key)
+            self._keys[var.name] = grouped
+        return self._keys[var.name]
+
+    @staticmethod
+    def _previous(mTEPES, p, sc, st):
+        """The stage before ``st`` in ``stt`` with load levels in ``(p, sc)``, and those load levels; ``(None, [])`` for the first stage."""
+        index    = _stage_index(mTEPES)
+        previous = None, []
+        for stt in mTEPES.stt:
+            if stt == st:
+                return previous
+            levels = index.stage(p, sc, stt)[1]
+            if levels:
+                previous = stt, levels
+        return previous
+
+    def shift(self, OptModel, mTEPES, p, sc, st) -> int:
+        """Give the discrete variables of stage ``(p, sc, st)`` the values of the previous stage; returns how many were set."""
+        previous, source = self._previous(mTEPES, p, sc, st)
+        levels           = _stage_index(mTEPES).stage(p, sc, st)[1]
+        if previous is None or not levels:
+            return 0
+        pairs = [(n, source[k % len(source)]) for k, n in enumerate(levels)]
+        count = 0
+        for name in STAGE_WARM_START_VARS:
+            var = getattr(OptModel, name, None)
+            if var is None or not var.is_indexed() or not len(var):
+                continue
+            grouped = self._grouped(var)
+            for n, nn in pairs:
+                values = {key[3:]: var[key].value for key in grouped.get((p,sc,nn), ())}
+                for key in grouped.get((p,sc,n), ()):
+                    data  = var[key]
+                    value = values.get(key[3:])
+                    if value is not None and not data.fixed and not data.is_continuous():
+                        data.set_value(round(value), skip_validation=True)
+                        count += 1
+        self._transitions(OptModel, mTEPES, p, sc, levels)
+        return count
+
+    def _transitions(self, OptModel, mTEPES, p, sc, levels) -> None:
+        """Startups and shutdowns of the shifted commitment, from the initial commitment at the first load level of the stage."""
+        if not hasattr(OptModel, "vCommitment") or not hasattr(OptModel, "vStartUp") or not hasattr(OptModel, "vShutDown"):
+            return
+        grouped = self._grouped(OptModel.vCommitment)
+        before  = {}
+        for n in levels:
+            for key in grouped.get((p,sc,n), ()):
+                commitment, startup, shutdown = OptModel.vCommitment[key], OptModel.vStartUp[key], OptModel.vShutDown[key]
+                nr    = key[3]
+                prior = before.get(nr, mTEPES.pInitialUC[key]() if key in mTEPES.pInitialUC else 0)
+                if commitment.value is not None and not commitment.is_continuous():
+                    for data, value in ((startup, max(commitment.value - prior, 0)), (shutdown, max(prior - commitment.value, 0))):
+                        if not data.fixed and not data.is_continuous():
+                            data.set_value(round(value), skip_validation=True)
+                before[nr] = commitment.value if commitment.value is not None else prior
+
+
+def WarmStartStage(OptModel, mTEPES, p, sc, st) -> None:
+    """Shift the previous stage's discrete values onto stage ``(p, sc, st)`` when the opt-in is on; does nothing otherwise."""
+    warm_start = getattr(mTEPES, 'pWarmStart', None)
+    if warm_start is not None:
+        warm_start.shift(OptModel, mTEPES, p, sc, st)
+
+
+def warm_start(mTEPES, SolverName: str) -> bool:
+    """True when the solve of ``mTEPES`` should pass its values to ``SolverName`` as a MIP start."""
+    return getattr(mTEPES, 'pWarmStart', None) is not None and SolverName in WARM_START_SOLVERS
@@ -15,7 +15,9 @@ fallback.
 This module adds that as an OPT-IN mode, off by default so the standard solve path is unchanged. It applies to
 persistent-solver RE-SOLVES of one built model: the Mode C hot-swap sweep (``openTEPES_ProblemSolvingResolve``)
 and, when a case is solved with ``gurobi_persistent``, the stage-loop re-solves (ncall > 1). It does nothing
-for Mode A / Mode B (each runs a different model, so nothing persists) or for non-Gurobi solvers.
+for Mode A / Mode B (each runs a different model, so nothing persists). The Mode C sweep of a HiGHS case
+(``highs`` / ``appsi_highs``) keeps one persistent ``appsi_highs`` instance instead of a Gurobi one; the stage-loop
+options below are Gurobi only.
 
   * ``enabled()``               True only when OTEPES_WARM_RESOLVE is set truthy.
   * ``apply_resolve_method()``  on a re-solve (ncall > 1) switch the persistent Gurobi solver to dual simplex
@@ -68,6 +70,10 @@ def _is_gurobi(SolverName: str) -> bool:
     return SolverName in ("gurobi", "gurobi_direct", "appsi_gurobi", "gurobi_persistent")
 
 
+def _is_highs(SolverName: str) -> bool:
+    return SolverName in ("highs", "appsi_highs")
+
+
 def _set_param(Solver, SolverName: str, name: str, value) -> None:
     """Set one Gurobi parameter through whichever API this solver flavour uses."""
     if SolverName == "gurobi_persistent":
@@ -118,7 +124,7 @@ def fallback_if_stalled(Solver, OptModel, SolverName: str, ncall: int, SolverRes
     return Solver.solve(OptModel, **solve_kwargs)
 
 
-def resolve_persistent(OptModel, overlays, baseline, touched, tee: bool = False):
+def resolve_persistent(OptModel, overlays, baseline, touched, tee: bool = False, SolverName: str = "gurobi"):
     """Persistent + warm-simplex version of the Mode C ``resolve`` re-solve loop.
 
     The standard ``resolve`` builds a fresh non-persistent solver and re-exports the whole model for every
@@ -127,12 +133,17 @@ def resolve_persistent(OptModel, overlays, baseline, touched, tee: bool = False)
     barrier + crossover to leave a basis; later overlays use dual simplex warm-started from it, under a time
     cap that falls back to barrier if it stalls. Returns the same list-of-dicts as ``resolve``.
 
+    For a HiGHS ``SolverName`` the instance is ``appsi_highs`` instead (``_resolve_persistent_highs``).
+
     ``baseline`` / ``touched`` are the caller's snapshot of the swapped Params (see ``resolve``); overlays are
     applied relative to the baseline, not cumulatively.
     """
     from pyomo.environ import SolverFactory, Constraint, Objective
     from pyomo.core.expr import identify_mutable_parameters
 
+    if _is_highs(SolverName):
+        return _resolve_persistent_highs(OptModel, overlays, baseline, tee)
+
     names = set(touched)
     # Constraints that read a swapped Param must be re-pushed after each swap; the persistent solver otherwise
     # keeps the stale coefficients. Find them once.
@@ -188,3 +199,56 @@ def resolve_persistent(OptModel, overlays, baseline, touched, tee: bool = False)
         cost = OptModel.vTotalSCost() if tc == TerminationCondition.optimal else None
         results.append({"overlay": i, "status": str(tc), "total_cost_meur": cost})
     return results
+
+
+def _resolve_persistent_highs(OptModel, overlays, baseline, tee: bool = False):
+    """``resolve_persistent`` on one ``appsi_highs`` instance.
+
+    The model is loaded into HiGHS once. Each overlay then pushes only the swapped Params, which the instance
+    tracks itself as the coefficients, bounds and objective terms that read them, and HiGHS starts from the
+    basis of the previous overlay. With ``OTEPES_WARM_RESOLVE_SIMPLEX`` the later overlays are forced to dual
+    simplex under the time cap, and a stalled one is solved again with the interior point method.
+    """
+    from pyomo.contrib import appsi
+
+    Solver = appsi.solvers.Highs()
+    Solver.config.stream_solver = tee
+    Solver.config.load_solution = False
+    # between overlays only Param values change: no constraint, variable or expression needs to be scanned
+    Solver.update_config.check_for_new_or_removed_params      = False
+    Solver.update_config.check_for_new_or_removed_vars        = False
+    Solver.update_config.check_for_new_or_removed_constraints = False
+    Solver.update_config.update_params                        = True
+    Solver.update_config.update_vars                          = False
+    Solver.update_config.update_constraints                   = False
+    Solver.update_config.update_named_expressions             = False
+    Solver.set_instance(OptModel)
+    use_simplex = simplex_enabled()
+    cap = cap_seconds()
+
+    results = []
+    for i, ov in enumerate(overlays):
+        for name, values in baseline.items():
+            getattr(OptModel, name).store_values(values)
+        for name, values in ov.items():
+            getattr(OptModel, name).store_values(values)
+        if use_simplex and i > 0:
+            Solver.highs_options["solver"]           = "simplex"   # dual simplex, warm from the retained basis
+            Solver.highs_options["simplex_strategy"] = 1
+            Solver.highs_options["time_limit"]       = float(cap)
+        else:
+            Solver.highs_options["solver"]           = "choose"
+            Solver.highs_options["time_limit"]       = float(_FULL_TIME_LIMIT)
+        SolverResults = Solver.solve(OptModel)
+        if use_simplex and i > 0 and SolverResults.termination_condition == appsi.base.TerminationCondition.maxTimeLimit:
+            print("warm simplex stalled on overlay", i, "; falling back to interior point")
+            Solver.highs_options["solver"]     = "ipm"
+            Solver.highs_options["time_limit"] = float(_FULL_TIME_LIMIT)
+            SolverResults = Solver.solve(OptModel)
+        tc = appsi.base.legacy_termination_condition_map[SolverResults.termination_condition]
+        cost = None
+        if tc == TerminationCondition.optimal:
+            SolverResults.solution_loader.load_vars()
+            cost = OptModel.vTotalSCost()
+        results.append({"overlay": i, "status": str(tc), "total_cost_meur": cost})
+    return results
@@ -0,0 +1,117 @@
+"""
+Open Generation, Storage, and Transmission Operation and Expansion Planning Model with RES and ESS (openTEPES) - October 18, 2026
+
+openTEPES.openTEPES_StageIndex — the stage and load-level sets of each stage, computed once per model.
+
+The stage loops formulate one ``(period, scenario, stage)`` at a time over the sets ``st``, ``n`` and ``n2`` of that stage and over the load
+levels that close a cycle of each unit (``nesc``, ``necc``, ``neso``, ``ngen`` and, with a hydro topology, ``nhc``, ``np2c``, ``npc``, ``nrsc``,
+``nrcc``, ``nrso``). They are rebuilt before every stage, and again over all stages before a joint solve and after the loop.
+
+``StageIndex`` (``mTEPES.pStageIndex``) reads ``s2n``, the stage weights and the cycle lengths once. The load levels of a stage come from a
+single pass over ``s2n``, and the cycle subsets from the position of each load level in the stage: a unit of cycle ``k`` closes a cycle at
+every ``k``-th load level, so the subsets depend only on the number of load levels of the stage. The boolean masks of the multiples are computed
+with numpy once per stage length and shared by every stage of that length. ``ActivateStageSets`` and ``ActivateAllStageSets`` then put the
+cached sets of a stage, or of all the stages, on the model.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+
+import numpy as np
+from pyomo.environ import Set
+
+
+def _multiples(length: int, steps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Row-major ``(i, j)`` with ``(i+1) % steps[j] == 0`` for the load levels ``i`` of a stage of ``length`` and the units ``j``, skipping zero steps."""
+    ords = np.arange(1, length+1)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mask = (steps[None, :] > 0) & (ords % np.where(steps > 0, steps, 1)[None, :] == 0)
+    return np.nonzero(mask)
+
+
+class StageIndex:
+    """Stage set, load levels and cycle subsets of every stage of ``mTEPES``, and of all the stages together."""
+
+    def __init__(self, mTEPES):
+        self._weight = {stt: mTEPES.pStageWeight[stt] for stt in mTEPES.stt}
+        position     = {nn: i for i, nn in enumerate(mTEPES.nn)}
+        levels       = defaultdict(list)
+        for p,sc,st,nn in mTEPES.s2n:
+            levels[p,sc,st].append(nn)
+        self._levels = {key: sorted(nns, key=position.__getitem__) for key, nns in levels.items()}
+        self._nn     = list(mTEPES.nn)
+        self._ps     = set(mTEPES.ps)
+        self._stt    = list(mTEPES.stt)
+
+        # (name, units, cycle length of each unit) of the cycle subsets, in the order they are put on the model
+        self._cycles = [('nesc', list(mTEPES.es), [mTEPES.pStorageTimeStep [es] for es in mTEPES.es]),
+                        ('necc', list(mTEPES.ec), [mTEPES.pStorageTimeStep [ec] for ec in mTEPES.ec]),
+                        ('neso', list(mTEPES.es), [mTEPES.pOutflowsTimeStep[es] for es in mTEPES.es]),
+                        ('ngen', list(mTEPES.g ), [mTEPES.pEnergyTimeStep  [g ] for g  in mTEPES.g ])]
+        if mTEPES.pIndHydroTopology():
+            ReservoirTimeStep = {rs: mTEPES.pReservoirTimeStep[rs] for rs in mTEPES.rs}
+            # the cycle of a hydro unit is the sum of the cycles of its related reservoirs; a unit with none of them never closes a cycle
+            self._cycles.append(('nhc',  list(mTEPES.h), [sum(ReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2h) for h in mTEPES.h]))
+            self._cycles.append(('np2c', list(mTEPES.h), [sum(ReservoirTimeStep[rs] for rs in mTEPES.rs if (h,rs) in mTEPES.p2r) for h in mTEPES.h] if mTEPES.p2r else []))
+            self._cycles.append(('npc',  list(mTEPES.h), [sum(ReservoirTimeStep[rs] for rs in mTEPES.rs if (rs,h) in mTEPES.r2p) for h in mTEPES.h] if mTEPES.r2p else []))
+            self._cycles += [('nrsc', list(mTEPES.rs), [ReservoirTimeStep        [rs] for rs in mTEPES.rs]),
+                             ('nrcc', list(mTEPES.rn), [ReservoirTimeStep        [rs] for rs in mTEPES.rn]),
+                             ('nrso', list(mTEPES.rs), [mTEPES.pWaterOutTimeStep[rs] for rs in mTEPES.rs])]
+        self._steps  = [np.array(steps, dtype=float) for name, units, steps in self._cycles]
+        self._masks  = {}
+        self._stages = {}
+        self._all    = None
+
+    def _subsets(self, levels: list) -> dict:
+        if len(levels) not in self._masks:
+            self._masks[len(levels)] = [_multiples(len(levels), steps) for steps in self._steps]
+        return {name: [(levels[i], units[j]) for i, j in zip(*mask)] if len(steps) else [] for (name, units, steps), mask in zip(self._cycles, self._masks[len(levels)])}
+
+    def stage(self, p, sc, st) -> tuple[list, list, dict]:
+        """``(st, n, subsets)`` of stage ``(p, sc, st)``: the stage itself if it has weight and load levels, its load levels, and the cycle subsets."""
+        if (p,sc,st) not in self._stages:
+            levels = self._levels.get((p,sc,st), [])
+            self._stages[p,sc,st] = ([st] if self._weight[st] and levels else [], levels, self._subsets(levels))
+        return self._stages[p,sc,st]
+
+    def all(self) -> tuple[list, list, dict]:
+        """``(st, n, subsets)`` over every stage with weight and load levels, in the order of ``stt`` and ``nn``."""
+        if self._all is None:
+            present = {st for p,sc,st in self._levels}
+            stages  = [stt for stt in self._stt if self._weight[stt] and stt in present]
+            weighed = set(stages)
+            active  = {nn for (p,sc,st), levels in self._levels.items() if (p,sc) in self._ps and st in weighed for nn in levels}
+            levels  = [nn for nn in self._nn if nn in active]
+            self._all = (stages, levels, self._subsets(levels))
+        return self._all
+
+
+def _stage_index(mTEPES) -> StageIndex:
+    index = getattr(mTEPES, 'pStageIndex', None)
+    if index is None:
+        index = StageIndex(mTEPES)
+        mTEPES.pStageIndex = index
+    return index
+
+
+def _activate(mTEPES, stages, levels, subsets=None) -> None:
+    mTEPES.del_component(mTEPES.st)
+    mTEPES.del_component(mTEPES.n )
+    mTEPES.del_component(mTEPES.n2)
+    mTEPES.st = Set(doc='stages',      initialize=stages)
+    mTEPES.n  = Set(doc='load levels', initialize=levels)
+    mTEPES.n2 = Set(doc='load levels', initialize=levels)
+    # load levels multiple of cycles for each ESS/generator
+    for name, subset in (subsets or {}).items():
+        setattr(mTEPES, name, list(subset))
+
+
+def ActivateStageSets(mTEPES, p, sc, st) -> None:
+    """Put the stage set, load levels and cycle subsets of stage ``(p, sc, st)`` on ``mTEPES``."""
+    _activate(mTEPES, *_stage_index(mTEPES).stage(p, sc, st))
+
+
+def ActivateAllStageSets(mTEPES, subsets: bool = True) -> None:
+    """Put the stage set, load levels and, if ``subsets``, the cycle subsets of all the stages on ``mTEPES``."""
+    stages, levels, cycles = _stage_index(mTEPES).all()
+    _activate(mTEPES, stages, levels, cycles if subsets else None)
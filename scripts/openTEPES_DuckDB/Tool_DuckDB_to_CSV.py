@@ -26,7 +26,7 @@ from pathlib import Path
 import pandas as pd
 
 from openTEPES.openTEPES_InputSchema import TABLE_SPECS, WIDE_MULTILEVEL_TO_LONG
-from openTEPES.openTEPES_InputSource import open_source
+from openTEPES.openTEPES_InputDuckDBSource import DuckDBSource
 
 # Transform kind per CSV stem prefix, so we know how each reconstructed frame maps back onto disk.
 _KIND_BY_STEM = {stem_prefix: kind for stem_prefix, _table, kind, _kwargs in TABLE_SPECS}
@@ -43,7 +43,8 @@ def _write_flat_csv(df: pd.DataFrame, path: Path) -> None:
 def export_case(db_path, out_dir=None, case_name: str | None = None) -> Path:
     """Export every table in ``db_path`` to CSV. ``case_name`` defaults to the DB's ``schema_metadata.source_case``.
     ``out_dir`` defaults to ``<db_path parent>/<case_name>``. Returns the output directory."""
-    src = open_source(db_path)
+    # every row, including the time series of the periods and scenarios a run would skip
+    src = DuckDBSource(Path(db_path), active_only=False)
     try:
         case = case_name or src.case_name
         out = Path(out_dir) if out_dir is not None else Path(db_path).parent / case
@@ -0,0 +1,64 @@
+"""
+Tool_CSV_to_Parquet — write an openTEPES CSV case to a ``<case>.parquet`` input directory.
+
+Offline case-prep utility (not part of the core model). The writer side of the in-package ``openTEPES_InputParquetSource`` reader:
+read every ``oT_Data_*`` / ``oT_Dict_*`` CSV of a case through ``CSVSource`` and store each as one Parquet file with the same name,
+exactly as parsed (column types, and for the multi-level header tables the column MultiIndex and row index). The reader sets the
+``InputData`` index with the same helper the CSV backend uses, so a Parquet case reads back input-identically. Files that are not
+input tables (results, logs) are not copied.
+
+Needs openTEPES with its ``parquet`` extra installed (``pip install openTEPES[parquet]``). Run it as a script:
+
+    python scripts/openTEPES_Parquet/Tool_CSV_to_Parquet.py cases/9n
+    python scripts/openTEPES_Parquet/Tool_CSV_to_Parquet.py cases/9n --out out/9n.parquet
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+from pathlib import Path
+
+from openTEPES.openTEPES_InputCSVSource import CSVSource
+from openTEPES.openTEPES_InputSource import _header_levels
+
+
+def write_case(case_dir, out_dir=None, case_name: str | None = None) -> Path:
+    """Write a CSV case directory to a ``.parquet`` case directory the Parquet backend can read.
+
+    ``case_dir`` is the folder holding ``oT_Data_*`` / ``oT_Dict_*`` CSVs. ``case_name`` defaults to the name detected from
+    ``oT_Data_Parameter_*.csv``. ``out_dir`` defaults to ``<case_dir>/../<case_name>.parquet`` and is replaced if it exists.
+    Returns the output directory.
+    """
+    source = CSVSource(Path(case_dir))
+    if case_name is not None:
+        source.case_name = case_name
+    out_dir = Path(out_dir) if out_dir is not None else source.case_dir.parent / f"{source.case_name}.parquet"
+    if out_dir.suffix != ".parquet":
+        raise ValueError(f"{out_dir}: a Parquet case directory must end in .parquet, which is how open_source recognises it")
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+
+    for stem in sorted(source.list_dict_stems()):
+        source.read_dict(stem).to_parquet(out_dir / f"oT_Dict_{stem}_{source.case_name}.parquet", engine="pyarrow", index=False)
+    for stem in sorted(source.list_data_stems()):
+        # only the multi-level header tables come with a row index (their first three columns); every other table keeps its columns
+        multilevel = bool(_header_levels(stem, None))
+        source.read_raw_data(stem).to_parquet(out_dir / f"oT_Data_{stem}_{source.case_name}.parquet", engine="pyarrow", index=multilevel)
+    return out_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write an openTEPES CSV case to a .parquet input directory.")
+    parser.add_argument("case_dir", type=Path, help="Case directory with oT_Data_*.csv and oT_Dict_*.csv files.")
+    parser.add_argument("--case-name", default=None, help="Case name (default: detected from oT_Data_Parameter_*.csv).")
+    parser.add_argument("--out", type=Path, default=None, help="Output .parquet directory (default: <case_dir>/../<case>.parquet).")
+    args = parser.parse_args()
+
+    out_dir = write_case(args.case_dir, args.out, args.case_name)
+    size = sum(p.stat().st_size for p in out_dir.iterdir())
+    print(f"wrote {out_dir} ({len(list(out_dir.iterdir()))} tables, {size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""``CutPool`` keeps the cuts of a decomposition loop with their origins, and a re-run with changed data starts from them.
+
+The pool test checks the bookkeeping on hand-made cuts: dominance over the decision bounds, the idle count, the origins and the pickle. The
+case test solves the two-period 9n investment case of ``test_benders_investments.py`` (built again here) with ``--cut-pool`` on, then a copy
+with 5% more demand: started from the saved pool, ``lshaped`` reaches the joint MIP cost of the new data in fewer iterations than from an
+empty master.
+"""
+import glob
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES import openTEPES_run
+from openTEPES.openTEPES_ProblemSolvingBenders import lshaped
+from openTEPES.openTEPES_ProblemSolvingCutPool import Cut, CutPool
+
+
+def test_the_pool_drops_dominated_cuts_and_purges_idle_ones(tmp_path):
+    pool = CutPool(bounds={"a": (0.0, 1.0), "b": (0.0, None)})
+    low  = Cut.at("total", 1.0, {"a": 2.0}, {"a": 0.0, "b": 0.0}, 1)
+    assert pool.add(low) == (low, [])
+    # below the first cut everywhere in the box of a
+    assert pool.add(Cut.at("total", 0.5, {"a": 2.0}, {"a": 0.0, "b": 0.0}, 2)) == (None, [])
+    # above it everywhere: it takes its place
+    high = Cut.at("total", 1.5, {"a": 2.0}, {"a": 0.0, "b": 0.0}, 3)
+    assert pool.add(high) == (high, [low])
+    # neither is above the other: the high cut is lower on b, whose box has no upper bound
+    steep = Cut.at("total", 2.0, {"a": -2.0, "b": 1.0}, {"a": 0.0, "b": 0.0}, 4)
+    other = Cut.at("investment", 0.0, {}, {"a": 1.0, "b": 0.0}, 4)
+    assert pool.add(steep) == (steep, []) and pool.add(other) == (other, [])
+    assert pool.cuts("total") == [high, steep] and len(pool) == 3
+
+    # at a = b = 0 with theta = 2 the steep cut binds and the high one is slack
+    pool.observe({"a": 0.0, "b": 0.0}, {"total": 2.0})
+    assert (high.idle, steep.idle, other.idle) == (1, 0, 0)
+    assert pool.purge(max_idle=0) == [high] and pool.cuts() == [steep, other]
+    assert pool.origins({"a", "b"}) == [{"a": 0.0, "b": 0.0}, {"a": 1.0, "b": 0.0}]
+    assert pool.origins({"a"}) == []
+
+    path = os.path.join(tmp_path, "pool.pkl")
+    pool.save(path)
+    loaded = CutPool.load(path)
+    assert loaded.bounds == pool.bounds
+    assert [(cut.block, cut.constant, cut.coefs, cut.origin, cut.iteration) for cut in loaded.cuts()] == \
+           [(cut.block, cut.constant, cut.coefs, cut.origin, cut.iteration) for cut in pool.cuts()]
+    assert len(CutPool.load(os.path.join(tmp_path, "missing.pkl"))) == 0
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, the operation of each period."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def _investment_9n(tmp_path, growth=1.3):
+    """The four-stage 9n repeated in 2040 with ``growth`` times its demand: a binary line, a binary wind farm and a continuous ESS candidate."""
+    DirName = _four_stage_9n(tmp_path, hours=24)
+    case    = os.path.join(DirName, "9n")
+    path    = os.path.join(case, "oT_Data_Option_9n.csv")
+    dfOption = pd.read_csv(path)
+    dfOption[["IndBinGenInvest", "IndBinNetInvest"]] = 1
+    dfOption.to_csv(path, index=False)
+
+    for path in glob.glob(os.path.join(case, "oT_Data_*_9n.csv")):
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        if df.columns[0] != "Period" or os.path.basename(path) == "oT_Data_Period_9n.csv":
+            continue
+        later = df.copy()
+        later["Period"] = 2040
+        if os.path.basename(path) == "oT_Data_Demand_9n.csv":
+            later.iloc[:, 3:] *= growth
+        pd.concat([df, later]).to_csv(path, index=False)
+    pd.DataFrame({"Period": [2030, 2040]}).to_csv(os.path.join(case, "oT_Dict_Period_9n.csv"), index=False)
+    pd.DataFrame({"Period": [2030, 2040], "Weight": 10}).to_csv(os.path.join(case, "oT_Data_Period_9n.csv"), index=False)
+
+    path  = os.path.join(case, "oT_Data_Generation_9n.csv")
+    dfGen = pd.read_csv(path)
+    dfGen["BinaryInvestment"] = dfGen["BinaryInvestment"].astype(object)
+    dfGen.loc[dfGen["Generator"] == "WindFarm_1", ["FixedInvestmentCost", "FixedChargeRate", "BinaryInvestment"]] = [60, 0.07, "Yes"]
+    dfGen.loc[dfGen["Generator"] == "ESS1",       ["FixedInvestmentCost", "FixedChargeRate"]] = [20, 0.07]
+    dfGen.to_csv(path, index=False)
+    return openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec={"economic": False})
+
+
+@pytest.mark.solve
+def test_a_rerun_with_more_demand_starts_from_the_saved_cuts(tmp_path, monkeypatch):
+    os.makedirs(tmp_path / "base")
+    os.makedirs(tmp_path / "rerun")
+    monkeypatch.setenv("OTEPES_CUT_POOL", "1")
+    base = _investment_9n(tmp_path / "base")
+    result = lshaped(base, solver_name="appsi_highs", max_iter=30)
+    assert result["converged"] and result["warm_cuts"] == 0
+    path = os.path.join(base.pCutPools.directory, "lshaped.pkl")
+    saved = CutPool.load(path)
+    # the cuts binding at the last master solution, each cut at a plan of every decision
+    assert 0 < len(saved) < result["num_iterations"]
+    assert all(set(cut.origin) == set(result["master_decisions"]) for cut in saved.cuts())
+
+    monkeypatch.delenv("OTEPES_CUT_POOL")
+    rerun = _investment_9n(tmp_path / "rerun", growth=1.35)
+    assert rerun.pCutPools is None
+    joint = float(pyo.value(rerun.eTotalSCost))
+    cold  = lshaped(rerun, solver_name="appsi_highs", max_iter=30)
+    warm  = lshaped(rerun, solver_name="appsi_highs", max_iter=30, cut_pool=saved)
+    print(f"cold: {cold['num_iterations']} iterations; warm: {warm['warm_cuts']} origins, {warm['num_iterations']} iterations")
+    for run in (cold, warm):
+        assert run["converged"] and run["total_cost"] == pytest.approx(joint, rel=1e-4)
+    assert warm["warm_cuts"] == len(CutPool.load(path).origins(saved.bounds))
+    assert warm["num_iterations"] < cold["num_iterations"]
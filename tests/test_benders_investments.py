@@ -0,0 +1,126 @@
+"""``lshaped`` decides every investment family in its master, binary ones included, and cuts it from LP operational subproblems.
+
+The case tests expand a two-period 9n whose demand grows by 30%: the candidate line and the wind farm are binary investments, the ESS a
+continuous one, and the joint MIP is what ``InvestmentModelFormulation`` builds. The L-shaped loop reaches the joint MIP cost with a binary
+plan that keeps what it built in 2030 in 2040, solves only LPs below the master, and leaves every variable as it found it; with one cut per
+period or per stage, and with each stabilization, it reaches the same cost.
+"""
+import glob
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES import openTEPES_ProblemSolvingBenders
+from openTEPES.openTEPES import openTEPES_run
+from openTEPES.openTEPES_ProblemSolvingBenders import STABILIZATIONS, lshaped
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, the operation the master cuts from."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def _investment_9n(tmp_path, growth=1.3):
+    """The four-stage 9n repeated in 2040 with ``growth`` times its demand: a binary line, a binary wind farm and a continuous ESS candidate."""
+    DirName = _four_stage_9n(tmp_path, hours=24)
+    case    = os.path.join(DirName, "9n")
+    path    = os.path.join(case, "oT_Data_Option_9n.csv")
+    dfOption = pd.read_csv(path)
+    dfOption[["IndBinGenInvest", "IndBinNetInvest"]] = 1
+    dfOption.to_csv(path, index=False)
+
+    for path in glob.glob(os.path.join(case, "oT_Data_*_9n.csv")):
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        if df.columns[0] != "Period" or os.path.basename(path) == "oT_Data_Period_9n.csv":
+            continue
+        later = df.copy()
+        later["Period"] = 2040
+        if os.path.basename(path) == "oT_Data_Demand_9n.csv":
+            later.iloc[:, 3:] *= growth
+        pd.concat([df, later]).to_csv(path, index=False)
+    pd.DataFrame({"Period": [2030, 2040]}).to_csv(os.path.join(case, "oT_Dict_Period_9n.csv"), index=False)
+    pd.DataFrame({"Period": [2030, 2040], "Weight": 10}).to_csv(os.path.join(case, "oT_Data_Period_9n.csv"), index=False)
+
+    path  = os.path.join(case, "oT_Data_Generation_9n.csv")
+    dfGen = pd.read_csv(path)
+    dfGen["BinaryInvestment"] = dfGen["BinaryInvestment"].astype(object)
+    dfGen.loc[dfGen["Generator"] == "WindFarm_1", ["FixedInvestmentCost", "FixedChargeRate", "BinaryInvestment"]] = [60, 0.07, "Yes"]
+    dfGen.loc[dfGen["Generator"] == "ESS1",       ["FixedInvestmentCost", "FixedChargeRate"]] = [20, 0.07]
+    dfGen.to_csv(path, index=False)
+    return openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec={"economic": False})
+
+
+def _state(mTEPES) -> dict:
+    return {var.name: (var.fixed, var.domain, var.value if var.fixed else None) for var in mTEPES.component_data_objects(pyo.Var)}
+
+
+@pytest.mark.solve
+def test_the_master_carries_the_integrality_of_every_family(tmp_path, monkeypatch):
+    mTEPES = _investment_9n(tmp_path)
+    joint  = float(pyo.value(mTEPES.eTotalSCost))
+    before = _state(mTEPES)
+
+    solved = []
+    subproblem_solver = openTEPES_ProblemSolvingBenders._subproblem_solver
+
+    def _lp_only(solver_name):
+        solver = subproblem_solver(solver_name)
+        solve  = solver.solve
+
+        def _solve(model, **kwargs):
+            solved.append(all(var.fixed or var.is_continuous() for var in model.component_data_objects(pyo.Var)))
+            return solve(model, **kwargs)
+        solver.solve = _solve
+        return solver
+
+    monkeypatch.setattr(openTEPES_ProblemSolvingBenders, "_subproblem_solver", _lp_only)
+    result = lshaped(mTEPES, solver_name="appsi_highs", max_iter=30)
+
+    assert result["converged"] and result["total_cost"] == pytest.approx(joint, rel=1e-4)
+    plan = result["master_decisions"]
+    assert sorted(plan) == sorted([("vGenerationInvest", (p, g)) for p in (2030, 2040) for g in ("WindFarm_1", "ESS1")] +
+                                  [("vNetworkInvest", (p, "Node_1", "Node_4", "dc1")) for p in (2030, 2040)])
+    binary = [key for key in plan if key[1][1] != "ESS1"]
+    assert all(plan[key] in (0.0, 1.0) for key in binary)
+    # eConsecutive*: the master keeps in 2040 what it built in 2030
+    assert all(plan[name, (2030,) + index[1:]] <= plan[name, index] + 1e-9 for name, index in plan if index[0] == 2040)
+    assert solved and all(solved)
+    assert _state(mTEPES) == before
+
+
+@pytest.mark.solve
+@pytest.mark.skipif(sys.platform == "win32", reason="subproblem workers need fork")
+def test_every_variant_reaches_the_joint_mip_cost(tmp_path):
+    mTEPES = _investment_9n(tmp_path)
+    joint  = float(pyo.value(mTEPES.eTotalSCost))
+    for kwargs in [dict(multicut="scenario"), dict(multicut="stage", workers=2)] + [dict(stabilization=method) for method in STABILIZATIONS]:
+        result = lshaped(mTEPES, solver_name="appsi_highs", max_iter=30, **kwargs)
+        print(f"{kwargs}: {result['num_iterations']} iterations, {result['num_subproblems']} cuts each")
+        assert result["converged"] and result["total_cost"] == pytest.approx(joint, rel=1e-4), kwargs
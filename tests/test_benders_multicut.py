@@ -0,0 +1,134 @@
+"""``lshaped`` with ``multicut`` adds one cut per scenario or per stage, and solves those subproblems in forked workers.
+
+The case tests expand the candidate line of a four-stage 9n with three demand scenarios. Per stage or per scenario the L-shaped loop reaches the
+joint-LP cost in fewer iterations than with the single cut, with the blocks solved in two workers or in this process on persistent HiGHS
+instances loaded once each, and leaves the model as it found it. A generation candidate is one more master decision; a variable two blocks
+share couples them, and the split refuses it.
+"""
+import glob
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES import openTEPES_run
+from openTEPES.openTEPES_ProblemSolvingBenders import lshaped
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, the blocks of the per-stage cuts."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def _expansion_9n(tmp_path, scenarios=3, wind=False):
+    """The four-stage 9n with its candidate line expanded and ``scenarios`` equally likely scenarios, each with 15% more demand than the last."""
+    DirName = _four_stage_9n(tmp_path, hours=24)
+    case    = os.path.join(DirName, "9n")
+    path    = os.path.join(case, "oT_Data_Option_9n.csv")
+    dfOption = pd.read_csv(path)
+    dfOption["IndBinNetInvest"] = 0
+    dfOption.to_csv(path, index=False)
+
+    names = [f"sc{s:02d}" for s in range(1, scenarios + 1)]
+    for path in glob.glob(os.path.join(case, "oT_Data_*_9n.csv")):
+        df = pd.read_csv(path)
+        if "Scenario" not in df.columns or "LoadLevel" not in df.columns:
+            continue
+        copies = []
+        for s, name in enumerate(names):
+            copy = df.copy()
+            copy["Scenario"] = name
+            if os.path.basename(path) == "oT_Data_Demand_9n.csv":
+                copy.iloc[:, 3:] *= 1 + 0.15*s
+            copies.append(copy)
+        pd.concat(copies).to_csv(path, index=False)
+    pd.DataFrame({"Scenario": names}).to_csv(os.path.join(case, "oT_Dict_Scenario_9n.csv"), index=False)
+    pd.DataFrame({"Period": 2030, "Scenario": names, "Probability": 1/scenarios}).to_csv(os.path.join(case, "oT_Data_Scenario_9n.csv"), index=False)
+
+    if wind:
+        path  = os.path.join(case, "oT_Data_Generation_9n.csv")
+        dfGen = pd.read_csv(path)
+        dfGen.loc[dfGen["Generator"] == "WindFarm_1", ["FixedInvestmentCost", "FixedChargeRate"]] = [60, 0.07]
+        dfGen.to_csv(path, index=False)
+    return openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec={"economic": False})
+
+
+def _spy_set_instance(monkeypatch):
+    """Count the loads of a whole model into an ``appsi_highs`` instance."""
+    from pyomo.contrib.appsi.solvers.highs import Highs
+    calls = []
+    real  = Highs.set_instance
+    monkeypatch.setattr(Highs, "set_instance", lambda self, model: (calls.append(model.name), real(self, model))[1])
+    return calls
+
+
+@pytest.mark.solve
+@pytest.mark.skipif(sys.platform == "win32", reason="subproblem workers need fork")
+def test_one_cut_per_scenario_or_stage_takes_fewer_iterations(tmp_path, monkeypatch):
+    mTEPES = _expansion_9n(tmp_path)
+    joint  = float(pyo.value(mTEPES.eTotalSCost))
+
+    single   = lshaped(mTEPES, solver_name="highs", max_iter=30)
+    stage    = lshaped(mTEPES, solver_name="highs", max_iter=30, multicut="stage", workers=2)
+    loads    = _spy_set_instance(monkeypatch)
+    scenario = lshaped(mTEPES, solver_name="appsi_highs", max_iter=30, multicut="scenario")
+
+    for result in (single, stage, scenario):
+        assert result["converged"] and result["total_cost"] == pytest.approx(joint, rel=1e-4)
+    # twelve stages or three scenarios, and the investment cost
+    assert (single["num_subproblems"], stage["num_subproblems"], scenario["num_subproblems"]) == (1, 13, 4)
+    assert stage["num_iterations"] < single["num_iterations"] and scenario["num_iterations"] < single["num_iterations"]
+    # each block was loaded once into its own instance, whatever the number of iterations
+    assert sorted(loads) == sorted(["benders_master"] + [mTEPES.name]*4)
+    # the model is left at the incumbent, whose cost is the one returned
+    assert pyo.value(mTEPES.eTotalSCost) == pytest.approx(scenario["total_cost"])
+
+    # the model is left as it was found: the whole LP solves to the joint cost again
+    assert mTEPES.component("_benders_objective") is None and mTEPES.component("_benders_fix_constr") is None
+    assert all(component.active for component in mTEPES.component_objects(pyo.Constraint)) and mTEPES.eTotalSCost.active
+    pyo.SolverFactory("highs").solve(mTEPES)
+    assert pyo.value(mTEPES.eTotalSCost) == pytest.approx(joint, rel=1e-9)
+
+
+@pytest.mark.solve
+def test_a_variable_two_blocks_share_couples_them(tmp_path):
+    mTEPES = _expansion_9n(tmp_path, scenarios=2, wind=True)
+    joint  = float(pyo.value(mTEPES.eTotalSCost))
+    with pytest.raises(ValueError, match="multicut must be"):
+        lshaped(mTEPES, solver_name="highs", multicut="period")
+    # the wind investment every scenario needs is a master decision, next to the candidate line
+    result = lshaped(mTEPES, solver_name="highs", max_iter=30, multicut="scenario")
+    assert result["converged"] and result["total_cost"] == pytest.approx(joint, rel=1e-4)
+    assert ("vGenerationInvest", (2030, "WindFarm_1")) in result["master_decisions"]
+    # a constraint across the scenarios that no master decision carries
+    first, second = (next(key for key in mTEPES.vTotalGCost if key[1] == sc) for sc in ("sc01", "sc02"))
+    mTEPES.coupling = pyo.Constraint(expr=mTEPES.vTotalGCost[first] <= mTEPES.vTotalGCost[second] + 1.0e3)
+    with pytest.raises(ValueError, match=r"share 1 variables .*vTotalGCost\[2030,sc02,"):
+        lshaped(mTEPES, solver_name="highs", multicut="scenario")
+    assert mTEPES.component("_benders_fix_constr") is None
@@ -0,0 +1,109 @@
+"""``lshaped`` with ``stabilization`` solves the subproblems at a point held near the incumbent: a box trust region, an in-out point or a level.
+
+The case tests run every method next to the plain cutting plane on the 7-day 9n of the Benders parity test in ``test_run.py`` and on the
+three-scenario, four-stage expansion of ``test_benders_multicut.py``, both built again here: each converges to the joint-LP cost, reports a lower bound that never
+drops and a gap that never grows, leaves the model at the cost of its best upper bound, and on the expansion case needs fewer iterations
+than the plain cutting plane.
+"""
+import glob
+import os
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES import openTEPES_run
+from openTEPES.openTEPES_ProblemSolvingBenders import STABILIZATIONS, lshaped
+
+
+def test_an_unknown_method_is_refused_before_the_model_is_touched():
+    with pytest.raises(ValueError, match="stabilization must be"):
+        lshaped(SimpleNamespace(), stabilization="bundle")
+
+
+def _runs(mTEPES, **kwargs) -> dict:
+    joint = float(pyo.value(mTEPES.eTotalSCost))
+    runs  = {}
+    for method in (None,) + STABILIZATIONS:
+        result = runs[method] = lshaped(mTEPES, solver_name="appsi_highs", max_iter=30, stabilization=method, **kwargs)
+        # the model is left at the operation of the incumbent, not at that of the last point tried
+        assert pyo.value(mTEPES.vTotalSCost) == pytest.approx(result["total_cost"], rel=1e-6)
+        print(f"{str(method):12s}: {result['num_iterations']:2d} iterations, {result['serious_steps']:2d} serious steps, "
+              f"final gap {result['history'][-1][3]:.2e}, {result['wall_clock_s']:.1f} s")
+        assert result["converged"] and result["stabilization"] == method
+        assert result["total_cost"] == pytest.approx(joint, rel=1e-4)
+        _, LB, UB, gap, _ = zip(*result["history"])
+        assert all(b >= a for a, b in zip(LB, LB[1:])) and all(b <= a for a, b in zip(gap, gap[1:]))
+        assert list(gap) == pytest.approx([u - l for l, u in zip(LB, UB)])
+    return runs
+
+
+def _copy_9n(tmp_path):
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+    return case
+
+
+def _seven_day_9n(tmp_path):
+    """9n kept to its first week, which stands in for the year (StageWeight 52), without the RES energy constraint."""
+    case = _copy_9n(tmp_path)
+    path = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1, 2])
+    df.iloc[168:, df.columns.get_loc("Duration")] = np.nan
+    df.to_csv(path)
+
+    path = os.path.join(case, "oT_Data_Stage_9n.csv")
+    df   = pd.read_csv(path, index_col=[0])
+    df["Weight"] = 52
+    df.to_csv(path)
+    return openTEPES_run(str(tmp_path), "9n", "highs", 0, 0)
+
+
+def _expansion_9n(tmp_path, scenarios=3):
+    """9n cut into four stages of 24 load levels, with its candidate line expanded and ``scenarios`` equally likely scenarios, each with 15%
+    more demand than the last."""
+    case   = _copy_9n(tmp_path)
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[96:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // 24, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    names = [f"sc{s:02d}" for s in range(1, scenarios + 1)]
+    for path in glob.glob(os.path.join(case, "oT_Data_*_9n.csv")):
+        df = pd.read_csv(path)
+        if "Scenario" not in df.columns or "LoadLevel" not in df.columns:
+            continue
+        copies = []
+        for s, name in enumerate(names):
+            copy = df.copy()
+            copy["Scenario"] = name
+            if os.path.basename(path) == "oT_Data_Demand_9n.csv":
+                copy.iloc[:, 3:] *= 1 + 0.15*s
+            copies.append(copy)
+        pd.concat(copies).to_csv(path, index=False)
+    pd.DataFrame({"Scenario": names}).to_csv(os.path.join(case, "oT_Dict_Scenario_9n.csv"), index=False)
+    pd.DataFrame({"Period": 2030, "Scenario": names, "Probability": 1/scenarios}).to_csv(os.path.join(case, "oT_Data_Scenario_9n.csv"), index=False)
+    return openTEPES_run(str(tmp_path), "9n", "highs", 0, 0, output_spec={"economic": False})
+
+
+@pytest.mark.solve
+def test_every_method_matches_the_joint_lp(tmp_path):
+    _runs(_seven_day_9n(tmp_path))
+
+
+@pytest.mark.solve
+def test_a_stabilized_master_takes_fewer_iterations_on_an_expansion_case(tmp_path):
+    runs = _runs(_expansion_9n(tmp_path))
+    assert all(runs[method]["num_iterations"] < runs[None]["num_iterations"] for method in STABILIZATIONS)
@@ -0,0 +1,87 @@
+"""The constraint registry selects the same constraints as the name scans it replaces in the stage loop.
+
+The unit test pins the selections against the substring and suffix matches of the component names; the case test checks that every
+per-stage constraint component the formulation modules build is recorded in the registry, so none is left active by a registry lookup.
+"""
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_ConstraintRegistry import AddStageConstraint, StageConstraints
+
+
+def _model():
+    m   = pyo.ConcreteModel()
+    m.n = pyo.Set(initialize=['n1', 'n2'])
+    m.x = pyo.Var(m.n)
+    for p, sc, st in [(2030, 'sc01', 'st1'), (2030, 'sc01', 'st2'), (2030, 'sc02', 'st1'), (2040, 'sc01', 'st1')]:
+        for family in ('eBalanceElec', 'eMaxOutput'):
+            AddStageConstraint(m, family, p, sc, st, pyo.Constraint(m.n, rule=lambda m, n: m.x[n] >= 0.0))
+    m.eTotalICost = pyo.Constraint(expr=m.x['n1'] >= 0.0)
+    return m
+
+
+def _names(constraints):
+    return sorted(c.name for c in constraints)
+
+
+def test_selections_match_the_name_scans():
+    m        = _model()
+    registry = StageConstraints(m)
+    scanned  = list(m.component_objects(pyo.Constraint))
+
+    assert _names(registry.select(2030, 'sc01')) == _names(c for c in scanned if '_2030_sc01_' in c.name)
+    assert _names(registry.select(st='st1'))     == _names(c for c in scanned if c.name.endswith('st1'))
+    assert registry.get('eMaxOutput', 2040, 'sc01', 'st1') is m.eMaxOutput_2040_sc01_st1
+    assert registry.get('eMaxOutput', 2040, 'sc01', 'st2') is None
+
+    registry.deactivate(2030, 'sc01')
+    assert _names(c for c in m.component_objects(pyo.Constraint, active=True)) == _names(c for c in scanned if '_2030_sc01_' not in c.name)
+    registry.activate(st='st1')
+    assert not m.eBalanceElec_2030_sc01_st2.active and m.eBalanceElec_2030_sc01_st1.active
+
+    # a component removed from the model is no longer returned
+    m.del_component(m.eMaxOutput_2030_sc02_st1)
+    assert _names(registry.stage(2030, 'sc02', 'st1')) == ['eBalanceElec_2030_sc02_st1']
+    assert registry.get('eMaxOutput', 2030, 'sc02', 'st1') is None
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, so the stage loop selects constraints of several stages."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+def test_every_stage_constraint_is_registered(tmp_path, monkeypatch):
+    from openTEPES.openTEPES import openTEPES_run
+
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    mTEPES   = openTEPES_run(_four_stage_9n(tmp_path, hours=24), "9n", "highs", 0, 0)
+    suffixes = tuple(f'_{p}_{sc}_{st}' for p, sc, st in mTEPES.ps*mTEPES.stt)
+    assert _names(StageConstraints(mTEPES).select()) == _names(c for c in mTEPES.component_objects(pyo.Constraint) if c.name.endswith(suffixes))
@@ -0,0 +1,106 @@
+"""The dual store keeps each constraint family's duals in arrays keyed by ``(p, sc, st) + index``.
+
+These pin the contract the output writers rely on: a family and key built from the sets the writers iterate find the same dual that the
+string key ``"eBalanceElec_{p}_{sc}_{st}('{n}', '{nd}')"`` used to, a re-collected stage replaces its values, and a missing key fails loudly.
+"""
+import pickle
+
+import numpy as np
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore, collect_duals
+
+
+def _stage_model():
+    """Two stages of a two-node balance plus a per-period constraint, named the way the formulation names them."""
+    m = pyo.ConcreteModel()
+    m.p   = pyo.Set(initialize=[2030])
+    m.sc  = pyo.Set(initialize=["sc01"])
+    m.stt = pyo.Set(initialize=["st1", "st11"])
+    m.pDuals = DualStore()
+    m.x = pyo.Var()
+    for st, n in (("st1", ["01", "02"]), ("st11", ["03"])):
+        m.add_component(f"eBalanceElec_2030_sc01_{st}", pyo.Constraint([(nn, nd) for nn in n for nd in ("Node_1", "Node_2")], rule=lambda m, *index: m.x >= 0))
+        m.add_component(f"eSystemRampUp_2030_sc01_{st}", pyo.Constraint(n, rule=lambda m, *index: m.x >= 0))
+    m.eTotalFElecCost = pyo.Constraint(m.p, rule=lambda m, *index: m.x >= 0)
+    return m
+
+
+def _fill(m, offset=0.0):
+    """Attach a dual Suffix with a distinct value per constraint data, as a solve would."""
+    m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+    values = {}
+    for i, con in enumerate(m.component_data_objects(pyo.Constraint)):
+        m.dual[con] = values[con.parent_component().name, con.index()] = float(i) + offset
+    return values
+
+
+def test_collected_duals_are_found_by_family_and_key():
+    m = _stage_model()
+    values = _fill(m)
+    collect_duals(m, m)
+
+    assert sorted(m.pDuals.families()) == ["eBalanceElec", "eSystemRampUp", "eTotalFElecCost"]
+    assert len(m.pDuals) == len(values)
+    keys = [(2030, "sc01", "st1", "02", "Node_2"), (2030, "sc01", "st11", "03", "Node_1")]
+    np.testing.assert_array_equal(m.pDuals.lookup("eBalanceElec", keys),
+                                  [values["eBalanceElec_2030_sc01_st1", ("02", "Node_2")], values["eBalanceElec_2030_sc01_st11", ("03", "Node_1")]])
+    assert m.pDuals["eSystemRampUp", (2030, "sc01", "st11", "03")] == values["eSystemRampUp_2030_sc01_st11", "03"]
+    assert m.pDuals["eTotalFElecCost", (2030,)] == values["eTotalFElecCost", 2030]
+    assert not hasattr(m, "dual")
+
+
+def test_frame_has_one_column_per_key_level():
+    m = _stage_model()
+    _fill(m)
+    collect_duals(m, m)
+    frame = m.pDuals.frame("eBalanceElec")
+    assert list(frame.columns) == ["level_0", "level_1", "level_2", "level_3", "level_4", "Dual"]
+    assert len(frame) == 6
+    assert set(frame["level_2"]) == {"st1", "st11"}
+
+
+def test_a_recollected_stage_replaces_its_duals():
+    m = _stage_model()
+    _fill(m)
+    collect_duals(m, m)
+    before = len(m.pDuals)
+    values = _fill(m, offset=100.0)
+    collect_duals(m, m)
+    assert len(m.pDuals) == before
+    assert m.pDuals["eBalanceElec", (2030, "sc01", "st1", "01", "Node_1")] == values["eBalanceElec_2030_sc01_st1", ("01", "Node_1")]
+
+
+def test_missing_key_raises_and_component_lookup_fills_nan():
+    m = _stage_model()
+    _fill(m)
+    collect_duals(m, m)
+    with pytest.raises(KeyError):
+        m.pDuals.lookup("eBalanceElec", [(2030, "sc01", "st1", "03", "Node_1")])
+    with pytest.raises(KeyError):
+        m.pDuals.lookup("eBalanceH2", [(2030, "sc01", "st1", "01", "Node_1")])
+    duals = m.pDuals.of("eBalanceElec_2030_sc01_st11", [("03", "Node_2"), ("99", "Node_2")])
+    assert duals[0] == m.pDuals["eBalanceElec", (2030, "sc01", "st11", "03", "Node_2")]
+    assert np.isnan(duals[1])
+    assert np.isnan(m.pDuals.of("eNotCollected", ["a"])).all()
+
+
+def test_store_survives_pickling_and_merges():
+    m = _stage_model()
+    _fill(m)
+    collect_duals(m, m)
+    merged = DualStore()
+    merged.update(pickle.loads(pickle.dumps(m.pDuals)))
+    assert len(merged) == len(m.pDuals)
+    assert merged.series("eSystemRampUp").equals(m.pDuals.series("eSystemRampUp"))
+
+
+def test_cleared_store_is_as_new():
+    m = _stage_model()
+    _fill(m)
+    collect_duals(m, m)
+    m.pDuals.clear()
+    assert len(m.pDuals) == 0 and not m.pDuals.families()
+    assert vars(m.pDuals) == vars(DualStore())
+    assert np.isnan(m.pDuals.of("eBalanceElec_2030_sc01_st1", [("01", "Node_1")])).all()
@@ -5,16 +5,29 @@ sets and parameters as the original CSV case. Inverse: ``export_case`` (Tool_Duc
 back out to CSV; a model built from the exported CSVs must again match the original. Both hops are compared with the
 same snapshot the CSV/DuckDB input-parity probe uses. Covers all four transform kinds: passthrough, wide-to-long,
 single-row unpivot (9n) and multi-level-header (9n_PTDF). No model is solved, so this runs in the fast CI job.
+
+The DuckDB backend also leaves out the time-series rows of periods and scenarios the model does not solve; the idle-period tests pin that
+those rows are not read and that the model solves as its CSV case does. A repeated key in a long time series is an error even when the table
+is sparse.
 """
+import glob
 import os
+import shutil
 import sys
 
+import duckdb
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "openTEPES_DuckDB"))
 from Tool_CSV_to_DuckDB import write_case
 from Tool_DuckDB_to_CSV import export_case
 from openTEPES._input_parity_test import compare_snapshots, snapshot
+from openTEPES.openTEPES import openTEPES_run
+from openTEPES.openTEPES_InputCSVSource import CSVSource
+from openTEPES.openTEPES_InputDuckDBSource import DuckDBSource
 
 CASES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases"))
 
@@ -50,3 +63,79 @@ def test_shipped_example_duckdb_matches_9n_csv():
         "  python scripts/openTEPES_DuckDB/Tool_CSV_to_DuckDB.py openTEPES/cases/9n "
         "--db openTEPES/cases/9n_duckdb/9n.duckdb\n" + "\n".join(diffs[:10])
     )
+
+
+def _with_idle_period(case_dir):
+    """Give a 9n case directory a second period, 2040, a copy of 2030 with weight 0 (not solved)."""
+    for path in sorted(glob.glob(os.path.join(case_dir, "oT_D*_9n.csv"))):
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        if "Period" not in df.columns:
+            continue
+        idle = df[df["Period"] == 2030].assign(Period=2040)
+        if path.endswith("oT_Data_Period_9n.csv"):
+            idle["Weight"] = 0
+        pd.concat([df, idle]).to_csv(path, index=False)
+
+
+def _four_stage_9n(tmp_path, hours=48):
+    """9n cut into four stages of ``hours`` load levels each, the case the idle period is added to."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def test_idle_periods_are_not_read(tmp_path):
+    case_dir = os.path.join(_four_stage_9n(tmp_path / "case"), "9n")
+    _with_idle_period(case_dir)
+    with DuckDBSource(write_case(case_dir, tmp_path / "9n.duckdb")) as source:
+        demand = source.read_data("Demand")
+    assert set(demand.index.get_level_values("Period")) == {2030}
+    expected = CSVSource(case_dir).read_data("Demand")
+    pd.testing.assert_frame_equal(demand, expected.loc[[2030]])
+
+    # the exporter keeps the whole case
+    out_dir = export_case(tmp_path / "9n.duckdb", tmp_path / "9n_from_db")
+    pd.testing.assert_frame_equal(CSVSource(out_dir).read_data("Demand"), expected)
+
+
+@pytest.mark.solve
+def test_a_duckdb_case_with_an_idle_period_solves_like_its_csv_case(tmp_path):
+    case_dir = os.path.join(_four_stage_9n(tmp_path / "case"), "9n")
+    _with_idle_period(case_dir)
+    (tmp_path / "db").mkdir()
+    write_case(case_dir, tmp_path / "db" / "9n.duckdb")
+    csv = openTEPES_run(os.path.dirname(case_dir), "9n", "highs", 0, 0)
+    db  = openTEPES_run(str(tmp_path / "db"), "9n.duckdb", "highs", 0, 0)
+    assert list(db.p) == list(csv.p) == [2030]
+    assert pyo.value(db.eTotalSCost) == pytest.approx(pyo.value(csv.eTotalSCost), rel=1e-9)
+
+
+def test_a_repeated_key_in_a_sparse_table_is_rejected(tmp_path):
+    db_path = write_case(os.path.join(CASES_DIR, "9n"), tmp_path / "9n.duckdb")
+    with duckdb.connect(str(db_path)) as con:
+        # one missing and one repeated row: as many rows as a dense table, so only a key count can tell
+        first, second = con.execute("SELECT LoadLevel FROM demand GROUP BY LoadLevel ORDER BY min(rowid) LIMIT 2").fetchall()
+        con.execute("DELETE FROM demand WHERE LoadLevel = ? AND Node = 'Node_1'", first)
+        con.execute("INSERT INTO demand SELECT * FROM demand WHERE LoadLevel = ? AND Node = 'Node_1'", second)
+    with DuckDBSource(db_path) as source, pytest.raises(ValueError, match="duplicate"):
+        source.read_data("Demand")
@@ -0,0 +1,89 @@
+"""The pre-solve infeasibility check reports every violation at once, with the verdict of the term-by-term sums.
+
+The window test pins that the cumulative-sum screening never changes a verdict, including where a window lands exactly on its bound; the case
+test pins that a case with several violating units gets one error listing all of them.
+"""
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_DataConfiguration import DataConfiguration
+from openTEPES.openTEPES_InfeasibilityCheck import _window_violations
+from openTEPES.openTEPES_InputData import InputData
+from openTEPES.openTEPES_SettingUpVariables import SettingUpVariables
+
+
+def _term_by_term(terms, ends, steps, base, bound):
+    found = []
+    for k, end in enumerate(ends):
+        lhs = base[k] + sum(terms[end-steps:end].tolist())
+        if lhs < bound[k]:
+            found.append((k, lhs))
+    return found
+
+
+def test_windows_match_the_sequential_sums():
+    rng   = np.random.default_rng(7)
+    terms = rng.normal(0.0, 100.0, 8736)
+    for steps in (1, 24, 168):
+        ends  = np.arange(steps, len(terms)+1, steps)
+        base  = rng.uniform(0.0, 500.0, len(ends))
+        bound = base + np.array([sum(terms[end-steps:end].tolist()) for end in ends])
+        # every window lands exactly on its bound, where a cumulative sum is off by rounding either way: none is a violation
+        assert _window_violations(terms, ends, steps, base, bound) == _term_by_term(terms, ends, steps, base, bound) == []
+        bound = bound + rng.normal(0.0, 50.0, len(ends))
+        assert _window_violations(terms, ends, steps, base, bound) == _term_by_term(terms, ends, steps, base, bound) != []
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, the case the check is run on before it solves."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def test_every_violation_is_reported_at_once(tmp_path):
+    DirName = _four_stage_9n(tmp_path, hours=24)
+    case    = os.path.join(DirName, "9n")
+    # daily minimum energy above what the wind farm and the solar plant can produce
+    generation = pd.read_csv(os.path.join(case, "oT_Data_Generation_9n.csv"))
+    generation["EnergyType"] = generation["EnergyType"].astype(object)
+    generation.loc[generation["Generator"].isin(["WindFarm_1", "SolarPV_1"]), "EnergyType"] = "Daily"
+    generation.to_csv(os.path.join(case, "oT_Data_Generation_9n.csv"), index=False)
+    energy = pd.read_csv(os.path.join(case, "oT_Data_VariableMinEnergy_9n.csv"), index_col=[0, 1, 2])
+    energy[["WindFarm_1", "SolarPV_1"]] = 5000.0
+    energy.to_csv(os.path.join(case, "oT_Data_VariableMinEnergy_9n.csv"))
+
+    mTEPES   = pyo.ConcreteModel()
+    dfs, par = InputData(DirName, "9n", mTEPES, 0)
+    DataConfiguration(mTEPES, dfs, par)
+    with pytest.raises(ValueError) as raised:
+        SettingUpVariables(mTEPES, mTEPES)
+    lines = str(raised.value).splitlines()
+    assert lines[0] == f'### {len(lines)-1} infeasibilities detected in the case data:'
+    assert {line.split()[-2] for line in lines[1:]} == {"WindFarm_1", "SolarPV_1"}
+    assert all(line.startswith('### Minimum energy violation 2030 sc01') for line in lines[1:])
@@ -0,0 +1,167 @@
+"""The built model can be cached between runs, keyed by everything that shapes it.
+
+The key tests pin what makes a cached model safe to reuse: any change to an input table or a case setting gives a new key, and a source with
+no files is not cached. The pickling test pins that a construction rule closing over the model comes back pointing at the loaded model.
+"""
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+import openTEPES.openTEPES as oT
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ModelCache import ModelCache, cache_dir, model_key
+
+
+def _case(tmp_path):
+    case = tmp_path / "toy"
+    case.mkdir()
+    (case / "oT_Data_Parameter_toy.csv").write_text("ENSCost,10\n")
+    (case / "oT_Dict_Period_toy.csv").write_text("Period\n2030\n")
+    (case / "oT_Result_Generation_toy.csv").write_text("not an input\n")
+    return str(tmp_path), case
+
+
+def test_off_when_nothing_is_set(monkeypatch, tmp_path):
+    monkeypatch.delenv("OTEPES_MODEL_CACHE", raising=False)
+    assert cache_dir() is None
+    assert ModelCache.create(*_case(tmp_path)[:1], "toy") is None
+    assert parser.parse_args(["--model-cache", "cache"]).model_cache == "cache"
+
+
+def test_key_follows_inputs_and_settings(tmp_path):
+    DirName, case = _case(tmp_path)
+    key = model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+    assert key == model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+    assert key != model_key(DirName, "toy", settings={"pIndCycleFlow": 1})
+
+    (case / "oT_Result_Generation_toy.csv").write_text("outputs do not count\n")
+    assert key == model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+    (case / "oT_Dict_Period_toy.csv").write_text("Period\n2031\n")
+    assert key != model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+
+
+def test_key_follows_the_fast_csv_read(monkeypatch, tmp_path):
+    DirName, _ = _case(tmp_path)
+    monkeypatch.delenv("OTEPES_FAST_CSV", raising=False)
+    key = model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+    monkeypatch.setenv("OTEPES_FAST_CSV", "1")
+    assert key != model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+    monkeypatch.setenv("OTEPES_FAST_CSV", "")
+    assert key == model_key(DirName, "toy", settings={"pIndCycleFlow": 0})
+
+
+def test_sources_without_files_are_not_cached(monkeypatch, tmp_path):
+    monkeypatch.setenv("OTEPES_MODEL_CACHE", str(tmp_path / "cache"))
+
+    class InMemory:
+        case_name = "toy"
+
+    assert model_key(str(tmp_path), "toy", InMemory()) is None
+    assert ModelCache.create(str(tmp_path), "toy", InMemory()) is None
+    assert model_key(str(tmp_path), "missing") is None
+
+
+def test_rules_closing_over_the_model_come_back_bound_to_the_loaded_model(monkeypatch, tmp_path):
+    monkeypatch.setenv("OTEPES_MODEL_CACHE", str(tmp_path / "cache"))
+    DirName, _ = _case(tmp_path)
+
+    def build():
+        m = pyo.ConcreteModel()
+        m.i = pyo.Set(initialize=[1, 2])
+        m.x = pyo.Var(m.i, bounds=(0, 3))
+        def rule(OptModel, i):
+            return m.x[i] >= i
+        m.c = pyo.Constraint(m.i, rule=rule)
+        m.o = pyo.Objective(expr=sum(m.x[i] for i in m.i))
+        m.pInputSource = object()   # stands in for an open database connection
+        return m
+
+    cache = ModelCache.create(DirName, "toy")
+    assert cache.load() is None
+    built = build()
+    cache.save(built)
+    assert hasattr(built, "pInputSource")
+
+    loaded = ModelCache.create(DirName, "toy").load()
+    assert not hasattr(loaded, "pInputSource")
+    cells = [cell.cell_contents for cell in loaded.c.rule._fcn.__closure__]
+    assert cells == [loaded]
+    pyo.SolverFactory("highs").solve(loaded)
+    assert pyo.value(loaded.o) == pytest.approx(3)
+
+
+def test_an_unreadable_entry_is_dropped(monkeypatch, tmp_path):
+    monkeypatch.setenv("OTEPES_MODEL_CACHE", str(tmp_path / "cache"))
+    cache = ModelCache.create(*_case(tmp_path)[:1], "toy")
+    with open(cache.path, "wb") as f:
+        f.write(b"truncated")
+    assert cache.load() is None
+    assert not os.path.exists(cache.path)
+
+
+def test_an_entry_replaced_while_it_was_read_is_kept(monkeypatch, tmp_path):
+    monkeypatch.setenv("OTEPES_MODEL_CACHE", str(tmp_path / "cache"))
+    cache = ModelCache.create(*_case(tmp_path)[:1], "toy")
+    with open(cache.path, "wb") as f:
+        f.write(b"truncated")
+
+    # another run renames its complete entry into place after this one opened the truncated file
+    def load(f):
+        ModelCache(os.path.dirname(cache.path), "toy", "x").save(pyo.ConcreteModel())
+        os.replace(os.path.join(os.path.dirname(cache.path), "oT_Model_toy_x.pkl"), cache.path)
+        raise EOFError("truncated")
+    with monkeypatch.context() as patch:
+        patch.setattr(pickle, "load", load)
+        assert cache.load() is None
+    assert isinstance(cache.load(), pyo.ConcreteModel)
+
+    # and an entry another run removed first is not an error
+    os.remove(cache.path)
+    assert cache.load() is None
+
+
+def _four_stage_9n(tmp_path, hours=48):
+    """9n cut into four stages of ``hours`` load levels each, the case the cache test builds twice."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+def test_a_repeat_run_loads_the_cached_model(monkeypatch, tmp_path):
+    monkeypatch.setenv("OTEPES_MODEL_CACHE", str(tmp_path / "cache"))
+    DirName = _four_stage_9n(tmp_path / "case")
+    built   = oT.openTEPES_run(DirName, "9n", "highs", 0, 0)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    def no_build(*args, **kwargs):
+        raise AssertionError("the model was built again")
+
+    monkeypatch.setattr(oT, "InputData", no_build)
+    loaded = oT.openTEPES_run(DirName, "9n", "highs", 0, 0)
+    assert pyo.value(loaded.eTotalSCost) == pytest.approx(pyo.value(built.eTotalSCost), rel=1e-9)
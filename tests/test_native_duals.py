@@ -0,0 +1,160 @@
+"""With ``--native-fixed-duals`` the duals of a MIP stage come from the fixed LP the solver builds from its own MIP, not from a Pyomo re-solve.
+
+The unit tests solve a small MIP, fix its decisions as ``fix_for_duals`` does, and solve the fixed LP both ways, on persistent HiGHS and, when
+Gurobi is installed, on its persistent and direct interfaces: the dispatch and the prices of the balance are the same. The case test solves a
+four-stage 9n with binary commitment on ``appsi_highs``: no stage is re-solved through Pyomo, and the duals the outputs read and the total cost
+are those of the Pyomo re-solve.
+"""
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingNativeDuals import SolveFixedLp, enabled
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_NATIVE_DUALS", raising=False)
+    assert not enabled() and not SolveFixedLp(None, None, "appsi_highs")
+    monkeypatch.setenv("OTEPES_NATIVE_DUALS", "1")
+    assert enabled() and not SolveFixedLp(None, None, "highs")
+    assert parser.parse_args(["--native-fixed-duals"]).native_fixed_duals
+
+
+def _mip():
+    """Two plants behind a commitment each, one candidate capacity, and a demand per hour."""
+    m        = pyo.ConcreteModel("mip")
+    m.h      = pyo.RangeSet(3)
+    m.g      = pyo.Set(initialize=["base", "peak"])
+    m.out    = pyo.Var(m.g, m.h, bounds=(0, 10))
+    m.on     = pyo.Var(m.g, m.h, within=pyo.Binary)
+    m.inv    = pyo.Var(bounds=(0, 5))
+    m.ens    = pyo.Var(m.h, bounds=(0, None))
+    m.bal    = pyo.Constraint(m.h, rule=lambda m, h: m.out["base", h] + m.out["peak", h] + m.inv + m.ens[h] == 6 + 3*h)
+    m.max    = pyo.Constraint(m.g, m.h, rule=lambda m, g, h: m.out[g, h] <= (8 if g == "base" else 6)*m.on[g, h])
+    m.min    = pyo.Constraint(m.g, m.h, rule=lambda m, g, h: m.out[g, h] >= 2*m.on[g, h])
+    m.obj    = pyo.Objective(expr=sum(3*m.out["base", h] + 7*m.out["peak", h] + 4*m.on["base", h] + 2*m.on["peak", h] + 100*m.ens[h] for h in m.h)
+                             + 9*m.inv)
+    return m
+
+
+def _fix(m):
+    """What ``fix_for_duals`` leaves on the model after the MIP solve."""
+    for var in m.on.values():
+        var.fix(var.value)
+        var.domain = pyo.UnitInterval
+    m.inv.fix(m.inv.value)
+
+
+def _duals(SolverName, native, monkeypatch):
+    monkeypatch.setenv("OTEPES_NATIVE_DUALS", "1" if native else "")
+    m      = _mip()
+    Solver = pyo.SolverFactory(SolverName)
+    if SolverName == "gurobi_persistent":
+        Solver.set_instance(m)
+    Solver.solve(m)
+    _fix(m)
+    if not native:
+        m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
+        if SolverName == "gurobi_persistent":
+            for var in m.component_data_objects(pyo.Var):
+                Solver.update_var(var)
+        Solver.solve(m)
+    else:
+        assert SolveFixedLp(m, Solver, SolverName)
+    return {con.name: m.dual[con] for con in m.component_data_objects(pyo.Constraint)}, {var.name: var.value for var in m.component_data_objects(pyo.Var)}
+
+
+@pytest.mark.solve
+@pytest.mark.parametrize("SolverName", ["appsi_highs", "appsi_gurobi", "gurobi_persistent", "gurobi_direct"])
+def test_the_fixed_lp_of_the_solver_gives_the_duals_of_the_pyomo_resolve(SolverName, monkeypatch):
+    if "gurobi" in SolverName:
+        pytest.importorskip("gurobipy")
+    (resolved, solution), (native, dispatch) = _duals(SolverName, False, monkeypatch), _duals(SolverName, True, monkeypatch)
+    assert dispatch == pytest.approx(solution)
+    # the prices of the balance; the duals of a unit that is off are degenerate (its output is held at zero by its bound and its rows)
+    prices = {name: value for name, value in native.items() if name.startswith("bal")}
+    assert prices == pytest.approx({name: resolved[name] for name in prices}) and all(value != 0 for value in prices.values())
+
+
+@pytest.mark.solve
+def test_an_integer_the_model_left_free_falls_back_to_the_pyomo_resolve(monkeypatch):
+    monkeypatch.setenv("OTEPES_NATIVE_DUALS", "1")
+    m      = _mip()
+    Solver = pyo.SolverFactory("appsi_highs")
+    Solver.solve(m)
+    _fix(m)
+    m.on["peak", 1].unfix()
+    m.on["peak", 1].domain = pyo.Binary
+    assert not SolveFixedLp(m, Solver, "appsi_highs") and m.component("dual") is None
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, each stage a MIP once committed."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def _binary_commitment(DirName):
+    """Commit every unit with a minimum output with binary variables."""
+    path      = os.path.join(DirName, "9n", "oT_Data_Option_9n.csv")
+    dfOption  = pd.read_csv(path)
+    dfOption["IndBinGenOperat"] = 1
+    dfOption.to_csv(path, index=False)
+    path      = os.path.join(DirName, "9n", "oT_Data_Generation_9n.csv")
+    dfGen     = pd.read_csv(path)
+    dfGen["BinaryCommitment"] = dfGen["BinaryCommitment"].astype(object)
+    dfGen.loc[dfGen["MinimumPower"].fillna(0) > 0, "BinaryCommitment"] = "Yes"
+    dfGen.to_csv(path, index=False)
+    return DirName
+
+
+@pytest.mark.solve
+def test_no_stage_is_resolved_through_pyomo(tmp_path, monkeypatch):
+    from openTEPES import openTEPES_ProblemSolving
+    from openTEPES.openTEPES import OUTPUT_DUALS, openTEPES_run
+
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    monkeypatch.delenv("OTEPES_NATIVE_DUALS", raising=False)
+    resolved = openTEPES_run(_binary_commitment(_four_stage_9n(tmp_path / "resolved", hours=24)), "9n", "appsi_highs", 0, 0)
+
+    def resolve(*args):
+        raise AssertionError("the fixed LP was re-solved through Pyomo")
+
+    monkeypatch.setenv("OTEPES_NATIVE_DUALS", "1")
+    monkeypatch.setattr(openTEPES_ProblemSolving, "prepare_for_resolve", resolve)
+    native = openTEPES_run(_binary_commitment(_four_stage_9n(tmp_path / "native", hours=24)), "9n", "appsi_highs", 0, 0)
+
+    assert native.pDuals.families() == resolved.pDuals.families()
+    read = {family for families in OUTPUT_DUALS.values() for family in families} & set(resolved.pDuals.families())
+    assert "eBalanceElec" in read
+    for family in read:
+        theirs, ours = resolved.pDuals.series(family), native.pDuals.series(family)
+        assert ours.index.equals(theirs.index)
+        np.testing.assert_allclose(ours.to_numpy(), theirs.to_numpy(), rtol=1e-9, atol=1e-9, err_msg=family)
+    assert pyo.value(native.eTotalSCost) == pytest.approx(pyo.value(resolved.eTotalSCost), rel=1e-9)
@@ -0,0 +1,135 @@
+"""Independent stages can be solved in forked workers, and the loop is unchanged when the opt-in is off.
+
+The payload tests are the ones that matter: a worker's solution crosses the process boundary by component name and index, so it has to land
+on the same variables in the parent, carry only what the solve touched, and repeat the fixing ``fix_for_duals`` did in the worker.
+"""
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES import openTEPES_run
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore, _FIX_REGISTRY, _registry
+from openTEPES.openTEPES_ProblemSolvingParallelStages import StageDispatcher, _merge_payload, _stage_payload, enabled, workers
+
+
+class _Holder:
+    """Stands in for ``mTEPES``: the merge only needs ``pDuals`` and ``Parallel``."""
+    def __init__(self, parallel=True):
+        self.pDuals   = DualStore()
+        self.Parallel = lambda: parallel
+
+
+def _toy():
+    m = pyo.ConcreteModel()
+    m.i = pyo.Set(initialize=["a", "b"])
+    m.x = pyo.Var(m.i, bounds=(0, 5))
+    m.u = pyo.Var(m.i, within=pyo.Binary)
+    m.z = pyo.Var(bounds=(1, 5), initialize=3)
+    m.c = pyo.Constraint(m.i, rule=lambda m, i: m.x[i] >= 2 * m.u[i])
+    m.o = pyo.Objective(expr=sum(m.x[i] - m.u[i] for i in m.i))
+    return m
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    assert workers() == 0
+    assert not enabled()
+    assert StageDispatcher.create(_Holder()) is None
+
+
+@pytest.mark.parametrize("value", ["", "junk", "0", "-2", "1"])
+def test_a_single_or_unusable_count_stays_sequential(monkeypatch, value):
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", value)
+    assert not enabled()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stage workers need fork")
+def test_the_model_can_veto_it(monkeypatch):
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", "3")
+    assert workers() == 3
+    assert StageDispatcher.create(_Holder(parallel=False)) is None
+    assert StageDispatcher.create(_Holder()).n_workers == 3
+
+
+def test_flag_is_parsed():
+    assert parser.parse_args(["--parallel-stages", "4"]).parallel_stages == 4
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--parallel-stages", "0"])
+
+
+def test_payload_round_trip_carries_only_what_the_solve_touched():
+    solved = _toy()
+    pyo.SolverFactory("highs").solve(solved)
+    # what fix_for_duals does after a MIP solve
+    relaxed = _registry(solved, _FIX_REGISTRY)
+    for var in solved.u.values():
+        relaxed.setdefault(id(var), (var, var.domain))
+        var.fixed  = True
+        var.domain = pyo.UnitInterval
+    payload = _stage_payload(solved)
+    payload["duals"] = DualStore()
+    payload["duals"].add("c", (), ["a"], [0.5])
+
+    assert "z" not in payload["values"]
+    assert sorted(payload["relaxed"]) == [("u", "a"), ("u", "b")]
+
+    parent, holder = _toy(), _Holder()
+    _merge_payload(parent, holder, payload)
+    for i in parent.i:
+        assert parent.x[i].value == pytest.approx(solved.x[i].value)
+        assert parent.u[i].value == pytest.approx(solved.u[i].value)
+        assert parent.u[i].fixed and parent.u[i].domain is pyo.UnitInterval
+    assert parent.z.value == 3
+    assert holder.pDuals["c", ("a",)] == 0.5
+
+
+def _four_stage_9n(tmp_path, hours=48):
+    """9n cut into four independent stages of ``hours`` load levels each, with the candidate line ignored (IndBinNetInvest=2)."""
+    src = os.path.abspath(os.path.join(os.path.dirname(__file__), "../openTEPES/cases/9n"))
+    dst = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(src, dst, ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+
+    duration_csv = os.path.join(dst, "oT_Data_Duration_9n.csv")
+    df = pd.read_csv(duration_csv)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(duration_csv, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(dst, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(dst, "oT_Data_Stage_9n.csv"), index=False)
+
+    RESEnergy_csv = os.path.join(dst, "oT_Data_RESEnergy_9n.csv")
+    df = pd.read_csv(RESEnergy_csv, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(RESEnergy_csv)
+
+    option_csv = os.path.join(dst, "oT_Data_Option_9n.csv")
+    df = pd.read_csv(option_csv)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(option_csv, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+@pytest.mark.skipif(sys.platform == "win32", reason="stage workers need fork")
+def test_parallel_stages_match_the_sequential_loop(tmp_path, monkeypatch):
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    sequential = openTEPES_run(_four_stage_9n(tmp_path / "seq"), "9n", "highs", 0, 0)
+    assert all(sequential.IndependentStages[p]() for p in sequential.p)
+
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", "2")
+    parallel = openTEPES_run(_four_stage_9n(tmp_path / "par"), "9n", "highs", 0, 0)
+
+    np.testing.assert_approx_equal(pyo.value(parallel.eTotalSCost), pyo.value(sequential.eTotalSCost))
+    for name in ("vTotalOutput", "vTotalGCost", "vENS"):
+        ours, theirs = getattr(parallel, name), getattr(sequential, name)
+        assert sum(v.value or 0.0 for v in ours.values()) == pytest.approx(sum(v.value or 0.0 for v in theirs.values()), rel=1e-6)
+    assert sorted(parallel.pDuals.families()) == sorted(sequential.pDuals.families())
+    for family in sequential.pDuals.families():
+        assert parallel.pDuals.series(family).index.equals(sequential.pDuals.series(family).index)
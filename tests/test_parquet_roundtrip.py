@@ -0,0 +1,60 @@
+"""A case converted to Parquet must read back input-identically through the Parquet backend.
+
+``write_case`` (Tool_CSV_to_Parquet) writes a ``.parquet`` case directory; the Parquet backend must hand ``InputData`` the same tables as
+the CSV backend, and a model built from it must have the same sets and parameters, compared with the snapshot the CSV/DuckDB input-parity
+probe uses. Covers passthrough, wide, single-row (9n) and multi-level-header (9n_PTDF) tables. No model is solved, so this runs in the fast
+CI job.
+"""
+import os
+import sys
+import tomllib
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "openTEPES_Parquet"))
+from Tool_CSV_to_Parquet import write_case
+from openTEPES._input_parity_test import compare_snapshots, snapshot
+from openTEPES.openTEPES_InputCSVSource import CSVSource
+from openTEPES import openTEPES_InputParquetSource
+from openTEPES.openTEPES_InputParquetSource import ParquetSource
+from openTEPES.openTEPES_InputSource import open_source
+
+CASES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases"))
+
+
+@pytest.mark.parametrize("case_name", ["9n", "9n_PTDF", "sSEP"])
+def test_csv_parquet_roundtrip(case_name, tmp_path):
+    case_dir = os.path.join(CASES_DIR, case_name)
+    out_dir  = write_case(case_dir, tmp_path / f"{case_name}.parquet")
+
+    csv, parquet = CSVSource(case_dir), open_source(out_dir)
+    assert isinstance(parquet, ParquetSource)
+    assert (parquet.case_name, parquet.dir_name) == (case_name, str(tmp_path))
+    assert parquet.list_data_stems() == csv.list_data_stems()
+    assert parquet.list_dict_stems() == csv.list_dict_stems()
+    for stem in sorted(csv.list_data_stems()):
+        pd.testing.assert_frame_equal(parquet.read_data(stem), csv.read_data(stem), obj=stem)
+    for stem in sorted(csv.list_dict_stems()):
+        pd.testing.assert_frame_equal(parquet.read_dict(stem), csv.read_dict(stem), obj=stem)
+    assert parquet.read_dict("NoSuchTable").empty
+    with pytest.raises(FileNotFoundError):
+        parquet.read_data("NoSuchTable")
+
+    diffs = compare_snapshots(snapshot(case_dir), snapshot(str(out_dir)))
+    assert not diffs, f"{case_name}: CSV vs written Parquet differ:\n" + "\n".join(diffs[:10])
+
+
+def test_output_directory_must_be_recognisable(tmp_path):
+    with pytest.raises(ValueError, match=r"\.parquet"):
+        write_case(os.path.join(CASES_DIR, "9n"), tmp_path / "9n_columnar")
+
+
+def test_a_missing_pyarrow_names_the_extra(tmp_path, monkeypatch):
+    (tmp_path / "9n.parquet").mkdir()
+    monkeypatch.setattr(openTEPES_InputParquetSource, "_HAS_PYARROW", False)
+    with pytest.raises(ImportError, match=r"pip install openTEPES\[parquet\]"):
+        open_source(tmp_path / "9n.parquet")
+    with open(os.path.join(os.path.dirname(__file__), "..", "pyproject.toml"), "rb") as f:
+        extras = tomllib.load(f)["project"]["optional-dependencies"]
+    assert any(requirement.startswith("pyarrow") for requirement in extras["parquet"])
@@ -0,0 +1,164 @@
+"""``appsi_highs`` keeps one HiGHS instance per model and gives the results of the one-shot ``highs`` interface.
+
+The unit test drives ``setup_solver`` on a small LP: the instance is loaded once, later solves only see the changed bound, and a forked stage
+worker drops it. The case tests solve a four-stage 9n with both interfaces, run the Mode C sweep of ``--warm-resolve`` on a persistent HiGHS
+instance, and run the L-shaped loop with it.
+"""
+import os
+import shutil
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_ProblemSolvingPersistent import PERSISTENT_SOLVERS, prepare_for_resolve, release_solver, setup_solver
+
+
+def _spy_set_instance(monkeypatch):
+    """Count the loads of a whole model into an ``appsi_highs`` instance."""
+    from pyomo.contrib.appsi.solvers.highs import Highs
+    calls = []
+    real  = Highs.set_instance
+    monkeypatch.setattr(Highs, "set_instance", lambda self, model: (calls.append(model.name), real(self, model))[1])
+    return calls
+
+
+@pytest.mark.solve
+def test_the_instance_is_loaded_once_and_updated(tmp_path, monkeypatch):
+    loads  = _spy_set_instance(monkeypatch)
+    m      = pyo.ConcreteModel("toy")
+    m.x    = pyo.Var(bounds=(0, 4))
+    m.y    = pyo.Var(within=pyo.Binary)
+    m.c    = pyo.Constraint(expr=m.x + m.y >= 1.5)
+    m.obj  = pyo.Objective(expr=m.x + 0.1*m.y)
+    mTEPES = SimpleNamespace(pIndSectorDecomposition=lambda: 0)
+
+    assert "appsi_highs" in PERSISTENT_SOLVERS
+    Solver = setup_solver(m, "appsi_highs", str(tmp_path / "toy.log"), 1, mTEPES)
+    Solver.solve(m)
+    assert pyo.value(m.obj) == pytest.approx(0.6)
+
+    m.y.fix(0)
+    m.y.domain = pyo.UnitInterval
+    prepare_for_resolve(m, Solver, "appsi_highs")
+    m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+    Solver.solve(m)
+    assert pyo.value(m.x) == pytest.approx(1.5) and m.dual[m.c] == pytest.approx(1.0)
+
+    m.x.setlb(2.0)
+    assert setup_solver(m, "appsi_highs", str(tmp_path / "toy.log"), 2, mTEPES) is Solver
+    Solver.solve(m)
+    assert pyo.value(m.x) == pytest.approx(2.0)
+    assert loads == ["toy"]
+
+    release_solver(m)
+    assert not hasattr(m, "_appsi_highs_solver") and not hasattr(m, "_appsi_highs_initialized")
+    assert setup_solver(m, "appsi_highs", str(tmp_path / "toy.log"), 3, mTEPES) is not Solver
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, solved with both HiGHS interfaces."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+@pytest.mark.parametrize("parallel", ["", "2"])
+def test_persistent_highs_matches_the_one_shot_interface(tmp_path, monkeypatch, parallel):
+    from openTEPES.openTEPES import openTEPES_run
+
+    if parallel and sys.platform == "win32":
+        pytest.skip("stage workers need fork")
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", parallel)
+    runs = {solver: openTEPES_run(_four_stage_9n(tmp_path / solver, hours=24), "9n", solver, 0, 0) for solver in ("highs", "appsi_highs")}
+    ours, theirs = runs["appsi_highs"], runs["highs"]
+
+    np.testing.assert_approx_equal(pyo.value(ours.eTotalSCost), pyo.value(theirs.eTotalSCost))
+    assert sorted(ours.pDuals.families()) == sorted(theirs.pDuals.families())
+    for family in theirs.pDuals.families():
+        assert ours.pDuals.series(family).index.equals(theirs.pDuals.series(family).index)
+        np.testing.assert_allclose(ours.pDuals.series(family).to_numpy(), theirs.pDuals.series(family).to_numpy(), atol=1e-6)
+    # the stages solved in the parent went through the one instance attached to the model
+    assert getattr(ours, "_appsi_highs_initialized", False) == (not parallel)
+
+
+def _seven_day_9n(tmp_path):
+    """``openTEPES_run`` arguments of 9n kept to its first week, which stands in for the year (StageWeight 52), without the RES energy constraint."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    path = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1, 2])
+    df.iloc[168:, df.columns.get_loc("Duration")] = np.nan
+    df.to_csv(path)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    path = os.path.join(case, "oT_Data_Stage_9n.csv")
+    df   = pd.read_csv(path, index_col=[0])
+    df["Weight"] = 52
+    df.to_csv(path)
+    return dict(DirName=str(tmp_path), CaseName="9n", SolverName="highs", pIndLogConsole=0, pIndOutputResults=0)
+
+
+@pytest.mark.solve
+def test_mode_c_warm_resolve_on_highs(tmp_path, monkeypatch):
+    from openTEPES.openTEPES import openTEPES_run
+    from openTEPES.openTEPES_ProblemSolvingResolve import overlay_scaled, resolve
+
+    mTEPES   = openTEPES_run(**_seven_day_9n(tmp_path))
+    overlays = [overlay_scaled(mTEPES, "pDemandElec", f) for f in (1.00, 1.05, 1.10)]
+    monkeypatch.delenv("OTEPES_WARM_RESOLVE", raising=False)
+    off = resolve(mTEPES, "highs", overlays)
+
+    loads = _spy_set_instance(monkeypatch)
+    monkeypatch.setenv("OTEPES_WARM_RESOLVE", "1")
+    on = resolve(mTEPES, "highs", overlays)
+
+    assert loads == [mTEPES.name]
+    assert [r["status"] for r in on] == ["optimal"] * len(overlays)
+    for base, warm in zip(off, on):
+        assert warm["total_cost_meur"] == pytest.approx(base["total_cost_meur"], rel=1e-6)
+
+
+@pytest.mark.solve
+def test_lshaped_on_persistent_highs(tmp_path, monkeypatch):
+    from openTEPES.openTEPES import openTEPES_run
+    from openTEPES.openTEPES_ProblemSolvingBenders import lshaped
+
+    mTEPES = openTEPES_run(**_seven_day_9n(tmp_path))
+    joint  = float(pyo.value(mTEPES.eTotalSCost))
+    loads  = _spy_set_instance(monkeypatch)
+    result = lshaped(mTEPES, solver_name="appsi_highs", max_iter=20, tol=1e-4)
+
+    assert result["converged"]
+    assert result["total_cost"] == pytest.approx(joint, rel=1e-4)
+    # the master and the subproblem were each loaded once, whatever the number of iterations
+    assert sorted(loads) == sorted(["benders_master", mTEPES.name]) and result["num_iterations"] > 1
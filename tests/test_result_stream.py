@@ -0,0 +1,195 @@
+"""Streaming the hourly tables stage by stage leaves the same result files as the batch writers.
+
+The unit tests drive a ``ResultStream`` over a stand-in model and check the three ways a streamed table can end: the writer's table matches the
+streamed rows and the write is skipped, it does not and the writer's table replaces the file, or no writer writes it and the file is removed.
+The case test solves a four-stage 9n with and without the stream and compares every result file byte for byte, and the DuckDB tables.
+"""
+import filecmp
+import glob
+import os
+import shutil
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_OutputResultsSink import ResultSink, clear_active_sink, set_active_sink
+from openTEPES.openTEPES_OutputResultsStream import ResultStream, enabled
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_STREAM_RESULTS", raising=False)
+    assert not enabled()
+    monkeypatch.setenv("OTEPES_STREAM_RESULTS", "1")
+    assert enabled()
+    assert parser.parse_args(["--stream-results"]).stream_results
+
+
+class _Index:
+    def __init__(self, levels):
+        self._levels = levels
+
+    def stage(self, p, sc, st):
+        return [st], self._levels[st], {}
+
+
+def _model():
+    """Two stages of two load levels and two generators, with the attributes the stream reads."""
+    levels = {'st1': ['01-01 00:00', '01-01 01:00'], 'st2': ['01-01 02:00', '01-01 03:00']}
+    psng   = [(2030, 'sc01', n, g) for st in levels for n in levels[st] for g in ('G1', 'G2')]
+    return SimpleNamespace(nr=[], pStageIndex=_Index(levels), psng=psng, vTotalOutput={key: SimpleNamespace(value=0.1*i) for i, key in enumerate(psng)})
+
+
+def _batch(m):
+    """The frame GenerationOperationResults writes to oT_Result_Generation."""
+    OutputToFile = pd.Series(data=np.array([m.vTotalOutput[key].value for key in m.psng], dtype=float), index=pd.MultiIndex.from_tuples(m.psng))
+    OutputToFile *= 1e3
+    return OutputToFile.to_frame(name='MW').reset_index().pivot_table(index=['level_0','level_1','level_2'], columns='level_3', values='MW').rename_axis(['Period', 'Scenario', 'LoadLevel'], axis=0).rename_axis([None], axis=1)
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_the_batch_write_of_a_streamed_table_is_skipped(tmp_path, background):
+    m      = _model()
+    path   = str(tmp_path / "oT_Result_Generation_toy.csv")
+    stream = ResultStream(ResultSink(str(tmp_path), "toy", fmt="csv"), m, {"generation": 1}, {"tech": 2}, background=background)
+    for st in ('st1', 'st2'):
+        stream.stage(m, 2030, 'sc01', st)
+    stream.wait()
+    streamed = open(path).read()
+
+    set_active_sink(stream)
+    try:
+        _batch(m).oT.write(path, sep=',')
+    finally:
+        stream.close()
+        clear_active_sink()
+    _batch(m).to_csv(tmp_path / "batch.csv", sep=',')
+    assert stream._tables[os.path.abspath(path)].complete and open(path).read() == streamed
+    assert filecmp.cmp(path, tmp_path / "batch.csv", shallow=False)
+
+
+def test_a_table_changed_after_it_was_streamed_is_rewritten(tmp_path):
+    m      = _model()
+    path   = str(tmp_path / "oT_Result_Generation_toy.csv")
+    stream = ResultStream(ResultSink(str(tmp_path), "toy", fmt="csv"), m, {"generation": 1}, {"tech": 2})
+    for st in ('st1', 'st2'):
+        stream.stage(m, 2030, 'sc01', st)
+    m.vTotalOutput[m.psng[0]].value = 7.0
+
+    set_active_sink(stream)
+    try:
+        _batch(m).oT.write(path, sep=',')
+    finally:
+        stream.close()
+        clear_active_sink()
+    _batch(m).to_csv(tmp_path / "batch.csv", sep=',')
+    assert not stream._tables[os.path.abspath(path)].complete
+    assert filecmp.cmp(path, tmp_path / "batch.csv", shallow=False)
+
+
+def test_a_streamed_table_no_writer_claims_is_removed(tmp_path):
+    m      = _model()
+    stream = ResultStream(ResultSink(str(tmp_path), "toy", fmt="both"), m, {"generation": 1}, {"tech": 2})
+    stream.stage(m, 2030, 'sc01', 'st1')
+    stream.wait()
+    assert os.path.exists(tmp_path / "oT_Result_Generation_toy.csv")
+    stream.close()
+
+    import duckdb
+    assert not os.path.exists(tmp_path / "oT_Result_Generation_toy.csv")
+    with duckdb.connect(str(tmp_path / "oT_Results_toy.duckdb")) as con:
+        assert con.execute("SELECT count(*) FROM information_schema.tables WHERE table_name = 'Generation'").fetchone()[0] == 0
+
+
+def test_a_failed_run_keeps_the_stages_streamed_so_far(tmp_path):
+    m      = _model()
+    stream = ResultStream(ResultSink(str(tmp_path), "toy", fmt="csv"), m, {"generation": 1}, {"tech": 2})
+    stream.stage(m, 2030, 'sc01', 'st1')
+    stream.close(drop_unclaimed=False)
+    assert stream._executor is None
+    assert len(pd.read_csv(tmp_path / "oT_Result_Generation_toy.csv")) == 2
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, so the hourly tables are streamed in four parts."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+def test_a_failing_stage_loop_closes_the_stream(tmp_path, monkeypatch):
+    from openTEPES import openTEPES as oT
+
+    streams = []
+    StageIterativeSolving = oT.StageIterativeSolving
+
+    def _fail_after_the_loop(mTEPES, *args):
+        streams.append((mTEPES, mTEPES.pResultStream))
+        StageIterativeSolving(mTEPES, *args)
+        raise RuntimeError("stage loop failed")
+
+    monkeypatch.setenv("OTEPES_STREAM_RESULTS", "1")
+    monkeypatch.setattr(oT, "StageIterativeSolving", _fail_after_the_loop)
+    DirName = _four_stage_9n(tmp_path, hours=24)
+    with pytest.raises(RuntimeError, match="stage loop failed"):
+        oT.openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec={"generation": True})
+
+    # the writer thread is stopped and the hourly tables hold every stage streamed before the failure
+    mTEPES, stream = streams[0]
+    assert stream._executor is None
+    assert len(pd.read_csv(os.path.join(DirName, "9n", "oT_Result_Generation_9n.csv"))) == len(mTEPES.n)
+
+
+@pytest.mark.solve
+@pytest.mark.parametrize("parallel", ["", "2"])
+def test_streamed_run_writes_the_batch_files(tmp_path, monkeypatch, parallel):
+    from openTEPES.openTEPES import openTEPES_run
+    import duckdb
+
+    if parallel and sys.platform == "win32":
+        pytest.skip("stage workers need fork")
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", parallel)
+    runs = {}
+    for stream in ("", "1"):
+        monkeypatch.setenv("OTEPES_STREAM_RESULTS", stream)
+        DirName = _four_stage_9n(tmp_path / f"stream{stream}", hours=24)
+        runs[stream] = openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec={"generation": True, "ess": True, "network": True}, output_format="both")
+
+    batch, streamed = (os.path.join(str(tmp_path), f"stream{stream}", "9n") for stream in ("", "1"))
+    names = sorted(os.path.basename(path) for path in glob.glob(os.path.join(batch, "oT_Result_*.csv")))
+    assert names == sorted(os.path.basename(path) for path in glob.glob(os.path.join(streamed, "oT_Result_*.csv")))
+    for name in names:
+        assert filecmp.cmp(os.path.join(batch, name), os.path.join(streamed, name), shallow=False), name
+
+    # every streamed table was complete when its writer wrote it
+    tables = runs["1"].pResultStream._tables
+    assert len(tables) == 7 and all(table.streamed and table.complete for table in tables.values())
+    assert runs[""].pResultStream is None
+
+    with duckdb.connect(os.path.join(batch, "oT_Results_9n.duckdb"), read_only=True) as ours, duckdb.connect(os.path.join(streamed, "oT_Results_9n.duckdb"), read_only=True) as theirs:
+        for table in ("Generation", "GenerationCommitment", "NetworkAngle"):
+            pd.testing.assert_frame_equal(ours.execute(f'SELECT * FROM "{table}"').df(), theirs.execute(f'SELECT * FROM "{table}"').df())
@@ -0,0 +1,95 @@
+"""In a sector decomposition the persistent subproblem solver gets only the bounds the loop recorded with ``push_bounds``.
+
+The unit test drives ``setup_solver`` in sector mode on a small LP: the instance is loaded once, a re-solve sees the bound pushed, and a bound
+changed without ``push_bounds`` stays out of the instance until a solve without a record scans every variable again. The case test switches
+the sector decomposition on for the 7-day sSEP on ``appsi_highs``, and gets the bounds of every iteration that a loop re-reading the bounds of
+every variable gets.
+"""
+import os
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES import openTEPES, openTEPES_ProblemSolvingPersistent
+from openTEPES.openTEPES_ProblemSolvingPersistent import push_bounds, setup_solver
+
+
+@pytest.mark.solve
+def test_a_sector_resolve_pushes_only_the_recorded_bounds(tmp_path):
+    m      = pyo.ConcreteModel("toy")
+    m.x    = pyo.Var(bounds=(0, 4))
+    m.y    = pyo.Var(bounds=(0, 4))
+    m.c    = pyo.Constraint(expr=m.x + m.y >= 1.5)
+    m.obj  = pyo.Objective(expr=m.x + 2*m.y)
+    mTEPES = SimpleNamespace(pIndSectorDecomposition=lambda: 1)
+    log    = str(tmp_path / "toy.log")
+
+    Solver = setup_solver(m, "appsi_highs", log, 1, mTEPES)
+    Solver.solve(m)
+    assert pyo.value(m.obj) == pytest.approx(1.5)
+
+    # the recorded bound is pushed, the other one is not seen
+    m.x.setub(0.5)
+    m.y.setlb(2.0)
+    push_bounds(m, [m.x])
+    assert setup_solver(m, "appsi_highs", log, 2, mTEPES) is Solver
+    Solver.solve(m)
+    assert (pyo.value(m.x), pyo.value(m.y)) == (pytest.approx(0.5), pytest.approx(1.0))
+    assert m._pPersistentPush is None
+
+    # without a record every variable is read again
+    assert setup_solver(m, "appsi_highs", log, 3, mTEPES) is Solver
+    Solver.solve(m)
+    assert (pyo.value(m.x), pyo.value(m.y)) == (pytest.approx(0.0), pytest.approx(2.0))
+
+
+def _seven_day_sSEP(tmp_path):
+    """sSEP kept to its first week, which stands in for the year (StageWeight 52), without the RES energy constraint."""
+    case = os.path.join(str(tmp_path), "sSEP")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "sSEP"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    path = os.path.join(case, "oT_Data_Duration_sSEP.csv")
+    df   = pd.read_csv(path, index_col=[0, 1, 2])
+    df.iloc[168:, df.columns.get_loc("Duration")] = np.nan
+    df.to_csv(path)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_sSEP.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = df["RESEnergy"].astype(float)
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    path = os.path.join(case, "oT_Data_Stage_sSEP.csv")
+    df   = pd.read_csv(path, index_col=[0])
+    df["Weight"] = 52
+    df.to_csv(path)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+def test_the_recorded_bounds_give_the_bounds_of_a_full_update(tmp_path, monkeypatch):
+    StageIterativeSolving = openTEPES.StageIterativeSolving
+    take_pushed           = openTEPES_ProblemSolvingPersistent._take_pushed
+    DirName               = _seven_day_sSEP(tmp_path)
+
+    def _sector(mTEPES, *args):
+        mTEPES.pIndSectorDecomposition = 1
+        return StageIterativeSolving(mTEPES, *args)
+
+    def _bounds() -> pd.DataFrame:
+        openTEPES.openTEPES_run(DirName, "sSEP", "appsi_highs", 0, 0)
+        path = os.path.join(DirName, "sSEP", "openTEPES_appsi_highs_BendersConvergence_sSEP.csv")
+        return pd.read_csv(path)[["Iteration", "LowerBound_[MEUR]", "UpperBound_[MEUR]"]]
+
+    monkeypatch.setattr(openTEPES, "StageIterativeSolving", _sector)
+    recorded = _bounds()
+    # without a record every re-solve re-reads the bounds of every variable, as the loop did before push_bounds
+    monkeypatch.setattr(openTEPES_ProblemSolvingPersistent, "_take_pushed", lambda OptModel: (take_pushed(OptModel), None)[1])
+    full = _bounds()
+
+    assert len(recorded) > 1
+    pd.testing.assert_frame_equal(recorded, full, rtol=1e-9)
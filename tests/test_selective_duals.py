@@ -0,0 +1,166 @@
+"""With ``--selective-duals`` a run harvests only the duals its outputs read, and a MIP stage whose duals nobody reads is not re-solved.
+
+The unit tests plan the families from the output selection, and collect only the planned ones. The case tests solve a four-stage 9n: as an LP
+with the minimal outputs, whose result files match a run that harvests every dual, and with binary commitment and outputs that read no dual,
+whose stages skip the fixed-LP re-solve.
+"""
+import filecmp
+import glob
+import os
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES import OUTPUT_ALIASES, OUTPUT_CATEGORIES, dual_plan
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore, collect_duals, selective, wants_duals
+
+
+def _model(**sets):
+    """Stands in for ``mTEPES`` in the guards of ``OUTPUT_REGISTRY``."""
+    state = dict(ch=[], es=[], rs=[], pa=[], ha=[], pIndHeat=0, pIndHydroTopology=0, pIndHydrogen=0, pIndSectorDecomposition=lambda: 0)
+    state.update(sets)
+    return SimpleNamespace(**state)
+
+
+def _flags(*categories):
+    return {key: int(key in categories) for key in OUTPUT_CATEGORIES}
+
+
+def _stage_model():
+    """Two stages of a two-node balance plus a per-period constraint, named the way the formulation names them."""
+    m = pyo.ConcreteModel()
+    m.p   = pyo.Set(initialize=[2030])
+    m.sc  = pyo.Set(initialize=["sc01"])
+    m.stt = pyo.Set(initialize=["st1", "st11"])
+    m.pDuals = DualStore()
+    m.x = pyo.Var()
+    for st, n in (("st1", ["01", "02"]), ("st11", ["03"])):
+        m.add_component(f"eBalanceElec_2030_sc01_{st}", pyo.Constraint([(nn, nd) for nn in n for nd in ("Node_1", "Node_2")], rule=lambda m, *index: m.x >= 0))
+        m.add_component(f"eSystemRampUp_2030_sc01_{st}", pyo.Constraint(n, rule=lambda m, *index: m.x >= 0))
+    m.eTotalFElecCost = pyo.Constraint(m.p, rule=lambda m, *index: m.x >= 0)
+    return m
+
+
+def _fill(m):
+    """Attach a dual Suffix with a distinct value per constraint data, as a solve would."""
+    m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+    values = {}
+    for i, con in enumerate(m.component_data_objects(pyo.Constraint)):
+        m.dual[con] = values[con.parent_component().name, con.index()] = float(i)
+    return values
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_SELECTIVE_DUALS", raising=False)
+    assert not selective() and wants_duals(SimpleNamespace())
+    monkeypatch.setenv("OTEPES_SELECTIVE_DUALS", "1")
+    assert selective()
+    assert parser.parse_args(["--selective-duals"]).selective_duals
+
+
+def test_the_plan_follows_the_selected_outputs():
+    assert dual_plan(_model(), _flags("investment", "cost", "generation", "network")) == frozenset()
+    assert dual_plan(_model(), _flags(*OUTPUT_ALIASES["min"])) == {"eBalanceElec", "eAdequacyReserveMarginElec", "eOperReserveUp", "eOperReserveDw",
+                                                                    "eSystemRampUp", "eSystemRampDw"}
+    # the water values are read only when the reservoir writer's guard lets it fire
+    assert "eHydroInventory" not in dual_plan(_model(), _flags("reservoir"))
+    assert dual_plan(_model(rs=["Reservoir"], pIndHydroTopology=1), _flags("reservoir")) == {"eHydroInventory"}
+    assert "eInstallConESS" in dual_plan(_model(pIndSectorDecomposition=lambda: 1), _flags())
+    assert dual_plan(_model(), _flags(), pIndDumpRawResults=1) is None
+
+
+def test_only_the_planned_families_are_collected():
+    m = _stage_model()
+    m.pDualPlan = frozenset({"eSystemRampUp"})
+    values = _fill(m)
+    collect_duals(m, m)
+    assert m.pDuals.families() == ["eSystemRampUp"]
+    assert m.pDuals["eSystemRampUp", (2030, "sc01", "st11", "03")] == values["eSystemRampUp_2030_sc01_st11", "03"]
+    assert m.component("dual") is None
+
+    # a solve that attached no Suffix leaves nothing to collect
+    m.pDualPlan = frozenset()
+    assert not wants_duals(m)
+    collect_duals(m, m)
+    assert m.pDuals.families() == ["eSystemRampUp"]
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, one dual harvest per stage."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def _binary_commitment(DirName):
+    """Commit every unit with a minimum output with binary variables, so each stage is a MIP."""
+    path      = os.path.join(DirName, "9n", "oT_Data_Option_9n.csv")
+    dfOption  = pd.read_csv(path)
+    dfOption["IndBinGenOperat"] = 1
+    dfOption.to_csv(path, index=False)
+    path      = os.path.join(DirName, "9n", "oT_Data_Generation_9n.csv")
+    dfGen     = pd.read_csv(path)
+    dfGen["BinaryCommitment"] = dfGen["BinaryCommitment"].astype(object)
+    dfGen.loc[dfGen["MinimumPower"].fillna(0) > 0, "BinaryCommitment"] = "Yes"
+    dfGen.to_csv(path, index=False)
+    return DirName
+
+
+@pytest.mark.solve
+def test_the_minimal_outputs_are_unchanged(tmp_path, monkeypatch):
+    from openTEPES.openTEPES import openTEPES_run
+
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    runs = {}
+    for name, on in (("every", ""), ("selected", "1")):
+        monkeypatch.setenv("OTEPES_SELECTIVE_DUALS", on)
+        runs[name] = openTEPES_run(_four_stage_9n(tmp_path / name, hours=24), "9n", "highs", 0, 0)
+
+    assert set(runs["selected"].pDuals.families()) < set(runs["every"].pDuals.families())
+    ours, theirs = (os.path.join(str(tmp_path), name, "9n") for name in ("selected", "every"))
+    names = sorted(os.path.basename(path) for path in glob.glob(os.path.join(theirs, "oT_Result_*.csv")))
+    assert names and names == sorted(os.path.basename(path) for path in glob.glob(os.path.join(ours, "oT_Result_*.csv")))
+    for name in names:
+        assert filecmp.cmp(os.path.join(ours, name), os.path.join(theirs, name), shallow=False), name
+
+
+@pytest.mark.solve
+def test_a_mip_whose_duals_nobody_reads_is_not_resolved(tmp_path, monkeypatch, capsys):
+    from openTEPES.openTEPES import openTEPES_run
+
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    spec = {"investment": True, "cost": True, "summary": False, "economic": False}
+    monkeypatch.setenv("OTEPES_SELECTIVE_DUALS", "")
+    reference = openTEPES_run(_binary_commitment(_four_stage_9n(tmp_path / "every", hours=24)), "9n", "appsi_highs", 0, 0, output_spec=spec)
+    assert capsys.readouterr().out.count("Problem solving with fixed investments") == 4
+
+    monkeypatch.setenv("OTEPES_SELECTIVE_DUALS", "1")
+    selected = openTEPES_run(_binary_commitment(_four_stage_9n(tmp_path / "selected", hours=24)), "9n", "appsi_highs", 0, 0, output_spec=spec)
+    assert "Problem solving with fixed investments" not in capsys.readouterr().out
+    assert len(selected.pDuals) == 0
+    assert pyo.value(selected.eTotalSCost) == pytest.approx(pyo.value(reference.eTotalSCost), rel=1e-6)
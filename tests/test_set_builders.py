@@ -0,0 +1,58 @@
+"""The set builders of DataConfiguration give the members of the comprehensions they replace, in the same order.
+
+Each test writes the original comprehension over Pyomo sets next to the builder call, so a builder that drops, adds or reorders a tuple fails
+here and not as a silently different model.
+"""
+import pandas as pd
+import pyomo.environ as pyo
+
+from openTEPES.openTEPES_DataConfiguration import _in_window, _members, _product
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.p  = pyo.Set(initialize=[2030, 2040, 2050])
+    m.sc = pyo.Set(initialize=['sc02', 'sc01'])
+    m.n  = pyo.Set(initialize=['n1', 'n2'])
+    m.g  = pyo.Set(initialize=['Wind', 'Coal', 'Solar', 'Hydro'])
+    m.la = pyo.Set(initialize=[('N1', 'N2', 'ac1'), ('N2', 'N3', 'ac1'), ('N1', 'N3', 'dc1')])
+    m.ps = pyo.Set(initialize=[(p,sc) for p,sc in m.p*m.sc])
+    return m
+
+
+def test_members_follow_the_order_of_the_set_not_of_the_mask():
+    m    = _model()
+    cost = pd.Series({'Solar': 0.0, 'Coal': 3.5, 'Hydro': 0.0, 'Wind': 0.0})
+    assert _members(m.g, cost == 0.0) == [g for g in m.g if cost[g] == 0.0] == ['Wind', 'Solar', 'Hydro']
+    assert _members([], cost == 0.0) == []
+
+    fixed = pd.Series([0.0, 2.0, 1.0], index=pd.MultiIndex.from_tuples(list(m.la)))
+    assert _members(m.la, fixed > 0.0) == [la for la in m.la if fixed[la] > 0.0]
+
+
+def test_in_window_matches_the_period_comprehension():
+    m   = _model()
+    ini = pd.Series({'Wind': 2030, 'Coal': 2020, 'Solar': 2040, 'Hydro': 2050})
+    fin = pd.Series({'Wind': 2099, 'Coal': 2040, 'Solar': 2040, 'Hydro': 2099})
+    assert _in_window(m.p, m.g, ini, fin) == [(p,g) for p,g in m.p*m.g if ini[g] <= p and fin[g] >= p]
+
+    idx = pd.MultiIndex.from_tuples(list(m.la))
+    ini = pd.Series([2030, 2040, 2060], index=idx)
+    fin = pd.Series([2099, 2040, 2099], index=idx)
+    assert _in_window(m.p, m.la, ini, fin) == [(p,ni,nf,cc) for p,ni,nf,cc in m.p*m.la if ini[ni,nf,cc] <= p and fin[ni,nf,cc] >= p]
+
+
+def test_product_matches_the_membership_comprehension():
+    m      = _model()
+    m.pg   = pyo.Set(initialize=[(2030, 'Coal'), (2040, 'Wind'), (2040, 'Coal'), (2050, 'Hydro')])
+    m.psn  = pyo.Set(initialize=[(p,sc,n) for p,sc,n in m.ps*m.n])
+    m.psnla = pyo.Set(initialize=[(p,sc,n,ni,nf,cc) for p,sc,n,ni,nf,cc in m.psn*m.la])
+
+    assert _product(m.p,   m.g, m.pg) == [(p,g)       for p,g       in m.p*m.g   if (p,g) in m.pg]
+    assert _product(m.psn, m.g, m.pg) == [(p,sc,n,g)  for p,sc,n,g  in m.psn*m.g if (p,g) in m.pg]
+    assert _product(m.psn, m.g)       == [(p,sc,n,g)  for p,sc,n,g  in m.psn*m.g]
+
+    columns = pd.MultiIndex.from_tuples([('N1', 'N2', 'ac1', 'N2'), ('N2', 'N3', 'ac1', 'N1')])
+    m.nd    = pyo.Set(initialize=['N1', 'N2', 'N3'])
+    assert (_product(m.psnla, m.nd, columns, key=slice(3, 6)) ==
+            [(p,sc,n,ni,nf,cc,nd) for p,sc,n,ni,nf,cc,nd in m.psnla*m.nd if (ni,nf,cc,nd) in columns])
@@ -0,0 +1,133 @@
+"""A run of a case starts each stage from the solution an earlier run stored, as long as the model structure is unchanged.
+
+The unit tests store the solution of a small LP solved on persistent HiGHS and offer it to the same LP with other costs, which then starts from
+the stored basis, and to an LP with one more constraint, which is solved from nothing. The case test runs a four-stage 9n twice with the store,
+the second time with dearer fuel: every stage starts from the stored basis or solution, and the cost is that of a run without the store.
+"""
+import os
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingSolutionStore import OfferSolution, SolutionStore, StoreSolution, enabled
+
+
+def test_off_when_nothing_is_set(monkeypatch, tmp_path):
+    monkeypatch.delenv("OTEPES_SOLUTION_STORE", raising=False)
+    assert not enabled() and SolutionStore.create(str(tmp_path), "9n") is None
+    assert OfferSolution(None, SimpleNamespace(), None, "highs", 2030, "sc01", "st1", False) is None
+    monkeypatch.setenv("OTEPES_SOLUTION_STORE", "1")
+    assert enabled() and os.path.isdir(SolutionStore.create(str(tmp_path), "9n").directory)
+    assert parser.parse_args(["--solution-store"]).solution_store
+
+
+def _toy(cost, rows=12):
+    m     = pyo.ConcreteModel("toy")
+    m.i   = pyo.RangeSet(20)
+    m.x   = pyo.Var(m.i, bounds=(0, 5))
+    m.c   = pyo.Constraint(pyo.RangeSet(rows), rule=lambda m, k: sum(((k*j) % 7 + 1)*m.x[j] for j in m.i if (k + j) % 3) >= 10 + k)
+    m.obj = pyo.Objective(expr=sum((1 + (j*cost) % 5)*m.x[j] for j in m.i))
+    return m
+
+
+def _solve(m, mTEPES, mip=False):
+    Solver = pyo.SolverFactory("appsi_highs")
+    Solver.set_instance(m)
+    stored = OfferSolution(m, mTEPES, Solver, "appsi_highs", 2030, "sc01", "st1", mip)
+    Solver.solve(m)
+    StoreSolution(mTEPES, stored, Solver, "appsi_highs", mip)
+    return Solver
+
+
+@pytest.mark.solve
+def test_an_lp_starts_from_the_stored_basis_of_the_same_structure(tmp_path, capsys):
+    mTEPES = SimpleNamespace(pSolutions=SolutionStore(str(tmp_path)))
+    _solve(_toy(1), mTEPES)
+    assert os.listdir(str(tmp_path)) == ["solution_2030_sc01_st1.pkl"]
+
+    cold = _toy(2)
+    pyo.SolverFactory("appsi_highs").solve(cold)
+    capsys.readouterr()
+    warm   = _toy(2)
+    Solver = _solve(warm, mTEPES)
+    assert "Stage st1 starts from the stored basis" in capsys.readouterr().out
+    assert pyo.value(warm.obj) == pytest.approx(pyo.value(cold.obj))
+    assert Solver._solver_model.getInfo().simplex_iteration_count < 6
+
+    _solve(_toy(2, rows=13), mTEPES)
+    assert "Stage st1 stored solution skipped: the model structure changed" in capsys.readouterr().out
+
+
+@pytest.mark.solve
+def test_a_mip_starts_from_the_stored_values(tmp_path):
+    mTEPES = SimpleNamespace(pSolutions=SolutionStore(str(tmp_path)))
+    m      = _toy(1)
+    m.y    = pyo.Var(within=pyo.Binary)
+    m.x[1].fix(0)
+    m.u    = pyo.Constraint(expr=m.x[2] <= 5*m.y)
+    _solve(m, mTEPES, mip=True)
+    solved = {j: m.x[j].value for j in m.i}, m.y.value
+
+    for var in m.component_data_objects(pyo.Var):
+        if not var.fixed:
+            var.set_value(None)
+    stored = OfferSolution(m, mTEPES, None, "appsi_highs", 2030, "sc01", "st1", True)
+    assert stored.offered and ({j: m.x[j].value for j in m.i}, m.y.value) == solved and m.x[1].value == 0
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, each stage started from the stored solution."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+def test_a_rerun_with_dearer_fuel_starts_from_the_stored_solutions(tmp_path, monkeypatch, capsys):
+    from openTEPES.openTEPES import openTEPES_run
+
+    def dearer(DirName):
+        path  = os.path.join(DirName, "9n", "oT_Data_Generation_9n.csv")
+        dfGen = pd.read_csv(path)
+        dfGen["FuelCost"] *= 1.05
+        dfGen.to_csv(path, index=False)
+        return DirName
+
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    monkeypatch.delenv("OTEPES_SOLUTION_STORE", raising=False)
+    reference = openTEPES_run(dearer(_four_stage_9n(tmp_path / "reference", hours=24)), "9n", "appsi_highs", 0, 0)
+
+    monkeypatch.setenv("OTEPES_SOLUTION_STORE", "1")
+    DirName = _four_stage_9n(tmp_path / "stored", hours=24)
+    openTEPES_run(DirName, "9n", "appsi_highs", 0, 0)
+    assert sorted(os.listdir(os.path.join(DirName, "9n", "openTEPES_solutions_9n"))) == [f"solution_2030_sc01_st{i}.pkl" for i in range(1, 5)]
+    capsys.readouterr()
+    rerun  = openTEPES_run(dearer(DirName), "9n", "appsi_highs", 0, 0)
+    starts = [line for line in capsys.readouterr().out.splitlines() if "starts from the stored basis" in line]
+    assert starts == [f"Period 2030, Scenario sc01, Stage st{i} starts from the stored basis" for i in range(1, 5)]
+    assert pyo.value(rerun.eTotalSCost) == pytest.approx(pyo.value(reference.eTotalSCost), rel=1e-6)
@@ -0,0 +1,164 @@
+"""The fork solver manager runs queued subproblems side by side and hands each one back as the serial manager would.
+
+What matters for the time-Benders loop is the collection side: ``get_results`` must load the worker's solution and duals into the model the
+handle was queued on, in whatever order the caller asks, and the manager must stay inside the solver thread budget. The case test runs the
+time-Benders loop in mode 0 on a two-period 9n with both managers and compares what each iteration hands to the master.
+"""
+import glob
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+from pyomo.opt.parallel import SolverManagerFactory
+from pyomo.opt.parallel.manager import ActionManagerError
+
+from openTEPES import openTEPES, openTEPES_ProblemSolvingStageSolve
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingSolverManager import SolverManager_Fork, parallel_manager
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the fork solver manager needs fork")
+
+
+def _stage_lp(demand):
+    """A one-node dispatch: two units meet ``demand``, the cheap one capped at 3, so the balance dual is the expensive unit's cost."""
+    m = pyo.ConcreteModel()
+    m.g       = pyo.Set(initialize=["cheap", "dear"])
+    m.x       = pyo.Var(m.g, bounds=(0, 10))
+    m.cap     = pyo.Constraint(expr=m.x["cheap"] <= 3)
+    m.balance = pyo.Constraint(expr=sum(m.x[g] for g in m.g) == demand)
+    m.cost    = pyo.Objective(expr=m.x["cheap"] + 5 * m.x["dear"])
+    m.dual    = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+    return m
+
+
+def test_results_and_duals_land_on_the_queued_models():
+    models  = [_stage_lp(d) for d in (4, 6, 8)]
+    manager = SolverManagerFactory("otepes_fork", n_workers=2)
+    with manager:
+        handles = [manager.queue(m, opt=pyo.SolverFactory("highs"), load_solutions=True) for m in models]
+        # collect the last one first: it must still be loaded into its own model
+        results = {h.id: manager.get_results(h) for h in reversed(handles)}
+    for handle, m, demand in zip(handles, models, (4, 6, 8)):
+        assert results[handle.id].solver.termination_condition == pyo.TerminationCondition.optimal
+        assert results[handle.id].Problem.__getattr__("Lower bound") == pytest.approx(3 + 5 * (demand - 3))
+        assert m.x["dear"].value == pytest.approx(demand - 3)
+        assert m.dual[m.balance] == pytest.approx(5)
+
+
+def test_wait_any_reports_each_finished_solve_once():
+    manager = SolverManagerFactory("otepes_fork", n_workers=3)
+    with manager:
+        handles = {manager.queue(_stage_lp(d), opt=pyo.SolverFactory("highs")).id for d in (4, 5, 6)}
+        seen    = {manager.wait_any().id for _ in handles}
+    assert seen == handles
+
+
+def test_a_failing_solve_is_raised_on_collection():
+    manager = SolverManagerFactory("otepes_fork", n_workers=2)
+    with manager:
+        handle = manager.queue(_stage_lp(4), opt=pyo.SolverFactory("highs"), no_such_option=True)
+        with pytest.raises(ActionManagerError, match="Subproblem solve failed"):
+            manager.get_results(handle)
+
+
+def test_workers_are_capped_by_the_thread_budget(monkeypatch):
+    monkeypatch.setenv("OTEPES_THREADS", "4")
+    monkeypatch.setenv("OTEPES_PARALLEL_SUBPROBLEMS", "8")
+    manager = parallel_manager()
+    assert isinstance(manager, SolverManager_Fork)
+    assert (manager.n_workers, manager.threads) == (4, 1)
+
+    monkeypatch.setenv("OTEPES_PARALLEL_SUBPROBLEMS", "2")
+    manager = parallel_manager()
+    assert (manager.n_workers, manager.threads) == (2, 2)
+
+    monkeypatch.delenv("OTEPES_PARALLEL_SUBPROBLEMS")
+    assert parallel_manager().n_workers == 4
+
+
+def test_the_switch_is_not_the_stage_one(monkeypatch):
+    monkeypatch.setenv("OTEPES_THREADS", "4")
+    monkeypatch.delenv("OTEPES_PARALLEL_SUBPROBLEMS", raising=False)
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", "2")
+    assert parallel_manager().n_workers == 4
+    assert parser.parse_args(["--parallel-subproblems", "3"]).parallel_subproblems == 3
+
+
+def _two_period_9n(tmp_path):
+    """A day of 9n in one stage, repeated in 2040 with 30% more demand, with a continuous OCGT candidate at Node_2."""
+    src  = os.path.abspath(os.path.join(os.path.dirname(__file__), "../openTEPES/cases/9n"))
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(src, case, ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+
+    path = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df   = pd.read_csv(path)
+    df.loc[24:, "Duration"] = np.nan
+    df.to_csv(path, index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    path  = os.path.join(case, "oT_Data_Generation_9n.csv")
+    dfGen = pd.read_csv(path)
+    new   = dfGen[dfGen["Generator"] == "OCGT_1"].assign(Generator="OCGT_new", FixedInvestmentCost=20, FixedChargeRate=0.07)
+    pd.concat([dfGen, new]).to_csv(path, index=False)
+    path  = os.path.join(case, "oT_Dict_Generation_9n.csv")
+    pd.concat([pd.read_csv(path), pd.DataFrame({"Generator": ["OCGT_new"]})]).to_csv(path, index=False)
+
+    for path in glob.glob(os.path.join(case, "oT_Data_*_9n.csv")):
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        if df.columns[0] != "Period" or os.path.basename(path) == "oT_Data_Period_9n.csv":
+            continue
+        later = df.copy()
+        later["Period"] = 2040
+        if os.path.basename(path) == "oT_Data_Demand_9n.csv":
+            later.iloc[:, 3:] *= 1.3
+        pd.concat([df, later]).to_csv(path, index=False)
+    pd.DataFrame({"Period": [2030, 2040]}).to_csv(os.path.join(case, "oT_Dict_Period_9n.csv"), index=False)
+    pd.DataFrame({"Period": [2030, 2040], "Weight": 10}).to_csv(os.path.join(case, "oT_Data_Period_9n.csv"), index=False)
+    return str(tmp_path)
+
+
+def _mode_0_iterations(tmp_path, monkeypatch, manager) -> list:
+    """Run the time-Benders loop with the subproblems queued on ``manager()``: the operation cost and the investment duals of each iteration."""
+    StageIterativeSolving = openTEPES.StageIterativeSolving
+    StageSolve            = openTEPES_ProblemSolvingStageSolve.StageSolve
+    iterations            = []
+
+    def _decomposed(mTEPES, *args):
+        mTEPES.pIndCompleteProblem   = 0
+        mTEPES.pIndSequentialSolving = 0
+        return StageIterativeSolving(mTEPES, *args)
+
+    def _recorded(OptModel, mTEPES, *args):
+        StageSolve(OptModel, mTEPES, *args)
+        iterations.append((mTEPES.pTotalOCost(),
+                           {key: value() for key, value in mTEPES.pGenerationInvestMarginalG.items()},
+                           {key: value() for key, value in mTEPES.pNetworkInvestMarginalCap .items()}))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(openTEPES, "StageIterativeSolving", _decomposed)
+        patch.setattr(openTEPES_ProblemSolvingStageSolve, "StageSolve",       _recorded)
+        patch.setattr(openTEPES_ProblemSolvingStageSolve, "parallel_manager", manager)
+        openTEPES.openTEPES_run(_two_period_9n(tmp_path), "9n", "highs", 0, 0, output_spec={"economic": False})
+    return iterations
+
+
+@pytest.mark.solve
+def test_mode_0_hands_the_master_what_the_serial_manager_does(tmp_path, monkeypatch):
+    monkeypatch.setenv("OTEPES_PARALLEL_SUBPROBLEMS", "2")
+    serial = _mode_0_iterations(tmp_path / "serial", monkeypatch, lambda: SolverManagerFactory("serial"))
+    forked = _mode_0_iterations(tmp_path / "fork",   monkeypatch, parallel_manager)
+
+    assert len(forked) == len(serial) > 1
+    for (cost, marginal_g, marginal_cap), (serial_cost, serial_g, serial_cap) in zip(forked, serial):
+        assert cost == pytest.approx(serial_cost, rel=1e-9)
+        assert marginal_g   == pytest.approx(serial_g,   rel=1e-9, abs=1e-9)
+        assert marginal_cap == pytest.approx(serial_cap, rel=1e-9, abs=1e-9)
+    assert any(value for _, _, marginal_cap in serial for value in marginal_cap.values())
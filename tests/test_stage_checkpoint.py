@@ -0,0 +1,151 @@
+"""A run resumed from its stage checkpoints ends as the uninterrupted run.
+
+The unit tests cover the switches and the per-stage view of the duals a checkpoint keeps. The case test solves a four-stage 9n once, then
+again with checkpoints and a solver failure at the third stage, and resumes it: the first two stages are loaded rather than solved, and the
+cost, the duals and every result file match the uninterrupted run.
+"""
+import filecmp
+import glob
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingCheckpoint import StageCheckpoints, enabled, resume
+from openTEPES.openTEPES_ProblemSolvingDualExtraction import DualStore
+
+CASES = os.path.abspath(os.path.join(os.path.dirname(__file__), "../openTEPES/cases"))
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_CHECKPOINT", raising=False)
+    monkeypatch.delenv("OTEPES_RESUME", raising=False)
+    assert not enabled() and not resume()
+    monkeypatch.setenv("OTEPES_CHECKPOINT", "1")
+    assert enabled() and not resume()
+    monkeypatch.delenv("OTEPES_CHECKPOINT")
+    monkeypatch.setenv("OTEPES_RESUME", "yes")
+    assert enabled() and resume()
+    args = parser.parse_args(["--checkpoint", "--resume"])
+    assert args.checkpoint and args.resume
+
+
+def test_a_stage_view_keeps_its_duals_and_the_unstaged_ones():
+    store = DualStore()
+    store.add("eBalanceElec", (2030, "sc01", "st1"), [("n1", "Node_1")], [1.0])
+    store.add("eBalanceElec", (2030, "sc01", "st2"), [("n1", "Node_1")], [2.0])
+    store.add("eTotalFElecCost", (), [2030], [3.0])
+    stage = store.stage((2030, "sc01", "st2"))
+    assert sorted(stage.families()) == ["eBalanceElec", "eTotalFElecCost"]
+    assert stage["eBalanceElec", (2030, "sc01", "st2", "n1", "Node_1")] == 2.0
+    assert len(stage) == 2
+
+
+def test_checkpoints_of_another_model_are_discarded(tmp_path, monkeypatch):
+    monkeypatch.setenv("OTEPES_CHECKPOINT", "1")
+    monkeypatch.delenv("OTEPES_RESUME", raising=False)
+    first = StageCheckpoints.create(str(tmp_path), "9n", CASES, settings={"pIndCycleFlow": 0})
+    first.save(2030, "sc01", "st1", {"values": {}})
+
+    monkeypatch.setenv("OTEPES_RESUME", "1")
+    assert (2030, "sc01", "st1") in StageCheckpoints.create(str(tmp_path), "9n", CASES, settings={"pIndCycleFlow": 0})
+    assert (2030, "sc01", "st1") not in StageCheckpoints.create(str(tmp_path), "9n", CASES, settings={"pIndCycleFlow": 1})
+    assert not os.path.exists(first._path(2030, "sc01", "st1"))
+
+
+@pytest.mark.parametrize("option", ["OTEPES_SELECTIVE_DUALS", "OTEPES_NATIVE_DUALS", "OTEPES_STAGE_WARM_START"])
+def test_checkpoints_of_another_solver_or_solve_option_are_discarded(tmp_path, monkeypatch, option):
+    monkeypatch.setenv("OTEPES_CHECKPOINT", "1")
+    monkeypatch.delenv("OTEPES_RESUME", raising=False)
+    monkeypatch.delenv(option, raising=False)
+    StageCheckpoints.create(str(tmp_path), "9n", CASES, SolverName="highs").save(2030, "sc01", "st1", {"values": {}})
+
+    monkeypatch.setenv("OTEPES_RESUME", "1")
+    assert (2030, "sc01", "st1") in     StageCheckpoints.create(str(tmp_path), "9n", CASES, SolverName="highs")
+    assert (2030, "sc01", "st1") not in StageCheckpoints.create(str(tmp_path), "9n", CASES, SolverName="gurobi")
+    StageCheckpoints.create(str(tmp_path), "9n", CASES, SolverName="highs").save(2030, "sc01", "st1", {"values": {}})
+    monkeypatch.setenv(option, "1")
+    assert (2030, "sc01", "st1") not in StageCheckpoints.create(str(tmp_path), "9n", CASES, SolverName="highs")
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, one checkpoint per stage."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+@pytest.mark.parametrize("parallel", ["", "2"])
+def test_a_resumed_run_matches_the_uninterrupted_one(tmp_path, monkeypatch, capsys, parallel):
+    from openTEPES import openTEPES_ProblemSolvingParallelStages, openTEPES_ProblemSolvingStageIter
+    from openTEPES.openTEPES import openTEPES_run
+
+    if parallel and sys.platform == "win32":
+        pytest.skip("stage workers need fork")
+    monkeypatch.setenv("OTEPES_PARALLEL_STAGES", parallel)
+    monkeypatch.delenv("OTEPES_CHECKPOINT", raising=False)
+    monkeypatch.delenv("OTEPES_RESUME", raising=False)
+    spec      = {"generation": True, "marginal": True}
+    reference = openTEPES_run(_four_stage_9n(tmp_path / "reference", hours=24), "9n", "highs", 0, 0, output_spec=spec)
+
+    # the solver fails at the third stage, after the first two were checkpointed
+    solve = openTEPES_ProblemSolvingStageIter.ProblemSolving
+
+    def failing(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st, ncall):
+        if st == "st3":
+            raise RuntimeError("solver lost")
+        return solve(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st, ncall)
+
+    DirName = _four_stage_9n(tmp_path / "resumed", hours=24)
+    monkeypatch.setenv("OTEPES_CHECKPOINT", "1")
+    with monkeypatch.context() as patch:
+        patch.setattr(openTEPES_ProblemSolvingStageIter,    "ProblemSolving", failing)
+        patch.setattr(openTEPES_ProblemSolvingParallelStages, "ProblemSolving", failing)
+        with pytest.raises((RuntimeError, ValueError), match="solver lost"):
+            openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec=spec)
+    checkpoints = os.path.join(DirName, "9n", "openTEPES_checkpoint_9n")
+    assert sorted(os.path.basename(path) for path in glob.glob(os.path.join(checkpoints, "stage_*.pkl"))) == ["stage_2030_sc01_st1.pkl", "stage_2030_sc01_st2.pkl"]
+
+    monkeypatch.delenv("OTEPES_CHECKPOINT")
+    monkeypatch.setenv("OTEPES_RESUME", "1")
+    capsys.readouterr()
+    resumed = openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec=spec)
+    restored = [line for line in capsys.readouterr().out.splitlines() if "restored from checkpoint" in line]
+    assert restored == ["Period 2030, Scenario sc01, Stage st1 restored from checkpoint", "Period 2030, Scenario sc01, Stage st2 restored from checkpoint"]
+    assert not os.path.exists(checkpoints)
+
+    np.testing.assert_approx_equal(pyo.value(resumed.eTotalSCost), pyo.value(reference.eTotalSCost))
+    assert sorted(resumed.pDuals.families()) == sorted(reference.pDuals.families())
+    for family in reference.pDuals.families():
+        assert resumed.pDuals.series(family).index.equals(reference.pDuals.series(family).index)
+    ours, theirs = (os.path.join(str(tmp_path), run, "9n") for run in ("resumed", "reference"))
+    names = sorted(os.path.basename(path) for path in glob.glob(os.path.join(theirs, "oT_Result_*.csv")))
+    assert names and names == sorted(os.path.basename(path) for path in glob.glob(os.path.join(ours, "oT_Result_*.csv")))
+    for name in names:
+        assert filecmp.cmp(os.path.join(ours, name), os.path.join(theirs, name), shallow=False), name
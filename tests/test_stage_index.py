@@ -0,0 +1,86 @@
+"""The stage index puts on the model the same stage sets and cycle subsets as the comprehensions of the stage loop it replaces.
+
+The original comprehensions are written out next to the calls, so a cached subset that drops, adds or reorders a tuple of any stage, or of
+all the stages together, fails here and not as a silently different model.
+"""
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+from pyomo.environ import Set
+
+from openTEPES.openTEPES_DataConfiguration import DataConfiguration
+from openTEPES.openTEPES_InputData import InputData
+from openTEPES.openTEPES_StageIndex import ActivateAllStageSets, ActivateStageSets
+
+
+def _sets(m):
+    return {name: list(getattr(m, name)) for name in ('st', 'n', 'n2', 'nesc', 'necc', 'neso', 'ngen')}
+
+
+def _comprehensions(m, stages, levels):
+    m.del_component(m.st)
+    m.del_component(m.n )
+    m.del_component(m.n2)
+    m.st = Set(initialize=stages)
+    m.n  = Set(initialize=levels)
+    m.n2 = Set(initialize=levels)
+    m.nesc = [(n,es) for n,es in m.n*m.es if m.n.ord(n) % m.pStorageTimeStep [es] == 0]
+    m.necc = [(n,ec) for n,ec in m.n*m.ec if m.n.ord(n) % m.pStorageTimeStep [ec] == 0]
+    m.neso = [(n,es) for n,es in m.n*m.es if m.n.ord(n) % m.pOutflowsTimeStep[es] == 0]
+    m.ngen = [(n,g ) for n,g  in m.n*m.g  if m.n.ord(n) % m.pEnergyTimeStep  [g ] == 0]
+    return _sets(m)
+
+
+def _four_stage_9n(tmp_path, hours=36):
+    """9n cut into four stages of ``hours`` load levels each, whose stage sets the index is compared on."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+def test_stage_sets_match_the_comprehensions(tmp_path):
+    # stages of a day and a half, so the daily storage cycle of ESS1 closes once per stage and not at its last load level; one stage without weight
+    DirName = _four_stage_9n(tmp_path, hours=36)
+    case    = os.path.join(DirName, "9n")
+    pd.DataFrame({"Stage": [f"st{s}" for s in range(1, 5)], "Weight": [13, 13, 0, 13]}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    m = pyo.ConcreteModel()
+    dfs, par = InputData(DirName, "9n", m, 0)
+    DataConfiguration(m, dfs, par)
+    assert len(m.es) and len(m.stt) == 4
+
+    for p,sc,st in m.ps*m.stt:
+        ActivateStageSets(m, p, sc, st)
+        cached   = _sets(m)
+        expected = _comprehensions(m, [stt for stt in m.stt if st == stt and m.pStageWeight[stt] and sum(1 for nn in m.nn if (p,sc,stt,nn) in m.s2n)],
+                                      [nn  for nn  in m.nn  if (p,sc,st,nn) in m.s2n])
+        assert cached == expected
+
+    ActivateAllStageSets(m)
+    cached   = _sets(m)
+    stages   = [stt for stt in m.stt if m.pStageWeight[stt] and sum(1 for pp,scc,stt2,nn in m.s2n if stt2 == stt)]
+    expected = _comprehensions(m, stages, [nn for nn in m.nn if sum(1 for p,sc in m.ps for st in stages if (p,sc,st,nn) in m.s2n)])
+    assert cached == expected and cached['st'] == ['st1', 'st2', 'st4'] and cached['nesc']
@@ -0,0 +1,112 @@
+"""Retiring the solved stages from the model leaves the results unchanged, and the model holds no constraint of a retired stage.
+
+The ramp constraints are switched on (IndBinGenRamps=1) and slowed down because their slacks are the only ones the output writers read, so the case test
+also covers the slacks served from the store instead of the deleted components.
+"""
+import glob
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingResolve import resolve
+from openTEPES.openTEPES_ProblemSolvingStageRetirement import RetiredStages, enabled, stage_slack
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_RETIRE_STAGES", raising=False)
+    assert not enabled()
+    monkeypatch.setenv("OTEPES_RETIRE_STAGES", "yes")
+    assert enabled()
+    assert parser.parse_args(["--retire-stages"]).retire_stages
+    assert not parser.parse_args([]).retire_stages
+
+
+def test_retired_slacks_are_served_from_the_store():
+    from openTEPES.openTEPES_ConstraintRegistry import AddStageConstraint, StageConstraints
+
+    m   = pyo.ConcreteModel()
+    m.n = pyo.Set(initialize=['n1', 'n2'])
+    m.x = pyo.Var(m.n, initialize={'n1': 1.0, 'n2': 3.0})
+    for st in ('st1', 'st2'):
+        AddStageConstraint(m, 'eRampUp',      2030, 'sc01', st, pyo.Constraint(m.n, rule=lambda m, n: m.x[n] <= 4.0))
+        AddStageConstraint(m, 'eBalanceElec', 2030, 'sc01', st, pyo.Constraint(m.n, rule=lambda m, n: m.x[n] >= 0.0))
+    m.pRetiredStages = RetiredStages()
+    expected = {n: m.eRampUp_2030_sc01_st1[n].slack() for n in m.n}
+
+    m.pRetiredStages.retire(m, 2030, 'sc01', 'st1')
+    assert (2030, 'sc01', 'st1') in m.pRetiredStages and len(m.pRetiredStages) == 1
+    assert not hasattr(m, 'eRampUp_2030_sc01_st1') and not hasattr(m, 'eBalanceElec_2030_sc01_st1')
+    assert [c.name for c in StageConstraints(m).select()] == ['eRampUp_2030_sc01_st2', 'eBalanceElec_2030_sc01_st2']
+    for n in m.n:
+        assert stage_slack(m, 'eRampUp', 2030, 'sc01', 'st1', n) == expected[n]
+        assert stage_slack(m, 'eRampUp', 2030, 'sc01', 'st2', n) == expected[n]
+    with pytest.raises(ValueError, match="retire-stages"):
+        resolve(m, "highs", [{}])
+
+
+def _results(DirName):
+    return {os.path.basename(path): pd.read_csv(path) for path in sorted(glob.glob(os.path.join(DirName, "9n", "oT_Result_*.csv")))}
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, the case whose solved stages are retired."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+@pytest.mark.parametrize("parallel", ["", "2"])
+def test_retired_run_matches_the_full_run(tmp_path, monkeypatch, parallel):
+    from openTEPES.openTEPES import openTEPES_run
+    from openTEPES.openTEPES_ConstraintRegistry import StageConstraints
+
+    if parallel and sys.platform == "win32":
+        pytest.skip("stage workers need fork")
+    runs = {}
+    for retire in ("", "1"):
+        DirName = _four_stage_9n(tmp_path / f"retire{retire}", hours=24)
+        option_csv = os.path.join(DirName, "9n", "oT_Data_Option_9n.csv")
+        pd.read_csv(option_csv).assign(IndBinGenRamps=1).to_csv(option_csv, index=False)
+        # ramps slower than the second block, so the ramp constraints bind and the surplus is written
+        generation_csv = os.path.join(DirName, "9n", "oT_Data_Generation_9n.csv")
+        df = pd.read_csv(generation_csv, index_col=0)
+        df[["RampUp", "RampDown"]] /= 4
+        df.to_csv(generation_csv)
+        monkeypatch.setenv("OTEPES_PARALLEL_STAGES", parallel)
+        monkeypatch.setenv("OTEPES_RETIRE_STAGES",   retire)
+        runs[retire] = (openTEPES_run(DirName, "9n", "highs", 0, 0, output_spec={"generation": True, "marginal": True}), _results(DirName))
+
+    (full, expected), (retired, results) = runs[""], runs["1"]
+    assert full.pRetiredStages is None and len(retired.pRetiredStages) == 4
+    assert not StageConstraints(retired).select()
+    assert not [c for c in retired.component_objects(pyo.Constraint) if c.name.startswith(('eRampUp_', 'eBalanceElec_'))]
+    assert sorted(results) == sorted(expected) and 'oT_Result_GenerationRampUpSurplus_9n.csv' in results
+    for name, frame in expected.items():
+        pd.testing.assert_frame_equal(results[name], frame, check_exact=False, rtol=1e-6, atol=1e-6)
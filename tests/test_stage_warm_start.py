@@ -0,0 +1,110 @@
+"""A stage's MIP starts from the commitment the stage before it left, and ends where the cold run does.
+
+The unit tests cover the switch and which solves take the start. The case test solves a four-stage 9n with binary commitment on persistent
+HiGHS, cold and with ``--stage-warm-start``: each stage after the first gets the previous stage's commitment load level by load level, its
+startups and shutdowns agree with it, HiGHS accepts it as a feasible MIP start, and the total cost matches the cold run within the MIP gap.
+"""
+import os
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_Main import parser
+from openTEPES.openTEPES_ProblemSolvingWarmStart import StageWarmStart, enabled, warm_start
+
+
+def test_off_when_nothing_is_set(monkeypatch):
+    monkeypatch.delenv("OTEPES_STAGE_WARM_START", raising=False)
+    assert not enabled()
+    monkeypatch.setenv("OTEPES_STAGE_WARM_START", "on")
+    assert enabled()
+    assert parser.parse_args(["--stage-warm-start"]).stage_warm_start
+
+
+def test_only_solvers_that_take_a_start_get_one():
+    on, off = SimpleNamespace(pWarmStart=StageWarmStart()), SimpleNamespace(pWarmStart=None)
+    assert warm_start(on, "appsi_highs") and warm_start(on, "gurobi")
+    assert not warm_start(on, "highs") and not warm_start(on, "glpk")
+    assert not warm_start(off, "appsi_highs")
+
+
+def _binary_commitment(DirName):
+    """Commit every unit with a minimum output with binary variables."""
+    path      = os.path.join(DirName, "9n", "oT_Data_Option_9n.csv")
+    dfOption  = pd.read_csv(path)
+    dfOption["IndBinGenOperat"] = 1
+    dfOption.to_csv(path, index=False)
+    path      = os.path.join(DirName, "9n", "oT_Data_Generation_9n.csv")
+    dfGen     = pd.read_csv(path)
+    dfGen["BinaryCommitment"] = dfGen["BinaryCommitment"].astype(object)
+    dfGen.loc[dfGen["MinimumPower"].fillna(0) > 0, "BinaryCommitment"] = "Yes"
+    dfGen.to_csv(path, index=False)
+    return DirName
+
+
+def _four_stage_9n(tmp_path, hours=24):
+    """9n cut into four stages of ``hours`` load levels each, so three stages start from the one before."""
+    case = os.path.join(str(tmp_path), "9n")
+    shutil.copytree(os.path.join(os.path.dirname(__file__), "..", "openTEPES", "cases", "9n"), case,
+                    ignore=shutil.ignore_patterns("openTEPES_*", "oT_Result_*", "oT_Plot_*", "*.html"))
+    stages = [f"st{s}" for s in range(1, 5)]
+    path   = os.path.join(case, "oT_Data_Duration_9n.csv")
+    df     = pd.read_csv(path)
+    df.loc[4*hours:, "Duration"] = np.nan
+    df["Stage"] = [stages[min(i // hours, 3)] for i in range(len(df))]
+    df.to_csv(path, index=False)
+    pd.DataFrame({"Stage": stages}).to_csv(os.path.join(case, "oT_Dict_Stage_9n.csv"), index=False)
+    pd.DataFrame({"Stage": stages, "Weight": 13}).to_csv(os.path.join(case, "oT_Data_Stage_9n.csv"), index=False)
+
+    path = os.path.join(case, "oT_Data_RESEnergy_9n.csv")
+    df   = pd.read_csv(path, index_col=[0, 1])
+    df["RESEnergy"] = np.nan
+    df.to_csv(path)
+
+    # the candidate line is ignored
+    path = os.path.join(case, "oT_Data_Option_9n.csv")
+    df   = pd.read_csv(path)
+    df["IndBinNetInvest"] = 2
+    df.to_csv(path, index=False)
+    return str(tmp_path)
+
+
+@pytest.mark.solve
+def test_each_stage_starts_from_the_previous_commitment(tmp_path, monkeypatch, capfd):
+    from openTEPES import openTEPES_ProblemSolvingStageIter
+    from openTEPES.openTEPES import openTEPES_run
+    from openTEPES.openTEPES_StageIndex import _stage_index
+
+    monkeypatch.delenv("OTEPES_PARALLEL_STAGES", raising=False)
+    monkeypatch.delenv("OTEPES_STAGE_WARM_START", raising=False)
+    cold = openTEPES_run(_binary_commitment(_four_stage_9n(tmp_path / "cold", hours=24)), "9n", "appsi_highs", 0, 0)
+    capfd.readouterr()
+
+    # the commitment each stage is solved to, the one it starts from, and the binary commitments it decides
+    solve, solved, started, free = openTEPES_ProblemSolvingStageIter.ProblemSolving, {}, {}, {}
+
+    def spy(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st, ncall):
+        levels      = _stage_index(mTEPES).stage(p, sc, st)[1]
+        started[st] = [{nr: OptModel.vCommitment[p,sc,n,nr].value for nr in mTEPES.nr if (p,sc,n,nr) in OptModel.vCommitment} for n in levels]
+        free[st]    = [{nr for nr in level if OptModel.vCommitment[p,sc,n,nr].is_binary() and not OptModel.vCommitment[p,sc,n,nr].fixed} for n, level in zip(levels, started[st])]
+        # within the stage, the startups and shutdowns of the start are the transitions of its commitment
+        for before, n, now in zip(started[st], levels[1:], started[st][1:]):
+            for nr in now:
+                assert OptModel.vStartUp[p,sc,n,nr].value - OptModel.vShutDown[p,sc,n,nr].value == now[nr] - before[nr]
+        result      = solve(DirName, CaseName, SolverName, OptModel, mTEPES, pIndLogConsole, p, sc, st, ncall)
+        solved[st]  = [{nr: round(OptModel.vCommitment[p,sc,n,nr].value) for nr in mTEPES.nr if (p,sc,n,nr) in OptModel.vCommitment} for n in levels]
+        return result
+
+    monkeypatch.setenv("OTEPES_STAGE_WARM_START", "1")
+    monkeypatch.setattr(openTEPES_ProblemSolvingStageIter, "ProblemSolving", spy)
+    warm = openTEPES_run(_binary_commitment(_four_stage_9n(tmp_path / "warm", hours=24)), "9n", "appsi_highs", 0, 0)
+
+    assert sorted(solved) == ["st1", "st2", "st3", "st4"] and any(free["st2"])
+    for previous, st in (("st1", "st2"), ("st2", "st3"), ("st3", "st4")):
+        assert [{nr: now[nr] for nr in units} for now, units in zip(started[st], free[st])] == [{nr: before[nr] for nr in units} for before, units in zip(solved[previous], free[st])]
+    assert capfd.readouterr().out.count("MIP start solution is feasible") == 3
+    assert pyo.value(warm.eTotalSCost) == pytest.approx(pyo.value(cold.eTotalSCost), rel=1e-2)
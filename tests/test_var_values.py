@@ -0,0 +1,66 @@
+"""The output writers read variable values through ``VarValues``, one extraction per variable, instead of one ``var[idx]()`` per index.
+
+These pin what the writers rely on: a lookup returns the same numbers as the per-index calls, in the order of the keys asked for, an unset
+value reads as NaN, a key the variable does not have fails loudly, and a fresh store sees the values of a new solve.
+"""
+import numpy as np
+import pyomo.environ as pyo
+import pytest
+
+from openTEPES.openTEPES_OutputResultsCommon import VarValues, var_values
+from openTEPES.openTEPES_OutputResultsMapCommon import make_flow_series
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.psng = pyo.Set(initialize=[(2030, "sc01", n, g) for n in ("01", "02", "03") for g in ("Coal", "Wind")], dimen=4)
+    m.g    = pyo.Set(initialize=["Coal", "Wind"])
+    m.vTotalOutput      = pyo.Var(m.psng)
+    m.vGenerationInvest = pyo.Var(m.g)
+    for i, v in enumerate(m.vTotalOutput.values()):
+        v.set_value(0.5 * i)
+    m.vGenerationInvest["Coal"].set_value(1.0)
+    return m
+
+
+def test_lookup_matches_the_per_index_calls_in_key_order():
+    m    = _model()
+    keys = list(reversed(m.psng))
+    np.testing.assert_array_equal(var_values(m).lookup("vTotalOutput", keys), [m.vTotalOutput[k]() for k in keys])
+    np.testing.assert_array_equal(var_values(m).lookup("vTotalOutput", m.psng), [m.vTotalOutput[k]() for k in m.psng])
+    assert var_values(m).lookup("vTotalOutput", []).shape == (0,)
+
+
+def test_one_dimensional_variables_and_unset_values():
+    m      = _model()
+    values = var_values(m).lookup("vGenerationInvest", ["Wind", "Coal"])
+    assert np.isnan(values[0]) and values[1] == 1.0
+
+
+def test_missing_key_raises():
+    m = _model()
+    with pytest.raises(KeyError):
+        var_values(m).lookup("vTotalOutput", [(2030, "sc01", "99", "Coal")])
+
+
+def test_store_is_shared_until_replaced():
+    m     = _model()
+    store = var_values(m)
+    assert var_values(m) is store
+    store.lookup("vTotalOutput", m.psng)
+    assert "vTotalOutput" in store
+    # a new solve: the writers only see the new values through a fresh store
+    m.vTotalOutput[2030, "sc01", "01", "Coal"].set_value(42.0)
+    assert store.lookup("vTotalOutput", [(2030, "sc01", "01", "Coal")])[0] == 0.0
+    m.pVarValues = VarValues(m)
+    assert var_values(m).lookup("vTotalOutput", [(2030, "sc01", "01", "Coal")])[0] == 42.0
+
+
+def test_flow_series_reads_through_the_store():
+    m = pyo.ConcreteModel()
+    m.psnla     = pyo.Set(initialize=[(2030, "sc01", n, "Node_1", "Node_2", "ac1") for n in ("01", "02")] + [(2030, "sc01", "01", "Node_2", "Node_3", "ac1")], dimen=6)
+    m.vFlowElec = pyo.Var(m.psnla, initialize=lambda m, *k: float(len(k[2]) + k[2].count("2")))
+    series = make_flow_series(m.vFlowElec, m.psnla, 1e3, {(2030, "Node_1", "Node_2", "ac1")})
+    assert list(series.index) == [(2030, "sc01", "01", "Node_1", "Node_2", "ac1"), (2030, "sc01", "02", "Node_1", "Node_2", "ac1")]
+    assert list(series) == [2e3, 3e3]
+    assert "vFlowElec" in var_values(m)